@@ -4,6 +4,7 @@
 
 from .device_manager import DeviceManager, AudioDevice
 from .audio_file import AudioFile, AudioMetadata
+from .pcm_cache import PCMCache
 from .audio_engine import AudioEngine
 from .audio_mixer import AudioMixer, AudioLaneState
 from .playback_synchronizer import PlaybackSynchronizer
@@ -17,6 +18,7 @@ from .live_feature_bridge import LiveFeatureBridge
 __all__ = [
     'DeviceManager', 'AudioDevice',
     'AudioFile', 'AudioMetadata',
+    'PCMCache',
     'AudioEngine',
     'AudioMixer', 'AudioLaneState',
     'PlaybackSynchronizer',
@@ -0,0 +1,166 @@
+"""Shared frame-level audio analysis for the offline pipeline.
+
+`analyze_song`, `compute_frame_features` and `compute_beat_features` all
+need the same frame-level features of the same file. Each used to decode
+the audio with librosa and run its own STFT, onset-strength, centroid and
+HPSS passes. `AudioAnalysisContext` decodes once, computes the magnitude
+spectrogram once and derives every frame-level array from it; the three
+public functions only aggregate those arrays.
+
+Contexts are persisted as ``.npz`` files in an ``.analysis_cache`` folder
+next to the audio file (the config's audiofiles bundle), keyed by a hash
+of the file content and the analysis parameters. Re-running autogen on the
+same song skips decoding and DSP entirely.
+"""
+
+import hashlib
+import os
+from dataclasses import dataclass, fields
+from typing import Optional
+
+import numpy as np
+
+try:
+    import librosa
+    LIBROSA_AVAILABLE = True
+except ImportError:
+    LIBROSA_AVAILABLE = False
+
+SAMPLE_RATE = 22050
+HOP_LENGTH = 512
+N_FFT = 2048
+N_MELS = 128
+
+# Bump when the set or meaning of the cached arrays changes
+_CACHE_VERSION = 1
+CACHE_DIR_NAME = ".analysis_cache"
+
+
+@dataclass
+class AudioAnalysisContext:
+    """Frame-level features of one audio file (hop_length frames at sample_rate)."""
+    sample_rate: int
+    hop_length: int
+    duration: float
+    onset_env: np.ndarray            # onset strength (spectral flux)
+    frame_times: np.ndarray          # time of each onset_env frame
+    onset_times: np.ndarray          # detected onsets (backtracked), seconds
+    spectral_centroid: np.ndarray    # Hz
+    spectral_bandwidth: np.ndarray   # Hz
+    spectral_flatness: np.ndarray    # 0-1
+    vocal_score: np.ndarray          # HPSS+MFCC delta RMS, normalized 0-1
+    rms: np.ndarray                  # RMS energy (unnormalized)
+    spectral_contrast: np.ndarray    # mean over bands, per frame
+    mel_db: np.ndarray               # N_MELS x frames, dB relative to max
+
+
+def compute_analysis_context(audio_path: str) -> AudioAnalysisContext:
+    """Decode audio_path once and compute every frame-level feature from one STFT."""
+    if not LIBROSA_AVAILABLE:
+        raise ImportError("librosa is required for audio analysis. Install with: pip install librosa")
+
+    y, sr = librosa.load(audio_path, sr=SAMPLE_RATE, mono=True)
+    duration = librosa.get_duration(y=y, sr=sr)
+
+    # One magnitude STFT; the feature functions accept it via S= and give the
+    # same result as when handed y (same n_fft, hop, window and padding)
+    S = np.abs(librosa.stft(y, n_fft=N_FFT, hop_length=HOP_LENGTH))
+    mel_power = librosa.feature.melspectrogram(S=S ** 2, sr=sr, n_mels=N_MELS)
+
+    onset_env = librosa.onset.onset_strength(S=librosa.power_to_db(mel_power), sr=sr, hop_length=HOP_LENGTH)
+    onset_frames = librosa.onset.onset_detect(
+        sr=sr, hop_length=HOP_LENGTH, onset_envelope=onset_env, backtrack=True
+    )
+
+    # HPSS + MFCC deltas for vocal detection: vocals have high delta variance
+    S_harmonic, _ = librosa.decompose.hpss(S)
+    mfcc_harmonic = librosa.feature.mfcc(S=librosa.power_to_db(S_harmonic ** 2), sr=sr, n_mfcc=13)
+    mfcc_delta = librosa.feature.delta(mfcc_harmonic)
+    # Per-frame vocal score: RMS of MFCC deltas across coefficients (skip c0=energy)
+    mfcc_delta_rms = np.sqrt(np.mean(mfcc_delta[1:] ** 2, axis=0))
+    mfcc_delta_max = float(np.max(mfcc_delta_rms)) if len(mfcc_delta_rms) > 0 else 1.0
+
+    return AudioAnalysisContext(
+        sample_rate=sr,
+        hop_length=HOP_LENGTH,
+        duration=duration,
+        onset_env=onset_env,
+        frame_times=librosa.frames_to_time(np.arange(len(onset_env)), sr=sr, hop_length=HOP_LENGTH),
+        onset_times=librosa.frames_to_time(onset_frames, sr=sr, hop_length=HOP_LENGTH),
+        spectral_centroid=librosa.feature.spectral_centroid(S=S, sr=sr)[0],
+        spectral_bandwidth=librosa.feature.spectral_bandwidth(S=S, sr=sr)[0],
+        spectral_flatness=librosa.feature.spectral_flatness(S=S)[0],
+        vocal_score=mfcc_delta_rms / max(mfcc_delta_max, 1e-6),
+        # Time-domain RMS; the S= variant is not sample-identical
+        rms=librosa.feature.rms(y=y, frame_length=N_FFT, hop_length=HOP_LENGTH)[0],
+        spectral_contrast=np.mean(librosa.feature.spectral_contrast(S=S, sr=sr), axis=0),
+        mel_db=librosa.power_to_db(mel_power, ref=np.max),
+    )
+
+
+def audio_content_hash(audio_path: str) -> str:
+    """SHA-1 of the file content (moving or renaming a song keeps its cache)."""
+    digest = hashlib.sha1()
+    with open(audio_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _cache_path(audio_path: str, cache_dir: Optional[str]) -> str:
+    if cache_dir is None:
+        cache_dir = os.path.join(os.path.dirname(os.path.abspath(audio_path)), CACHE_DIR_NAME)
+    key = f"{audio_content_hash(audio_path)}_v{_CACHE_VERSION}_{SAMPLE_RATE}_{N_FFT}_{HOP_LENGTH}"
+    return os.path.join(cache_dir, key + ".npz")
+
+
+def _load_cached(cache_path: str) -> Optional[AudioAnalysisContext]:
+    if not os.path.exists(cache_path):
+        return None
+    try:
+        with np.load(cache_path, allow_pickle=False) as data:
+            values = {}
+            for f in fields(AudioAnalysisContext):
+                value = data[f.name]
+                values[f.name] = value.item() if value.ndim == 0 else value
+        values['sample_rate'] = int(values['sample_rate'])
+        values['hop_length'] = int(values['hop_length'])
+        values['duration'] = float(values['duration'])
+        return AudioAnalysisContext(**values)
+    except Exception as e:
+        print(f"Ignoring unreadable analysis cache {cache_path}: {e}")
+        return None
+
+
+def _save_cached(cache_path: str, context: AudioAnalysisContext):
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        tmp_path = cache_path + ".tmp.npz"
+        np.savez(tmp_path, **{f.name: getattr(context, f.name) for f in fields(AudioAnalysisContext)})
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        print(f"Error saving analysis cache {cache_path}: {e}")
+
+
+def load_analysis_context(audio_path: str, cache_dir: Optional[str] = None,
+                          use_cache: bool = True) -> AudioAnalysisContext:
+    """Analysis context for audio_path, from the on-disk cache when possible.
+
+    Args:
+        audio_path: Path to the audio file (mp3, wav, etc.)
+        cache_dir: Where to keep cached contexts (default: .analysis_cache next to the file)
+        use_cache: False to always recompute and not touch the cache
+
+    Raises:
+        ImportError: If librosa is needed but not installed
+        FileNotFoundError: If audio file doesn't exist
+    """
+    if not use_cache:
+        return compute_analysis_context(audio_path)
+
+    cache_path = _cache_path(audio_path, cache_dir)
+    context = _load_cached(cache_path)
+    if context is None:
+        context = compute_analysis_context(audio_path)
+        _save_cached(cache_path, context)
+    return context
@@ -200,16 +200,13 @@ class AudioEngine:
                 outdata[:] = 0
                 return
 
-        # Mix audio from all lanes
+        # Mix audio from all lanes straight into the output buffer
         try:
-            mixed_audio = self.mixer.mix_frames(frames)
+            self.mixer.mix_into(outdata)
 
             with self._lock:
                 self._current_frame += frames
 
-            # Write mixed audio to output buffer
-            outdata[:] = mixed_audio
-
             # Periodically report position (every ~100ms)
             if self._position_callback and self._current_frame % 4410 == 0:
                 try:
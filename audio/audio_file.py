@@ -1,6 +1,9 @@
 """
 Audio file loading and management for QLCAutoShow.
 Supports WAV, MP3, FLAC, and OGG formats.
+
+Decoded audio goes through the on-disk PCM cache (see pcm_cache.py), so
+``audio_data`` is usually a read-only memory map rather than an array in RAM.
 """
 
 import numpy as np
@@ -9,6 +12,11 @@ from dataclasses import dataclass
 from typing import Optional, Tuple
 import os
 
+from .pcm_cache import PCMCache, USE_PCM_CACHE
+
+# Frames decoded per block when streaming a file into the PCM cache
+_DECODE_BLOCK_FRAMES = 65536
+
 
 @dataclass
 class AudioMetadata:
@@ -27,7 +35,8 @@ class AudioMetadata:
 class AudioFile:
     """Represents a loaded audio file with playback capabilities"""
 
-    def __init__(self, target_sample_rate: int = 44100):
+    def __init__(self, target_sample_rate: int = 44100, use_cache: bool = USE_PCM_CACHE,
+                 cache_dir: Optional[str] = None):
         self.file_path: Optional[str] = None
         self.audio_data: Optional[np.ndarray] = None
         self.sample_rate: int = 0
@@ -37,6 +46,7 @@ class AudioFile:
         self.target_sample_rate = target_sample_rate
         self.current_frame = 0
         self._is_loaded = False
+        self.pcm_cache: Optional[PCMCache] = PCMCache(cache_dir) if use_cache else None
 
     def load(self, file_path: str) -> bool:
         """Load audio file from disk"""
@@ -44,6 +54,72 @@ class AudioFile:
             print(f"Audio file not found: {file_path}")
             return False
 
+        if self.pcm_cache is not None:
+            audio_data = self.pcm_cache.open(file_path, self.target_sample_rate)
+            if audio_data is None:
+                audio_data = self._decode_to_cache(file_path)
+            if audio_data is not None:
+                self._set_audio(file_path, audio_data, self.target_sample_rate)
+                return True
+
+        if not self._decode(file_path):
+            return False
+
+        # Decoded in RAM (resampled or via librosa); keep the cached copy instead
+        if (self.pcm_cache is not None and self.sample_rate == self.target_sample_rate
+                and self.frames > 0):
+            cached = self.pcm_cache.store(file_path, self.sample_rate, self.audio_data)
+            if cached is not None:
+                self.audio_data = cached
+        return True
+
+    def _set_audio(self, file_path: str, audio_data: np.ndarray, sample_rate: int):
+        self.file_path = file_path
+        self.audio_data = audio_data
+        self.sample_rate = sample_rate
+        self.channels = 2
+        self.frames = len(audio_data)
+        self.duration = self.frames / self.sample_rate
+        self.current_frame = 0
+        self._is_loaded = True
+
+    def _decode_to_cache(self, file_path: str) -> Optional[np.ndarray]:
+        """
+        Stream-decode a file at the target sample rate straight into the PCM cache
+
+        Only the current block is held in RAM. Returns the cached audio,
+        memory-mapped, or None when the file needs resampling, is not
+        readable by soundfile, or reports an unreliable length; load()
+        then decodes it in memory.
+        """
+        try:
+            with sf.SoundFile(file_path) as f:
+                if f.samplerate != self.target_sample_rate or f.frames <= 0:
+                    return None
+                with self.pcm_cache.create(file_path, f.samplerate, f.frames) as writer:
+                    written = 0
+                    for block in f.blocks(blocksize=_DECODE_BLOCK_FRAMES, dtype='float32', always_2d=True):
+                        if block.shape[1] == 1:
+                            block = np.repeat(block, 2, axis=1)
+                        elif block.shape[1] > 2:
+                            block = self._downmix_to_stereo(block)
+                        end = written + len(block)
+                        if end > f.frames:
+                            return None
+                        writer.data[written:end] = block
+                        written = end
+                    if written != f.frames:
+                        return None
+                    return writer.commit()
+        except RuntimeError:
+            # Format soundfile cannot read (e.g. MP3 on older libsndfile)
+            return None
+        except Exception as e:
+            print(f"Could not stream {file_path} into the PCM cache: {e}")
+            return None
+
+    def _decode(self, file_path: str) -> bool:
+        """Decode a whole file into RAM, resampling to the target rate"""
         try:
             # Load audio using soundfile
             # This handles WAV, FLAC, OGG natively
@@ -223,6 +299,45 @@ class AudioFile:
 
         return audio_chunk
 
+    def mix_into(self, out: np.ndarray, gain: float = 1.0,
+                 scratch: Optional[np.ndarray] = None) -> int:
+        """
+        Add the next frames, scaled by ``gain``, into ``out`` in place
+
+        Reads ``len(out)`` frames from the current position and advances it
+        like read_frames(). Frames past the end of the file add nothing.
+        Allocation-free when ``gain`` is 1.0 or ``scratch`` is given.
+
+        Args:
+            out: Stereo float32 buffer of shape (frames, 2) to mix into
+            gain: Volume applied to this file's frames
+            scratch: Float32 buffer of at least ``len(out)`` frames for the scaled copy
+
+        Returns:
+            Number of frames read from the file
+        """
+        if not self._is_loaded or self.audio_data is None:
+            return 0
+
+        start = self.current_frame
+        count = max(0, min(len(out), self.frames - start))
+        if count:
+            chunk = self.audio_data[start:start + count]
+            target = out[:count]
+            if gain != 1.0:
+                if scratch is not None and len(scratch) >= count:
+                    chunk = np.multiply(chunk, gain, out=scratch[:count])
+                else:
+                    chunk = chunk * gain
+            np.add(target, chunk, out=target)
+            self.current_frame = start + count
+        return count
+
+    def skip(self, frame_count: int):
+        """Advance the position like read_frames() without reading any audio"""
+        if self._is_loaded:
+            self.current_frame = min(self.frames, self.current_frame + frame_count)
+
     def seek(self, frame_number: int) -> bool:
         """Seek to specific frame position"""
         if not self._is_loaded:
@@ -254,7 +369,7 @@ class AudioFile:
         return self._is_loaded
 
     def unload(self):
-        """Unload audio data from memory"""
+        """Unload audio data from memory (or unmap the cached copy)"""
         self.audio_data = None
         self._is_loaded = False
         self.current_frame = 0
@@ -28,6 +28,7 @@ class AudioMixer:
         self._lanes: Dict[int, AudioLaneState] = {}
         self._lock = threading.Lock()
         self._has_solo_lanes = False
+        self._scratch: Optional[np.ndarray] = None
 
     def add_lane(self, lane_id: int, audio_file: AudioFile, volume: float = 1.0):
         """
@@ -100,43 +101,48 @@ class AudioMixer:
         Returns:
             Mixed audio as numpy array of shape (frame_count, 2)
         """
-        # Create output buffer (stereo)
-        output = np.zeros((frame_count, 2), dtype=np.float32)
+        output = np.empty((frame_count, 2), dtype=np.float32)
+        self.mix_into(output)
+        return output
+
+    def mix_into(self, out: np.ndarray) -> bool:
+        """
+        Mix the next frames of all active lanes directly into ``out``
+
+        Gain, summing and clipping happen in place, so the audio callback
+        can pass the sounddevice buffer without allocating per block.
+
+        Args:
+            out: Stereo float32 buffer of shape (frames, 2), e.g. ``outdata``
+
+        Returns:
+            True if any lane contributed audio
+        """
+        frame_count = len(out)
+        out.fill(0.0)
 
         with self._lock:
             if not self._lanes:
-                return output
+                return False
 
             # Check if any lanes should play
             has_audio = False
+            scratch = self._get_scratch(frame_count)
 
             for lane_state in self._lanes.values():
                 # Skip if disabled or not loaded
                 if not lane_state.enabled or not lane_state.audio_file.is_loaded():
                     continue
 
-                # Skip if muted
-                if lane_state.muted:
-                    # Still need to advance the audio file position
-                    lane_state.audio_file.read_frames(frame_count)
-                    continue
-
-                # Handle solo logic
-                if self._has_solo_lanes and not lane_state.solo:
-                    # Still need to advance the audio file position
-                    lane_state.audio_file.read_frames(frame_count)
+                # Muted lanes, and other lanes while any lane is solo, still
+                # advance their audio file position
+                if lane_state.muted or (self._has_solo_lanes and not lane_state.solo):
+                    lane_state.audio_file.skip(frame_count)
                     continue
 
-                # Read frames from this lane
+                # Mix this lane into the output
                 try:
-                    frames = lane_state.audio_file.read_frames(frame_count)
-
-                    # Apply volume
-                    if lane_state.volume != 1.0:
-                        frames = frames * lane_state.volume
-
-                    # Mix into output
-                    output += frames
+                    lane_state.audio_file.mix_into(out, lane_state.volume, scratch)
                     has_audio = True
 
                 except Exception as e:
@@ -145,9 +151,15 @@ class AudioMixer:
 
         # Prevent clipping by limiting output range
         if has_audio:
-            output = np.clip(output, -1.0, 1.0)
+            np.clip(out, -1.0, 1.0, out=out)
 
-        return output
+        return has_audio
+
+    def _get_scratch(self, frame_count: int) -> np.ndarray:
+        """Scratch buffer for scaled lane audio, reallocated only when the block grows"""
+        if self._scratch is None or len(self._scratch) < frame_count:
+            self._scratch = np.empty((frame_count, 2), dtype=np.float32)
+        return self._scratch
 
     def seek_all_lanes(self, time_seconds: float):
         """Seek all lanes to specific time position"""
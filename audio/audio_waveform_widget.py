@@ -165,11 +165,11 @@ class AudioWaveformWidget(QWidget):
             self.draw_no_audio_state(painter, width, height)
             return
 
-        # Draw waveform
-        self.draw_waveform(painter, width, height)
+        # Draw waveform, only where it needs repainting (e.g. the playhead strip)
+        self.draw_waveform(painter, width, height, event.rect())
 
-    def draw_waveform(self, painter: QPainter, width: int, height: int):
-        """Draw the actual waveform"""
+    def draw_waveform(self, painter: QPainter, width: int, height: int, rect=None):
+        """Draw the actual waveform, limited to the columns of ``rect`` if given"""
         if not self.waveform_data:
             return
 
@@ -180,16 +180,18 @@ class AudioWaveformWidget(QWidget):
         if not peaks or len(peaks.min_peaks) == 0:
             return
 
-        # Calculate visible time range
-        visible_start_time = self.pixel_to_time(self.scroll_offset)
-        visible_end_time = self.pixel_to_time(self.scroll_offset + width)
+        # Calculate visible time range, padded so the envelope's closing
+        # edges fall outside the repainted area
+        left, right = (rect.left() - 2, rect.right() + 3) if rect is not None else (0, width)
+        visible_start_time = self.pixel_to_time(self.scroll_offset + max(0, left))
+        visible_end_time = self.pixel_to_time(self.scroll_offset + min(width, right))
 
         # Calculate peak indices for visible range
         samples_per_peak = peaks.resolution
         sample_rate = self.waveform_data.sample_rate
 
         start_peak_idx = int(visible_start_time * sample_rate / samples_per_peak)
-        end_peak_idx = int(visible_end_time * sample_rate / samples_per_peak) + 1
+        end_peak_idx = int(visible_end_time * sample_rate / samples_per_peak) + 2
 
         # Clamp to valid range
         start_peak_idx = max(0, start_peak_idx)
@@ -198,28 +200,30 @@ class AudioWaveformWidget(QWidget):
         if start_peak_idx >= end_peak_idx:
             return
 
-        # Create polygon for waveform envelope
-        top_points = []
-        bottom_points = []
-
-        center_y = height / 2
-        scale = height / 2.5  # Leave some margin
+        # Slice only the visible peaks; with memory-mapped levels this is
+        # all that gets read from disk
+        min_vals = np.asarray(peaks.min_peaks[start_peak_idx:end_peak_idx], dtype=np.float64)
+        max_vals = np.asarray(peaks.max_peaks[start_peak_idx:end_peak_idx], dtype=np.float64)
 
-        for i in range(start_peak_idx, end_peak_idx):
-            # Calculate time and x position for this peak
-            peak_time = (i * samples_per_peak) / sample_rate
-            x = self.time_to_pixel(peak_time) - self.scroll_offset
+        # x position of each peak, truncated like time_to_pixel()
+        peak_times = np.arange(start_peak_idx, end_peak_idx) * samples_per_peak / sample_rate
+        xs = (peak_times * self.pixels_per_second * self.zoom_factor).astype(np.int64) - self.scroll_offset
 
-            # Get peak values
-            min_val = peaks.min_peaks[i]
-            max_val = peaks.max_peaks[i]
+        # Merge peaks falling on the same pixel column into one envelope point
+        xs, column_starts = np.unique(xs, return_index=True)
+        max_vals = np.maximum.reduceat(max_vals, column_starts)
+        min_vals = np.minimum.reduceat(min_vals, column_starts)
 
-            # Scale to widget coordinates
-            top_y = center_y - (max_val * scale)
-            bottom_y = center_y - (min_val * scale)
+        # Scale to widget coordinates
+        center_y = height / 2
+        scale = height / 2.5  # Leave some margin
+        top_ys = center_y - max_vals * scale
+        bottom_ys = center_y - min_vals * scale
 
-            top_points.append(QPointF(x, top_y))
-            bottom_points.append(QPointF(x, bottom_y))
+        # Create polygon for waveform envelope
+        x_list = xs.tolist()
+        top_points = [QPointF(x, y) for x, y in zip(x_list, top_ys.tolist())]
+        bottom_points = [QPointF(x, y) for x, y in zip(x_list, bottom_ys.tolist())]
 
         # Create closed polygon (top line forward, bottom line backward)
         polygon = QPolygonF(top_points + list(reversed(bottom_points)))
@@ -0,0 +1,216 @@
+"""
+Decoded-PCM cache for audio lanes.
+
+AudioFile used to decode every song into a float32 stereo array held in
+RAM for as long as the lane existed. On a long set with several audio
+lanes that is gigabytes, decoded again (and resampled) on every load.
+
+PCMCache stores decoded audio once, already at the playback sample rate,
+as a ``.npy`` file under ``~/.qlcautoshow/pcm_cache`` and hands it back
+memory-mapped read-only. The OS then pages in only what playback and
+analysis touch, and lanes playing the same file share pages. Entries are
+keyed by source path, mtime, size and sample rate, so edited files are
+decoded again.
+
+At an hour of audio per ~1.3 GB the cache is bounded: writing an entry
+drops the older entries of the same source file, then the least recently
+used entries until the cache fits in PCM_CACHE_MAX_GB.
+"""
+
+import hashlib
+import os
+from typing import Optional
+
+import numpy as np
+
+# Set PCM_CACHE=0 to decode into RAM as before
+USE_PCM_CACHE = os.environ.get('PCM_CACHE', '1') != '0'
+# Total size the cache is trimmed to when a new entry is written
+_MAX_CACHE_BYTES = int(float(os.environ.get('PCM_CACHE_MAX_GB', '10')) * 1024 ** 3)
+
+# Bump when the decoding (downmix, resampling) changes
+_CACHE_VERSION = 1
+_DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".qlcautoshow", "pcm_cache")
+_EXTENSION = '.pcm.npy'
+
+
+class PCMCache:
+    """On-disk cache of decoded stereo float32 audio, read back memory-mapped."""
+
+    def __init__(self, cache_dir: Optional[str] = None, max_bytes: Optional[int] = None):
+        """
+        Initialize the cache
+
+        Args:
+            cache_dir: Directory to store decoded audio in
+            max_bytes: Size the cache is trimmed to (default PCM_CACHE_MAX_GB)
+        """
+        self.cache_dir = cache_dir or _DEFAULT_CACHE_DIR
+        self.max_bytes = _MAX_CACHE_BYTES if max_bytes is None else max_bytes
+
+    def get_cache_path(self, file_path: str, sample_rate: int) -> str:
+        """Cache file path for a source file decoded at ``sample_rate``
+
+        The name starts with a hash of the source path alone, so all
+        entries of one source file can be found again.
+        """
+        try:
+            stat = os.stat(file_path)
+            source = f"{stat.st_mtime}_{stat.st_size}"
+        except OSError:
+            source = ""
+        source_hash = hashlib.md5(os.path.abspath(file_path).encode()).hexdigest()
+        cache_key = f"{_CACHE_VERSION}_{source}_{sample_rate}"
+        entry_hash = hashlib.md5(cache_key.encode()).hexdigest()[:16]
+        return os.path.join(self.cache_dir, f"{source_hash}_{entry_hash}{_EXTENSION}")
+
+    def open(self, file_path: str, sample_rate: int) -> Optional[np.ndarray]:
+        """
+        Map cached audio for a source file
+
+        Returns:
+            Read-only (frames, 2) float32 array backed by the cache file,
+            or None if there is no usable entry
+        """
+        cache_path = self.get_cache_path(file_path, sample_rate)
+        if not os.path.exists(cache_path):
+            return None
+        try:
+            audio_data = np.load(cache_path, mmap_mode='r')
+        except (OSError, ValueError) as e:
+            print(f"Error reading PCM cache {cache_path}: {e}")
+            return None
+        if audio_data.dtype != np.float32 or audio_data.ndim != 2 or audio_data.shape[1] != 2:
+            return None
+        # Mark as recently used for eviction
+        try:
+            os.utime(cache_path)
+        except OSError:
+            pass
+        return audio_data
+
+    def create(self, file_path: str, sample_rate: int, frames: int) -> 'PCMCacheWriter':
+        """Start a cache entry of ``frames`` frames, filled in place before committing"""
+        cache_path = self.get_cache_path(file_path, sample_rate)
+        self._evict(cache_path, frames * 2 * np.dtype(np.float32).itemsize)
+        return PCMCacheWriter(cache_path, frames)
+
+    def store(self, file_path: str, sample_rate: int, audio_data: np.ndarray) -> Optional[np.ndarray]:
+        """
+        Write decoded audio to the cache
+
+        Returns:
+            The cached copy, memory-mapped, or None if it could not be written
+        """
+        try:
+            writer = self.create(file_path, sample_rate, len(audio_data))
+        except OSError as e:
+            print(f"Error writing PCM cache: {e}")
+            return None
+        with writer:
+            writer.data[:] = audio_data
+            return writer.commit()
+
+    def clear_cache(self):
+        """Remove all cached audio (entries still mapped on Windows are kept)"""
+        try:
+            filenames = os.listdir(self.cache_dir)
+        except FileNotFoundError:
+            return
+        except OSError as e:
+            print(f"Error clearing PCM cache: {e}")
+            return
+        for filename in filenames:
+            if filename.endswith(_EXTENSION):
+                _remove(os.path.join(self.cache_dir, filename))
+
+    def _evict(self, cache_path: str, incoming_bytes: int):
+        """
+        Make room for a new entry at ``cache_path``
+
+        Drops the other entries of the same source file (an older version
+        of it, or another sample rate), then the least recently used
+        entries until the cache plus ``incoming_bytes`` fits in max_bytes.
+        """
+        try:
+            filenames = os.listdir(self.cache_dir)
+        except OSError:
+            return
+        source_prefix = os.path.basename(cache_path).split('_', 1)[0] + '_'
+        entries = []
+        for filename in filenames:
+            path = os.path.join(self.cache_dir, filename)
+            if not filename.endswith(_EXTENSION) or path == cache_path:
+                continue
+            if filename.startswith(source_prefix):
+                _remove(path)
+                continue
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        total = incoming_bytes + sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            if _remove(path):
+                total -= size
+
+
+def _remove(path: str) -> bool:
+    """Delete a cache file; False if it is gone already or still in use"""
+    try:
+        os.remove(path)
+        return True
+    except OSError:
+        return False
+
+
+class PCMCacheWriter:
+    """
+    A cache entry being written
+
+    ``data`` is a writable (frames, 2) memory map of a temporary file, so
+    decoders can fill it block by block without holding the whole song in
+    RAM. ``commit()`` publishes the file under its cache name; leaving the
+    ``with`` block without committing discards it.
+    """
+
+    def __init__(self, cache_path: str, frames: int):
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        self.cache_path = cache_path
+        self._tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        self.data = np.lib.format.open_memmap(
+            self._tmp_path, mode='w+', dtype=np.float32, shape=(frames, 2)
+        )
+        self._committed = False
+
+    def commit(self) -> Optional[np.ndarray]:
+        """Publish the entry and return it memory-mapped read-only"""
+        try:
+            self.data.flush()
+            self.data = None
+            os.replace(self._tmp_path, self.cache_path)
+            self._committed = True
+            return np.load(self.cache_path, mmap_mode='r')
+        except (OSError, ValueError) as e:
+            print(f"Error writing PCM cache: {e}")
+            return None
+
+    def discard(self):
+        """Drop the entry without publishing it"""
+        self.data = None
+        try:
+            os.remove(self._tmp_path)
+        except OSError:
+            pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if not self._committed:
+            self.discard()
+        return False
@@ -9,11 +9,7 @@ import numpy as np
 from dataclasses import dataclass, field
 from typing import List, Tuple, Optional
 
-try:
-    import librosa
-    LIBROSA_AVAILABLE = True
-except ImportError:
-    LIBROSA_AVAILABLE = False
+from .analysis_context import LIBROSA_AVAILABLE, AudioAnalysisContext, load_analysis_context  # noqa: F401  re-exported
 
 
 @dataclass
@@ -41,12 +37,14 @@ class SongAnalysis:
     duration: float = 0.0
 
 
-def analyze_song(audio_path: str, song_structure) -> SongAnalysis:
+def analyze_song(audio_path: str, song_structure,
+                 context: Optional[AudioAnalysisContext] = None) -> SongAnalysis:
     """Run full spectral analysis on a song file.
 
     Args:
         audio_path: Path to the audio file (mp3, wav, etc.)
         song_structure: SongStructure instance with parts defining section boundaries
+        context: Pre-computed analysis context (default: load_analysis_context(audio_path))
 
     Returns:
         SongAnalysis with per-section results
@@ -55,62 +53,14 @@ def analyze_song(audio_path: str, song_structure) -> SongAnalysis:
         ImportError: If librosa is not installed
         FileNotFoundError: If audio file doesn't exist
     """
-    if not LIBROSA_AVAILABLE:
-        raise ImportError("librosa is required for audio analysis. Install with: pip install librosa")
-
-    # Load audio
-    y, sr = librosa.load(audio_path, sr=22050, mono=True)
-    duration = librosa.get_duration(y=y, sr=sr)
-
-    # Compute global features
-    hop_length = 512
-    n_fft = 2048
-
-    # Spectral flux (onset strength envelope)
-    onset_env = librosa.onset.onset_strength(y=y, sr=sr, hop_length=hop_length, n_fft=n_fft)
-
-    # Onset detection for transient sharpness
-    onset_frames = librosa.onset.onset_detect(
-        y=y, sr=sr, hop_length=hop_length, onset_envelope=onset_env, backtrack=True
-    )
-    onset_times = librosa.frames_to_time(onset_frames, sr=sr, hop_length=hop_length)
-
-    # Spectral centroid
-    spectral_centroid = librosa.feature.spectral_centroid(y=y, sr=sr, hop_length=hop_length, n_fft=n_fft)[0]
-
-    # Spectral bandwidth (for richness)
-    spectral_bandwidth = librosa.feature.spectral_bandwidth(y=y, sr=sr, hop_length=hop_length, n_fft=n_fft)[0]
-
-    # Spectral flatness (for richness — flat = noise-like = rich)
-    spectral_flatness = librosa.feature.spectral_flatness(y=y, hop_length=hop_length, n_fft=n_fft)[0]
-
-    # STFT for spectral richness
-    S = np.abs(librosa.stft(y, n_fft=n_fft, hop_length=hop_length))
-    freqs = librosa.fft_frequencies(sr=sr, n_fft=n_fft)
-
-    # HPSS + MFCC deltas for vocal detection
-    # Harmonic component isolates tonal content (removes drums/transients)
-    S_harmonic, _ = librosa.decompose.hpss(S)
-    # MFCCs on harmonic component — vocals have high delta variance (phoneme changes)
-    mfcc_harmonic = librosa.feature.mfcc(S=librosa.power_to_db(S_harmonic ** 2), sr=sr, n_mfcc=13)
-    mfcc_delta = librosa.feature.delta(mfcc_harmonic)
-    # Per-frame vocal score: RMS of MFCC deltas across coefficients (skip c0=energy)
-    mfcc_delta_rms = np.sqrt(np.mean(mfcc_delta[1:] ** 2, axis=0))
-    # Normalize to 0-1 globally
-    mfcc_delta_max = float(np.max(mfcc_delta_rms)) if len(mfcc_delta_rms) > 0 else 1.0
-    vocal_score_frames = mfcc_delta_rms / max(mfcc_delta_max, 1e-6)
+    if context is None:
+        context = load_analysis_context(audio_path)
 
-    # RMS energy (loudness) — per frame
-    rms = librosa.feature.rms(y=y, frame_length=n_fft, hop_length=hop_length)[0]
-
-    # Spectral contrast — peak-to-valley per frequency band, per frame
-    # Returns shape (n_bands+1, n_frames), default 7 bands
-    spec_contrast = librosa.feature.spectral_contrast(y=y, sr=sr, n_fft=n_fft, hop_length=hop_length)
-    # Average across bands for a single per-frame contrast score
-    spec_contrast_avg = np.mean(spec_contrast, axis=0)
-
-    # Frame times
-    frame_times = librosa.frames_to_time(np.arange(len(onset_env)), sr=sr, hop_length=hop_length)
+    onset_env = context.onset_env
+    spectral_centroid = context.spectral_centroid
+    spectral_bandwidth = context.spectral_bandwidth
+    rms = context.rms
+    spec_contrast_avg = context.spectral_contrast
 
     # Global normalization ranges
     flux_min = float(np.min(onset_env))
@@ -128,20 +78,16 @@ def analyze_song(audio_path: str, song_structure) -> SongAnalysis:
             start_time=part.start_time,
             end_time=part.start_time + part.duration,
             onset_env=onset_env,
-            onset_times=onset_times,
+            onset_times=context.onset_times,
             spectral_centroid=spectral_centroid,
             spectral_bandwidth=spectral_bandwidth,
-            spectral_flatness=spectral_flatness,
-            S=S,
-            freqs=freqs,
-            frame_times=frame_times,
-            sr=sr,
-            hop_length=hop_length,
+            spectral_flatness=context.spectral_flatness,
+            frame_times=context.frame_times,
             flux_min=flux_min,
             flux_max=flux_max,
             centroid_max=centroid_max,
             bandwidth_max=bandwidth_max,
-            vocal_score_frames=vocal_score_frames,
+            vocal_score_frames=context.vocal_score,
             rms=rms,
             rms_max=rms_max,
             spec_contrast_avg=spec_contrast_avg,
@@ -152,8 +98,8 @@ def analyze_song(audio_path: str, song_structure) -> SongAnalysis:
     return SongAnalysis(
         sections=sections,
         global_flux_range=(flux_min, flux_max),
-        sample_rate=sr,
-        duration=duration,
+        sample_rate=context.sample_rate,
+        duration=context.duration,
     )
 
 
@@ -166,11 +112,7 @@ def _analyze_section(
     spectral_centroid: np.ndarray,
     spectral_bandwidth: np.ndarray,
     spectral_flatness: np.ndarray,
-    S: np.ndarray,
-    freqs: np.ndarray,
     frame_times: np.ndarray,
-    sr: int,
-    hop_length: int,
     flux_min: float,
     flux_max: float,
     centroid_max: float,
@@ -295,7 +237,8 @@ class FrameFeatures:
     mel_times: Optional[np.ndarray] = field(default=None, repr=False)
 
 
-def compute_frame_features(audio_path: str, max_display_points: int = 800) -> FrameFeatures:
+def compute_frame_features(audio_path: str, max_display_points: int = 800,
+                           context: Optional[AudioAnalysisContext] = None) -> FrameFeatures:
     """Compute all 5 audio features at frame level, lightly smoothed.
 
     Returns a continuous envelope for flux, transient, richness, vocal,
@@ -304,24 +247,22 @@ def compute_frame_features(audio_path: str, max_display_points: int = 800) -> Fr
     Args:
         audio_path: Path to audio file
         max_display_points: Downsample to this many points for display
+        context: Pre-computed analysis context (default: load_analysis_context(audio_path))
 
     Returns:
         FrameFeatures with all 5 features at continuous resolution
     """
-    if not LIBROSA_AVAILABLE:
-        raise ImportError("librosa required for audio analysis")
+    import librosa
     from scipy.ndimage import uniform_filter1d
 
-    y, sr = librosa.load(audio_path, sr=22050, mono=True)
-    duration = librosa.get_duration(y=y, sr=sr)
+    if context is None:
+        context = load_analysis_context(audio_path)
 
-    hop_length = 512
-    n_fft = 2048
     smooth_window = 5  # ~115ms at 43fps — light smoothing, keeps transients
 
     # ── Onset strength (flux) ──
-    onset_env = librosa.onset.onset_strength(y=y, sr=sr, hop_length=hop_length, n_fft=n_fft)
-    frame_times = librosa.frames_to_time(np.arange(len(onset_env)), sr=sr, hop_length=hop_length)
+    onset_env = context.onset_env
+    frame_times = context.frame_times
     n_frames = len(onset_env)
 
     # Smooth first, then normalize — preserves 0-1 range after smoothing
@@ -339,9 +280,9 @@ def compute_frame_features(audio_path: str, max_display_points: int = 800) -> Fr
     norm_transient = np.clip(transient_raw / max(t_max, 1e-6), 0.0, 1.0)
 
     # ── Spectral features (centroid, bandwidth, flatness) ──
-    spectral_centroid = librosa.feature.spectral_centroid(y=y, sr=sr, hop_length=hop_length, n_fft=n_fft)[0]
-    spectral_bandwidth = librosa.feature.spectral_bandwidth(y=y, sr=sr, hop_length=hop_length, n_fft=n_fft)[0]
-    spectral_flatness = librosa.feature.spectral_flatness(y=y, hop_length=hop_length, n_fft=n_fft)[0]
+    spectral_centroid = context.spectral_centroid
+    spectral_bandwidth = context.spectral_bandwidth
+    spectral_flatness = context.spectral_flatness
 
     # Ensure same length as onset_env (they should be, but guard)
     min_len = min(n_frames, len(spectral_centroid), len(spectral_bandwidth), len(spectral_flatness))
@@ -358,14 +299,7 @@ def compute_frame_features(audio_path: str, max_display_points: int = 800) -> Fr
         norm_richness = np.full(min_len, 0.5)
 
     # ── Vocal presence: HPSS + MFCC delta variance ──
-    S = np.abs(librosa.stft(y, n_fft=n_fft, hop_length=hop_length))
-    S_harmonic, _ = librosa.decompose.hpss(S)
-    mfcc_h = librosa.feature.mfcc(S=librosa.power_to_db(S_harmonic ** 2), sr=sr, n_mfcc=13)
-    mfcc_d = librosa.feature.delta(mfcc_h)
-    # Per-frame vocal score: RMS of MFCC deltas (skip c0=energy)
-    mfcc_d_rms = np.sqrt(np.mean(mfcc_d[1:] ** 2, axis=0))
-    mfcc_d_max = float(np.max(mfcc_d_rms)) if len(mfcc_d_rms) > 0 else 1.0
-    raw_vocal = mfcc_d_rms[:min_len] / max(mfcc_d_max, 1e-6)
+    raw_vocal = context.vocal_score[:min_len]
     norm_vocal = np.clip(uniform_filter1d(raw_vocal.astype(float), smooth_window * 3), 0.0, 1.0)
 
     # ── Centroid: smooth then normalize to 0-1 ──
@@ -377,7 +311,7 @@ def compute_frame_features(audio_path: str, max_display_points: int = 800) -> Fr
         norm_cent = np.full(min_len, 0.5)
 
     # ── RMS energy (loudness): smooth then normalize to 0-1 ──
-    rms_raw = librosa.feature.rms(y=y, frame_length=n_fft, hop_length=hop_length)[0]
+    rms_raw = context.rms
     smoothed_rms = uniform_filter1d(rms_raw[:min_len].astype(float), smooth_window)
     rms_mn, rms_mx = float(np.min(smoothed_rms)), float(np.max(smoothed_rms))
     if rms_mx > rms_mn:
@@ -386,8 +320,7 @@ def compute_frame_features(audio_path: str, max_display_points: int = 800) -> Fr
         norm_rms = np.full(min_len, 0.5)
 
     # ── Spectral contrast: smooth then normalize to 0-1 ──
-    spec_contrast = librosa.feature.spectral_contrast(y=y, sr=sr, n_fft=n_fft, hop_length=hop_length)
-    raw_contrast = np.mean(spec_contrast, axis=0)[:min_len]
+    raw_contrast = context.spectral_contrast[:min_len]
     smoothed_contrast = uniform_filter1d(raw_contrast.astype(float), smooth_window)
     ct_mn, ct_mx = float(np.min(smoothed_contrast)), float(np.max(smoothed_contrast))
     if ct_mx > ct_mn:
@@ -403,15 +336,13 @@ def compute_frame_features(audio_path: str, max_display_points: int = 800) -> Fr
 
     # ── Mel spectrogram for inspector display ──
     # Downsample time axis to max_display_points for display performance
-    n_mels = 128
-    mel_spec = librosa.feature.melspectrogram(
-        y=y, sr=sr, n_fft=n_fft, hop_length=hop_length, n_mels=n_mels,
-    )
-    mel_db = librosa.power_to_db(mel_spec, ref=np.max)
+    sr = context.sample_rate
+    hop_length = context.hop_length
+    mel_db = context.mel_db
     mel_times_full = librosa.frames_to_time(
         np.arange(mel_db.shape[1]), sr=sr, hop_length=hop_length,
     )
-    mel_freqs = librosa.mel_frequencies(n_mels=n_mels, fmin=0, fmax=sr / 2)
+    mel_freqs = librosa.mel_frequencies(n_mels=mel_db.shape[0], fmin=0, fmax=sr / 2)
 
     # Downsample time axis by picking evenly spaced columns
     n_mel_frames = mel_db.shape[1]
@@ -433,7 +364,7 @@ def compute_frame_features(audio_path: str, max_display_points: int = 800) -> Fr
         contrast=[float(norm_contrast[i]) for i in indices],
         sample_rate=sr,
         hop_length=hop_length,
-        duration=duration,
+        duration=context.duration,
         mel_spectrogram_db=mel_db,
         mel_frequencies=mel_freqs,
         mel_times=mel_times_ds,
@@ -455,53 +386,34 @@ class BeatFeatures:
     centroid: List[float] = field(default_factory=list)
 
 
-def compute_beat_features(audio_path: str, song_structure) -> BeatFeatures:
+def compute_beat_features(audio_path: str, song_structure,
+                          context: Optional[AudioAnalysisContext] = None) -> BeatFeatures:
     """Compute audio features per beat using BPM from song structure.
 
     Args:
         audio_path: Path to audio file
         song_structure: SongStructure with parts (provides BPM + time signatures)
+        context: Pre-computed analysis context (default: load_analysis_context(audio_path))
 
     Returns:
         BeatFeatures with one value per beat across the entire song
     """
-    if not LIBROSA_AVAILABLE:
-        raise ImportError("librosa required for audio analysis")
+    if context is None:
+        context = load_analysis_context(audio_path)
 
-    y, sr = librosa.load(audio_path, sr=22050, mono=True)
-
-    hop_length = 512
-    n_fft = 2048
-
-    # Compute frame-level features (same as analyze_song)
-    onset_env = librosa.onset.onset_strength(y=y, sr=sr, hop_length=hop_length, n_fft=n_fft)
-    frame_times = librosa.frames_to_time(np.arange(len(onset_env)), sr=sr, hop_length=hop_length)
-    spectral_centroid = librosa.feature.spectral_centroid(y=y, sr=sr, hop_length=hop_length, n_fft=n_fft)[0]
-    spectral_bandwidth = librosa.feature.spectral_bandwidth(y=y, sr=sr, hop_length=hop_length, n_fft=n_fft)[0]
-    spectral_flatness = librosa.feature.spectral_flatness(y=y, hop_length=hop_length, n_fft=n_fft)[0]
-    S = np.abs(librosa.stft(y, n_fft=n_fft, hop_length=hop_length))
-    freqs = librosa.fft_frequencies(sr=sr, n_fft=n_fft)
+    onset_env = context.onset_env
+    frame_times = context.frame_times
+    spectral_centroid = context.spectral_centroid
+    spectral_bandwidth = context.spectral_bandwidth
+    spectral_flatness = context.spectral_flatness
+    onset_times_arr = context.onset_times
+    vocal_score_frames = context.vocal_score
 
     # Global normalization
     flux_min, flux_max = float(np.min(onset_env)), float(np.max(onset_env))
     flux_range = flux_max - flux_min if flux_max > flux_min else 1.0
-    centroid_max = float(np.max(spectral_centroid)) if len(spectral_centroid) > 0 else 1.0
     bandwidth_max = float(np.max(spectral_bandwidth)) if len(spectral_bandwidth) > 0 else 1.0
 
-    # Onset detection for transient density
-    onset_frames = librosa.onset.onset_detect(
-        y=y, sr=sr, hop_length=hop_length, onset_envelope=onset_env, backtrack=True
-    )
-    onset_times_arr = librosa.frames_to_time(onset_frames, sr=sr, hop_length=hop_length)
-
-    # HPSS + MFCC deltas for vocal detection (pre-computed per frame)
-    S_harmonic, _ = librosa.decompose.hpss(S)
-    mfcc_h = librosa.feature.mfcc(S=librosa.power_to_db(S_harmonic ** 2), sr=sr, n_mfcc=13)
-    mfcc_d = librosa.feature.delta(mfcc_h)
-    mfcc_d_rms = np.sqrt(np.mean(mfcc_d[1:] ** 2, axis=0))
-    mfcc_d_max = float(np.max(mfcc_d_rms)) if len(mfcc_d_rms) > 0 else 1.0
-    vocal_score_frames = mfcc_d_rms / max(mfcc_d_max, 1e-6)
-
     # Generate beat timestamps from song structure
     beat_starts = []
     for part in song_structure.parts:
@@ -1,24 +1,38 @@
 """
 Waveform analysis and peak extraction for visualization.
 Generates multi-resolution peak data for efficient waveform display at different zoom levels.
+
+Peaks are cached per audio file as a small JSON index (``.waveform``) plus
+one binary ``.npy`` file per resolution holding float32 min/max/rms rows.
+Cached levels are memory-mapped only when a zoom level first needs them.
 """
 
 import numpy as np
+import math
 import os
 import json
 import hashlib
-from typing import Optional, Tuple, List
+from typing import Dict, Iterable, Optional, Tuple, List, Union
 from dataclasses import dataclass, asdict
 from .audio_file import AudioFile
 
+# Bump when the cache layout changes; older indexes are regenerated
+_CACHE_VERSION = 2
+_LEVEL_EXTENSION = '.peaks.npy'
+
+# Frames of audio reduced per block while generating peaks
+_GENERATE_BLOCK_FRAMES = 1 << 20
+
+PeakValues = Union[List[float], np.ndarray]
+
 
 @dataclass
 class WaveformPeaks:
     """Container for waveform peak data at a specific resolution"""
     resolution: int  # Samples per peak
-    min_peaks: List[float]  # Minimum values
-    max_peaks: List[float]  # Maximum values
-    rms_peaks: List[float]  # RMS values for visual intensity
+    min_peaks: PeakValues  # Minimum values
+    max_peaks: PeakValues  # Maximum values
+    rms_peaks: PeakValues  # RMS values for visual intensity
 
 
 class WaveformData:
@@ -29,10 +43,46 @@ class WaveformData:
         self.sample_rate = sample_rate
         self.duration = duration
         self.peak_levels: dict[int, WaveformPeaks] = {}  # resolution -> peaks
+        self._level_files: Dict[int, str] = {}  # resolution -> cache file not mapped yet
 
     def add_peak_level(self, peaks: WaveformPeaks):
         """Add a peak level to the waveform data"""
         self.peak_levels[peaks.resolution] = peaks
+        self._level_files.pop(peaks.resolution, None)
+
+    def add_cached_level(self, resolution: int, level_path: str):
+        """Add a peak level stored in a cache file, mapped on first use"""
+        if resolution not in self.peak_levels:
+            self._level_files[resolution] = level_path
+
+    @property
+    def resolutions(self) -> List[int]:
+        """All available resolutions, loaded or not"""
+        return sorted(set(self.peak_levels) | set(self._level_files))
+
+    def get_peak_level(self, resolution: int) -> Optional[WaveformPeaks]:
+        """Peaks at ``resolution``, memory-mapping the cache file if needed"""
+        peaks = self.peak_levels.get(resolution)
+        if peaks is not None:
+            return peaks
+
+        level_path = self._level_files.pop(resolution, None)
+        if level_path is None:
+            return None
+        try:
+            level = np.load(level_path, mmap_mode='r')
+        except (OSError, ValueError) as e:
+            print(f"Error loading waveform level {resolution}: {e}")
+            return None
+
+        peaks = WaveformPeaks(
+            resolution=resolution,
+            min_peaks=level[0],
+            max_peaks=level[1],
+            rms_peaks=level[2]
+        )
+        self.peak_levels[resolution] = peaks
+        return peaks
 
     def get_peaks_for_zoom(self, pixels_per_second: float) -> Optional[WaveformPeaks]:
         """
@@ -44,23 +94,24 @@ class WaveformData:
         Returns:
             WaveformPeaks object or None if no suitable resolution available
         """
-        if not self.peak_levels:
+        resolutions = self.resolutions
+        if not resolutions:
             return None
 
         # Calculate samples per pixel
         samples_per_pixel = self.sample_rate / pixels_per_second
 
         # Find the peak level with resolution closest to but not less than samples_per_pixel
-        suitable_resolutions = [res for res in self.peak_levels.keys()
+        suitable_resolutions = [res for res in resolutions
                                 if res >= samples_per_pixel * 0.5]
 
         if not suitable_resolutions:
             # Fall back to highest resolution available
-            return self.peak_levels[max(self.peak_levels.keys())]
+            return self.get_peak_level(max(resolutions))
 
         # Use the finest suitable resolution
         best_resolution = min(suitable_resolutions)
-        return self.peak_levels[best_resolution]
+        return self.get_peak_level(best_resolution)
 
 
 class WaveformAnalyzer:
@@ -114,14 +165,15 @@ class WaveformAnalyzer:
             audio_file.duration
         )
 
-        # Generate peaks at each resolution
-        for resolution in self.RESOLUTIONS:
-            peaks = self._generate_peaks(audio_file.audio_data, resolution)
-            if peaks:
-                waveform_data.add_peak_level(peaks)
+        # Generate peaks at each resolution in one pass over the audio
+        for peaks in self._generate_levels(audio_file.audio_data, self.RESOLUTIONS):
+            waveform_data.add_peak_level(peaks)
 
-        # Cache the results
-        self._save_to_cache(waveform_data)
+        # Cache the results, then keep only the levels the display maps in
+        if self._save_to_cache(waveform_data):
+            cached_data = self._load_from_cache(audio_file.file_path)
+            if cached_data:
+                return cached_data
 
         return waveform_data
 
@@ -136,46 +188,66 @@ class WaveformAnalyzer:
         Returns:
             WaveformPeaks object
         """
-        try:
-            # Convert stereo to mono for waveform display (simple average)
-            if audio_data.shape[1] == 2:
-                mono_data = np.mean(audio_data, axis=1)
-            else:
-                mono_data = audio_data[:, 0]
+        levels = self._generate_levels(audio_data, [resolution])
+        return levels[0] if levels else None
 
-            # Calculate number of peaks
-            num_peaks = (len(mono_data) + resolution - 1) // resolution
-
-            min_peaks = []
-            max_peaks = []
-            rms_peaks = []
+    def _generate_levels(self, audio_data: np.ndarray, resolutions: Iterable[int]) -> List[WaveformPeaks]:
+        """
+        Generate peak data at several resolutions in one pass
 
-            # Generate peaks
-            for i in range(num_peaks):
-                start_idx = i * resolution
-                end_idx = min(start_idx + resolution, len(mono_data))
+        The audio is reduced block by block (each block a whole number of
+        peaks at every resolution), so a memory-mapped file is never
+        converted to mono in full.
 
-                chunk = mono_data[start_idx:end_idx]
+        Args:
+            audio_data: Audio data as numpy array (frames, channels)
+            resolutions: Samples per peak of each level
 
-                if len(chunk) > 0:
-                    min_peaks.append(float(np.min(chunk)))
-                    max_peaks.append(float(np.max(chunk)))
-                    rms_peaks.append(float(np.sqrt(np.mean(chunk ** 2))))
+        Returns:
+            WaveformPeaks per resolution, as float32 arrays
+        """
+        resolutions = list(resolutions)
+        try:
+            block_unit = math.lcm(*resolutions)
+            block_frames = block_unit * max(1, _GENERATE_BLOCK_FRAMES // block_unit)
+            parts = {res: ([], [], []) for res in resolutions}
+
+            for start in range(0, len(audio_data), block_frames):
+                block = audio_data[start:start + block_frames]
+                # Convert stereo to mono for waveform display (simple average)
+                if block.shape[1] == 2:
+                    mono_data = np.mean(block, axis=1, dtype=np.float32)
                 else:
-                    min_peaks.append(0.0)
-                    max_peaks.append(0.0)
-                    rms_peaks.append(0.0)
-
-            return WaveformPeaks(
-                resolution=resolution,
-                min_peaks=min_peaks,
-                max_peaks=max_peaks,
-                rms_peaks=rms_peaks
-            )
+                    mono_data = np.asarray(block[:, 0], dtype=np.float32)
+
+                for res in resolutions:
+                    mins, maxs, rms = parts[res]
+                    full = len(mono_data) // res
+                    chunks = [mono_data[:full * res].reshape(full, res)] if full else []
+                    if len(mono_data) > full * res:
+                        # Partial last peak at the end of the file
+                        chunks.append(mono_data[full * res:].reshape(1, -1))
+                    for chunk in chunks:
+                        mins.append(chunk.min(axis=1))
+                        maxs.append(chunk.max(axis=1))
+                        rms.append(np.sqrt(np.mean(np.square(chunk), axis=1)))
+
+            levels = []
+            for res in resolutions:
+                mins, maxs, rms = parts[res]
+                if not mins:
+                    mins = maxs = rms = [np.zeros(0, dtype=np.float32)]
+                levels.append(WaveformPeaks(
+                    resolution=res,
+                    min_peaks=np.concatenate(mins),
+                    max_peaks=np.concatenate(maxs),
+                    rms_peaks=np.concatenate(rms)
+                ))
+            return levels
 
         except Exception as e:
-            print(f"Error generating peaks at resolution {resolution}: {e}")
-            return None
+            print(f"Error generating peaks at resolutions {resolutions}: {e}")
+            return []
 
     def _get_cache_path(self, file_path: str) -> str:
         """Generate cache file path for an audio file"""
@@ -189,36 +261,51 @@ class WaveformAnalyzer:
         file_hash = hashlib.md5(cache_key.encode()).hexdigest()
         return os.path.join(self.cache_dir, f"{file_hash}.waveform")
 
-    def _save_to_cache(self, waveform_data: WaveformData):
+    def _get_level_path(self, cache_path: str, resolution: int) -> str:
+        """Binary peak file of one resolution next to a cache index"""
+        return f"{os.path.splitext(cache_path)[0]}_{resolution}{_LEVEL_EXTENSION}"
+
+    def _save_to_cache(self, waveform_data: WaveformData) -> bool:
         """Save waveform data to cache"""
         try:
             cache_path = self._get_cache_path(waveform_data.file_path)
 
-            # Convert to serializable format
+            # One (3, peaks) float32 array per level: min, max, rms rows
+            levels = {}
+            for resolution in waveform_data.resolutions:
+                peaks = waveform_data.get_peak_level(resolution)
+                if peaks is None:
+                    continue
+                level = np.stack([
+                    np.asarray(peaks.min_peaks, dtype=np.float32),
+                    np.asarray(peaks.max_peaks, dtype=np.float32),
+                    np.asarray(peaks.rms_peaks, dtype=np.float32),
+                ])
+                level_path = self._get_level_path(cache_path, resolution)
+                tmp_path = f"{level_path}.tmp"
+                with open(tmp_path, 'wb') as f:
+                    np.save(f, level)
+                os.replace(tmp_path, level_path)
+                levels[str(resolution)] = level.shape[1]
+
+            # Index last, so it only ever lists complete level files
             cache_data = {
+                'version': _CACHE_VERSION,
                 'file_path': waveform_data.file_path,
                 'sample_rate': waveform_data.sample_rate,
                 'duration': waveform_data.duration,
-                'peak_levels': {}
+                'levels': levels
             }
-
-            for resolution, peaks in waveform_data.peak_levels.items():
-                cache_data['peak_levels'][str(resolution)] = {
-                    'resolution': peaks.resolution,
-                    'min_peaks': peaks.min_peaks,
-                    'max_peaks': peaks.max_peaks,
-                    'rms_peaks': peaks.rms_peaks
-                }
-
-            # Save to file
             with open(cache_path, 'w') as f:
                 json.dump(cache_data, f, separators=(',', ':'))
+            return True
 
         except Exception as e:
             print(f"Error saving waveform cache: {e}")
+            return False
 
     def _load_from_cache(self, file_path: str) -> Optional[WaveformData]:
-        """Load waveform data from cache"""
+        """Load the waveform cache index; levels are mapped lazily on use"""
         try:
             cache_path = self._get_cache_path(file_path)
 
@@ -229,6 +316,10 @@ class WaveformAnalyzer:
             with open(cache_path, 'r') as f:
                 cache_data = json.load(f)
 
+            # JSON caches from before the binary levels are regenerated
+            if cache_data.get('version') != _CACHE_VERSION:
+                return None
+
             # Reconstruct waveform data
             waveform_data = WaveformData(
                 cache_data['file_path'],
@@ -236,16 +327,14 @@ class WaveformAnalyzer:
                 cache_data['duration']
             )
 
-            for resolution_str, peak_data in cache_data['peak_levels'].items():
-                peaks = WaveformPeaks(
-                    resolution=peak_data['resolution'],
-                    min_peaks=peak_data['min_peaks'],
-                    max_peaks=peak_data['max_peaks'],
-                    rms_peaks=peak_data['rms_peaks']
-                )
-                waveform_data.add_peak_level(peaks)
+            for resolution_str in cache_data['levels']:
+                resolution = int(resolution_str)
+                level_path = self._get_level_path(cache_path, resolution)
+                if not os.path.exists(level_path):
+                    return None
+                waveform_data.add_cached_level(resolution, level_path)
 
-            return waveform_data
+            return waveform_data if waveform_data.resolutions else None
 
         except Exception as e:
             print(f"Error loading waveform cache: {e}")
@@ -255,7 +344,7 @@ class WaveformAnalyzer:
         """Clear all cached waveform data"""
         try:
             for filename in os.listdir(self.cache_dir):
-                if filename.endswith('.waveform'):
+                if filename.endswith('.waveform') or filename.endswith(_LEVEL_EXTENSION):
                     os.remove(os.path.join(self.cache_dir, filename))
         except Exception as e:
             print(f"Error clearing waveform cache: {e}")
@@ -3,22 +3,28 @@ Auto DMX Controller — dedicated ArtNet output for Auto mode.
 
 Runs its own DMXManager + ArtNetSender, completely independent
 from the main app's ShowsArtNetController. Supports configurable
-target IP and universe mapping for venue-specific setups.
+target IP and universe mapping for venue-specific setups. Universes
+configured as E1.31 are additionally sent via sACN from the same loop.
 """
 
 import time
-import threading
 from typing import Optional, Dict, Callable
 
 from utils.artnet.dmx_manager import DMXManager
 from utils.artnet.sender import ArtNetSender
+from utils.artnet.sacn_sender import SACNSender
+from utils.artnet.output_scheduler import OutputScheduler, SchedulerStats
+from utils.dmx_stream import DMXStreamEncoder
 from config.models import Configuration
 from auto.engine import AutoShowEngine
+from auto.planner import PlannerStats
 
 
 class AutoDMXController:
     """Manages DMX output for Auto mode on a dedicated 30Hz thread."""
 
+    DEFAULT_OUTPUT_RATE_HZ = 30.0
+
     def __init__(self, config: Configuration, fixture_definitions: dict,
                  target_ip: str = "192.168.1.151",
                  local_dmx_callback: Optional[Callable[[int, bytes], None]] = None):
@@ -44,9 +50,16 @@ class AutoDMXController:
         self._visualizer_sender = ArtNetSender(target_ip="255.255.255.255")
         self._mirror_to_visualizer = True
 
+        # sACN for universes whose output plugin is E1.31 (keyed by config universe id)
+        self.sacn_sender = SACNSender()
+
         # Local in-process visualizer hook (see __init__ docstring).
         self._local_dmx_callback = local_dmx_callback
 
+        # Delta-compressed stream of the same frames (set_dmx_stream_callback)
+        self._dmx_stream_callback: Optional[Callable[[bytes], None]] = None
+        self._dmx_stream_encoder = DMXStreamEncoder()
+
         # Universe mapping: {config_universe_id: artnet_universe_number}
         # Default: identity mapping (config universe 1 → artnet 0, etc.)
         self._universe_mapping: Dict[int, int] = {}
@@ -57,10 +70,12 @@ class AutoDMXController:
         # Engine reference
         self._engine: Optional[AutoShowEngine] = None
 
-        # Thread control
-        self._thread: Optional[threading.Thread] = None
-        self._stop_event = threading.Event()
-        self._update_interval = 1.0 / 30.0  # 30Hz
+        # Deadline-scheduled output thread
+        self._scheduler = OutputScheduler(self._update_frame, rate_hz=self.DEFAULT_OUTPUT_RATE_HZ,
+                                          name="AutoDMXController")
+
+        # Follow multi-universe frames with ArtSync on the wire sender
+        self.artsync_enabled = True
 
     def set_engine(self, engine: AutoShowEngine):
         """Connect the Auto show engine."""
@@ -81,6 +96,14 @@ class AutoDMXController:
         """Update or clear the embedded-visualizer DMX hook after init."""
         self._local_dmx_callback = callback
 
+    def set_dmx_stream_callback(
+        self, callback: Optional[Callable[[bytes], None]]
+    ) -> None:
+        """Set or clear the hook receiving each frame as a delta-compressed
+        stream frame (utils.dmx_stream), keyed by 1-based config universe."""
+        self._dmx_stream_callback = callback
+        self._dmx_stream_encoder.request_keyframe()
+
     def set_universe_mapping(self, mapping: Dict[int, int]):
         """Set universe mapping.
 
@@ -90,23 +113,39 @@ class AutoDMXController:
         """
         self._universe_mapping = dict(mapping)
 
-    def start(self):
-        """Start the DMX output thread."""
-        if self._thread and self._thread.is_alive():
-            return
+    def set_output_rate(self, rate_hz: float):
+        """Set the DMX frame rate (ArtNet stays limited to 44Hz per universe)."""
+        self._scheduler.set_rate(rate_hz)
+        self.sacn_sender.set_max_rate(max(self._scheduler.rate_hz, SACNSender.MAX_SEND_RATE_HZ))
+
+    def output_stats(self) -> SchedulerStats:
+        """Frame timing statistics (jitter, late frames) since start()."""
+        return self._scheduler.stats()
+
+    def planner_stats(self) -> Optional[PlannerStats]:
+        """Engine lookahead planner latency versus the bar deadline, if an engine is set."""
+        return self._engine.planner_stats() if self._engine else None
 
-        self._stop_event.clear()
+    def start(self) -> bool:
+        """
+        Start the DMX output thread.
+
+        Returns:
+            False if the previous output thread did not exit in time
+        """
+        if self._scheduler.is_running():
+            return True
 
         # Start the engine's riff cycle
         if self._engine:
             self._engine.start()
 
-        self._thread = threading.Thread(
-            target=self._update_loop,
-            name="AutoDMXController",
-            daemon=True,
-        )
-        self._thread.start()
+        self._scheduler.reset_stats()
+        if not self._scheduler.start():
+            if self._engine:
+                self._engine.stop()
+            return False
+        return True
 
     def stop(self):
         """Stop the DMX output thread and clear fixtures."""
@@ -114,63 +153,72 @@ class AutoDMXController:
         if self._engine:
             self._engine.stop()
 
-        self._stop_event.set()
-        if self._thread:
-            self._thread.join(timeout=2.0)
-            self._thread = None
+        self._scheduler.stop(timeout=2.0)
 
         # Send blackout
         self._send_blackout()
 
-    def _update_loop(self):
-        """Main DMX update loop — runs at 30Hz."""
-        while not self._stop_event.is_set():
-            loop_start = time.monotonic()
+    def _update_frame(self):
+        """One DMX frame, called by the output scheduler (30Hz by default)."""
+        now = time.monotonic()
+        try:
+            # Advance engine
+            if self._engine:
+                self._engine.tick(now)
 
-            try:
-                # Advance engine
-                if self._engine:
-                    self._engine.tick(loop_start)
+            # Compute DMX state
+            self.dmx_manager.update_dmx(now)
 
-                # Compute DMX state
-                self.dmx_manager.update_dmx(loop_start)
+            # Send all universes
+            self._send_all_universes()
 
-                # Send all universes
-                self._send_all_universes()
-
-            except Exception as e:
-                print(f"Auto DMX update error: {e}")
-
-            # Maintain consistent frame rate
-            elapsed = time.monotonic() - loop_start
-            sleep_time = self._update_interval - elapsed
-            if sleep_time > 0:
-                time.sleep(sleep_time)
+        except Exception as e:
+            print(f"Auto DMX update error: {e}")
 
     def _send_all_universes(self):
-        """Send DMX data for all configured universes."""
+        """Send DMX data for all configured universes, one batch per sender."""
+        frame = []
         for config_uid, artnet_uid in self._universe_mapping.items():
             try:
-                dmx_data = self.dmx_manager.get_dmx_data(config_uid)
-                self.artnet_sender.send_dmx(artnet_uid, dmx_data)
-
-                # Mirror to broadcast for visualizer
-                if self._mirror_to_visualizer:
-                    self._visualizer_sender.send_dmx(artnet_uid, dmx_data)
-
-                # Forward the same frame to the in-process visualizer if
-                # one is wired up. Wrap in try/except so a misbehaving
-                # callback can't kill the DMX thread mid-show. Pass the
-                # 1-based config universe id to match what the embedded
-                # visualizer keys off (build_fixtures_payload uses
-                # fixture.universe directly, also 1-based).
-                if self._local_dmx_callback is not None:
-                    try:
-                        self._local_dmx_callback(config_uid, bytes(dmx_data))
-                    except Exception as cb_err:
-                        print(f"Auto local_dmx_callback raised: {cb_err}")
+                frame.append((config_uid, artnet_uid, self.dmx_manager.get_dmx_data(config_uid)))
             except Exception as e:
                 print(f"Error sending universe {config_uid}→{artnet_uid}: {e}")
+        if not frame:
+            return
+
+        wire_frame = [(artnet_uid, dmx_data) for _, artnet_uid, dmx_data in frame]
+        self.artnet_sender.send_frame(wire_frame, sync=self.artsync_enabled and len(wire_frame) > 1)
+
+        # Mirror to broadcast for visualizer
+        if self._mirror_to_visualizer:
+            self._visualizer_sender.send_frame(wire_frame)
+
+        sacn_universes = set(self.sacn_sender.configure_from_config(self.config.universes))
+        if sacn_universes:
+            self.sacn_sender.send_frame(
+                [(config_uid, dmx_data) for config_uid, _, dmx_data in frame if config_uid in sacn_universes])
+
+        # Forward the same frame to the in-process visualizer if one is
+        # wired up. Wrap in try/except so a misbehaving callback can't
+        # kill the DMX thread mid-show. Pass the 1-based config universe
+        # id to match what the embedded visualizer keys off
+        # (build_fixtures_payload uses fixture.universe directly, also
+        # 1-based).
+        if self._local_dmx_callback is not None:
+            for config_uid, _, dmx_data in frame:
+                try:
+                    self._local_dmx_callback(config_uid, bytes(dmx_data))
+                except Exception as cb_err:
+                    print(f"Auto local_dmx_callback raised: {cb_err}")
+
+        if self._dmx_stream_callback is not None:
+            stream_frame = self._dmx_stream_encoder.encode(
+                [(config_uid, dmx_data) for config_uid, _, dmx_data in frame])
+            if stream_frame is not None:
+                try:
+                    self._dmx_stream_callback(stream_frame)
+                except Exception as cb_err:
+                    print(f"Auto dmx_stream_callback raised: {cb_err}")
 
     def _send_blackout(self):
         """Send all zeros to all universes (blackout).
@@ -182,9 +230,14 @@ class AutoDMXController:
         visualiser.
         """
         blackout = bytearray(512)
-        for artnet_uid in self._universe_mapping.values():
+        frame = [(artnet_uid, blackout) for artnet_uid in self._universe_mapping.values()]
+        for sender in (self.artnet_sender, self._visualizer_sender):
             try:
-                self.artnet_sender.send_dmx(artnet_uid, blackout, force=True)
-                self._visualizer_sender.send_dmx(artnet_uid, blackout, force=True)
+                sender.send_frame(frame, force=True)
             except Exception:
                 pass
+        try:
+            self.sacn_sender.send_frame(
+                [(config_uid, blackout) for config_uid in self._universe_mapping], force=True)
+        except Exception:
+            pass
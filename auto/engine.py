@@ -11,8 +11,8 @@ import threading
 import colorsys
 import numpy as np
 from collections import deque
-from dataclasses import dataclass, field
-from typing import Optional, Tuple, Dict, List, Set, Callable
+from dataclasses import dataclass, field, replace
+from typing import Any, Optional, Tuple, Dict, List, Set, Callable
 
 from audio.realtime_spectral import LiveFeatureFrame
 from audio.spectral_analysis import SectionAnalysis
@@ -23,6 +23,7 @@ from autogen.spatial import (
 )
 from rudiments.block_converter import rudiment_to_dimmer_block, rudiment_to_movement_block
 from config.models import DimmerBlock, ColourBlock, MovementBlock, SpecialBlock, Configuration
+from auto.planner import LookaheadPlanner, PlannerStats
 
 
 # How many feature frames to keep (~86 frames/sec at 44100/512)
@@ -36,6 +37,10 @@ _MEDIUM_ENERGY_SHAPES = ["bounce", "linear_sweep", "square", "triangle"]
 _LOW_ENERGY_SHAPES = ["linear_sweep", "fan", "circle"]
 _VERY_LOW_SHAPES = ["linear_sweep"]
 
+# A plan is used if its bar starts and ends within this many seconds of
+# the bar being entered (covers tiny BPM drift from auto-BPM)
+_PLAN_TIME_TOLERANCE = 0.005
+
 
 @dataclass
 class AutoCycleState:
@@ -55,6 +60,40 @@ class AutoCycleState:
     fill_rudiment: str = "stroke"  # selected for force_fill use
 
 
+@dataclass
+class _PlanInputs:
+    """Copy of the engine state a bar plan is computed from.
+
+    Taken under the engine lock, so planning can run without it.
+    """
+    frames: List[LiveFeatureFrame]
+    bpm: float
+    energy_sensitivity: float
+    color_override: Optional[Tuple[int, int, int]]
+    auto_color: Tuple[int, int, int]
+    groups: Dict[str, Any]
+    group_names: List[str]
+    group_classifications: Dict[str, Any]
+    group_submasters: Dict[str, float]
+    group_constraints: Dict[str, Optional[Set[str]]]
+    per_group_rudiments: Dict[str, Tuple[str, str]]
+    previous_rudiments: Dict[str, str]
+    target_plane_name: Optional[str]
+    movement_cycle_index: int
+    is_fill: bool
+
+
+@dataclass
+class _BarPlan:
+    """Blocks for one bar, plus the riff selection if the bar starts a cycle."""
+    bar_start: float
+    bar_end: float
+    # (lane_key, fixtures, block, block_type) for DMXManager.block_started
+    registrations: List[Tuple[str, list, Any, str]]
+    per_group_rudiments: Optional[Dict[str, Tuple[str, str]]] = None
+    auto_color: Optional[Tuple[int, int, int]] = None
+
+
 class AutoShowEngine:
     """Core engine for live audio-reactive lighting.
 
@@ -62,6 +101,9 @@ class AutoShowEngine:
     - on_feature_frame() called from analysis thread
     - tick() called from DMX thread at 30Hz
     - UI setters called from Qt main thread
+    - the next bar (and, before a cycle boundary, the next riff
+      selection) is planned one bar ahead on the planner thread, from a
+      snapshot of the engine state; tick() only swaps the plan in
     All shared state protected by _lock.
     """
 
@@ -112,6 +154,13 @@ class AutoShowEngine:
         # Callbacks for UI updates
         self._on_riffs_updated: Optional[Callable[[Dict[str, Tuple[str, str]]], None]] = None
 
+        # Lookahead planning. Plans are keyed by (cycle number, bar index,
+        # generation); setters that change what a bar looks like bump the
+        # generation so plans made before the change are not used.
+        self._planner = LookaheadPlanner()
+        self._cycle_number: int = 0
+        self._plan_generation: int = 0
+
     # ── Public setters (called from Qt main thread) ──
 
     def set_dmx_manager(self, dmx_manager):
@@ -125,26 +174,31 @@ class AutoShowEngine:
     def set_energy_sensitivity(self, value: float):
         with self._lock:
             self._energy_sensitivity = max(0.0, min(1.0, value))
+            self._plan_generation += 1
 
     def set_color_override(self, rgb: Optional[Tuple[int, int, int]]):
         with self._lock:
             self._color_override = rgb
+            self._plan_generation += 1
 
     def set_group_submaster(self, group_name: str, value: float):
         with self._lock:
             if group_name in self._group_submasters:
                 self._group_submasters[group_name] = max(0.0, min(1.0, value))
+                self._plan_generation += 1
 
     def set_group_constraints(self, group_name: str, allowed: Optional[Set[str]]):
         """Set allowed rudiments for a group. None or empty = all allowed."""
         with self._lock:
             if group_name in self._group_constraints:
                 self._group_constraints[group_name] = allowed if allowed else None
+                self._plan_generation += 1
 
     def set_target_plane(self, plane):
         """Set the target plane for moving heads. None = no targeting."""
         with self._lock:
             self._target_plane = plane
+            self._plan_generation += 1
 
     def refresh_from_config(self, config: Configuration) -> None:
         """Re-snapshot group classifications and names from ``config``.
@@ -166,6 +220,7 @@ class AutoShowEngine:
             self._group_constraints = {
                 g: self._group_constraints.get(g, None) for g in new_group_names
             }
+            self._plan_generation += 1
 
     def set_max_movement_speed(self, degrees_per_sec: float):
         """Set max pan/tilt speed. Forwarded to DMX manager."""
@@ -208,6 +263,10 @@ class AutoShowEngine:
         with self._lock:
             return dict(self._per_group_rudiments)
 
+    def planner_stats(self) -> PlannerStats:
+        """Lookahead planner latency against the bar deadline since start()."""
+        return self._planner.stats()
+
     # ── Audio feature input (called from analysis thread) ──
 
     def on_feature_frame(self, frame: LiveFeatureFrame):
@@ -219,16 +278,21 @@ class AutoShowEngine:
 
     def start(self):
         """Start the engine cycle."""
+        self._planner.reset_stats()
+        self._planner.start()
         with self._lock:
             self._running = True
             self._engine_time = time.monotonic()
+            self._cycle_number = 0
             self._start_new_cycle()
+            self._request_next_plan()
 
     def stop(self):
         """Stop the engine and clear all blocks."""
         with self._lock:
             self._running = False
             self._end_all_blocks()
+        self._planner.stop()
 
     def tick(self, current_time: float):
         """Advance the engine. Called at 30Hz from DMX thread.
@@ -250,9 +314,13 @@ class AutoShowEngine:
             if current_bar >= self._cycle_bars:
                 # Cycle complete → re-select riffs and loop. There's no
                 # auto-fill bar at the end of the cycle anymore — the
-                # engine just keeps grooving.
+                # engine just keeps grooving. The next cycle starts on
+                # the exact boundary (where its plan was made for) unless
+                # we are more than a bar late.
                 self._end_all_blocks()
-                self._start_new_cycle()
+                boundary = self._cycle.cycle_start_time + self._cycle_bars * bar_duration
+                self._start_new_cycle(boundary if current_time - boundary < bar_duration else None)
+                self._request_next_plan()
                 return
 
             if current_bar != self._cycle.bar_index:
@@ -267,7 +335,14 @@ class AutoShowEngine:
                 self._end_all_blocks()
                 bar_start = self._cycle.cycle_start_time + current_bar * bar_duration
                 bar_end = bar_start + bar_duration
-                self._create_all_blocks(bar_start, bar_end)
+                plan = self._take_plan(current_bar, bar_start, bar_end, bar_duration)
+                if plan is None:
+                    sync_start = time.monotonic()
+                    plan = self._plan_bar(self._snapshot(), bar_start, bar_end)
+                    self._planner.record_miss(bar_duration, time.monotonic() - sync_start)
+                self._register_blocks(plan.registrations)
+
+            self._request_next_plan()
 
     def force_fill(self):
         """Punch a one-shot fill on the current bar.
@@ -296,32 +371,120 @@ class AutoShowEngine:
 
     # ── Internal methods ──
 
-    def _start_new_cycle(self):
-        """Select new riffs and start a fresh groove+fill cycle."""
-        self._cycle.cycle_start_time = self._engine_time
+    def _start_new_cycle(self, start_time: Optional[float] = None):
+        """Select new riffs and start a fresh groove+fill cycle.
+
+        Uses the planner's result when it was made for this cycle start;
+        otherwise selects riffs and builds the first bar here.
+        """
+        self._cycle.cycle_start_time = self._engine_time if start_time is None else start_time
         self._cycle.bar_index = 0
         self._cycle.is_fill = False
         self._movement_cycle_index += 1
+        self._cycle_number += 1
 
-        # Build profile from sliding window
-        profile = self._build_window_profile()
-
-        # Select riffs per group
-        self._select_next_riffs(profile)
-
-        # Update auto color from centroid
-        self._update_auto_color(profile)
-
-        # Create first bar blocks
         beat_duration = 60.0 / self._bpm
         bar_duration = 4.0 * beat_duration
         bar_start = self._cycle.cycle_start_time
         bar_end = bar_start + bar_duration
-        self._create_all_blocks(bar_start, bar_end)
 
-    def _build_window_profile(self) -> SectionAnalysis:
-        """Synthesize a SectionAnalysis from the sliding window."""
-        if not self._window:
+        plan = self._take_plan(0, bar_start, bar_end, bar_duration)
+        if plan is None:
+            sync_start = time.monotonic()
+            plan = self._plan_bar(self._snapshot(), bar_start, bar_end, new_cycle=True)
+            if self._cycle_number > 1:  # The first cycle cannot be planned ahead
+                self._planner.record_miss(bar_duration, time.monotonic() - sync_start)
+
+        # Riffs and auto color from the window profile, then first bar blocks
+        self._apply_riffs(plan.per_group_rudiments)
+        self._auto_color_rgb = plan.auto_color
+        self._register_blocks(plan.registrations)
+
+    # ── Lookahead planning ──
+
+    def _snapshot(self) -> _PlanInputs:
+        """Copy the state bar planning reads (caller holds _lock)."""
+        return _PlanInputs(
+            frames=list(self._window),
+            bpm=self._bpm,
+            energy_sensitivity=self._energy_sensitivity,
+            color_override=self._color_override,
+            auto_color=self._auto_color_rgb,
+            groups=dict(self.config.groups),
+            group_names=list(self._group_names),
+            group_classifications=self._group_classifications,
+            group_submasters=dict(self._group_submasters),
+            group_constraints=dict(self._group_constraints),
+            per_group_rudiments=dict(self._per_group_rudiments),
+            previous_rudiments=dict(self._previous_rudiments),
+            target_plane_name=self._target_plane.name if self._target_plane else None,
+            movement_cycle_index=self._movement_cycle_index,
+            is_fill=self._cycle.is_fill,
+        )
+
+    def _plan_bar(self, inputs: _PlanInputs, bar_start: float, bar_end: float,
+                  new_cycle: bool = False) -> _BarPlan:
+        """Compute one bar's blocks; for a new cycle, select its riffs first.
+
+        Reads only ``inputs``, so it can run on the planner thread.
+        """
+        profile = self._build_window_profile(inputs.frames)
+        if not new_cycle:
+            return _BarPlan(bar_start, bar_end, self._plan_blocks(inputs, profile, bar_start, bar_end))
+
+        rudiments = self._choose_riffs(inputs, profile)
+        auto_color = self._auto_color_for(profile)
+        inputs = replace(inputs, per_group_rudiments=rudiments, auto_color=auto_color)
+        return _BarPlan(bar_start, bar_end, self._plan_blocks(inputs, profile, bar_start, bar_end),
+                        per_group_rudiments=rudiments, auto_color=auto_color)
+
+    def _next_bar(self) -> Tuple[Tuple[int, int, int], float, float, bool]:
+        """Plan key, start, end and new-cycle flag of the bar after the current one."""
+        bar_duration = 4.0 * 60.0 / self._bpm
+        next_bar = self._cycle.bar_index + 1
+        bar_start = self._cycle.cycle_start_time + next_bar * bar_duration
+        new_cycle = next_bar >= self._cycle_bars
+        if new_cycle:
+            key = (self._cycle_number + 1, 0, self._plan_generation)
+        else:
+            key = (self._cycle_number, next_bar, self._plan_generation)
+        return key, bar_start, bar_start + bar_duration, new_cycle
+
+    def _request_next_plan(self):
+        """Have the planner work on the next bar unless it already is (caller holds _lock)."""
+        key, bar_start, bar_end, new_cycle = self._next_bar()
+        if self._planner.has(key):
+            return
+
+        inputs = self._snapshot()
+        # The next bar starts without a fill; a new cycle advances the
+        # movement shape rotation
+        inputs.is_fill = False
+        if new_cycle:
+            inputs.movement_cycle_index += 1
+        self._planner.submit(
+            key, bar_start,
+            lambda: self._plan_bar(inputs, bar_start, bar_end, new_cycle=new_cycle),
+        )
+
+    def _take_plan(self, bar_index: int, bar_start: float, bar_end: float,
+                   bar_duration: float) -> Optional[_BarPlan]:
+        """The planner's result for the bar being entered, if ready and still valid."""
+        if not self._running:
+            return None
+        plan = self._planner.take((self._cycle_number, bar_index, self._plan_generation))
+        if (plan is None
+                or abs(plan.bar_start - bar_start) > _PLAN_TIME_TOLERANCE
+                or abs(plan.bar_end - bar_end) > _PLAN_TIME_TOLERANCE):
+            return None
+        self._planner.record_hit(bar_duration)
+        return plan
+
+    def _build_window_profile(self, frames: Optional[List[LiveFeatureFrame]] = None) -> SectionAnalysis:
+        """Synthesize a SectionAnalysis from the sliding window (or a copy of it)."""
+        if frames is None:
+            frames = list(self._window)
+        if not frames:
             return SectionAnalysis(
                 name="live", start_time=0.0, end_time=1.0,
                 spectral_flux_avg=0.5, transient_sharpness=0.5,
@@ -331,7 +494,6 @@ class AutoShowEngine:
                 spectral_flux_envelope=[0.5] * 32,
             )
 
-        frames = list(self._window)
         flux_vals = [f.flux for f in frames]
         transient_vals = [f.transient for f in frames]
         richness_vals = [f.richness for f in frames]
@@ -362,13 +524,13 @@ class AutoShowEngine:
             spectral_contrast_avg=float(np.mean(contrast_vals)),
         )
 
-    def _select_next_riffs(self, profile: SectionAnalysis):
+    def _choose_riffs(self, inputs: _PlanInputs, profile: SectionAnalysis) -> Dict[str, Tuple[str, str]]:
         """Use the autogen matcher to select riffs per group."""
         from rudiments.registry import get_intensity_rudiments
 
         scores = match_rudiments_to_section(
-            profile, self._bpm,
-            previous_section_rudiments=self._previous_rudiments,
+            profile, inputs.bpm,
+            previous_section_rudiments=inputs.previous_rudiments,
             section_type="generic",
         )
         ranked = list(scores.keys())
@@ -379,8 +541,8 @@ class AutoShowEngine:
         locked_result = {}
         auto_groups = []
 
-        for group_name in self._group_names:
-            allowed = self._group_constraints.get(group_name)
+        for group_name in inputs.group_names:
+            allowed = inputs.group_constraints.get(group_name)
             if allowed is None:
                 # Unconstrained
                 auto_groups.append(group_name)
@@ -404,8 +566,8 @@ class AutoShowEngine:
         # Select riffs for auto/curated groups via matcher
         if auto_groups:
             matcher_result = select_rudiments_per_group(
-                profile, self._bpm, auto_groups,
-                previous_section_rudiments=self._previous_rudiments,
+                profile, inputs.bpm, auto_groups,
+                previous_section_rudiments=inputs.previous_rudiments,
                 section_type="generic",
                 allowed_per_group=allowed_per_group if allowed_per_group else None,
             )
@@ -413,7 +575,11 @@ class AutoShowEngine:
             matcher_result = {}
 
         # Merge locked + matcher results
-        self._per_group_rudiments = {**matcher_result, **locked_result}
+        return {**matcher_result, **locked_result}
+
+    def _apply_riffs(self, per_group_rudiments: Dict[str, Tuple[str, str]]):
+        """Make a riff selection current and notify the UI."""
+        self._per_group_rudiments = per_group_rudiments
 
         # Store for next cycle's contrast
         self._previous_rudiments = {
@@ -433,7 +599,8 @@ class AutoShowEngine:
             except Exception:
                 pass
 
-    def _update_auto_color(self, profile: SectionAnalysis):
+    @staticmethod
+    def _auto_color_for(profile: SectionAnalysis) -> Tuple[int, int, int]:
         """Generate color from spectral centroid."""
         # Map centroid (0-8000 Hz range) to hue (0-1)
         centroid_normalized = min(1.0, profile.spectral_centroid_avg / 8000.0)
@@ -442,42 +609,66 @@ class AutoShowEngine:
         value = 0.8 + 0.2 * profile.rms_energy
 
         r, g, b = colorsys.hsv_to_rgb(hue, saturation, value)
-        self._auto_color_rgb = (int(r * 255), int(g * 255), int(b * 255))
-
-    def _get_color_for_block(self) -> Tuple[int, int, int]:
-        """Get current color (override or auto)."""
-        if self._color_override is not None:
-            return self._color_override
-        return self._auto_color_rgb
+        return (int(r * 255), int(g * 255), int(b * 255))
 
     def _create_all_blocks(self, bar_start: float, bar_end: float):
         """Create and register blocks for all groups for the current bar."""
         if not self._dmx_manager:
             return
 
-        profile = self._build_window_profile()
-        relative_energy = profile.rms_energy * self._energy_sensitivity
+        inputs = self._snapshot()
+        profile = self._build_window_profile(inputs.frames)
+        self._register_blocks(self._plan_blocks(inputs, profile, bar_start, bar_end))
+
+    def _register_blocks(self, registrations: List[Tuple[str, list, Any, str]]):
+        """Start planned blocks on the DMX manager."""
+        if not self._dmx_manager:
+            return
+
+        for lane_key, fixtures, block, block_type in registrations:
+            if block_type == 'movement':
+                try:
+                    self._dmx_manager.block_started(
+                        lane_key, fixtures, block, block_type, block.start_time,
+                    )
+                except Exception:
+                    pass  # Not all movement rudiments may be registered
+            else:
+                self._dmx_manager.block_started(
+                    lane_key, fixtures, block, block_type, block.start_time,
+                )
+            self._active_lanes.add(lane_key)
+
+    def _plan_blocks(self, inputs: _PlanInputs, profile: SectionAnalysis,
+                     bar_start: float, bar_end: float) -> List[Tuple[str, list, Any, str]]:
+        """Build the blocks of every group for one bar.
+
+        Returns (lane_key, fixtures, block, block_type) registrations for
+        _register_blocks(). Reads only ``inputs`` and ``profile``.
+        """
+        relative_energy = profile.rms_energy * inputs.energy_sensitivity
 
         # Spatial rules
-        vocal_weights = apply_vocal_rule(self._group_classifications, profile.vocal_presence)
+        vocal_weights = apply_vocal_rule(inputs.group_classifications, profile.vocal_presence)
         richness_weights = compute_richness_weights(
-            self._group_classifications, profile.spectral_richness,
+            inputs.group_classifications, profile.spectral_richness,
             profile.spectral_flux_avg, relative_energy,
         )
         roles = assign_group_roles(
-            self._per_group_rudiments, relative_energy, self._group_classifications,
+            inputs.per_group_rudiments, relative_energy, inputs.group_classifications,
         )
         gobo_prism = get_gobo_prism_groups(
-            self._group_classifications, profile.spectral_richness,
+            inputs.group_classifications, profile.spectral_richness,
         )
 
-        color = self._get_color_for_block()
+        color = inputs.color_override if inputs.color_override is not None else inputs.auto_color
+        registrations = []
 
-        for group_name in self._group_names:
-            if group_name not in self._per_group_rudiments:
+        for group_name in inputs.group_names:
+            if group_name not in inputs.per_group_rudiments:
                 continue
 
-            groove_name, fill_name = self._per_group_rudiments[group_name]
+            groove_name, fill_name = inputs.per_group_rudiments[group_name]
             role = roles.get(group_name, ActivationRole.FULL)
 
             # Determine which rudiment to use this bar.
@@ -489,7 +680,7 @@ class AutoShowEngine:
             # ``fill_name`` rudiment and let the energy-threshold weight
             # from ``compute_richness_weights`` gate when the group
             # actually fires — accent at energy>=0.60, etc.
-            if self._cycle.is_fill:
+            if inputs.is_fill:
                 if role == ActivationRole.GROOVE_ONLY:
                     continue  # Skip groove-only groups during manual fill
                 rudiment_name = fill_name
@@ -504,7 +695,7 @@ class AutoShowEngine:
             base_weight = richness_weights.get(group_name, 1.0)
             vocal_raw = vocal_weights.get(group_name, 1.0)
             vocal_weight = 0.7 + 0.3 * vocal_raw  # compress 0-1 → 0.7-1.0
-            submaster = self._group_submasters.get(group_name, 1.0)
+            submaster = inputs.group_submasters.get(group_name, 1.0)
             # FILL_ONLY groups must respect the raw weight (0.0 →
             # silent) — that's the whole point of the "accent" role.
             # Other groups get a 0.3 floor so they don't drop fully
@@ -532,20 +723,15 @@ class AutoShowEngine:
             )
 
             # Get fixtures for this group
-            group = self.config.groups.get(group_name)
+            group = inputs.groups.get(group_name)
             if not group:
                 continue
 
             lane_key = f"live_{group_name}"
 
-            # Register blocks with DMX manager
-            self._dmx_manager.block_started(
-                lane_key, group.fixtures, dimmer_block, 'dimmer', bar_start,
-            )
-            self._dmx_manager.block_started(
-                lane_key, group.fixtures, colour_block, 'colour', bar_start,
-            )
-            self._active_lanes.add(lane_key)
+            # Blocks to register with the DMX manager
+            registrations.append((lane_key, group.fixtures, dimmer_block, 'dimmer'))
+            registrations.append((lane_key, group.fixtures, colour_block, 'colour'))
 
             # Special blocks (gobo/prism)
             gp = gobo_prism.get(group_name, {})
@@ -556,12 +742,10 @@ class AutoShowEngine:
                     gobo_index=3 if gp.get("gobo") else 0,
                     prism_enabled=gp.get("prism", False),
                 )
-                self._dmx_manager.block_started(
-                    lane_key, group.fixtures, special_block, 'special', bar_start,
-                )
+                registrations.append((lane_key, group.fixtures, special_block, 'special'))
 
             # Movement block for groups with moving heads
-            gc = self._group_classifications.get(group_name)
+            gc = inputs.group_classifications.get(group_name)
             if gc and gc.has_moving_heads:
                 # Select shape from energy-tiered pool, rotating across cycles
                 if relative_energy >= 0.7:
@@ -572,7 +756,7 @@ class AutoShowEngine:
                     pool = _LOW_ENERGY_SHAPES
                 else:
                     pool = _VERY_LOW_SHAPES
-                movement_name = pool[self._movement_cycle_index % len(pool)]
+                movement_name = pool[inputs.movement_cycle_index % len(pool)]
 
                 amplitude = 25.0 + 55.0 * relative_energy
                 speed = "1/2" if relative_energy < 0.4 else "1"
@@ -581,17 +765,16 @@ class AutoShowEngine:
                     "speed": speed,
                 }
                 try:
-                    plane_name = self._target_plane.name if self._target_plane else None
                     movement_block = rudiment_to_movement_block(
                         movement_name, mov_params, bar_start, bar_end,
-                        target_plane_name=plane_name,
-                    )
-                    self._dmx_manager.block_started(
-                        lane_key, group.fixtures, movement_block, 'movement', bar_start,
+                        target_plane_name=inputs.target_plane_name,
                     )
+                    registrations.append((lane_key, group.fixtures, movement_block, 'movement'))
                 except Exception:
                     pass  # Not all movement rudiments may be registered
 
+        return registrations
+
     def _end_all_blocks(self):
         """Unregister all active blocks from DMXManager."""
         if not self._dmx_manager:
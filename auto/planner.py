@@ -0,0 +1,191 @@
+"""
+Lookahead planner for the Auto Show Engine.
+
+Choosing riffs (the rudiment matcher) and building a bar's blocks takes
+long enough to stall a 30 Hz DMX frame, and it is needed exactly on the
+downbeat. LookaheadPlanner runs that work on a worker thread while the
+previous bar plays; the DMX thread only picks up the finished plan at the
+boundary. Plans are keyed by the caller, so a plan made from outdated
+inputs is simply never taken.
+"""
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Hashable, Optional
+
+
+@dataclass
+class PlannerStats:
+    """Planner timing since start or the last reset."""
+    bar_ms: float = 0.0           # Bar duration: the time a plan has to be ready
+    plans: int = 0                # Plans computed on the worker thread
+    hits: int = 0                 # Boundaries served from a ready plan
+    misses: int = 0               # Boundaries planned on the DMX thread instead
+    mean_latency_ms: float = 0.0  # Worker time per plan
+    max_latency_ms: float = 0.0
+    min_slack_ms: float = 0.0     # Least time between a plan finishing and its bar (negative = late)
+    max_sync_ms: float = 0.0      # Longest DMX-thread stall on a miss
+
+
+class LookaheadPlanner:
+    """
+    Computes one plan at a time on a background thread.
+
+    ``submit()`` queues ``plan_fn`` under ``key``, replacing any queued
+    plan that has not started yet. ``take(key)`` returns the finished
+    result if the newest plan has that key, without ever waiting for the
+    worker.
+    """
+
+    def __init__(self, name: str = "AutoPlanner"):
+        self.name = name
+        self._cond = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._running = False
+
+        self._queued: Optional[tuple] = None     # (key, deadline, plan_fn)
+        self._running_key: Optional[Hashable] = None
+        self._ready: Optional[tuple] = None      # (key, result)
+        self._failed_key: Optional[Hashable] = None  # Not retried until resubmitted under a new key
+        self.reset_stats()
+
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive() and self._running
+
+    def start(self):
+        """Start the worker thread (no-op if already running).
+
+        Refuses while a stopped worker is still finishing a plan; the engine
+        then plans every bar synchronously.
+        """
+        if self.is_running():
+            return
+        if self._thread is not None and self._thread.is_alive():
+            print(f"{self.name}: previous worker has not exited yet, not starting another")
+            return
+        with self._cond:
+            self._running = True
+        self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 2.0):
+        """Stop the worker and drop queued and finished plans."""
+        with self._cond:
+            self._running = False
+            self._queued = None
+            self._ready = None
+            self._cond.notify_all()
+        if self._thread is None:
+            return
+        if self._thread is not threading.current_thread():
+            self._thread.join(timeout=timeout)
+        if not self._thread.is_alive():
+            self._thread = None
+
+    def has(self, key: Hashable) -> bool:
+        """Whether a plan for ``key`` is queued, being computed or ready."""
+        with self._cond:
+            return ((self._queued is not None and self._queued[0] == key)
+                    or self._running_key == key
+                    or self._failed_key == key
+                    or (self._ready is not None and self._ready[0] == key))
+
+    def submit(self, key: Hashable, deadline: float, plan_fn: Callable[[], Any]):
+        """
+        Queue a plan
+
+        Args:
+            key: Identifies what the plan is for; passed back to take()
+            deadline: time.monotonic() value by which the plan is needed
+            plan_fn: Computes the plan on the worker thread
+        """
+        with self._cond:
+            self._queued = (key, deadline, plan_fn)
+            self._cond.notify_all()
+
+    def take(self, key: Hashable) -> Optional[Any]:
+        """Finished plan for ``key``, or None if it is not ready. Never blocks."""
+        with self._cond:
+            if self._ready is None or self._ready[0] != key:
+                return None
+            result = self._ready[1]
+            self._ready = None
+            return result
+
+    # ── Statistics ────────────────────────────────────────────────────
+
+    def reset_stats(self):
+        with self._cond:
+            self._bar = 0.0
+            self._plans = 0
+            self._hits = 0
+            self._misses = 0
+            self._latency_sum = 0.0
+            self._latency_max = 0.0
+            self._slack_min: Optional[float] = None
+            self._sync_max = 0.0
+
+    def record_hit(self, bar_duration: float):
+        """Count a boundary served from a ready plan."""
+        with self._cond:
+            self._bar = bar_duration
+            self._hits += 1
+
+    def record_miss(self, bar_duration: float, sync_seconds: float):
+        """Count a boundary that had to be planned synchronously."""
+        with self._cond:
+            self._bar = bar_duration
+            self._misses += 1
+            self._sync_max = max(self._sync_max, sync_seconds)
+
+    def stats(self) -> PlannerStats:
+        """Snapshot of the planner statistics."""
+        with self._cond:
+            plans = self._plans
+            return PlannerStats(
+                bar_ms=self._bar * 1000.0,
+                plans=plans,
+                hits=self._hits,
+                misses=self._misses,
+                mean_latency_ms=self._latency_sum / plans * 1000.0 if plans else 0.0,
+                max_latency_ms=self._latency_max * 1000.0,
+                min_slack_ms=self._slack_min * 1000.0 if self._slack_min is not None else 0.0,
+                max_sync_ms=self._sync_max * 1000.0,
+            )
+
+    # ── Worker ────────────────────────────────────────────────────────
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while self._running and self._queued is None:
+                    self._cond.wait()
+                if not self._running:
+                    return
+                key, deadline, plan_fn = self._queued
+                self._queued = None
+                self._running_key = key
+
+            started = time.monotonic()
+            try:
+                result = plan_fn()
+            except Exception as e:
+                print(f"{self.name} plan error: {e}")
+                result = None
+            finished = time.monotonic()
+
+            with self._cond:
+                self._running_key = None
+                if result is None:
+                    self._failed_key = key
+                if result is None or not self._running:
+                    continue
+                self._ready = (key, result)
+                self._plans += 1
+                latency = finished - started
+                self._latency_sum += latency
+                self._latency_max = max(self._latency_max, latency)
+                slack = deadline - finished
+                if self._slack_min is None or slack < self._slack_min:
+                    self._slack_min = slack
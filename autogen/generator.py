@@ -21,6 +21,7 @@ from config.models import (
 )
 from timeline.song_structure import SongStructure
 from audio.spectral_analysis import analyze_song, SongAnalysis, SectionAnalysis
+from audio.analysis_context import load_analysis_context
 from autogen.color_generator import (
     SongPalette, SectionColorAssignment,
     generate_palette_from_audio, assign_section_colors,
@@ -68,8 +69,9 @@ def generate_show(
     if autogen_config is None:
         autogen_config = AutogenConfig()
 
-    # Step 1: Analyze audio
-    analysis = analyze_song(audio_path, song_structure)
+    # Step 1: Analyze audio (decoded once, shared with the inspector features below)
+    analysis_context = load_analysis_context(audio_path)
+    analysis = analyze_song(audio_path, song_structure, context=analysis_context)
 
     # Compute global centroid range for normalization
     all_centroids = [s.spectral_centroid_avg for s in analysis.sections if s.spectral_centroid_avg > 0]
@@ -105,7 +107,7 @@ def generate_show(
     # Compute continuous frame-level audio features for the inspector
     try:
         from audio.spectral_analysis import compute_frame_features
-        frame_features = compute_frame_features(audio_path)
+        frame_features = compute_frame_features(audio_path, context=analysis_context)
     except Exception:
         frame_features = None
 
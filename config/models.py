@@ -6,7 +6,7 @@ import yaml
 import xml.etree.ElementTree as ET
 import os
 import sys
-from utils.fixture_utils import determine_fixture_type
+from utils.fixture_db import get_fixture_database
 
 
 @dataclass
@@ -744,53 +744,64 @@ class Riff:
     def to_light_block(self, start_time: float, song_structure) -> 'LightBlock':
         """Convert riff to absolute-timed LightBlock.
 
-        Uses song_structure.get_bpm_at_time() for each beat to handle
-        BPM transitions correctly. The riff "stretches" to match the grid.
+        Beats are placed on the song's tempo map (SongStructure.time_to_beat /
+        beat_to_time), so the riff "stretches" to match the grid across BPM
+        transitions. Song structures without a tempo map fall back to
+        sampling get_bpm_at_time().
 
         Args:
             start_time: Absolute time in seconds where riff starts
-            song_structure: SongStructure object with get_bpm_at_time() method
+            song_structure: SongStructure, or any object with get_bpm_at_time()
 
         Returns:
             LightBlock with absolute timing
         """
-        def beat_to_time(beat_offset: float) -> float:
-            """Convert a beat offset from riff start to absolute time.
-
-            For efficiency, check if BPM is constant first.
-            If not, sample at quarter-beat intervals for accuracy.
-            """
-            if beat_offset <= 0:
-                return start_time
-
-            # Check if BPM is constant across the riff duration
-            # (optimization for the common case)
-            start_bpm = song_structure.get_bpm_at_time(start_time)
-            # Estimate end time assuming constant BPM
-            estimated_end = start_time + (self.length_beats * 60.0 / start_bpm)
-            end_bpm = song_structure.get_bpm_at_time(estimated_end)
-
-            if abs(start_bpm - end_bpm) < 0.01:
-                # BPM is constant, use simple calculation
-                seconds_per_beat = 60.0 / start_bpm
-                return start_time + (beat_offset * seconds_per_beat)
-
-            # BPM varies - sample at quarter-beat intervals
-            current_time = start_time
-            remaining_beats = beat_offset
-            sample_size = 0.25  # Quarter-beat samples for accuracy
-
-            while remaining_beats > 0:
-                bpm = song_structure.get_bpm_at_time(current_time)
-                seconds_per_beat = 60.0 / bpm
-
-                beats_this_sample = min(remaining_beats, sample_size)
-                time_this_sample = beats_this_sample * seconds_per_beat
-
-                current_time += time_this_sample
-                remaining_beats -= beats_this_sample
-
-            return current_time
+        if hasattr(song_structure, 'time_to_beat'):
+            start_beat = song_structure.time_to_beat(start_time)
+
+            def beat_to_time(beat_offset: float) -> float:
+                """Convert a beat offset from riff start to absolute time."""
+                if beat_offset <= 0:
+                    return start_time
+                return song_structure.beat_to_time(start_beat + beat_offset)
+        else:
+            def beat_to_time(beat_offset: float) -> float:
+                """Convert a beat offset from riff start to absolute time.
+
+                For efficiency, check if BPM is constant first.
+                If not, sample at quarter-beat intervals for accuracy.
+                """
+                if beat_offset <= 0:
+                    return start_time
+
+                # Check if BPM is constant across the riff duration
+                # (optimization for the common case)
+                start_bpm = song_structure.get_bpm_at_time(start_time)
+                # Estimate end time assuming constant BPM
+                estimated_end = start_time + (self.length_beats * 60.0 / start_bpm)
+                end_bpm = song_structure.get_bpm_at_time(estimated_end)
+
+                if abs(start_bpm - end_bpm) < 0.01:
+                    # BPM is constant, use simple calculation
+                    seconds_per_beat = 60.0 / start_bpm
+                    return start_time + (beat_offset * seconds_per_beat)
+
+                # BPM varies - sample at quarter-beat intervals
+                current_time = start_time
+                remaining_beats = beat_offset
+                sample_size = 0.25  # Quarter-beat samples for accuracy
+
+                while remaining_beats > 0:
+                    bpm = song_structure.get_bpm_at_time(current_time)
+                    seconds_per_beat = 60.0 / bpm
+
+                    beats_this_sample = min(remaining_beats, sample_size)
+                    time_this_sample = beats_this_sample * seconds_per_beat
+
+                    current_time += time_this_sample
+                    remaining_beats -= beats_this_sample
+
+                return current_time
 
         # Convert dimmer blocks
         dimmer_blocks = []
@@ -1498,75 +1509,17 @@ class Configuration:
         elif sys.platform == 'darwin':
             qlc_fixture_dirs.append(os.path.expanduser('~/Library/Application Support/QLC+/fixtures'))
 
-        # Scan all fixture definitions first
+        # Scan all fixture definitions first (compiled once per file and
+        # cached on disk; later files override earlier ones)
         fixture_definitions = {}
-        for dir_path in qlc_fixture_dirs:
-            if os.path.exists(dir_path):
-                for manufacturer_dir in os.listdir(dir_path):
-                    manufacturer_path = os.path.join(dir_path, manufacturer_dir)
-                    if os.path.isdir(manufacturer_path):
-                        for fixture_file in os.listdir(manufacturer_path):
-                            if fixture_file.endswith('.qxf'):
-                                fixture_path = os.path.join(manufacturer_path, fixture_file)
-                                try:
-                                    tree = ET.parse(fixture_path)
-                                    root = tree.getroot()
-                                    ns = {'': 'http://www.qlcplus.org/FixtureDefinition'}
-
-                                    manufacturer = root.find('.//Manufacturer', ns).text
-                                    model = root.find('.//Model', ns).text
-
-                                    # Determine fixture type once for all modes
-                                    fixture_type = determine_fixture_type(root)
-
-                                    # Get all available modes
-                                    modes = []
-                                    for mode in root.findall('.//Mode', ns):
-                                        mode_name = mode.get('Name')
-                                        channels = mode.findall('Channel', ns)
-                                        modes.append({
-                                            'name': mode_name,
-                                            'channels': len(channels),
-                                            'type': fixture_type  # Same type for all modes
-                                        })
-
-                                    fixture_definitions[(manufacturer, model)] = {
-                                        'path': fixture_path,
-                                        'modes': modes,
-                                        'type': fixture_type  # Store type at fixture level
-                                    }
-                                except Exception as e:
-                                    print(f"Error parsing fixture file {fixture_path}: {e}")
-                    elif manufacturer_path.endswith('.qxf'):
-                        try:
-                            tree = ET.parse(manufacturer_path)
-                            root = tree.getroot()
-                            ns = {'': 'http://www.qlcplus.org/FixtureDefinition'}
-
-                            manufacturer = root.find('.//Manufacturer', ns).text
-                            model = root.find('.//Model', ns).text
-
-                            # Determine fixture type once for all modes
-                            fixture_type = determine_fixture_type(root)
-
-                            # Get all available modes
-                            modes = []
-                            for mode in root.findall('.//Mode', ns):
-                                mode_name = mode.get('Name')
-                                channels = mode.findall('Channel', ns)
-                                modes.append({
-                                    'name': mode_name,
-                                    'channels': len(channels),
-                                    'type': fixture_type  # Same type for all modes
-                                })
-
-                            fixture_definitions[(manufacturer, model)] = {
-                                'path': manufacturer_path,
-                                'modes': modes,
-                                'type': fixture_type  # Store type at fixture level
-                            }
-                        except Exception as e:
-                            print(f"Error parsing fixture file {manufacturer_path}: {e}")
+        for record in get_fixture_database().records(qlc_fixture_dirs):
+            if record.modes is None:
+                continue
+            fixture_definitions[(record.manufacturer, record.model)] = {
+                'path': record.path,
+                'modes': [dict(mode, type=record.fixture_type) for mode in record.modes],
+                'type': record.fixture_type  # Store type at fixture level
+            }
         return fixture_definitions
 
     @staticmethod
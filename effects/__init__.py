@@ -1,11 +1,13 @@
-from effects.types import DimmerContext, DimmerResult, MovementContext, MovementResult
+from effects.types import DimmerContext, DimmerResult, DimmerBatchContext, MovementContext, MovementResult
 from effects.timing import parse_speed, get_bpm, movement_total_cycles, MOVEMENT_CYCLES_PER_BAR
 from effects.dimmer_effects import DIMMER_REGISTRY
+from effects.dimmer_kernels import DIMMER_KERNELS, evaluate_dimmer_batch, dimmer_batch_segmented
 from effects.movement_effects import MOVEMENT_REGISTRY
 
 __all__ = [
-    "DimmerContext", "DimmerResult",
+    "DimmerContext", "DimmerResult", "DimmerBatchContext",
     "MovementContext", "MovementResult",
     "parse_speed", "get_bpm", "movement_total_cycles", "MOVEMENT_CYCLES_PER_BAR",
     "DIMMER_REGISTRY", "MOVEMENT_REGISTRY",
+    "DIMMER_KERNELS", "evaluate_dimmer_batch", "dimmer_batch_segmented",
 ]
@@ -0,0 +1,414 @@
+"""Batched NumPy versions of the dimmer effects in ``dimmer_effects``.
+
+Each kernel evaluates one effect for many (time, fixture, segment) samples in
+a single call. Per-sample inputs are arrays that broadcast against each other,
+so passing times of shape (T, 1, 1), fixture indices of shape (1, F, 1) and
+segment indices of shape (1, 1, S) yields a (T, F, S) intensity matrix.
+
+Kernels follow the scalar functions step by step so results match the
+registry; the scalar versions remain the reference implementation.
+"""
+
+import math
+import random
+import hashlib
+from functools import lru_cache
+from typing import Dict, Callable
+
+import numpy as np
+
+from effects.types import DimmerBatchContext
+
+
+# ──────────────────────────────────────────────
+# Helper functions
+# ──────────────────────────────────────────────
+
+@lru_cache(maxsize=1024)
+def _name_hash(name: str) -> int:
+    """First 32 bits of the MD5 of a fixture name (waterfall offsets)."""
+    return int(hashlib.md5(name.encode()).hexdigest()[:8], 16)
+
+
+@lru_cache(maxsize=4096)
+def _sparkle_row(name: str, step: int, num_segments: int) -> np.ndarray:
+    """Sparkle target levels for every segment of one fixture at one step."""
+    row = np.empty(num_segments)
+    for seg_idx in range(num_segments):
+        seed_str = f"{name}_seg{seg_idx}_{step}"
+        seed_hash = int(hashlib.md5(seed_str.encode()).hexdigest()[:8], 16)
+        row[seg_idx] = random.Random(seed_hash).random() * 0.7 + 0.3
+    row.flags.writeable = False
+    return row
+
+
+@lru_cache(maxsize=256)
+def _shuffled_order(seed: int, total_fixtures: int) -> np.ndarray:
+    """Deck-of-cards order used by random_stroke for one cycle."""
+    rng = random.Random(seed)
+    shuffled_indices = list(range(total_fixtures))
+    rng.shuffle(shuffled_indices)
+    return np.array(shuffled_indices)
+
+
+def _shape(*arrays):
+    return np.broadcast_shapes(*(np.shape(a) for a in arrays))
+
+
+def _chase_bounce_calc(t, seconds_per_beat, speed_multiplier, num_items):
+    """Vector form of ``dimmer_effects._chase_bounce_calc``."""
+    time_per_pass = (seconds_per_beat * 2) / speed_multiplier
+    cycle_time = time_per_pass * 2
+    time_in_cycle = t % cycle_time
+
+    going_forward = time_in_cycle < time_per_pass
+    head_position = np.where(
+        going_forward,
+        (time_in_cycle / time_per_pass) * (num_items - 1),
+        (num_items - 1) * (1.0 - (time_in_cycle - time_per_pass) / time_per_pass),
+    )
+    return head_position, going_forward
+
+
+def _chase_tail_intensity(distance, tail_length):
+    """Vector form of ``dimmer_effects._chase_tail_intensity``."""
+    fade_factor = 1.0 - (distance / (tail_length + 1))
+    return np.select(
+        [distance < -0.5, distance < 0.5, distance <= tail_length],
+        [0.0, 1.0, fade_factor * 0.8],
+        default=0.0,
+    )
+
+
+# ──────────────────────────────────────────────
+# Kernels (alphabetical by rudiment name)
+# ──────────────────────────────────────────────
+
+def cascade(ctx: DimmerBatchContext, t, f, s) -> np.ndarray:
+    if ctx.block_duration <= 0:
+        return np.ones(_shape(t, f, s))
+
+    progress = t / ctx.block_duration
+    build_fraction = ctx.build_fraction
+    with np.errstate(divide='ignore', invalid='ignore'):
+        release = np.maximum(0.0, 1.0 - ((progress - build_fraction) / (1.0 - build_fraction)) * 3)
+    values = np.where(progress < build_fraction, progress / build_fraction, release)
+    return np.broadcast_to(values, _shape(t, f, s))
+
+
+def chase(ctx: DimmerBatchContext, t, f, s) -> np.ndarray:
+    seconds_per_beat = 60.0 / ctx.bpm
+
+    if ctx.is_segmented and ctx.chase_scope == "global":
+        num_items = ctx.num_segments * ctx.total_fixtures
+        position = f * ctx.num_segments + s
+    elif ctx.is_segmented:
+        num_items = ctx.num_segments
+        position = s
+    else:
+        num_items = ctx.total_fixtures
+        position = f
+    tail_length = max(1, num_items // 2)
+
+    head_position, going_forward = _chase_bounce_calc(t, seconds_per_beat, ctx.speed_multiplier, num_items)
+    distance = np.where(going_forward, head_position - position, position - head_position)
+    return np.broadcast_to(_chase_tail_intensity(distance, tail_length), _shape(t, f, s))
+
+
+def fade(ctx: DimmerBatchContext, t, f, s) -> np.ndarray:
+    if ctx.block_duration <= 0:
+        return np.ones(_shape(t, f, s))
+
+    progress = np.clip(t / ctx.block_duration, 0.0, 1.0)
+    values = 1.0 - progress if ctx.direction == "out" else progress
+    return np.broadcast_to(values, _shape(t, f, s))
+
+
+def fill(ctx: DimmerBatchContext, t, f, s) -> np.ndarray:
+    seconds_per_beat = 60.0 / ctx.bpm
+    time_per_phase = (seconds_per_beat * 2) / ctx.speed_multiplier
+    cycle_time = time_per_phase * 2
+    time_in_cycle = t % cycle_time
+    filling = time_in_cycle < time_per_phase
+
+    if not ctx.is_segmented:
+        return np.broadcast_to(np.where(filling, 1.0, 0.0), _shape(t, f, s))
+
+    fill_progress = np.where(
+        filling,
+        time_in_cycle / time_per_phase,
+        1.0 - ((time_in_cycle - time_per_phase) / time_per_phase),
+    )
+    center = (ctx.num_segments - 1) / 2.0
+    current_fill_distance = fill_progress * center
+    distance_from_center = np.abs(s - center)
+
+    edge = (current_fill_distance > 0) & (distance_from_center > current_fill_distance - 1)
+    inside = np.where(
+        edge,
+        np.minimum(1.0, (current_fill_distance - distance_from_center) + 0.2),
+        1.0,
+    )
+    values = np.where(distance_from_center <= current_fill_distance, inside, 0.0)
+    return np.broadcast_to(values, _shape(t, f, s))
+
+
+def heartbeat(ctx: DimmerBatchContext, t, f, s) -> np.ndarray:
+    seconds_per_beat = 60.0 / ctx.bpm
+    seconds_per_bar = seconds_per_beat * 4
+    cycle_time = seconds_per_bar / ctx.speed_multiplier
+
+    cycle_pos = (t % cycle_time) / cycle_time
+    floor = 0.2
+
+    values = np.select(
+        [cycle_pos < 0.10, cycle_pos < 0.20, cycle_pos < 0.30, cycle_pos < 0.50],
+        [
+            floor + (1.0 - floor) * (cycle_pos / 0.10),
+            1.0 - (1.0 - 0.6) * ((cycle_pos - 0.10) / 0.10),
+            0.6 + (0.8 - 0.6) * ((cycle_pos - 0.20) / 0.10),
+            0.8 - (0.8 - floor) * ((cycle_pos - 0.30) / 0.20),
+        ],
+        default=floor,
+    )
+    return np.broadcast_to(values, _shape(t, f, s))
+
+
+def ping_pong(ctx: DimmerBatchContext, t, f, s) -> np.ndarray:
+    if ctx.total_fixtures <= 1:
+        return np.ones(_shape(t, f, s))
+
+    seconds_per_beat = 60.0 / ctx.bpm
+    time_per_fixture = seconds_per_beat / ctx.speed_multiplier
+
+    steps_in_cycle = (ctx.total_fixtures - 1) * 2
+    cycle_time = time_per_fixture * steps_in_cycle
+
+    time_in_cycle = t % cycle_time
+    current_step = time_in_cycle / time_per_fixture
+    step_index = np.floor(current_step)
+    time_within_step = (current_step - step_index) * time_per_fixture
+
+    going_forward = step_index < (ctx.total_fixtures - 1)
+    active_fixture = np.where(going_forward, step_index, steps_in_cycle - step_index)
+    prev_fixture = np.where(going_forward, active_fixture - 1, active_fixture + 1)
+
+    decay_progress = time_within_step / time_per_fixture
+    active_level = 0.2 + 0.8 * np.exp(-decay_progress * 3)
+    tail_level = 0.3 * (1.0 - time_within_step / (time_per_fixture * 0.3))
+    in_tail = (f == prev_fixture) & (time_within_step < time_per_fixture * 0.3)
+
+    values = np.where(f == active_fixture, active_level, np.where(in_tail, tail_level, 0.0))
+    return np.broadcast_to(values, _shape(t, f, s))
+
+
+def pulse(ctx: DimmerBatchContext, t, f, s) -> np.ndarray:
+    seconds_per_beat = 60.0 / ctx.bpm
+    seconds_per_bar = seconds_per_beat * 4
+    cycle_time = seconds_per_bar / ctx.speed_multiplier
+
+    if ctx.phase_offset_per_fixture and ctx.total_fixtures > 1:
+        phase_offset = (np.asarray(f) / ctx.total_fixtures) * cycle_time
+    else:
+        phase_offset = 0.0
+
+    phase = ((t + phase_offset) / cycle_time) * 2 * math.pi
+    floor = 0.3
+    values = floor + (1 - floor) * (np.sin(phase) + 1) / 2
+    return np.broadcast_to(values, _shape(t, f, s))
+
+
+def random_stroke(ctx: DimmerBatchContext, t, f, s) -> np.ndarray:
+    if ctx.total_fixtures <= 1:
+        return np.ones(_shape(t, f, s))
+
+    seconds_per_beat = 60.0 / ctx.bpm
+    time_per_fixture = seconds_per_beat / ctx.speed_multiplier
+    cycle_time = time_per_fixture * ctx.total_fixtures
+    cycle_number = np.floor(np.asarray(t) / cycle_time).astype(np.int64)
+    time_in_cycle = t % cycle_time
+    current_step = time_in_cycle / time_per_fixture
+    step_index = np.floor(current_step)
+    time_within_step = (current_step - step_index) * time_per_fixture
+
+    # One shuffle per cycle; only the few cycles present in the batch are built
+    base_seed = int(ctx.block_start_time * 1000)
+    active_fixture = np.empty(cycle_number.shape, dtype=np.int64)
+    slot = step_index.astype(np.int64) % ctx.total_fixtures
+    for cycle in np.unique(cycle_number):
+        mask = cycle_number == cycle
+        order = _shuffled_order(base_seed + int(cycle), ctx.total_fixtures)
+        active_fixture[mask] = order[slot[mask]]
+
+    decay_progress = time_within_step / time_per_fixture
+    values = np.where(f == active_fixture, 0.2 + 0.8 * np.exp(-decay_progress * 3), 0.0)
+    return np.broadcast_to(values, _shape(t, f, s))
+
+
+def sparkle(ctx: DimmerBatchContext, t, f, s) -> np.ndarray:
+    step_duration = 0.2 / ctx.speed_multiplier
+    step_float = np.asarray(t) / step_duration
+    current_step = np.floor(step_float)
+    transition_progress = step_float - current_step
+
+    f_b, s_b, step_b = np.broadcast_arrays(f, s, current_step.astype(np.int64))
+    keys = np.stack([f_b.ravel(), step_b.ravel()], axis=1)
+    unique_keys, inverse = np.unique(keys, axis=0, return_inverse=True)
+    inverse = inverse.reshape(-1)
+    seg_flat = s_b.ravel()
+
+    # Target levels at the current and next step for every (fixture, step) in the batch
+    levels = []
+    for step_offset in (0, 1):
+        table = np.stack([
+            _sparkle_row(ctx.fixture_names[int(fixture_index)], int(step) + step_offset, ctx.num_segments)
+            for fixture_index, step in unique_keys
+        ])
+        levels.append(table[inverse, seg_flat].reshape(f_b.shape))
+    current_variation, next_variation = levels
+
+    smooth_t = transition_progress * transition_progress * (3 - 2 * transition_progress)
+    return current_variation + (next_variation - current_variation) * smooth_t
+
+
+def static(ctx: DimmerBatchContext, t, f, s) -> np.ndarray:
+    return np.ones(_shape(t, f, s))
+
+
+def strobe(ctx: DimmerBatchContext, t, f, s) -> np.ndarray:
+    strobe_hz = 2.0 * ctx.speed_multiplier
+    phase = (t * strobe_hz) % 1.0
+    return np.broadcast_to(np.where(phase < 0.5, 1.0, 0.0), _shape(t, f, s))
+
+
+def stroke(ctx: DimmerBatchContext, t, f, s) -> np.ndarray:
+    seconds_per_beat = 60.0 / ctx.bpm
+    time_per_hit = seconds_per_beat / ctx.speed_multiplier
+    time_in_cycle = t % time_per_hit
+
+    decay_progress = time_in_cycle / time_per_hit
+    return np.broadcast_to(np.exp(-decay_progress * 3), _shape(t, f, s))
+
+
+def throb(ctx: DimmerBatchContext, t, f, s) -> np.ndarray:
+    seconds_per_beat = 60.0 / ctx.bpm
+    time_per_pulse = seconds_per_beat / ctx.speed_multiplier
+    time_in_cycle = t % time_per_pulse
+
+    min_intensity = 0.7
+    decay_progress = time_in_cycle / time_per_pulse
+    values = min_intensity + (1.0 - min_intensity) * np.exp(-decay_progress * 4)
+    return np.broadcast_to(values, _shape(t, f, s))
+
+
+def waterfall(ctx: DimmerBatchContext, t, f, s) -> np.ndarray:
+    if not ctx.is_segmented:
+        return np.ones(_shape(t, f, s))
+
+    seconds_per_beat = 60.0 / ctx.bpm
+    time_per_step = seconds_per_beat / ctx.speed_multiplier
+    direction_down = (ctx.direction == "down")
+    num_segments = ctx.num_segments
+
+    # Per-fixture offsets from the name hash, looked up by fixture index
+    name_hashes = np.array([_name_hash(name) for name in ctx.fixture_names], dtype=np.int64)
+    fixture_hash = name_hashes[np.asarray(f, dtype=np.int64)]
+    base_offset = (fixture_hash % 1000) / 1000.0
+    drift_seed = (fixture_hash % 997) / 997.0 * 2 * math.pi
+
+    drift_period = 30.0
+    current_time = ctx.block_start_time + t
+    drift_phase = (current_time / drift_period) * 2 * math.pi
+    drift_amount = 0.3 * np.sin(drift_phase + drift_seed)
+
+    total_offset = base_offset + drift_amount
+
+    cycle_time = time_per_step * num_segments
+    cycle_progress = (t / cycle_time + total_offset) % 1.0
+    head_position = cycle_progress * num_segments
+
+    if direction_down:
+        head_position = (num_segments - 1) - head_position
+        raw_distance = s - head_position
+    else:
+        raw_distance = head_position - s
+
+    circular_distance = raw_distance % num_segments
+    normalized_dist = circular_distance / num_segments
+    return np.broadcast_to(np.exp(-1.5 * normalized_dist), _shape(t, f, s))
+
+
+def wave(ctx: DimmerBatchContext, t, f, s) -> np.ndarray:
+    seconds_per_beat = 60.0 / ctx.bpm
+    seconds_per_bar = seconds_per_beat * 4
+    cycle_time = seconds_per_bar / ctx.speed_multiplier
+
+    wavelength = max(2, ctx.total_fixtures / 2)
+    time_progress = t / cycle_time
+    wave_pos = 2 * math.pi * (f / wavelength - time_progress)
+    return np.broadcast_to((np.sin(wave_pos) + 1) / 2, _shape(t, f, s))
+
+
+# ──────────────────────────────────────────────
+# Registry and dispatch
+# ──────────────────────────────────────────────
+
+DIMMER_KERNELS: Dict[str, Callable[..., np.ndarray]] = {
+    "static": static,
+    "stroke": stroke,
+    "throb": throb,
+    "ping_pong": ping_pong,
+    "chase": chase,
+    "wave": wave,
+    "waterfall": waterfall,
+    "fill": fill,
+    "random_stroke": random_stroke,
+    "sparkle": sparkle,
+    "pulse": pulse,
+    "strobe": strobe,
+    "fade": fade,
+    "cascade": cascade,
+    "heartbeat": heartbeat,
+}
+
+# Effects whose scalar version never returns segment intensities
+_SCALAR_ONLY = {"static", "strobe"}
+# One-shot effects that fall back to a scalar 1.0 for zero-length blocks
+_DURATION_BASED = {"cascade", "fade"}
+
+
+def evaluate_dimmer_batch(effect_type: str, ctx: DimmerBatchContext,
+                          time_in_block, fixture_index, segment_index) -> np.ndarray:
+    """
+    Evaluate a dimmer effect for a batch of samples.
+
+    Args:
+        effect_type: Key into DIMMER_KERNELS (unknown effects evaluate as static)
+        ctx: Block-level effect inputs
+        time_in_block: Seconds since block start, array-like
+        fixture_index: Fixture indices within the group, array-like
+        segment_index: Segment indices within each fixture, array-like
+
+    Returns:
+        Intensity multipliers (0.0-1.0) with the broadcast shape of the inputs
+    """
+    kernel = DIMMER_KERNELS.get(effect_type, static)
+    return kernel(ctx, np.asarray(time_in_block, dtype=float),
+                  np.asarray(fixture_index), np.asarray(segment_index))
+
+
+def dimmer_batch_segmented(effect_type: str, ctx: DimmerBatchContext) -> bool:
+    """
+    Whether the scalar effect would return per-segment intensities.
+
+    DMX output treats a per-segment result differently from a single
+    multiplier (e.g. pixel bars move the modulation to the colour channels),
+    so callers need this alongside the intensity matrix.
+    """
+    if effect_type not in DIMMER_KERNELS or effect_type in _SCALAR_ONLY:
+        return False
+    if effect_type == "sparkle":
+        return True
+    if effect_type in _DURATION_BASED and ctx.block_duration <= 0:
+        return False
+    return ctx.is_segmented
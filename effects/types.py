@@ -1,5 +1,5 @@
 from dataclasses import dataclass, field
-from typing import List, Optional
+from typing import List, Optional, Sequence
 
 
 @dataclass
@@ -34,6 +34,27 @@ class DimmerResult:
     segment_intensities: Optional[List[float]] = None
 
 
+@dataclass
+class DimmerBatchContext:
+    """Block-level inputs for evaluating a dimmer effect over many samples.
+
+    Per-sample inputs (time in block, fixture index, segment index) are passed
+    as arrays to ``evaluate_dimmer_batch``; everything here is shared.
+    """
+    block_duration: float
+    speed_multiplier: float
+    bpm: float
+    total_fixtures: int
+    num_segments: int
+    block_start_time: float
+    is_segmented: bool
+    fixture_names: Sequence[str] = ()     # indexed by fixture_index (sparkle/waterfall seeds)
+    direction: str = "down"
+    chase_scope: str = "fixture"
+    phase_offset_per_fixture: bool = False
+    build_fraction: float = 0.7
+
+
 @dataclass
 class MovementContext:
     """All inputs a movement shape needs to compute pan/tilt."""
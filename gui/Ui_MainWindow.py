@@ -204,6 +204,8 @@ class Ui_MainWindow(object):
         self.actionAudioSettings = QAction("Audio Settings...", MainWindow)
         self.actionAudioSettings.setShortcut("Ctrl+,")
         self.menuSettings.addAction(self.actionAudioSettings)
+        self.actionClearAudioCache = QAction("Clear Audio Cache", MainWindow)
+        self.menuSettings.addAction(self.actionClearAudioCache)
 
         # Help menu
         self.menuHelp = QtWidgets.QMenu("Help", parent=self.menubar)
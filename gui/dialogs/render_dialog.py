@@ -5,7 +5,7 @@ import os
 from PyQt6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel,
                               QComboBox, QPushButton, QFileDialog, QLineEdit,
                               QCheckBox, QGroupBox, QScrollArea, QWidget,
-                              QProgressBar, QTextEdit, QApplication)
+                              QProgressBar, QTextEdit, QApplication, QSpinBox)
 from PyQt6.QtCore import Qt, QThread, pyqtSignal
 from PyQt6.QtGui import QFont
 
@@ -19,13 +19,14 @@ class RenderWorker(QThread):
     finished = pyqtSignal(str, bool)  # show_name, success
 
     def __init__(self, config, show, fixture_definitions, camera_preset,
-                 output_path, parent=None):
+                 output_path, workers=1, parent=None):
         super().__init__(parent)
         self.config = config
         self.show = show
         self.fixture_definitions = fixture_definitions
         self.camera_preset = camera_preset
         self.output_path = output_path
+        self.workers = workers
         self._renderer = None
 
     def run(self):
@@ -36,6 +37,7 @@ class RenderWorker(QThread):
             fixture_definitions=self.fixture_definitions,
             camera_preset_name=self.camera_preset,
             output_path=self.output_path,
+            workers=self.workers,
             progress_callback=lambda cur, tot, msg: self.progress.emit(cur, tot, msg),
         )
         success = self._renderer.render()
@@ -111,6 +113,16 @@ class RenderDialog(QDialog):
             self._camera_combo.addItem(f"{name} - {preset['description']}", name)
         self._camera_combo.setCurrentIndex(0)
         cam_row.addWidget(self._camera_combo, stretch=1)
+        cam_row.addWidget(QLabel("Workers:"))
+        self._workers_spin = QSpinBox()
+        self._workers_spin.setRange(1, max(1, os.cpu_count() or 1))
+        self._workers_spin.setValue(1)
+        self._workers_spin.setToolTip(
+            "Render processes. Each renders a time chunk of the show; the chunks\n"
+            "are joined without re-encoding. Every worker needs its own OpenGL\n"
+            "context and GPU memory."
+        )
+        cam_row.addWidget(self._workers_spin)
         layout.addLayout(cam_row)
 
         # Output directory
@@ -180,7 +192,7 @@ class RenderDialog(QDialog):
             QGroupBox { color: white; font-weight: bold; border: 1px solid #555; border-radius: 4px; margin-top: 10px; padding-top: 15px; }
             QGroupBox::title { subcontrol-origin: margin; left: 10px; padding: 0 3px; }
             QCheckBox { color: white; }
-            QComboBox, QLineEdit { background-color: #2d2d2d; color: white; border: 1px solid #555; border-radius: 3px; padding: 4px; }
+            QComboBox, QLineEdit, QSpinBox { background-color: #2d2d2d; color: white; border: 1px solid #555; border-radius: 3px; padding: 4px; }
             QScrollArea { border: none; background-color: #2d2d2d; }
             QScrollArea > QWidget > QWidget { background-color: #2d2d2d; }
             QProgressBar { border: 1px solid #555; border-radius: 3px; background-color: #2d2d2d; text-align: center; color: white; }
@@ -252,7 +264,7 @@ class RenderDialog(QDialog):
 
         self._worker = RenderWorker(
             self.config, show, self.fixture_definitions,
-            camera_preset, output_path
+            camera_preset, output_path, workers=self._workers_spin.value()
         )
         self._worker.progress.connect(self._on_progress)
         self._worker.finished.connect(
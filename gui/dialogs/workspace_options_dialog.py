@@ -1,6 +1,8 @@
 # gui/dialogs/workspace_options_dialog.py
 # Dialog for configuring QLC+ workspace export options
 
+import os
+
 from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QCheckBox, QGroupBox,
     QDialogButtonBox, QLabel, QSpinBox, QGridLayout, QComboBox
@@ -190,6 +192,23 @@ class WorkspaceOptionsDialog(QDialog):
         version_layout.addWidget(self.qlc_version_combo)
         layout.addWidget(version_group)
 
+        # Parallel step generation for large show sets
+        performance_group = QGroupBox("Export Performance")
+        performance_layout = QHBoxLayout(performance_group)
+        performance_layout.addWidget(QLabel("Worker processes:"))
+        self.export_workers_spinbox = QSpinBox()
+        self.export_workers_spinbox.setRange(0, os.cpu_count() or 1)
+        self.export_workers_spinbox.setValue(1)
+        self.export_workers_spinbox.setSpecialValueText("All CPUs")
+        self.export_workers_spinbox.setToolTip(
+            "Generate show sequences in parallel worker processes.\n"
+            "1 = serial export. The workspace file is identical either way;\n"
+            "more workers only help with many shows or long timelines."
+        )
+        performance_layout.addWidget(self.export_workers_spinbox)
+        performance_layout.addStretch()
+        layout.addWidget(performance_group)
+
         # Dark mode option
         appearance_group = QGroupBox("Appearance")
         appearance_layout = QVBoxLayout(appearance_group)
@@ -243,6 +262,8 @@ class WorkspaceOptionsDialog(QDialog):
                 - group_intensities: dict[str, int] - Per-group max intensity (0-255)
                 - qlc_target_version: str - Version string stamped into
                   <Creator><Version> (cosmetic; e.g. "4.14.4" or "5.2.1")
+                - export_workers: int - Worker processes for show sequence
+                  generation (1 = serial, 0 = one per CPU)
         """
         group_intensities = {
             name: spinbox.value()
@@ -259,4 +280,5 @@ class WorkspaceOptionsDialog(QDialog):
             'dark_mode': self.dark_mode_checkbox.isChecked(),
             'group_intensities': group_intensities,
             'qlc_target_version': self.qlc_version_combo.currentData() or DEFAULT_QLC_TARGET_VERSION,
+            'export_workers': self.export_workers_spinbox.value(),
         }
@@ -393,6 +393,7 @@ class MainWindow(QMainWindow, Ui_MainWindow):
 
         # Settings menu actions
         self.actionAudioSettings.triggered.connect(self.open_audio_settings)
+        self.actionClearAudioCache.triggered.connect(self.clear_audio_cache)
 
         # View menu actions
         self.actionToggleFullscreen.triggered.connect(self._toggle_fullscreen)
@@ -1150,6 +1151,23 @@ class MainWindow(QMainWindow, Ui_MainWindow):
             import traceback
             traceback.print_exc()
 
+    def clear_audio_cache(self):
+        """Delete the decoded audio and waveform caches under ~/.qlcautoshow"""
+        try:
+            from audio.pcm_cache import PCMCache
+            from audio.waveform_analyzer import WaveformAnalyzer
+        except (ImportError, OSError) as e:
+            QMessageBox.warning(self, "Clear Audio Cache", f"Audio support is not available: {e}")
+            return
+        PCMCache().clear_cache()
+        WaveformAnalyzer().clear_cache()
+        QMessageBox.information(
+            self,
+            "Clear Audio Cache",
+            "Decoded audio and waveform caches were cleared. Songs are decoded "
+            "again the next time they are loaded."
+        )
+
     def show_about(self):
         """Show about dialog"""
         QMessageBox.about(
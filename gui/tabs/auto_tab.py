@@ -271,7 +271,7 @@ class AutoTab(BaseTab):
         # Embedded visualizer. Build mode at construction so all fixtures
         # light up before the user hits START; preview flips to "live"
         # in _on_start (DMX from AutoDMXController feeds it via the
-        # local_dmx_callback hook) and back to "build" in _on_stop.
+        # DMX stream callback) and back to "build" in _on_stop.
         self.embedded_visualizer = EmbeddedVisualizer(self)
         self.embedded_visualizer.set_pop_out_callback(self._launch_visualizer)
         self.embedded_visualizer.set_config(self.config)
@@ -1032,19 +1032,20 @@ class AutoTab(BaseTab):
 
             target_ip = self._ip_input.text().strip() or "192.168.1.151"
             # Forward each DMX frame to the embedded visualizer in-process
-            # so the right-pane preview mirrors what's being broadcast
-            # over ArtNet — no extra TCP/ArtNet round-trip. Wrap in a
-            # guard so a torn-down visualizer can't blow up the DMX
-            # thread mid-show.
-            def _feed_embedded(universe: int, dmx_bytes: bytes) -> None:
+            # as a delta-compressed stream frame so the right-pane preview
+            # mirrors what's being broadcast over ArtNet — no extra
+            # TCP/ArtNet round-trip, and only changed fixtures are
+            # touched. Wrap in a guard so a torn-down visualizer can't
+            # blow up the DMX thread mid-show.
+            def _feed_embedded(stream_frame: bytes) -> None:
                 vis = getattr(self, "embedded_visualizer", None)
                 if vis is not None:
-                    vis.feed_dmx(universe, dmx_bytes)
+                    vis.feed_dmx_stream(stream_frame)
 
             self._dmx_controller = AutoDMXController(
                 self.config, self.fixture_definitions, target_ip=target_ip,
-                local_dmx_callback=_feed_embedded,
             )
+            self._dmx_controller.set_dmx_stream_callback(_feed_embedded)
             # Only override the controller's default mapping if the
             # universe table actually has rows. An empty user mapping
             # used to silently wipe the controller's default (built
@@ -1073,7 +1074,14 @@ class AutoTab(BaseTab):
                 self._cleanup()
                 return
             self._bridge.start(self._live_input.ring_buffer)
-            self._dmx_controller.start()
+            if not self._dmx_controller.start():
+                self.show_error(
+                    "DMX output failed",
+                    "The previous DMX output thread is still busy and did "
+                    "not stop in time. Wait a moment and start again.",
+                )
+                self._cleanup()
+                return
 
             self._is_running = True
             self._ui_timer.start()
@@ -1082,7 +1090,7 @@ class AutoTab(BaseTab):
             self._stop_btn.setEnabled(True)
             self._set_phase("running")
 
-            # Flip the preview to "live" so feed_dmx frames drive it.
+            # Flip the preview to "live" so streamed DMX frames drive it.
             # In build mode the visualizer ignores DMX so the synthetic
             # full-on lights would mask the show.
             if self.embedded_visualizer is not None:
@@ -1159,7 +1167,7 @@ class AutoTab(BaseTab):
             pass
         # Stop the embedded visualizer's FPS timer; the GL surface gets
         # torn down through Qt's normal child-deletion. Order matters:
-        # _cleanup above already stopped the DMX thread so feed_dmx
+        # _cleanup above already stopped the DMX thread so feed_dmx_stream
         # can't be called once the engine is destroyed.
         if hasattr(self, "embedded_visualizer") and self.embedded_visualizer:
             try:
@@ -1285,6 +1293,16 @@ class AutoTab(BaseTab):
             total = self._engine.cycle_bars
             bar = self._engine.current_bar + 1
             self._status_bar_counter.setText(f"Bar: {bar}/{total}")
+            if self._dmx_controller is not None:
+                stats = self._dmx_controller.planner_stats()
+                if stats is not None:
+                    self._status_bar_counter.setToolTip(
+                        f"Lookahead planner: {stats.mean_latency_ms:.1f} ms mean, "
+                        f"{stats.max_latency_ms:.1f} ms max per plan "
+                        f"(bar = {stats.bar_ms:.0f} ms, min slack {stats.min_slack_ms:.0f} ms)\n"
+                        f"{stats.hits} bars on time, {stats.misses} planned late "
+                        f"(longest stall {stats.max_sync_ms:.1f} ms)"
+                    )
             phase = "fill" if self._engine.is_fill else "groove"
             self._status_phase.setText("FILL" if self._engine.is_fill else "GROOVE")
             self._set_phase(phase)
@@ -157,7 +157,7 @@ class ShowsTab(BaseTab):
 
         # Right-side embedded 3D preview. While playback is running and
         # the ArtNet controller is wired up, the preview mirrors the show
-        # via the local_dmx_callback path (no TCP/ArtNet round-trip).
+        # via the DMX stream callback (no TCP/ArtNet round-trip).
         # When stopped, it falls back to build mode so the user always
         # sees their fixtures lit. The standalone visualizer subprocess
         # keeps working unchanged for QLC+ interop.
@@ -997,10 +997,15 @@ class ShowsTab(BaseTab):
             if self.artnet_controller:
                 # Set initial position before starting playback
                 self.artnet_controller.update_position(self.playhead_position)
-                self.artnet_controller.start_playback()
+                if not self.artnet_controller.start_playback():
+                    self.show_error(
+                        "ArtNet output failed",
+                        "The previous DMX output thread is still busy, so this "
+                        "playback sends no DMX. Stop and start playback again.",
+                    )
 
         # Switch the embedded preview to live so the show drives it via
-        # local_dmx_callback. If ArtNet is off the callback never fires
+        # the DMX stream callback. If ArtNet is off the callback never fires
         # and the preview stays on whatever was last shown.
         if hasattr(self, "embedded_visualizer") and self.embedded_visualizer:
             self.embedded_visualizer.set_preview_mode("live")
@@ -1250,23 +1255,28 @@ class ShowsTab(BaseTab):
                 models_in_config = {(f.manufacturer, f.model) for f in self.config.fixtures}
                 fixture_defs = load_fixture_definitions_from_qlc(models_in_config)
 
-                # Create controller. The local_dmx_callback feeds the
+                # Create controller. The DMX stream callback feeds the
                 # embedded visualizer in-process so the right-side preview
                 # mirrors what's being broadcast over ArtNet — no TCP
-                # round-trip. Wrap in a guard so a torn-down visualizer
-                # doesn't blow up the DMX thread mid-show.
-                def _feed_embedded(universe: int, dmx_bytes: bytes) -> None:
+                # round-trip — and forwards the same delta frames to
+                # TCP-connected standalone visualizers. Wrap in a guard so
+                # a torn-down visualizer doesn't blow up the DMX thread
+                # mid-show.
+                def _feed_visualizers(stream_frame: bytes) -> None:
                     vis = getattr(self, "embedded_visualizer", None)
                     if vis is not None:
-                        vis.feed_dmx(universe, dmx_bytes)
+                        vis.feed_dmx_stream(stream_frame)
+                    tcp_server = getattr(self, "tcp_server", None)
+                    if tcp_server is not None:
+                        tcp_server.send_dmx_frame(stream_frame)
 
                 self.artnet_controller = ShowsArtNetController(
                     config=self.config,
                     fixture_definitions=fixture_defs,
                     song_structure=self.song_structure,
                     target_ip="255.255.255.255",  # Broadcast
-                    local_dmx_callback=_feed_embedded,
                 )
+                self.artnet_controller.set_dmx_stream_callback(_feed_visualizers)
 
                 # Set light lanes
                 self.artnet_controller.set_light_lanes(
@@ -1365,6 +1375,9 @@ class ShowsTab(BaseTab):
     def _on_tcp_client_connected(self, client_addr: str):
         """Handle TCP client connection."""
         print(f"Visualizer connected: {client_addr}")
+        # The new client can only decode the DMX stream from a keyframe
+        if self.artnet_controller is not None:
+            self.artnet_controller.request_dmx_keyframe()
 
     def _on_tcp_client_disconnected(self, client_addr: str):
         """Handle TCP client disconnection."""
@@ -1744,13 +1757,8 @@ class ShowsTab(BaseTab):
         # Find the lane widget for this timeline
         for lane_widget in self.lane_widgets:
             if lane_widget.timeline_widget is timeline_widget:
-                # Check if position is on any block widget
-                for block_widget in lane_widget.light_block_widgets:
-                    # Map pos to block widget coordinates
-                    block_pos = block_widget.mapFrom(timeline_widget, pos)
-                    if block_widget.rect().contains(block_pos):
-                        return False  # Clicked on a block
-                return True  # Clicked on empty space in this lane
+                # Empty unless the position is on a laid-out block widget
+                return lane_widget.block_widget_at(pos) is None
 
         return True  # Default to empty space
 
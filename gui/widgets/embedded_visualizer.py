@@ -14,13 +14,19 @@ Two preview modes:
   Live ``feed_dmx`` calls are ignored in this mode.
 - **"live"**: pass through DMX from whoever is feeding us. Used while
   playback is running so the embedded preview mirrors the show.
+
+The engine renders on demand — only when DMX, the camera or an animated
+effect changes the picture — under a frame-rate cap picked in the toolbar
+(persisted as ``visualizer/max_fps``). The engine lowers the effective
+rate further while the UI thread is busy so the hosting tab's timeline
+stays responsive.
 """
 
 from typing import Callable, Optional
 
-from PyQt6.QtCore import Qt, QTimer, pyqtSignal
+from PyQt6.QtCore import Qt, QTimer, QSettings, pyqtSignal
 from PyQt6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel,
+    QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, QComboBox,
 )
 
 
@@ -43,6 +49,10 @@ _BUILD_MODE_DEFAULTS = {
     "zoom": 128,
 }
 
+# Frame-rate caps offered in the toolbar.
+_MAX_FPS_CHOICES = (15, 30, 60)
+_DEFAULT_MAX_FPS = 60
+
 
 class EmbeddedVisualizer(QWidget):
     """Compact in-tab 3D preview wrapping ``RenderEngine``."""
@@ -53,6 +63,8 @@ class EmbeddedVisualizer(QWidget):
     # so direct mutation would race. The queued connection on the slot
     # in :meth:`_setup_ui` does the thread hop.
     _dmx_frame = pyqtSignal(int, object)
+    # Same thread hop for frames of the delta-compressed DMX stream.
+    _dmx_stream_frame = pyqtSignal(bytes)
 
     def __init__(self, parent: Optional[QWidget] = None):
         super().__init__(parent)
@@ -87,6 +99,15 @@ class EmbeddedVisualizer(QWidget):
 
         toolbar.addStretch()
 
+        self._max_fps_combo = QComboBox()
+        for fps in _MAX_FPS_CHOICES:
+            self._max_fps_combo.addItem(f"{fps} FPS max", fps)
+        self._max_fps_combo.setToolTip(
+            "Frame-rate cap for the preview. It only redraws when something "
+            "changes and slows down further while the UI is busy."
+        )
+        toolbar.addWidget(self._max_fps_combo)
+
         self._fps_label = QLabel("FPS: --")
         self._fps_label.setStyleSheet("font-family: monospace; font-size: 10px;")
         toolbar.addWidget(self._fps_label)
@@ -102,13 +123,19 @@ class EmbeddedVisualizer(QWidget):
         self._fps_timer.timeout.connect(self._update_fps_label)
         self._fps_timer.start(500)
 
+        self._restore_max_fps()
+
         self._reset_btn.clicked.connect(self._engine.reset_camera)
         self._popout_btn.clicked.connect(self._on_popout_clicked)
+        self._max_fps_combo.currentIndexChanged.connect(self._on_max_fps_changed)
 
         # Queued connection: emit-from-DMX-thread → slot-runs-on-main.
         self._dmx_frame.connect(
             self._apply_dmx_frame, Qt.ConnectionType.QueuedConnection,
         )
+        self._dmx_stream_frame.connect(
+            self._apply_dmx_stream_frame, Qt.ConnectionType.QueuedConnection,
+        )
 
     # ── Public API ────────────────────────────────────────────────────
 
@@ -162,11 +189,27 @@ class EmbeddedVisualizer(QWidget):
             return
         self._dmx_frame.emit(universe, dmx_bytes)
 
+    def feed_dmx_stream(self, payload: bytes) -> None:
+        """Forward a frame of the delta-compressed DMX stream
+        (:mod:`utils.dmx_stream`) to the engine.
+
+        Preferred over :meth:`feed_dmx` by the live controllers: a frame
+        carries only the channels that changed, and the engine only
+        touches the fixtures reading them. Thread-safe like
+        :meth:`feed_dmx`.
+        """
+        if payload:
+            self._dmx_stream_frame.emit(payload)
+
     def _apply_dmx_frame(self, universe: int, dmx_bytes: bytes) -> None:
         """Slot for the :pyattr:`_dmx_frame` queued signal — runs on the
         Qt main thread, safely mutates renderer state."""
         self._engine.update_dmx(universe, dmx_bytes)
 
+    def _apply_dmx_stream_frame(self, payload: bytes) -> None:
+        """Slot for the :pyattr:`_dmx_stream_frame` queued signal."""
+        self._engine.apply_dmx_stream(payload)
+
     def set_preview_mode(self, mode: str) -> None:
         """Switch between ``"build"`` and ``"live"``.
 
@@ -185,6 +228,15 @@ class EmbeddedVisualizer(QWidget):
     def preview_mode(self) -> str:
         return self._preview_mode
 
+    def set_max_fps(self, fps: int) -> None:
+        """Cap the preview frame rate (not persisted; the toolbar choice is)."""
+        self._engine.set_max_fps(fps)
+        index = self._max_fps_combo.findData(fps)
+        if index >= 0 and index != self._max_fps_combo.currentIndex():
+            self._max_fps_combo.blockSignals(True)
+            self._max_fps_combo.setCurrentIndex(index)
+            self._max_fps_combo.blockSignals(False)
+
     def set_pop_out_callback(self, callback: Optional[Callable[[], None]]) -> None:
         """Wire the Pop Out button to the standalone-visualizer launcher
         provided by the hosting tab."""
@@ -202,12 +254,29 @@ class EmbeddedVisualizer(QWidget):
         if self._pop_out_callback is not None:
             self._pop_out_callback()
 
+    def _restore_max_fps(self) -> None:
+        settings = QSettings("QLCShowCreator", "QLCShowCreator")
+        try:
+            fps = int(settings.value("visualizer/max_fps", _DEFAULT_MAX_FPS))
+        except (TypeError, ValueError):
+            fps = _DEFAULT_MAX_FPS
+        if fps not in _MAX_FPS_CHOICES:
+            fps = _DEFAULT_MAX_FPS
+        self.set_max_fps(fps)
+
+    def _on_max_fps_changed(self, index: int) -> None:
+        fps = self._max_fps_combo.itemData(index)
+        self._engine.set_max_fps(fps)
+        settings = QSettings("QLCShowCreator", "QLCShowCreator")
+        settings.setValue("visualizer/max_fps", fps)
+
     def _update_fps_label(self) -> None:
         try:
             fps = self._engine.get_fps()
         except Exception:
             return
-        self._fps_label.setText(f"FPS: {fps:.0f}")
+        # Render-on-demand draws nothing while the scene is static.
+        self._fps_label.setText(f"FPS: {fps:.0f}" if fps > 0 else "FPS: idle")
 
     def _push_build_mode_dmx(self) -> None:
         """Synthesise per-universe DMX buffers using sane defaults per
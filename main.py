@@ -78,4 +78,7 @@ def main():
         traceback.print_exc()
 
 if __name__ == "__main__":
+    # Workspace export can run step generation in spawned worker processes
+    import multiprocessing
+    multiprocessing.freeze_support()
     main()
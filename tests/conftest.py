@@ -26,6 +26,18 @@ def qapp():
     yield app
 
 
+# ---------------------------------------------------------------------------
+# Compiled fixture-definition cache (in memory per test)
+# ---------------------------------------------------------------------------
+@pytest.fixture(autouse=True)
+def isolated_fixture_database():
+    """Keep tests from reading or rewriting ~/.qlcautoshow/fixture_db.pickle."""
+    from utils.fixture_db import FixtureDatabase, set_fixture_database
+    set_fixture_database(FixtureDatabase(db_path=None))
+    yield
+    set_fixture_database(None)
+
+
 # ---------------------------------------------------------------------------
 # Sample data model fixtures
 # ---------------------------------------------------------------------------
@@ -0,0 +1,92 @@
+"""Tests for the shared, cached audio analysis context."""
+
+import shutil
+
+import numpy as np
+import pytest
+
+from audio.analysis_context import LIBROSA_AVAILABLE
+
+pytestmark = pytest.mark.skipif(not LIBROSA_AVAILABLE, reason="librosa not installed")
+
+
+@pytest.fixture
+def audio_path(tmp_path):
+    import soundfile as sf
+    sr = 22050
+    t = np.linspace(0, 4.0, int(sr * 4.0), endpoint=False)
+    audio = 0.4 * np.sin(2 * np.pi * 330 * t)
+    audio[::sr // 4] += 0.8  # clicks for onsets
+    path = tmp_path / "song" / "clip.wav"
+    path.parent.mkdir()
+    sf.write(str(path), audio, sr)
+    return str(path)
+
+
+@pytest.fixture
+def song_structure():
+    from timeline.song_structure import SongStructure
+    from config.models import ShowPart
+    parts = [
+        ShowPart(name="Verse", color="#00FF00", signature="4/4", bpm=120.0, num_bars=1, transition="instant"),
+        ShowPart(name="Chorus", color="#FF0000", signature="4/4", bpm=120.0, num_bars=1, transition="instant"),
+    ]
+    ss = SongStructure()
+    ss.load_from_show_parts(parts)
+    return ss
+
+
+class TestAnalysisContext:
+
+    def test_features_match_per_function_librosa_calls(self, audio_path):
+        import librosa
+        from audio.analysis_context import compute_analysis_context
+        context = compute_analysis_context(audio_path)
+        y, sr = librosa.load(audio_path, sr=22050, mono=True)
+        np.testing.assert_array_equal(
+            context.onset_env, librosa.onset.onset_strength(y=y, sr=sr, hop_length=512, n_fft=2048))
+        np.testing.assert_array_equal(
+            context.spectral_centroid,
+            librosa.feature.spectral_centroid(y=y, sr=sr, hop_length=512, n_fft=2048)[0])
+        np.testing.assert_array_equal(
+            context.spectral_flatness, librosa.feature.spectral_flatness(y=y, hop_length=512, n_fft=2048)[0])
+
+    def test_cache_written_next_to_audio_and_reused(self, audio_path, monkeypatch):
+        import os
+        from audio import analysis_context
+        first = analysis_context.load_analysis_context(audio_path)
+        cache_dir = os.path.join(os.path.dirname(audio_path), analysis_context.CACHE_DIR_NAME)
+        assert len(os.listdir(cache_dir)) == 1
+
+        def fail(path):
+            raise AssertionError("recomputed")
+        monkeypatch.setattr(analysis_context, "compute_analysis_context", fail)
+        second = analysis_context.load_analysis_context(audio_path)
+        assert second.sample_rate == first.sample_rate
+        assert second.duration == pytest.approx(first.duration)
+        np.testing.assert_array_equal(second.mel_db, first.mel_db)
+        np.testing.assert_array_equal(second.onset_times, first.onset_times)
+
+    def test_cache_keyed_by_content(self, audio_path, tmp_path, monkeypatch):
+        from audio import analysis_context
+        cache_dir = str(tmp_path / "cache")
+        analysis_context.load_analysis_context(audio_path, cache_dir=cache_dir)
+        renamed = str(tmp_path / "renamed.wav")
+        shutil.copy(audio_path, renamed)
+
+        def fail(path):
+            raise AssertionError("recomputed")
+        monkeypatch.setattr(analysis_context, "compute_analysis_context", fail)
+        analysis_context.load_analysis_context(renamed, cache_dir=cache_dir)
+
+    def test_shared_context_gives_same_results(self, audio_path, song_structure):
+        from audio.analysis_context import load_analysis_context
+        from audio.spectral_analysis import analyze_song, compute_beat_features, compute_frame_features
+        context = load_analysis_context(audio_path, use_cache=False)
+        assert analyze_song(audio_path, song_structure, context=context) == \
+            analyze_song(audio_path, song_structure)
+        assert compute_beat_features(audio_path, song_structure, context=context) == \
+            compute_beat_features(audio_path, song_structure)
+        frames = compute_frame_features(audio_path, context=context)
+        assert frames.flux == compute_frame_features(audio_path).flux
+        assert frames.mel_spectrogram_db.shape[0] == 128
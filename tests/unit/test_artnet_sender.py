@@ -126,4 +126,74 @@ class TestSenderInit:
 
     def test_min_interval(self):
         expected = 1.0 / 44
-        assert abs(ArtNetSender.MIN_SEND_INTERVAL - expected) < 0.001
\ No newline at end of file
+        assert abs(ArtNetSender.MIN_SEND_INTERVAL - expected) < 0.001
+
+class TestSendFrame:
+
+    def test_packets_patched_in_place_match_fresh_build(self, sender):
+        sender.sequence = 7
+        first = sender.create_dmx_packet(2, bytes([9] * 512))
+        second = sender.create_dmx_packet(2, bytes([1, 2, 3]))
+        assert first[12] == 7 and second[12] == 8
+        assert second[18:21] == bytes([1, 2, 3])
+        assert second[21:] == bytes(509)  # Stale payload cleared
+        assert second[:12] == first[:12] and second[13:18] == first[13:18]
+
+    def test_fallback_sends_every_universe(self, sender):
+        sender.socket.sendto = MagicMock()
+        sent = sender.send_frame([(0, bytes(10)), (1, bytes(10)), (2, bytes(10))])
+        assert sent == [0, 1, 2]
+        assert sender.socket.sendto.call_count == 3
+        universes = [struct.unpack('<H', bytes(call.args[0][14:16]))[0]
+                     for call in sender.socket.sendto.call_args_list]
+        assert universes == [0, 1, 2]
+
+    def test_rate_limited_universes_skipped(self, sender):
+        sender.socket.sendto = MagicMock()
+        sender.send_dmx(1, bytes(10), force=True)
+        assert sender.send_frame([(0, bytes(10)), (1, bytes(10))]) == [0]
+        assert sender.send_frame([(0, bytes(10)), (1, bytes(10))], force=True) == [0, 1]
+
+    def test_socket_error_returns_unsent(self, sender):
+        sender.socket.sendto = MagicMock(side_effect=OSError("Network error"))
+        assert sender.send_frame([(0, bytes(10))], force=True) == []
+        assert 0 not in sender.last_send_time
+
+    def test_sync_appended_after_frame(self, sender):
+        sender.socket.sendto = MagicMock()
+        assert sender.send_frame([(0, bytes(10)), (1, bytes(10))], sync=True) == [0, 1]
+        packets = [bytes(call.args[0]) for call in sender.socket.sendto.call_args_list]
+        assert len(packets) == 3
+        assert packets[2] == b'Art-Net\x00' + struct.pack('<H', 0x5200) + struct.pack('>H', 14) + bytes(2)
+
+    def test_no_sync_when_nothing_sent(self, sender):
+        sender.socket.sendto = MagicMock()
+        sender.send_dmx(0, bytes(10), force=True)
+        assert sender.send_frame([(0, bytes(10))], sync=True) == []
+        assert sender.socket.sendto.call_count == 1
+
+    def test_frame_on_44hz_cadence_not_dropped(self, sender):
+        sender.socket.sendto = MagicMock()
+        sender.send_frame([(0, bytes(10))])
+        # Scheduler wake-up slightly ahead of the nominal interval
+        sender.last_send_time[0] -= ArtNetSender.MIN_SEND_INTERVAL - 0.0005
+        assert sender.send_frame([(0, bytes(10))]) == [0]
+
+
+def test_batched_send_over_udp():
+    """Real loopback socket: sendmmsg (or the fallback) delivers identical packets."""
+    import socket
+    receiver = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    receiver.bind(("127.0.0.1", 0))
+    receiver.settimeout(2.0)
+    sender = ArtNetSender(target_ip="127.0.0.1", target_port=receiver.getsockname()[1])
+    reference = ArtNetSender(target_ip="127.0.0.1", target_port=9)
+    try:
+        frame = [(u, bytes([u] * (512 - u))) for u in range(8)]
+        expected = [reference.create_dmx_packet(u, data) for u, data in frame]
+        assert sender.send_frame(frame, force=True) == list(range(8))
+        assert [receiver.recv(1024) for _ in frame] == expected
+    finally:
+        sender.close()
+        reference.close()
+        receiver.close()
@@ -0,0 +1,137 @@
+# tests/unit/test_audio_mixer.py
+"""Unit tests for the PCM cache (audio/pcm_cache.py) and in-place lane mixing."""
+
+import os
+
+import numpy as np
+import pytest
+import soundfile as sf
+
+from audio.audio_file import AudioFile
+from audio.audio_mixer import AudioMixer
+from audio.pcm_cache import PCMCache
+
+
+def _lane(data: np.ndarray) -> AudioFile:
+    audio_file = AudioFile(use_cache=False)
+    audio_file._set_audio("lane.wav", data.astype(np.float32), 44100)
+    return audio_file
+
+
+@pytest.fixture
+def wav_path(tmp_path):
+    """One second of mono audio at 44.1 kHz."""
+    path = tmp_path / "tone.wav"
+    t = np.arange(44100) / 44100
+    sf.write(str(path), 0.5 * np.sin(2 * np.pi * 440 * t), 44100)
+    return str(path)
+
+
+class TestPCMCache:
+
+    def test_load_maps_cached_audio(self, wav_path, tmp_path):
+        cache_dir = str(tmp_path / "cache")
+        first = AudioFile(cache_dir=cache_dir)
+        assert first.load(wav_path)
+        assert isinstance(first.audio_data, np.memmap)
+        assert first.audio_data.shape == (44100, 2)
+        # Mono is duplicated to both channels
+        assert np.array_equal(first.audio_data[:, 0], first.audio_data[:, 1])
+
+        second = AudioFile(cache_dir=cache_dir)
+        assert second.load(wav_path)
+        assert np.array_equal(np.asarray(second.audio_data), np.asarray(first.audio_data))
+
+    def test_matches_uncached_decode(self, wav_path, tmp_path):
+        cached = AudioFile(cache_dir=str(tmp_path / "cache"))
+        plain = AudioFile(use_cache=False)
+        assert cached.load(wav_path) and plain.load(wav_path)
+        assert np.array_equal(np.asarray(cached.audio_data), plain.audio_data)
+
+    def test_key_follows_sample_rate(self, wav_path, tmp_path):
+        cache = PCMCache(str(tmp_path))
+        assert cache.get_cache_path(wav_path, 44100) != cache.get_cache_path(wav_path, 48000)
+
+    def test_discarded_writer_leaves_no_entry(self, wav_path, tmp_path):
+        cache_dir = tmp_path / "cache"
+        cache = PCMCache(str(cache_dir))
+        with cache.create(wav_path, 44100, 10):
+            pass
+        assert cache.open(wav_path, 44100) is None
+        assert list(cache_dir.iterdir()) == []
+
+    def test_new_entry_replaces_older_versions_of_source(self, wav_path, tmp_path):
+        cache_dir = tmp_path / "cache"
+        cache = PCMCache(str(cache_dir))
+        other = tmp_path / "other.wav"
+        sf.write(str(other), np.zeros(100), 44100)
+        cache.store(str(other), 44100, np.zeros((100, 2), dtype=np.float32))
+        cache.store(wav_path, 44100, np.zeros((10, 2), dtype=np.float32))
+
+        # Editing the song changes its key; the stale entry goes on the next write
+        os.utime(wav_path, (1, 1))
+        cache.store(wav_path, 44100, np.ones((10, 2), dtype=np.float32))
+        assert sorted(p.name for p in cache_dir.iterdir()) == sorted(
+            os.path.basename(cache.get_cache_path(path, 44100)) for path in (wav_path, str(other)))
+
+    def test_trims_least_recently_used_to_max_size(self, tmp_path):
+        paths = []
+        for i in range(3):
+            path = tmp_path / f"song{i}.wav"
+            sf.write(str(path), np.zeros(1000), 44100)
+            paths.append(str(path))
+        data = np.zeros((1000, 2), dtype=np.float32)
+
+        cache = PCMCache(str(tmp_path / "cache"))
+        cache.store(paths[0], 44100, data)
+        cache.store(paths[1], 44100, data)
+        cache.max_bytes = 2 * os.path.getsize(cache.get_cache_path(paths[0], 44100))
+        os.utime(cache.get_cache_path(paths[1], 44100), (1, 1))  # Least recently used
+
+        cache.store(paths[2], 44100, data)
+        assert cache.open(paths[1], 44100) is None
+        assert cache.open(paths[0], 44100) is not None
+        assert cache.open(paths[2], 44100) is not None
+
+    def test_clear_cache(self, wav_path, tmp_path):
+        cache = PCMCache(str(tmp_path / "cache"))
+        cache.store(wav_path, 44100, np.zeros((10, 2), dtype=np.float32))
+        cache.clear_cache()
+        assert cache.open(wav_path, 44100) is None
+
+
+class TestMixInto:
+
+    def test_sums_lanes_with_gain_in_place(self):
+        mixer = AudioMixer()
+        mixer.add_lane(1, _lane(np.full((100, 2), 0.25)))
+        mixer.add_lane(2, _lane(np.full((100, 2), 0.5)), volume=0.5)
+        out = np.full((64, 2), 7.0, dtype=np.float32)
+        assert mixer.mix_into(out)
+        assert np.allclose(out, 0.5)
+
+    def test_clips_and_pads_past_end(self):
+        mixer = AudioMixer()
+        mixer.add_lane(1, _lane(np.full((10, 2), 0.8)))
+        mixer.add_lane(2, _lane(np.full((10, 2), 0.8)))
+        out = np.empty((16, 2), dtype=np.float32)
+        mixer.mix_into(out)
+        assert np.allclose(out[:10], 1.0)
+        assert np.allclose(out[10:], 0.0)
+
+    def test_muted_lane_still_advances(self):
+        mixer = AudioMixer()
+        audio_file = _lane(np.zeros((100, 2)))
+        mixer.add_lane(1, audio_file)
+        mixer.set_mute_state(1, True)
+        mixer.mix_into(np.empty((32, 2), dtype=np.float32))
+        assert audio_file.current_frame == 32
+
+    def test_mix_frames_matches_mix_into(self):
+        data = np.random.default_rng(0).uniform(-1, 1, (256, 2))
+        a, b = AudioMixer(), AudioMixer()
+        a.add_lane(1, _lane(data), volume=0.3)
+        b.add_lane(1, _lane(data), volume=0.3)
+        out = np.empty((128, 2), dtype=np.float32)
+        b.mix_into(out)
+        assert np.array_equal(a.mix_frames(128), out)
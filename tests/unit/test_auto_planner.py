@@ -0,0 +1,142 @@
+# tests/unit/test_auto_planner.py
+"""Lookahead planning of Auto Mode bars (auto/planner.py, auto/engine.py)."""
+
+import threading
+import time
+
+import pytest
+
+from auto.planner import LookaheadPlanner
+
+
+def _wait_for(predicate, timeout: float = 5.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.005)
+    return False
+
+
+@pytest.fixture
+def planner():
+    p = LookaheadPlanner()
+    p.start()
+    yield p
+    p.stop()
+
+
+class TestLookaheadPlanner:
+    def test_plan_is_taken_once_by_key(self, planner):
+        planner.submit("a", time.monotonic() + 1.0, lambda: 42)
+        assert planner.has("a")
+        assert _wait_for(lambda: planner.stats().plans == 1)
+
+        assert planner.take("b") is None
+        assert planner.take("a") == 42
+        assert planner.take("a") is None
+
+    def test_take_never_waits_for_the_worker(self, planner):
+        release = threading.Event()
+        planner.submit("slow", time.monotonic() + 1.0, lambda: release.wait(5.0))
+        assert _wait_for(lambda: planner.has("slow"))
+        started = time.monotonic()
+        assert planner.take("slow") is None
+        assert time.monotonic() - started < 0.1
+        release.set()
+
+    def test_newer_submission_replaces_queued_plan(self, planner):
+        release = threading.Event()
+        planner.submit("busy", time.monotonic() + 1.0, lambda: release.wait(5.0))
+        assert _wait_for(lambda: planner._running_key == "busy")
+        planner.submit("old", time.monotonic() + 1.0, lambda: "old")
+        planner.submit("new", time.monotonic() + 1.0, lambda: "new")
+        assert not planner.has("old")
+        release.set()
+        assert _wait_for(lambda: planner.take("new") == "new")
+
+    def test_failed_plan_is_not_retried(self, planner, capsys):
+        planner.submit("bad", time.monotonic() + 1.0, lambda: 1 / 0)
+        assert _wait_for(lambda: planner._running_key is None and planner._queued is None)
+        assert planner.has("bad")
+        assert planner.take("bad") is None
+
+    def test_stats_measure_latency_against_deadline(self, planner):
+        planner.submit("late", time.monotonic(), lambda: time.sleep(0.02) or "x")
+        assert _wait_for(lambda: planner.stats().plans == 1)
+        stats = planner.stats()
+        assert stats.max_latency_ms >= 15.0
+        assert stats.min_slack_ms < 0.0
+
+        planner.record_hit(2.0)
+        planner.record_miss(2.0, 0.004)
+        stats = planner.stats()
+        assert (stats.hits, stats.misses, stats.bar_ms) == (1, 1, 2000.0)
+        assert stats.max_sync_ms == pytest.approx(4.0)
+
+
+    def test_restart_waits_for_stuck_plan(self):
+        release = threading.Event()
+        p = LookaheadPlanner()
+        p.start()
+        first = p._thread
+        p.submit("stuck", time.monotonic() + 1.0, lambda: release.wait(5.0))
+        assert _wait_for(lambda: p._running_key == "stuck")
+        p.stop(timeout=0.01)
+        assert not p.is_running()
+
+        # The old worker is still inside its plan: no second worker
+        p.start()
+        assert p._thread is first and not p.is_running()
+
+        release.set()
+        first.join(1.0)
+        p.start()
+        assert p.is_running() and p._thread is not first
+        p.stop()
+
+class TestEnginePlanning:
+    @pytest.fixture
+    def engine(self):
+        from config.models import Configuration
+        from auto.engine import AutoShowEngine
+
+        e = AutoShowEngine(Configuration(), fixture_definitions={})
+        e.set_bpm(240.0)  # 1 bar = 1 second
+        e.start()
+        yield e
+        e.stop()
+
+    def _wait_for_plan(self, engine):
+        assert _wait_for(lambda: engine._planner._ready is not None)
+
+    def test_bar_boundary_uses_ready_plan(self, engine):
+        self._wait_for_plan(engine)
+        t0 = engine._cycle.cycle_start_time
+        engine.tick(t0 + 1.01)
+        stats = engine.planner_stats()
+        assert (stats.hits, stats.misses) == (1, 0)
+        assert engine.current_bar == 1
+
+    def test_cycle_boundary_swaps_in_planned_riffs(self, engine):
+        received = []
+        engine.set_on_riffs_updated(received.append)
+        t0 = engine._cycle.cycle_start_time
+        for bar in range(1, 5):
+            self._wait_for_plan(engine)
+            engine.tick(t0 + bar + 0.01)
+
+        stats = engine.planner_stats()
+        assert (stats.hits, stats.misses) == (4, 0)
+        assert engine.current_bar == 0
+        # The new cycle starts on the exact boundary, not at the tick
+        assert engine._cycle.cycle_start_time == pytest.approx(t0 + 4.0)
+        assert len(received) == 1
+
+    def test_changed_settings_discard_plan(self, engine):
+        self._wait_for_plan(engine)
+        engine.set_energy_sensitivity(0.2)
+        t0 = engine._cycle.cycle_start_time
+        engine.tick(t0 + 1.01)
+        stats = engine.planner_stats()
+        assert (stats.hits, stats.misses) == (0, 1)
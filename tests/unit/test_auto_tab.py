@@ -271,7 +271,8 @@ def test_live_dmx_callback_fires_per_universe():
     # Must not raise.
     bad_controller._send_all_universes()
     # Wire send still happened for both universes.
-    assert bad_controller.artnet_sender.send_dmx.call_count == 2
+    sent_frame, = bad_controller.artnet_sender.send_frame.call_args.args
+    assert len(sent_frame) == 2
 
 
 def test_fixture_definitions_reload_after_late_config_load(qapp, monkeypatch):
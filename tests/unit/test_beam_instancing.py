@@ -0,0 +1,143 @@
+# tests/unit/test_beam_instancing.py
+"""Instanced beam rendering in visualizer/renderer/beams.py."""
+
+import struct
+from unittest.mock import MagicMock
+
+import glm
+import pytest
+
+from visualizer.renderer import beams
+from visualizer.renderer import fixtures as fx
+from visualizer.renderer.beams import (
+    INSTANCE_STRIDE,
+    BeamInstanceBatch,
+    BeamModifiers,
+    ConeBeam,
+    GlowBeam,
+    SegmentedRectBeam,
+)
+from visualizer.renderer.emitters import Emission
+from visualizer.renderer.shaders import (
+    INSTANCED_BEAM_FRAGMENT_SHADER,
+    INSTANCED_GOBO_BEAM_FRAGMENT_SHADER,
+)
+
+
+def _emission(dimmer: float = 1.0, color=(1.0, 0.5, 0.25)) -> Emission:
+    return Emission(local_transform=glm.mat4(1.0), color=color, dimmer=dimmer)
+
+
+def _row_floats(row: bytes):
+    return struct.unpack('<24f', row)
+
+
+class TestInstancedShaders:
+    def test_fragment_shaders_read_varyings_not_uniforms(self):
+        assert 'uniform' not in INSTANCED_BEAM_FRAGMENT_SHADER
+        assert 'uniform' not in INSTANCED_GOBO_BEAM_FRAGMENT_SHADER
+        assert 'flat in int gobo_pattern;' in INSTANCED_GOBO_BEAM_FRAGMENT_SHADER
+
+
+class TestMeshKeys:
+    def test_identical_beams_share_a_key(self):
+        a = SegmentedRectBeam(MagicMock(), cell_width_m=0.04, cell_height_m=0.05)
+        b = SegmentedRectBeam(MagicMock(), cell_width_m=0.04, cell_height_m=0.05)
+        assert a.mesh_key == b.mesh_key == ('box', 0.04, 0.05, 0.3)
+
+    def test_cone_angle_changes_the_key(self):
+        assert ConeBeam(MagicMock(), cone_angle_deg=15.0).mesh_key != \
+            ConeBeam(MagicMock(), cone_angle_deg=25.0).mesh_key
+
+
+class TestCollect:
+    def test_rows_grouped_per_mesh(self):
+        batch = BeamInstanceBatch(MagicMock())
+        glow_a, glow_b = GlowBeam(MagicMock()), GlowBeam(MagicMock())
+        cone = ConeBeam(MagicMock())
+        for beam in (glow_a, cone, glow_b):
+            beam.collect_instances(batch, glm.mat4(1.0), _emission())
+        assert len(batch) == 3
+        assert [len(rows) for rows in batch._rows.values()] == [2, 1]
+
+    def test_dark_emission_skipped(self):
+        batch = BeamInstanceBatch(MagicMock())
+        GlowBeam(MagicMock()).collect_instances(batch, glm.mat4(1.0), _emission(dimmer=0.0))
+        assert len(batch) == 0
+
+    def test_row_layout(self):
+        batch = BeamInstanceBatch(MagicMock())
+        model = glm.translate(glm.mat4(1.0), glm.vec3(1.0, 2.0, 3.0))
+        mods = BeamModifiers(brightness_scale=0.5, gobo_pattern=2,
+                             gobo_rotation_rad=0.25, focus_sharpness=0.75)
+        ConeBeam(MagicMock()).collect_instances(batch, model, _emission(), mods)
+        (row,) = next(iter(batch._rows.values()))
+        assert len(row) == INSTANCE_STRIDE
+        values = _row_floats(row)
+        assert values[12:15] == (1.0, 2.0, 3.0)  # translation column
+        assert values[16:] == (1.0, 0.5, 0.25, 0.5, 2.0, 0.25, 0.75, 0.0)
+
+    def test_prism_facets_become_instances(self):
+        batch = BeamInstanceBatch(MagicMock())
+        mods = BeamModifiers(prism_active=True, prism_facets=3)
+        ConeBeam(MagicMock()).collect_instances(batch, glm.mat4(1.0), _emission(), mods)
+        rows = next(iter(batch._rows.values()))
+        assert len(rows) == 3
+        for row in rows:
+            assert _row_floats(row)[19] == pytest.approx(ConeBeam.PRISM_INTENSITY_PER_FACET)
+
+
+class TestFlush:
+    def test_one_draw_per_mesh_and_one_blend_switch(self, monkeypatch):
+        setup, restore = MagicMock(), MagicMock()
+        monkeypatch.setattr(beams, '_setup_additive_blending', setup)
+        monkeypatch.setattr(beams, '_restore_state', restore)
+        ctx = MagicMock()
+        batch = BeamInstanceBatch(ctx)
+        bars = [SegmentedRectBeam(MagicMock()) for _ in range(50)]
+        for bar in bars:
+            for _ in range(8):
+                bar.collect_instances(batch, glm.mat4(1.0), _emission())
+        ConeBeam(MagicMock()).collect_instances(batch, glm.mat4(1.0), _emission())
+
+        batch.flush(glm.mat4(1.0))
+
+        assert batch.draw_calls == 2
+        assert setup.call_count == restore.call_count == 1
+        assert len(batch) == 0
+        (written,), _ = ctx.buffer.return_value.write.call_args
+        assert len(written) == 401 * INSTANCE_STRIDE
+        # Two shared programs (plain + gobo), one per shader variant
+        assert ctx.program.call_count == 2
+
+    def test_instance_buffer_reused_until_it_overflows(self):
+        ctx = MagicMock()
+        batch = BeamInstanceBatch(ctx)
+        beam = GlowBeam(MagicMock())
+        for count in (3, 2, 40):
+            for _ in range(count):
+                beam.collect_instances(batch, glm.mat4(1.0), _emission())
+            batch.flush(glm.mat4(1.0))
+        reserves = [c.kwargs['reserve'] for c in ctx.buffer.call_args_list if 'reserve' in c.kwargs]
+        assert reserves == [512, 4096]
+
+    def test_empty_flush_draws_nothing(self):
+        ctx = MagicMock()
+        batch = BeamInstanceBatch(ctx)
+        batch.flush(glm.mat4(1.0))
+        assert batch.draw_calls == 0
+        ctx.program.assert_not_called()
+
+
+class TestManagerToggle:
+    def test_disabled_instancing_has_no_batch(self, monkeypatch):
+        monkeypatch.setattr(fx, 'USE_BEAM_INSTANCING', False)
+        assert fx.FixtureManager(ctx=MagicMock())._get_beam_batch() is None
+
+    def test_batch_shared_and_released(self, monkeypatch):
+        monkeypatch.setattr(fx, 'USE_BEAM_INSTANCING', True)
+        manager = fx.FixtureManager(ctx=MagicMock())
+        batch = manager._get_beam_batch()
+        assert manager._get_beam_batch() is batch
+        manager.release()
+        assert manager._beam_batch is None
@@ -0,0 +1,170 @@
+# tests/unit/test_block_index.py
+"""Unit tests for timeline/block_index.py - per-lane block time index."""
+
+import random
+
+import pytest
+from config.models import LightBlock, DimmerBlock, ColourBlock
+from timeline.block_index import LaneBlockIndex, SUBLANE_TYPES, ENVELOPE, first_frame_at
+from timeline.light_lane import LightLane
+
+
+def _light_block(start, end, dimmers=(), colours=()):
+    return LightBlock(
+        start_time=start, end_time=end, effect_name="test",
+        dimmer_blocks=[DimmerBlock(start_time=s, end_time=e) for s, e in dimmers],
+        colour_blocks=[ColourBlock(start_time=s, end_time=e) for s, e in colours],
+    )
+
+
+def _linear_active(light_blocks, kind, t):
+    """Reference: the linear scan the playback loops used to do."""
+    result = []
+    for lb in light_blocks:
+        for block in getattr(lb, f"{kind}_blocks"):
+            if block.start_time <= t < block.end_time:
+                result.append(block)
+    return result
+
+
+@pytest.fixture
+def blocks():
+    return [
+        _light_block(0, 8, dimmers=[(0, 4), (4, 8)], colours=[(0, 8)]),
+        _light_block(8, 16, dimmers=[(8, 16)], colours=[(8, 10), (12, 16)]),
+        _light_block(16, 64, dimmers=[(16, 64)]),
+    ]
+
+
+class TestActiveAt:
+
+    def test_matches_linear_scan(self, blocks):
+        index = LaneBlockIndex(blocks)
+        for step in range(0, 700):
+            t = step * 0.1
+            for kind in SUBLANE_TYPES:
+                assert index.active_at(kind, t) == _linear_active(blocks, kind, t)
+
+    def test_end_is_exclusive(self, blocks):
+        index = LaneBlockIndex(blocks)
+        assert index.active_at('dimmer', 4.0) == [blocks[0].dimmer_blocks[1]]
+
+    def test_gap_is_empty(self, blocks):
+        index = LaneBlockIndex(blocks)
+        assert index.active_at('colour', 11.0) == []
+
+    def test_envelopes(self, blocks):
+        index = LaneBlockIndex(blocks)
+        assert index.active_at(ENVELOPE, 20.0) == [blocks[2]]
+
+    def test_overlaps_keep_lane_order(self):
+        lbs = [_light_block(0, 10, dimmers=[(2, 10)]), _light_block(0, 10, dimmers=[(0, 10)])]
+        index = LaneBlockIndex(lbs)
+        assert index.active_at('dimmer', 5.0) == [lbs[0].dimmer_blocks[0], lbs[1].dimmer_blocks[0]]
+
+
+class TestCursor:
+
+    def test_forward_matches_linear_scan(self):
+        rng = random.Random(7)
+        lbs = []
+        for _ in range(40):
+            start = rng.uniform(0, 200)
+            subs = [(start + rng.uniform(0, 5), start + rng.uniform(5, 20)) for _ in range(3)]
+            lbs.append(_light_block(start, start + 20, dimmers=subs))
+        cursor = LaneBlockIndex(lbs).cursor()
+        t = 0.0
+        while t < 230:
+            cursor.advance(t)
+            expected = {id(b) for b in _linear_active(lbs, 'dimmer', t)}
+            assert set(cursor.active['dimmer']) == expected
+            t += 0.033
+
+    def test_backward_seek_resets(self, blocks):
+        cursor = LaneBlockIndex(blocks).cursor()
+        cursor.advance(30.0)
+        assert set(cursor.active['dimmer']) == {id(blocks[2].dimmer_blocks[0])}
+        cursor.advance(1.0)
+        assert set(cursor.active['dimmer']) == {id(blocks[0].dimmer_blocks[0])}
+
+    def test_entered_excludes_previous(self, blocks):
+        cursor = LaneBlockIndex(blocks).cursor()
+        cursor.advance(1.0)
+        first = blocks[0].dimmer_blocks[0]
+        assert cursor.entered('dimmer', set()) == [first]
+        assert cursor.entered('dimmer', {id(first)}) == []
+
+
+def _replayed_holds(light_blocks, kind, fps, frames):
+    """Reference: the held block per frame, tracked tick by tick the way the
+    playback loops drive DMXManager.block_started / block_ended."""
+    cursor = LaneBlockIndex(light_blocks).cursor()
+    previous, held, result = set(), None, []
+    for frame in range(frames):
+        cursor.advance(frame / fps)
+        for block in cursor.entered(kind, previous):
+            held = block
+        currently_active = cursor.active[kind]
+        if previous and not currently_active:
+            held = None
+        previous = set(currently_active)
+        result.append(held)
+    return result
+
+
+class TestHoldSchedule:
+
+    def test_matches_tick_by_tick_replay(self):
+        rng = random.Random(11)
+        lbs = []
+        for _ in range(60):
+            start = rng.uniform(0, 120)
+            subs = [(start + rng.uniform(0, 4), start + rng.uniform(0.01, 12)) for _ in range(2)]
+            lbs.append(_light_block(start, start + 12, dimmers=subs))
+        for fps in (24, 30, 60):
+            frames = 140 * fps
+            schedule = LaneBlockIndex(lbs).hold_schedule('dimmer', fps)
+            expected = _replayed_holds(lbs, 'dimmer', fps, frames)
+            assert [schedule.block_at(f) for f in range(frames)] == expected
+
+    def test_later_block_held_past_its_end(self):
+        lbs = [_light_block(0, 10, dimmers=[(0, 10), (2, 4)])]
+        schedule = LaneBlockIndex(lbs).hold_schedule('dimmer', 10)
+        first, second = lbs[0].dimmer_blocks
+        assert schedule.block_at(5) is first
+        assert schedule.block_at(25) is second
+        assert schedule.block_at(60) is second
+        assert schedule.block_at(100) is None
+
+    def test_first_frame_at(self):
+        assert first_frame_at(0.0, 30) == 0
+        assert first_frame_at(1.0, 30) == 30
+        assert first_frame_at(0.1, 30) == 3
+        assert all((first_frame_at(t, 60) - 1) / 60 < t <= first_frame_at(t, 60) / 60
+                   for t in (0.01, 0.5, 1 / 3, 7.77))
+
+
+class TestLaneInvalidation:
+
+    def test_index_reused_until_changed(self, blocks):
+        lane = LightLane(name="Test")
+        lane.light_blocks = blocks
+        index = lane.get_block_index()
+        assert lane.get_block_index() is index
+
+    def test_append_rebuilds(self, blocks):
+        lane = LightLane(name="Test")
+        lane.light_blocks = blocks
+        index = lane.get_block_index()
+        lane.light_blocks.append(_light_block(64, 72, dimmers=[(64, 72)]))
+        assert lane.get_block_index() is not index
+        assert len(lane.get_block_index().tracks['dimmer']) == 5
+
+    def test_in_place_edit_needs_invalidate(self, blocks):
+        lane = LightLane(name="Test")
+        lane.light_blocks = blocks
+        lane.get_block_index()
+        blocks[2].dimmer_blocks[0].start_time = 100.0
+        blocks[2].dimmer_blocks[0].end_time = 110.0
+        lane.invalidate_block_index()
+        assert lane.get_block_index().active_at('dimmer', 105.0) == [blocks[2].dimmer_blocks[0]]
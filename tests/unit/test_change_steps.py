@@ -0,0 +1,88 @@
+# tests/unit/test_change_steps.py
+"""Tests for change-point step selection in utils/to_xml/unified_sequence.py."""
+
+import os
+import xml.etree.ElementTree as ET
+
+import pytest
+
+from config.models import Configuration, ColourBlock, DimmerBlock, MovementBlock
+from utils.fixture_utils import load_fixture_definitions_from_qlc
+from utils.to_xml.setup_to_xml import create_fixture_elements
+from utils.to_xml.shows_to_xml import _iter_unified_step_jobs
+from utils.to_xml.unified_sequence import (
+    build_unified_step, calculate_change_steps, calculate_unified_step_grid,
+    generate_unified_sequence_steps, merge_identical_steps, resolve_spot_centers, sample_dimmer_matrix,
+)
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+GRID = [i * 50 for i in range(100)]  # 0 .. 4.95 s
+
+
+class TestCalculateChangeSteps:
+
+    def test_static_blocks_only_change_at_boundaries(self):
+        dimmers = [DimmerBlock(start_time=0.0, end_time=2.0, effect_type="static"),
+                   DimmerBlock(start_time=2.0, end_time=4.0, effect_type="static", intensity=100)]
+        colours = [ColourBlock(start_time=1.0, end_time=5.0)]
+        assert calculate_change_steps(GRID, dimmers, colours, [], [], 4) == [0, 20, 40, 80]
+
+    def test_animated_movement_samples_every_step(self):
+        movement = [MovementBlock(start_time=1.0, end_time=1.5, effect_type="circle")]
+        assert calculate_change_steps(GRID, [], [], movement, [], 4) == [0] + list(range(20, 31))
+
+    def test_static_movement_is_constant(self):
+        movement = [MovementBlock(start_time=1.0, end_time=1.5, effect_type="static")]
+        assert calculate_change_steps(GRID, [], [], movement, [], 4) == [0, 20, 30]
+
+    def test_single_fixture_chase_is_constant(self):
+        dimmers = [DimmerBlock(start_time=0.0, end_time=5.0, effect_type="chase")]
+        assert calculate_change_steps(GRID, dimmers, [], [], [], 1) == [0]
+        assert len(calculate_change_steps(GRID, dimmers, [], [], [], 4)) == len(GRID)
+
+    def test_dimmer_rows_limit_animated_dimmer_to_value_changes(self):
+        dimmers = [DimmerBlock(start_time=0.0, end_time=5.0, effect_type="strobe")]
+        rows = sample_dimmer_matrix([t / 1000.0 for t in GRID], dimmers, [0], 1, 120.0)
+        change_steps = calculate_change_steps(GRID, dimmers, [], [], [], 1, dimmer_rows=rows)
+        assert change_steps == [0] + [i for i in range(1, len(GRID)) if rows[i] != rows[i - 1]]
+        assert len(change_steps) < len(GRID) // 2
+
+    def test_empty_grid(self):
+        assert calculate_change_steps([], [DimmerBlock(start_time=0.0, end_time=1.0)], [], [], [], 1) == []
+
+
+def _full_grid_steps(fixtures, fixture_id_map, fixture_definitions, light_block, bpm, signature,
+                     all_lane_fixtures, config, export_overrides):
+    """Reference: build a step for every grid time, then merge."""
+    blocks = (light_block.dimmer_blocks, light_block.colour_blocks,
+              light_block.movement_blocks, light_block.special_blocks)
+    step_times_ms, step_duration_ms = calculate_unified_step_grid(*map(list, blocks), bpm, signature)
+    global_idx = {id(f): i for i, f in enumerate(all_lane_fixtures)}
+    matrix = sample_dimmer_matrix(
+        [t / 1000.0 for t in step_times_ms], light_block.dimmer_blocks,
+        [global_idx.get(id(f), i) for i, f in enumerate(fixtures)], len(all_lane_fixtures), bpm,
+        max_intensity=export_overrides.get('group_max_intensity', 255))
+    spot_centers = resolve_spot_centers(light_block.movement_blocks, fixtures, config)
+    steps = [
+        build_unified_step(i, t / 1000.0, step_duration_ms, fixtures, fixture_id_map, fixture_definitions,
+                           *blocks, len(step_times_ms), all_lane_fixtures, bpm, signature, config,
+                           export_overrides=export_overrides, dimmer_values=matrix[i], spot_centers=spot_centers)
+        for i, t in enumerate(step_times_ms)
+    ]
+    return merge_identical_steps(steps)
+
+
+@pytest.mark.parametrize("rig_name", ["club_band", "dj_edm"])
+def test_matches_full_grid_export(rig_name):
+    config = Configuration.load(os.path.join(REPO_ROOT, "demos", "shows", f"{rig_name}.yaml"))
+    fixture_definitions = load_fixture_definitions_from_qlc(
+        {(f.manufacturer, f.model) for g in config.groups.values() for f in g.fixtures})
+    fixture_id_map = create_fixture_elements(ET.Element("Engine"), config)
+
+    jobs = list(_iter_unified_step_jobs(config, {}))
+    assert jobs
+    for _, kwargs in jobs:
+        expected = _full_grid_steps(fixture_id_map=fixture_id_map, fixture_definitions=fixture_definitions, **kwargs)
+        actual = generate_unified_sequence_steps(
+            fixture_id_map=fixture_id_map, fixture_definitions=fixture_definitions, **kwargs)
+        assert [ET.tostring(s) for s in actual] == [ET.tostring(s) for s in expected]
@@ -0,0 +1,87 @@
+# tests/unit/test_channel_index.py
+"""Unit tests for utils/channel_index.py - cached per-mode channel lookups."""
+
+import copy
+
+import pytest
+from utils.channel_index import ChannelIndex, get_channel_index, clear_channel_index_cache
+from utils.effects_utils import get_channels_by_property
+
+
+def _linear_lookup(fixture_def, mode_name, properties):
+    """Reference: the mode/channel/capability scan get_channels_by_property used to do."""
+    channels = {}
+    mode = next((m for m in fixture_def['modes'] if m['name'] == mode_name), None)
+    if not mode:
+        return channels
+    for channel_mapping in mode['channels']:
+        channel_def = next((ch for ch in fixture_def['channels'] if ch['name'] == channel_mapping['name']), None)
+        if not channel_def:
+            continue
+        number = channel_mapping['number']
+        if channel_def.get('preset') in properties:
+            channels.setdefault(channel_def['preset'], []).append({'channel': number})
+        if channel_def.get('group') in properties:
+            channels.setdefault(channel_def['group'], []).append({'channel': number})
+        for capability in channel_def.get('capabilities', []):
+            if capability.get('preset') in properties:
+                channels.setdefault(capability['preset'], []).append(
+                    {'channel': number, 'min': capability.get('min'), 'max': capability.get('max')})
+    return channels
+
+
+@pytest.fixture
+def fixture_def(mock_fixture_def):
+    d = copy.deepcopy(mock_fixture_def)
+    d['channels'].append({"name": "Shutter", "preset": None, "group": "Shutter", "capabilities": [
+        {"min": 0, "max": 9, "preset": "ShutterClose", "name": "Closed"},
+        {"min": 10, "max": 255, "preset": "ShutterOpen", "name": "Open"},
+    ]})
+    d['modes'][0]['channels'].append({"number": 10, "name": "Shutter"})
+    d['modes'].append({"name": "Basic", "channels": [{"number": 0, "name": "Dimmer"}, {"number": 1, "name": "Pan"}]})
+    return d
+
+
+PROPERTIES = [
+    "PositionPan", "PositionTilt", "IntensityMasterDimmer", "IntensityRed",
+    "Colour", "Intensity", "Gobo", "ShutterOpen", "ShutterClose", "Shutter", "Missing",
+]
+
+
+class TestLookup:
+
+    @pytest.mark.parametrize("mode", ["Standard", "Basic", "Nope"])
+    def test_matches_linear_scan(self, fixture_def, mode):
+        index = ChannelIndex(fixture_def, mode)
+        expected = _linear_lookup(fixture_def, mode, PROPERTIES)
+        assert index.lookup(PROPERTIES) == expected
+        assert list(index.lookup(PROPERTIES)) == list(expected)
+
+    def test_wrapper_returns_copy(self, fixture_def):
+        first = get_channels_by_property(fixture_def, "Standard", ["PositionPan"])
+        first["PositionPan"].append({'channel': 99})
+        assert get_channels_by_property(fixture_def, "Standard", ["PositionPan"]) == {"PositionPan": [{'channel': 5}]}
+
+    def test_offsets_follow_property_order(self, fixture_def):
+        index = ChannelIndex(fixture_def, "Standard")
+        assert index.offsets(["IntensityBlue", "IntensityRed"]) == [3, 1]
+
+    def test_split_tables(self, fixture_def):
+        index = ChannelIndex(fixture_def, "Standard")
+        assert index.preset_channels["PositionTilt"] == [6]
+        assert index.group_channels["Colour"] == [1, 2, 3, 4]
+        assert index.capability_channels["ShutterOpen"] == [10]
+        assert index.channel_count == 11
+
+
+class TestCache:
+
+    def test_reused_for_same_definition(self, fixture_def):
+        clear_channel_index_cache()
+        assert get_channel_index(fixture_def, "Standard") is get_channel_index(fixture_def, "Standard")
+
+    def test_rebuilt_for_reloaded_definition(self, fixture_def):
+        clear_channel_index_cache()
+        index = get_channel_index(fixture_def, "Standard")
+        reloaded = copy.deepcopy(fixture_def)
+        assert get_channel_index(reloaded, "Standard") is not index
@@ -0,0 +1,125 @@
+"""Tests for effects/dimmer_kernels.py - batched dimmer effect kernels."""
+
+import numpy as np
+import pytest
+
+from config.models import DimmerBlock
+from effects.types import DimmerContext, DimmerBatchContext
+from effects.dimmer_effects import DIMMER_REGISTRY
+from effects.dimmer_kernels import DIMMER_KERNELS, evaluate_dimmer_batch, dimmer_batch_segmented
+from utils.to_xml.unified_sequence import sample_dimmer_at_time, sample_dimmer_matrix
+
+
+NAMES = ["PB1", "PB2", "PB3", "PB4", "PB5"]
+
+
+def _batch_ctx(**overrides):
+    defaults = dict(
+        block_duration=12.0, speed_multiplier=1.0, bpm=128.0,
+        total_fixtures=len(NAMES), num_segments=8, block_start_time=3.5,
+        is_segmented=True, fixture_names=NAMES,
+    )
+    defaults.update(overrides)
+    return DimmerBatchContext(**defaults)
+
+
+def _scalar_matrix(effect_type, ctx, times):
+    """Reference: call the scalar effect once per (time, fixture)."""
+    effect_fn = DIMMER_REGISTRY[effect_type]
+    result = np.empty((len(times), ctx.total_fixtures, ctx.num_segments))
+    for ti, t in enumerate(times):
+        for fi in range(ctx.total_fixtures):
+            r = effect_fn(DimmerContext(
+                time_in_block=t, block_duration=ctx.block_duration, intensity=255,
+                speed_multiplier=ctx.speed_multiplier, bpm=ctx.bpm,
+                fixture_index=fi, total_fixtures=ctx.total_fixtures,
+                num_segments=ctx.num_segments, fixture_name=ctx.fixture_names[fi],
+                block_start_time=ctx.block_start_time, is_segmented=ctx.is_segmented,
+                direction=ctx.direction, chase_scope=ctx.chase_scope,
+                phase_offset_per_fixture=ctx.phase_offset_per_fixture,
+                build_fraction=ctx.build_fraction,
+            ))
+            if r.segment_intensities is not None:
+                result[ti, fi, :] = r.segment_intensities
+            else:
+                result[ti, fi, :] = r.intensity_multiplier
+    return result
+
+
+def _batch_matrix(effect_type, ctx, times):
+    return evaluate_dimmer_batch(
+        effect_type, ctx,
+        np.asarray(times)[:, None, None],
+        np.arange(ctx.total_fixtures)[None, :, None],
+        np.arange(ctx.num_segments)[None, None, :],
+    )
+
+
+TIMES = np.arange(0.0, 12.0, 0.037)
+
+VARIANTS = [
+    {},
+    {"is_segmented": False, "num_segments": 1},
+    {"chase_scope": "global"},
+    {"direction": "up"},
+    {"direction": "out"},
+    {"phase_offset_per_fixture": True},
+    {"speed_multiplier": 0.5, "bpm": 90.0},
+    {"total_fixtures": 1, "fixture_names": NAMES[:1]},
+]
+
+
+class TestKernelsMatchRegistry:
+
+    def test_same_effects(self):
+        assert set(DIMMER_KERNELS) == set(DIMMER_REGISTRY)
+
+    @pytest.mark.parametrize("effect_type", sorted(DIMMER_REGISTRY))
+    @pytest.mark.parametrize("overrides", VARIANTS)
+    def test_matches_scalar(self, effect_type, overrides):
+        ctx = _batch_ctx(**overrides)
+        expected = _scalar_matrix(effect_type, ctx, TIMES)
+        np.testing.assert_allclose(_batch_matrix(effect_type, ctx, TIMES), expected, atol=1e-9)
+
+    def test_zero_duration(self):
+        ctx = _batch_ctx(block_duration=0.0)
+        for effect_type in ("fade", "cascade"):
+            assert np.all(_batch_matrix(effect_type, ctx, [0.0]) == 1.0)
+            assert not dimmer_batch_segmented(effect_type, ctx)
+
+
+class TestSegmentedFlag:
+
+    def test_scalar_only_effects(self):
+        assert not dimmer_batch_segmented("static", _batch_ctx())
+        assert not dimmer_batch_segmented("strobe", _batch_ctx())
+
+    def test_sparkle_always_segmented(self):
+        assert dimmer_batch_segmented("sparkle", _batch_ctx(is_segmented=False))
+
+    def test_follows_fixture_type(self):
+        assert dimmer_batch_segmented("chase", _batch_ctx())
+        assert not dimmer_batch_segmented("chase", _batch_ctx(is_segmented=False))
+
+    def test_unknown_effect_is_static(self):
+        ctx = _batch_ctx()
+        assert not dimmer_batch_segmented("nope", ctx)
+        assert np.all(_batch_matrix("nope", ctx, [1.0]) == 1.0)
+
+
+class TestExportDimmerMatrix:
+
+    @pytest.mark.parametrize("effect_type", sorted(DIMMER_REGISTRY) + ["unknown"])
+    @pytest.mark.parametrize("total_fixtures", [1, 6])
+    def test_matches_sample_dimmer_at_time(self, effect_type, total_fixtures):
+        blocks = [
+            DimmerBlock(start_time=1.0, end_time=5.0, effect_type=effect_type, intensity=230),
+            DimmerBlock(start_time=5.0, end_time=9.0, effect_type="static", effect_speed="1/2"),
+        ]
+        times = [i * 0.05 for i in range(200)]
+        fixtures = list(range(total_fixtures))
+        matrix = sample_dimmer_matrix(times, blocks, fixtures, total_fixtures, 124.0, max_intensity=200)
+        for step_idx, t in enumerate(times):
+            expected = [sample_dimmer_at_time(t, blocks, f, total_fixtures, step_idx, len(times), 124.0,
+                                              max_intensity=200) for f in fixtures]
+            assert matrix[step_idx] == expected
@@ -0,0 +1,119 @@
+# tests/unit/test_dmx_gather_tables.py
+"""Per-universe DMX gather tables in visualizer/renderer/fixtures.py."""
+
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from utils.fixture_capabilities import (
+    Chassis, ColorMixing, ColorMixingMode, FixtureCapabilities, Movement, MovementType,
+)
+from visualizer.renderer import fixtures as fx
+from visualizer.renderer.composable_fixtures import FixtureRenderer as ComposableFixtureRenderer
+
+
+def _universe(seed: int) -> bytes:
+    return np.random.default_rng(seed).integers(0, 256, 512, dtype=np.uint8).tobytes()
+
+
+def _composable(name: str, address: int) -> ComposableFixtureRenderer:
+    caps = FixtureCapabilities(
+        chassis=Chassis.MOVING_YOKE, qlc_type="Moving Head", mode_name="8ch",
+        movement=Movement(type=MovementType.YOKE, pan_channel=0, pan_fine_channel=1,
+                          tilt_channel=2, tilt_fine_channel=3),
+        dimmer_channel=4,
+        color_mixing=ColorMixing(mode=ColorMixingMode.RGB,
+                                 channels={"red": 5, "green": 6, "blue": 7}),
+        channel_count=8,
+    )
+    return ComposableFixtureRenderer(MagicMock(), {"name": name, "universe": 1, "address": address}, caps)
+
+
+def _legacy_fixtures():
+    return [
+        fx.MovingHeadRenderer(MagicMock(), {
+            "name": "MH", "universe": 1, "address": 1,
+            "channel_mapping": {"0": "pan", "1": "pan_fine", "2": "tilt", "3": "tilt_fine",
+                                "4": "dimmer", "5": "red", "6": "green", "7": "blue"},
+        }),
+        fx.PixelBarRenderer(MagicMock(), {
+            "name": "PB", "universe": 1, "address": 20,
+            "layout": {"width": 3, "height": 1}, "channel_mapping": {"12": "dimmer"},
+        }),
+        # Runs past the end of the universe
+        fx.SunstripRenderer(MagicMock(), {
+            "name": "SS", "universe": 1, "address": 510, "layout": {"width": 5, "height": 1},
+        }),
+    ]
+
+
+def _manager(fixtures) -> fx.FixtureManager:
+    manager = fx.FixtureManager(ctx=MagicMock())
+    for fixture in fixtures:
+        manager.fixtures[fixture.name] = fixture
+    manager._rebuild_universe_index()
+    return manager
+
+
+class TestLegacyGather:
+
+    def test_state_from_gathered_values(self):
+        manager = _manager(_legacy_fixtures())
+        data = _universe(1)
+        manager.update_dmx(1, data)
+
+        mh = manager.fixtures["MH"]
+        assert mh.dmx_values["dimmer"] == data[4]
+        assert mh.get_color() == pytest.approx((data[5] / 255, data[6] / 255, data[7] / 255))
+        expected_pan = ((data[0] * 256 + data[1]) / 65535.0 - 0.5) * mh.pan_max
+        assert mh.current_pan == pytest.approx(expected_pan)
+
+        pb = manager.fixtures["PB"]
+        master = data[19 + 12] / 255.0
+        for i, color in enumerate(pb.segment_colors):
+            base = 19 + i * 4
+            assert color == pytest.approx(tuple(data[base + c] / 255.0 * master for c in range(4)))
+
+        ss = manager.fixtures["SS"]
+        assert ss.segment_values == [data[509], data[510], data[511], 0, 0]
+
+    def test_manager_matches_direct_update(self):
+        data = _universe(2)
+        gathered = _manager(_legacy_fixtures())
+        gathered.update_dmx(1, data)
+        for direct in _legacy_fixtures():
+            direct.update_dmx(data)
+            other = gathered.fixtures[direct.name]
+            assert other.dmx_values == direct.dmx_values
+            assert other.segment_values == direct.segment_values
+
+    def test_short_buffer_zero_padded(self):
+        manager = _manager(_legacy_fixtures())
+        manager.update_dmx(1, bytes([7]) * 10)
+        assert manager.fixtures["SS"].segment_values == [0] * 5
+        assert manager.fixtures["MH"].dmx_values["pan"] == 7
+
+
+class TestComposableGather:
+
+    def test_manager_matches_full_buffer_update(self):
+        data = _universe(3)
+        manager = _manager([_composable("A", 1), _composable("B", 508)])
+        manager.update_dmx(1, data)
+        for name, address in (("A", 1), ("B", 508)):
+            direct = _composable(name, address)
+            direct.update_dmx(data)
+            gathered = manager.fixtures[name]
+            assert gathered.movement.pan_deg == pytest.approx(direct.movement.pan_deg)
+            assert gathered.movement.tilt_deg == pytest.approx(direct.movement.tilt_deg)
+            assert gathered.color.rgb == pytest.approx(direct.color.rgb)
+            assert gathered.dimmer.normalized == pytest.approx(direct.dimmer.normalized)
+
+    def test_unknown_channel_count_takes_full_buffer(self):
+        fixture = _composable("A", 1)
+        fixture.capabilities.channel_count = 0
+        assert fixture.dmx_gather_indices() is None
+        manager = _manager([fixture])
+        assert 1 not in manager._gather_tables
+        manager.update_dmx(1, _universe(4))
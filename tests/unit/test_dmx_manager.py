@@ -4,7 +4,7 @@
 import pytest
 from config.models import (
     Configuration, Fixture, FixtureMode, FixtureGroup, Universe,
-    FixtureGroupCapabilities,
+    FixtureGroupCapabilities, DimmerBlock, ColourBlock, MovementBlock, Spot,
 )
 from utils.artnet.dmx_manager import FixtureChannelMap, DMXManager
 
@@ -136,6 +136,26 @@ class TestDMXManagerOperations:
         assert "MH1" in mgr.fixture_maps
 
 
+class TestDMXManagerPanTiltGeometry:
+
+    def test_moved_fixture_is_resolved_again(self, test_config, fixture_defs, test_fixture):
+        mgr = DMXManager(test_config, fixture_defs)
+        target = [0.0, 0.0, 0.0]
+        before = mgr._solve_pan_tilt_dmx([test_fixture], target)
+        test_fixture.x = -4.0
+        position, _ = mgr._ik_geometry(test_fixture)
+        assert position[0] == -4.0
+        assert mgr._solve_pan_tilt_dmx([test_fixture], target)[0][0] != before[0][0]
+
+    def test_rotated_fixture_is_resolved_again(self, test_config, fixture_defs, test_fixture):
+        mgr = DMXManager(test_config, fixture_defs)
+        test_fixture.orientation_uses_group_default = False
+        _, inverse = mgr._ik_geometry(test_fixture)
+        test_fixture.yaw = 90.0
+        _, rotated = mgr._ik_geometry(test_fixture)
+        assert (rotated != inverse).any()
+
+
 class TestDMXManagerFixturesVisible:
 
     def test_set_fixtures_visible(self, test_config, fixture_defs):
@@ -145,4 +165,94 @@ class TestDMXManagerFixturesVisible:
         fcm = mgr.fixture_maps["MH1"]
         if fcm.dimmer_channels:
             ch = fcm.dimmer_channels[0]
-            assert mgr.dmx_state[0][ch] == 255
\ No newline at end of file
+            assert mgr.dmx_state[0][ch] == 255
+
+
+def _play(mgr, fixture, dimmer, colour, t=1.0):
+    mgr.block_started("Lane", [fixture], dimmer, 'dimmer', 0.0)
+    mgr.block_started("Lane", [fixture], colour, 'colour', 0.0)
+    mgr.update_dmx(t)
+    return mgr.get_dmx_data(0)
+
+
+class TestDMXManagerIncremental:
+
+    def test_matches_full_redraw(self, test_config, fixture_defs, test_fixture):
+        dimmer = DimmerBlock(start_time=0, end_time=10, intensity=200)
+        colour = ColourBlock(start_time=0, end_time=10, red=255, blue=80)
+        full = _play(DMXManager(test_config, fixture_defs, incremental=False), test_fixture, dimmer, colour)
+        mgr = DMXManager(test_config, fixture_defs)
+        assert _play(mgr, test_fixture, dimmer, colour) == full
+        assert ("Lane", 'colour') in mgr._static_cache
+        # Second frame replays the cached static writes
+        mgr.update_dmx(2.0)
+        assert mgr.get_dmx_data(0) == full
+
+    def test_dynamic_dimmer_matches_full_redraw(self, test_config, fixture_defs, test_fixture):
+        dimmer = DimmerBlock(start_time=0, end_time=10, effect_type="pulse")
+        colour = ColourBlock(start_time=0, end_time=10, green=255)
+        full = DMXManager(test_config, fixture_defs, incremental=False)
+        mgr = DMXManager(test_config, fixture_defs)
+        _play(full, test_fixture, dimmer, colour)
+        _play(mgr, test_fixture, dimmer, colour)
+        for t in (1.1, 1.3, 2.7):
+            full.update_dmx(t)
+            mgr.update_dmx(t)
+            assert mgr.get_dmx_data(0) == full.get_dmx_data(0)
+
+    def test_block_end_restores_idle_frame(self, test_config, fixture_defs, test_fixture):
+        mgr = DMXManager(test_config, fixture_defs)
+        mgr.update_dmx(0.0)
+        idle = mgr.get_dmx_data(0)
+        _play(mgr, test_fixture, DimmerBlock(start_time=0, end_time=10), ColourBlock(start_time=0, end_time=10, red=255))
+        mgr.block_ended("Lane", 'dimmer')
+        mgr.block_ended("Lane", 'colour')
+        mgr.update_dmx(11.0)
+        assert mgr.get_dmx_data(0) == idle
+
+    def test_invalidate_picks_up_edit(self, test_config, fixture_defs, test_fixture):
+        colour = ColourBlock(start_time=0, end_time=10, red=255)
+        mgr = DMXManager(test_config, fixture_defs)
+        before = _play(mgr, test_fixture, DimmerBlock(start_time=0, end_time=10), colour)
+        colour.red = 0
+        colour.green = 255
+        mgr.invalidate_static_cache()
+        mgr.update_dmx(2.0)
+        assert mgr.get_dmx_data(0) != before
+
+    def test_spot_target_follows_moved_fixture(self, test_config, fixture_defs, test_fixture):
+        test_config.spots = {"Center": Spot(name="Center")}
+        movement = MovementBlock(start_time=0, end_time=10, target_spot_name="Center")
+        mgr = DMXManager(test_config, fixture_defs)
+        mgr.block_started("Lane", [test_fixture], movement, 'movement', 0.0)
+        mgr.update_dmx(1.0)
+        before = mgr.get_dmx_data(0)
+        assert ("Lane", 'movement') not in mgr._static_cache
+
+        test_fixture.x = -4.0
+        mgr.update_dmx(2.0)
+        moved = mgr.get_dmx_data(0)
+        mgr.invalidate_static_cache()
+        mgr.update_dmx(3.0)
+        assert moved == mgr.get_dmx_data(0) != before
+
+
+class TestDMXManagerDirtyTracking:
+
+    def test_new_universe_is_dirty(self, test_config, fixture_defs):
+        mgr = DMXManager(test_config, fixture_defs)
+        assert mgr.is_universe_dirty(0)
+
+    def test_mark_sent_clears_dirty(self, test_config, fixture_defs):
+        mgr = DMXManager(test_config, fixture_defs)
+        mgr.mark_universe_sent(0)
+        assert not mgr.is_universe_dirty(0)
+        mgr.set_dmx_value(0, 5, 10)
+        assert mgr.is_universe_dirty(0)
+
+    def test_identical_redraw_stays_clean(self, test_config, fixture_defs, test_fixture):
+        mgr = DMXManager(test_config, fixture_defs)
+        _play(mgr, test_fixture, DimmerBlock(start_time=0, end_time=10), ColourBlock(start_time=0, end_time=10, red=255))
+        mgr.mark_universe_sent(0)
+        mgr.update_dmx(2.0)
+        assert not mgr.is_universe_dirty(0)
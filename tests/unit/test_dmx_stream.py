@@ -0,0 +1,137 @@
+"""Unit tests for utils/dmx_stream.py - delta-compressed DMX frame stream."""
+
+import pytest
+
+from utils.dmx_stream import (
+    DMXStreamDecoder, DMXStreamEncoder, FLAG_KEYFRAME, changed_ranges,
+)
+
+
+def _universe(values=None):
+    data = bytearray(512)
+    for channel, value in (values or {}).items():
+        data[channel] = value
+    return data
+
+
+class TestChangedRanges:
+
+    def test_no_change(self):
+        import numpy as np
+        a = np.zeros(512, dtype=np.uint8)
+        assert changed_ranges(a, a.copy()) == []
+
+    def test_nearby_changes_merged_distant_split(self):
+        import numpy as np
+        old = np.zeros(512, dtype=np.uint8)
+        new = old.copy()
+        new[[10, 12, 100, 511]] = 1
+        assert changed_ranges(old, new) == [(10, 13), (100, 101), (511, 512)]
+
+
+class TestEncoderDecoder:
+
+    def test_round_trip_matches_source_buffers(self):
+        encoder, decoder = DMXStreamEncoder(), DMXStreamDecoder()
+        frames = [
+            [(1, _universe({0: 255, 5: 10})), (2, _universe({100: 7}))],
+            [(1, _universe({0: 128, 5: 10})), (2, _universe({100: 7}))],
+            [(1, _universe({0: 128, 300: 9})), (2, _universe())],
+        ]
+        for t, frame in enumerate(frames):
+            decoder.decode(encoder.encode(frame, now=0.1 * t))
+            for universe, data in frame:
+                assert decoder.buffers[universe] == data
+
+    def test_first_frame_is_keyframe_then_only_deltas(self):
+        encoder, decoder = DMXStreamEncoder(keyframe_interval=1.0), DMXStreamDecoder()
+        first = encoder.encode([(1, _universe())], now=0.0)
+        assert first[5] & FLAG_KEYFRAME
+        assert decoder.decode(first) == [(1, bytearray(512), [(0, 512)])]
+
+        # Static rig: nothing to send
+        assert encoder.encode([(1, _universe())], now=0.1) is None
+
+        delta = encoder.encode([(1, _universe({42: 200}))], now=0.2)
+        assert not delta[5] & FLAG_KEYFRAME
+        assert len(delta) < 32
+        (universe, buffer, ranges), = decoder.decode(delta)
+        assert (universe, ranges, buffer[42]) == (1, [(42, 43)], 200)
+
+    def test_keyframe_interval_includes_all_universes(self):
+        encoder = DMXStreamEncoder(keyframe_interval=1.0)
+        encoder.encode([(1, _universe()), (2, _universe())], now=0.0)
+        frame = encoder.encode([(1, _universe())], now=1.5)
+        assert frame[5] & FLAG_KEYFRAME
+        decoded = DMXStreamDecoder().decode(frame)
+        assert sorted(u for u, _, _ in decoded) == [1, 2]
+
+    def test_decoder_resyncs_on_keyframe_after_gap(self):
+        encoder, decoder = DMXStreamEncoder(keyframe_interval=1.0), DMXStreamDecoder()
+        decoder.decode(encoder.encode([(1, _universe())], now=0.0))
+        encoder.encode([(1, _universe({1: 1}))], now=0.1)  # Lost in transit
+        assert decoder.decode(encoder.encode([(1, _universe({2: 2}))], now=0.2)) == []
+        assert decoder.dropped_frames == 1
+
+        encoder.request_keyframe()
+        decoder.decode(encoder.encode([(1, _universe({2: 2}))], now=0.3))
+        assert decoder.buffers[1] == _universe({2: 2})
+
+    def test_joining_mid_stream_waits_for_keyframe(self):
+        encoder = DMXStreamEncoder()
+        encoder.encode([(1, _universe())], now=0.0)
+        late = DMXStreamDecoder()
+        assert late.decode(encoder.encode([(1, _universe({3: 3}))], now=0.1)) == []
+
+    def test_corrupt_frames_rejected(self):
+        frame = DMXStreamEncoder().encode([(1, _universe({0: 1}))], now=0.0)
+        decoder = DMXStreamDecoder()
+        with pytest.raises(ValueError):
+            decoder.decode(b'junk')
+        with pytest.raises(ValueError):
+            decoder.decode(frame[:40])
+
+
+class TestVisualizerProtocol:
+
+    def test_dmx_message_round_trip(self):
+        import base64
+        import json
+        from utils.tcp.protocol import VisualizerProtocol
+
+        frame = DMXStreamEncoder().encode([(1, _universe({0: 1}))], now=0.0)
+        message = json.loads(VisualizerProtocol.create_dmx_message(frame))
+        assert message["type"] == "dmx"
+        assert base64.b64decode(message["frame"]) == frame
+
+
+class TestFixtureManagerRanges:
+
+    @pytest.fixture
+    def manager(self):
+        from unittest.mock import MagicMock
+        from visualizer.renderer.fixtures import FixtureManager
+
+        fm = FixtureManager(ctx=MagicMock())
+        for name, universe, address, footprint in [
+            ("A", 1, 1, 4), ("B", 1, 101, 8), ("C", 2, 1, 4), ("D", 1, 300, 0),
+        ]:
+            # Plain fixtures without gather tables get the full buffer
+            fixture = MagicMock(spec=["universe", "address", "dmx_footprint", "update_dmx"])
+            fixture.universe, fixture.address = universe, address
+            fixture.dmx_footprint.return_value = footprint
+            fm.fixtures[name] = fixture
+        fm._rebuild_universe_index()
+        return fm
+
+    def test_only_overlapping_fixtures_updated(self, manager):
+        data = bytes(512)
+        manager.update_dmx_ranges(1, data, [(102, 104)])
+        updated = [n for n, f in manager.fixtures.items() if f.update_dmx.called]
+        # D has an unknown footprint and is always refreshed
+        assert updated == ["B", "D"]
+
+    def test_full_update_uses_universe_index(self, manager):
+        manager.update_dmx(2, bytes(512))
+        updated = [n for n, f in manager.fixtures.items() if f.update_dmx.called]
+        assert updated == ["C"]
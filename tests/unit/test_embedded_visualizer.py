@@ -127,3 +127,10 @@ def test_set_preview_mode_idempotent(vis):
     vis._preview_mode = "build"
     vis.set_preview_mode("build")
     vis._engine.update_dmx.assert_not_called()
+
+
+def test_feed_dmx_stream_marshals_via_queued_signal(vis, qapp):
+    vis.feed_dmx_stream(b"QDMX-frame")
+    vis._engine.apply_dmx_stream.assert_not_called()
+    _drain_events(qapp)
+    vis._engine.apply_dmx_stream.assert_called_once_with(b"QDMX-frame")
@@ -0,0 +1,81 @@
+# tests/unit/test_fixture_db.py
+"""Tests for the persistent compiled fixture cache in utils/fixture_db.py."""
+
+import os
+import pickle
+import shutil
+
+import pytest
+
+from utils.fixture_db import FixtureDatabase, compile_qxf, _DB_VERSION
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+QXF_NAME = "Varytec-Hero-Spot-60.qxf"
+
+
+@pytest.fixture
+def fixture_dir(tmp_path):
+    fixtures = tmp_path / "fixtures"
+    fixtures.mkdir()
+    shutil.copy(os.path.join(REPO_ROOT, "custom_fixtures", QXF_NAME), fixtures / QXF_NAME)
+    return fixtures
+
+
+class TestFixtureDatabase:
+
+    def test_compiles_manufacturer_model_and_modes(self, fixture_dir):
+        record = compile_qxf(str(fixture_dir / QXF_NAME))
+        assert record.error is None
+        assert (record.manufacturer, record.model) == ("Varytec", "Hero Spot 60")
+        assert record.definition["modes"]
+        assert [m["name"] for m in record.modes] == [m["name"] for m in record.definition["modes"]]
+        assert record.fixture_type
+
+    def test_reuses_persisted_records(self, fixture_dir, tmp_path, monkeypatch):
+        db_path = str(tmp_path / "db.pickle")
+        first = FixtureDatabase(db_path).records([str(fixture_dir)])
+        assert os.path.exists(db_path)
+
+        def fail(path):
+            raise AssertionError(f"recompiled {path}")
+        monkeypatch.setattr("utils.fixture_db.compile_qxf", fail)
+        second = FixtureDatabase(db_path).records([str(fixture_dir)])
+        assert second == first
+
+    def test_recompiles_changed_file(self, fixture_dir, tmp_path):
+        db_path = str(tmp_path / "db.pickle")
+        FixtureDatabase(db_path).records([str(fixture_dir)])
+        path = fixture_dir / QXF_NAME
+        path.write_text(path.read_text(encoding="utf-8").replace("Hero Spot 60", "Hero Spot 60 MkII"),
+                        encoding="utf-8")
+        record, = FixtureDatabase(db_path).records([str(fixture_dir)])
+        assert record.model == "Hero Spot 60 MkII"
+
+    def test_save_uses_per_process_temp_file(self, fixture_dir, tmp_path, monkeypatch):
+        db_path = str(tmp_path / "db.pickle")
+        opened = []
+
+        def tracking_open(path, *args, **kwargs):
+            opened.append(str(path))
+            return open(path, *args, **kwargs)
+        monkeypatch.setattr("utils.fixture_db.open", tracking_open, raising=False)
+        FixtureDatabase(db_path).records([str(fixture_dir)])
+        assert f"{db_path}.{os.getpid()}.tmp" in opened
+        assert os.path.exists(db_path)
+        assert not [n for n in os.listdir(tmp_path) if n.endswith(".tmp")]
+
+    def test_ignores_other_cache_versions(self, fixture_dir, tmp_path):
+        db_path = tmp_path / "db.pickle"
+        db_path.write_bytes(pickle.dumps({"version": _DB_VERSION + 1, "entries": {"x": None}}))
+        db = FixtureDatabase(str(db_path))
+        assert db._entries == {}
+        assert db.find([str(fixture_dir)], "Varytec", "Hero Spot 60") is not None
+
+    def test_find_returns_first_match_in_scan_order(self, fixture_dir, tmp_path):
+        other = tmp_path / "other"
+        other.mkdir()
+        shutil.copy(fixture_dir / QXF_NAME, other / QXF_NAME)
+        db = FixtureDatabase(None)
+        record = db.find([str(other), str(fixture_dir)], "Varytec", "Hero Spot 60")
+        assert record.path == str(other / QXF_NAME)
+        assert db.find([str(fixture_dir)], "Varytec", "Missing") is None
@@ -0,0 +1,118 @@
+# tests/unit/test_frame_pacing.py
+"""Render-on-demand and adaptive frame pacing (visualizer/renderer/frame_pacing.py)."""
+
+import os
+from unittest.mock import MagicMock
+
+import pytest
+
+from visualizer.renderer.frame_pacing import FramePacer
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+
+def _run(pacer: FramePacer, seconds: float, late: float = 0.0, cost: float = 0.0,
+         start: float = 0.0) -> float:
+    """Tick the pacer like the render timer would while the scene keeps
+    changing (e.g. during playback); returns the end time."""
+    now = start
+    while now < start + seconds:
+        now += 1.0 / pacer.target_fps + late
+        pacer.invalidate()
+        if pacer.tick(now):
+            pacer.frame_rendered(cost)
+    return now
+
+
+class TestRepaintDecision:
+    def test_static_scene_paints_once(self):
+        pacer = FramePacer()
+        assert pacer.tick(0.0)
+        pacer.frame_rendered(0.001)
+        assert not pacer.tick(0.016)
+        assert not pacer.tick(0.033)
+
+    def test_invalidate_and_animation_repaint(self):
+        pacer = FramePacer()
+        pacer.frame_rendered(0.001)
+        pacer.invalidate()
+        assert pacer.tick(0.0)
+        pacer.frame_rendered(0.001)
+        assert pacer.tick(0.016, animating=True)
+
+    def test_continuous_mode_paints_every_tick(self):
+        pacer = FramePacer(on_demand=False)
+        pacer.frame_rendered(0.001)
+        assert pacer.tick(0.0) and pacer.tick(0.016)
+
+
+class TestAdaptiveCap:
+    def test_interval_follows_cap(self):
+        pacer = FramePacer(max_fps=30)
+        assert pacer.interval_ms == 33
+        pacer.set_max_fps(60)
+        assert pacer.interval_ms == 17
+
+    def test_busy_ui_thread_backs_off_to_floor(self):
+        pacer = FramePacer(max_fps=60)
+        _run(pacer, 10.0, late=0.08)
+        assert pacer.target_fps == pytest.approx(FramePacer.MIN_FPS)
+
+    def test_expensive_frames_back_off(self):
+        pacer = FramePacer(max_fps=60)
+        _run(pacer, 3.0, cost=0.014)
+        assert pacer.target_fps < 60
+
+    def test_recovers_to_cap_when_idle(self):
+        pacer = FramePacer(max_fps=60)
+        end = _run(pacer, 10.0, late=0.08)
+        _run(pacer, 10.0, start=end)
+        assert pacer.target_fps == pytest.approx(60)
+
+    def test_cap_never_exceeded(self):
+        pacer = FramePacer(max_fps=15)
+        _run(pacer, 5.0)
+        assert pacer.target_fps == pytest.approx(15)
+
+
+@pytest.fixture
+def engine(qapp):
+    """A RenderEngine without a GL context, render timer stopped."""
+    from visualizer.renderer.engine import RenderEngine
+
+    e = RenderEngine(parent=None)
+    try:
+        e.render_timer.stop()
+        e.pacer.frame_rendered(0.0)
+        yield e
+    finally:
+        e.deleteLater()
+
+
+class TestEngine:
+    def test_identical_dmx_frame_does_not_invalidate(self, engine):
+        engine.update_dmx(1, b"\x10" * 512)
+        assert engine.pacer.dirty
+        engine.pacer.frame_rendered(0.0)
+        engine.update_dmx(1, b"\x10" * 512)
+        assert not engine.pacer.dirty
+        engine.update_dmx(1, b"\x11" * 512)
+        assert engine.pacer.dirty
+
+    def test_camera_interaction_invalidates(self, engine):
+        engine.reset_camera()
+        assert engine.pacer.dirty
+
+    def test_tick_repaints_only_when_due(self, engine):
+        engine.update = MagicMock()
+        engine._on_render_tick()
+        engine.update.assert_not_called()
+
+        engine.fixture_manager = MagicMock()
+        engine.fixture_manager.is_animating.return_value = True
+        engine._on_render_tick()
+        engine.update.assert_called_once()
+
+    def test_max_fps_sets_timer_interval(self, engine):
+        engine.set_max_fps(15)
+        assert engine.render_timer.interval() == 67
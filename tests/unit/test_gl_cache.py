@@ -0,0 +1,128 @@
+# tests/unit/test_gl_cache.py
+"""Shared, reference-counted GL resources in visualizer/renderer/gl_cache.py."""
+
+from unittest.mock import MagicMock
+
+import numpy as np
+
+from utils.fixture_capabilities import Chassis
+from visualizer.renderer import gl_cache
+from visualizer.renderer.beams import BeamInstanceBatch, ConeBeam, GlowBeam
+from visualizer.renderer.chassis import PARChassisGeometry, StaticChassisGeometry
+from visualizer.renderer.gl_cache import GLResourceCache, resource_cache
+
+
+def _ctx() -> MagicMock:
+    """Context mock handing out a distinct object per program / buffer / VAO."""
+    ctx = MagicMock()
+    ctx.program.side_effect = lambda **kwargs: MagicMock(name='program')
+    ctx.buffer.side_effect = lambda *args, **kwargs: MagicMock(name='buffer')
+    ctx.vertex_array.side_effect = lambda *args, **kwargs: MagicMock(name='vao')
+    return ctx
+
+
+def _mesh():
+    return np.zeros(9, dtype='f4'), np.ones(9, dtype='f4')
+
+
+class TestPrograms:
+    def test_same_sources_compile_once(self):
+        cache = GLResourceCache(_ctx())
+        a = cache.program('vs', 'fs')
+        b = cache.program('vs', 'fs')
+        assert a is b
+        assert cache.programs_compiled == 1
+        assert cache.refcount(a) == 2
+
+    def test_different_sources_compile_separately(self):
+        cache = GLResourceCache(_ctx())
+        assert cache.program('vs', 'fs') is not cache.program('vs', 'fs2')
+        assert cache.programs_compiled == 2
+
+    def test_freed_with_last_reference(self):
+        cache = GLResourceCache(_ctx())
+        program = cache.program('vs', 'fs')
+        cache.program('vs', 'fs')
+        cache.release(program)
+        program.release.assert_not_called()
+        cache.release(program)
+        program.release.assert_called_once()
+        assert len(cache) == 0
+
+
+class TestMeshes:
+    def test_builder_runs_once_per_key(self):
+        cache = GLResourceCache(_ctx())
+        build = MagicMock(side_effect=_mesh)
+        first = cache.mesh(('box', 1.0), build)
+        second = cache.mesh(('box', 1.0), build)
+        assert first == second and len(first) == 2
+        assert build.call_count == 1
+        assert cache.buffers_uploaded == 2
+
+    def test_rebuilt_after_release(self):
+        cache = GLResourceCache(_ctx())
+        build = MagicMock(side_effect=_mesh)
+        for buffer in cache.mesh(('box', 1.0), build):
+            cache.release(buffer)
+        cache.mesh(('box', 1.0), build)
+        assert build.call_count == 2
+
+    def test_unknown_resources_released_directly(self):
+        cache = GLResourceCache(_ctx())
+        vao = MagicMock()
+        cache.release(vao)
+        cache.release(None)
+        vao.release.assert_called_once()
+
+
+class TestRegistry:
+    def test_one_cache_per_context(self):
+        ctx = _ctx()
+        assert resource_cache(ctx) is resource_cache(ctx)
+        assert resource_cache(ctx) is not resource_cache(_ctx())
+
+    def test_empty_cache_leaves_registry(self):
+        ctx = _ctx()
+        cache = resource_cache(ctx)
+        cache.release(cache.program('vs', 'fs'))
+        assert id(ctx) not in gl_cache._CACHES
+
+
+class TestRendererSharing:
+    def test_beams_share_program_and_mesh(self):
+        ctx = _ctx()
+        beams = [GlowBeam(ctx) for _ in range(20)]
+        cache = resource_cache(ctx)
+        assert cache.programs_compiled == 1
+        assert cache.buffers_uploaded == 2
+        assert len({id(b.vbo) for b in beams}) == 1
+        for beam in beams:
+            beam.release()
+        assert id(ctx) not in gl_cache._CACHES
+
+    def test_instanced_batch_reuses_component_meshes(self):
+        ctx = _ctx()
+        cone = ConeBeam(ctx)
+        batch = BeamInstanceBatch(ctx)
+        batch._mesh(True, cone.mesh_key)
+        cache = resource_cache(ctx)
+        # Gobo program for the component + instanced gobo program; one cone mesh
+        assert cache.programs_compiled == 2
+        assert cache.buffers_uploaded == 2
+        batch.release()
+        cone.release()
+        assert len(cache) == 0
+
+    def test_identical_chassis_share_meshes(self):
+        ctx = _ctx()
+        bodies = [PARChassisGeometry(ctx, (0.3, 0.3, 0.2)) for _ in range(10)]
+        other = StaticChassisGeometry(ctx, Chassis.BAR, (1.0, 0.1, 0.1))
+        cache = resource_cache(ctx)
+        assert cache.programs_compiled == 1
+        # PAR body + lens (2 buffers each) and one bar body
+        assert cache.buffers_uploaded == 6
+        for chassis in (*bodies, other):
+            chassis.release()
+        assert len(cache) == 0
+        assert bodies[0].program is None
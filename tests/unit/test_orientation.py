@@ -9,6 +9,9 @@ from utils.orientation import (
     get_rotation_matrix,
     calculate_pan_tilt,
     pan_tilt_to_dmx,
+    get_inverse_orientation,
+    calculate_pan_tilt_batch,
+    pan_tilt_to_dmx_batch,
     get_beam_direction,
     is_fixture_pointing_down,
     get_direction_for_tilt_calculation,
@@ -104,6 +107,48 @@ class TestCalculatePanTilt:
         assert -135 <= tilt <= 135
 
 
+class TestCalculatePanTiltBatch:
+
+    @pytest.fixture
+    def rig(self):
+        rng = np.random.default_rng(11)
+        positions = rng.uniform([-5, -3, 2], [5, 3, 6], size=(24, 3))
+        angles = rng.uniform([-180, -90, -180], [180, 90, 180], size=(24, 3))
+        inverse = np.array([get_inverse_orientation(*a) for a in angles])
+        return positions, angles, inverse
+
+    def test_matches_scalar(self, rig):
+        positions, angles, inverse = rig
+        targets = np.random.default_rng(5).uniform([-6, -4, 0], [6, 4, 5], size=(10, 24, 3))
+        pan, tilt = calculate_pan_tilt_batch(positions, inverse, targets)
+        assert pan.shape == (10, 24)
+        for k in range(10):
+            for i in range(24):
+                expected = calculate_pan_tilt(*positions[i], *targets[k, i], 'hanging', *angles[i])
+                assert pan[k, i] == pytest.approx(expected[0], abs=1e-9)
+                assert tilt[k, i] == pytest.approx(expected[1], abs=1e-9)
+
+    def test_single_target_broadcasts(self, rig):
+        positions, _, inverse = rig
+        pan, tilt = calculate_pan_tilt_batch(positions, inverse, (0.0, 0.0, 0.0))
+        assert pan.shape == (24,)
+
+    def test_target_at_fixture_returns_zero(self, rig):
+        positions, _, inverse = rig
+        pan, tilt = calculate_pan_tilt_batch(positions, inverse, positions)
+        assert np.all(pan == 0.0)
+        assert np.all(tilt == 0.0)
+
+    def test_dmx_matches_scalar(self):
+        pans = np.linspace(-300, 300, 121)
+        tilts = np.linspace(-150, 150, 121)
+        for inverted in (False, True):
+            pan_dmx, tilt_dmx = pan_tilt_to_dmx_batch(pans, tilts, pan_inverted=inverted, tilt_inverted=inverted)
+            expected = [pan_tilt_to_dmx(p, t, pan_inverted=inverted, tilt_inverted=inverted)
+                        for p, t in zip(pans, tilts)]
+            assert list(zip(pan_dmx.tolist(), tilt_dmx.tolist())) == expected
+
+
 class TestGetBeamDirection:
 
     def test_returns_unit_vector(self):
@@ -0,0 +1,155 @@
+"""Unit tests for utils/artnet/output_scheduler.py - deadline-based frame scheduling."""
+
+import threading
+import time
+
+import pytest
+
+from utils.artnet.output_scheduler import OutputScheduler
+
+
+def _run_for(scheduler, seconds):
+    scheduler.start()
+    time.sleep(seconds)
+    scheduler.stop()
+
+
+class TestOutputScheduler:
+
+    def test_ticks_on_absolute_deadlines(self):
+        starts = []
+        scheduler = OutputScheduler(lambda: starts.append(time.monotonic()), rate_hz=100)
+        _run_for(scheduler, 0.3)
+        assert len(starts) >= 20
+        # Deadlines are start + k * interval, so slow ticks don't accumulate drift
+        span = starts[-1] - starts[0]
+        assert span == pytest.approx((len(starts) - 1) * 0.01, abs=0.01)
+        assert scheduler.stats().frames == len(starts)
+
+    def test_overrun_skips_missed_deadlines(self):
+        calls = []
+
+        def tick():
+            calls.append(time.monotonic())
+            if len(calls) == 2:
+                time.sleep(0.055)  # Overrun by several 10ms frames
+
+        scheduler = OutputScheduler(tick, rate_hz=100)
+        _run_for(scheduler, 0.15)
+        stats = scheduler.stats()
+        assert stats.skipped_frames >= 3
+        # No burst of catch-up ticks right after the overrun
+        assert sum(1 for t in calls if calls[2] <= t < calls[2] + 0.004) <= 2
+
+    def test_late_frames_counted(self):
+        scheduler = OutputScheduler(lambda: None, rate_hz=50, late_threshold=0.002)
+        scheduler._record(0.0001, 0)
+        scheduler._record(0.004, 0)
+        scheduler._record(-0.001, 1)
+        stats = scheduler.stats()
+        assert (stats.frames, stats.late_frames, stats.skipped_frames) == (3, 1, 1)
+        assert stats.max_jitter_ms == pytest.approx(4.0)
+        assert stats.mean_jitter_ms == pytest.approx((0.1 + 4.0 + 1.0) / 3)
+
+    def test_tick_errors_do_not_stop_thread(self):
+        calls = []
+
+        def tick():
+            calls.append(1)
+            raise RuntimeError("boom")
+
+        scheduler = OutputScheduler(tick, rate_hz=100)
+        _run_for(scheduler, 0.1)
+        assert len(calls) >= 3
+        assert not scheduler.is_running()
+
+    def test_restart_waits_for_stuck_tick(self):
+        release = threading.Event()
+        calls = []
+
+        def tick():
+            calls.append(threading.current_thread())
+            release.wait(2.0)
+
+        scheduler = OutputScheduler(tick, rate_hz=100)
+        scheduler.start()
+        while not calls:
+            time.sleep(0.001)
+        scheduler.stop(timeout=0.01)
+        assert not scheduler.is_running()
+
+        # The old thread is still inside its tick: give up after the timeout
+        assert scheduler.start(timeout=0.01) is False
+        assert not scheduler.is_running()
+        assert len(set(calls)) == 1
+
+        # Once the tick returns within the timeout, start() goes ahead
+        threading.Timer(0.05, release.set).start()
+        assert scheduler.start(timeout=1.0) is True
+        assert scheduler.is_running()
+        while len(set(calls)) < 2:
+            time.sleep(0.001)
+        scheduler.stop()
+
+    def test_set_rate(self):
+        scheduler = OutputScheduler(lambda: None, rate_hz=30)
+        scheduler.set_rate(44)
+        assert scheduler.interval == pytest.approx(1 / 44)
+        scheduler.set_rate(10000)
+        assert scheduler.rate_hz == OutputScheduler.MAX_RATE_HZ
+        with pytest.raises(ValueError):
+            scheduler.set_rate(0)
+
+
+class TestControllerRestart:
+
+    @pytest.fixture
+    def controller(self):
+        from unittest.mock import MagicMock
+        from config.models import Configuration, Universe
+        from utils.artnet.shows_artnet_controller import ShowsArtNetController
+
+        config = Configuration(universes={1: Universe(id=1, name="Universe 1", output={})})
+        controller = ShowsArtNetController(config=config, fixture_definitions={})
+        controller.artnet_sender = MagicMock()
+        controller.enable_output()
+        yield controller
+        controller._scheduler.stop()
+
+    def _stick_first_tick(self, controller, release):
+        threads = []
+
+        def tick():
+            threads.append(threading.current_thread())
+            if len(threads) == 1:
+                release.wait(5.0)
+        controller._update_and_send_dmx = tick
+        return threads
+
+    def test_start_after_slow_stop_waits_for_old_thread(self, controller):
+        release = threading.Event()
+        threads = self._stick_first_tick(controller, release)
+        assert controller.start_playback()
+        while not threads:
+            time.sleep(0.001)
+        controller.stop_playback()  # Times out with the tick still running
+
+        threading.Timer(0.1, release.set).start()
+        assert controller.start_playback()
+        assert controller._scheduler.is_running()
+        while len(set(threads)) < 2:
+            time.sleep(0.001)
+
+    def test_start_reports_stuck_thread(self, controller, monkeypatch):
+        release = threading.Event()
+        threads = self._stick_first_tick(controller, release)
+        assert controller.start_playback()
+        while not threads:
+            time.sleep(0.001)
+        controller.stop_playback()
+
+        start = controller._scheduler.start
+        monkeypatch.setattr(controller._scheduler, "start", lambda: start(timeout=0.01))
+        assert controller.start_playback() is False
+        assert not controller._scheduler.is_running()
+        release.set()
@@ -0,0 +1,48 @@
+# tests/unit/test_parallel_export.py
+"""Parallel show export must produce the same XML as the serial path."""
+
+import os
+import xml.etree.ElementTree as ET
+
+import pytest
+
+from config.models import Configuration
+from utils.fixture_utils import load_fixture_definitions_from_qlc
+from utils.to_xml.setup_to_xml import create_fixture_elements
+from utils.to_xml.shows_to_xml import create_shows, precompute_unified_steps, _iter_unified_step_jobs
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+SHOW_PATH = os.path.join(REPO_ROOT, "demos", "shows", "club_band.yaml")
+
+
+def _export_shows(workers):
+    config = Configuration.load(SHOW_PATH)
+    fixture_definitions = load_fixture_definitions_from_qlc(
+        {(f.manufacturer, f.model) for g in config.groups.values() for f in g.fixtures})
+    engine = ET.Element("Engine")
+    fixture_id_map = create_fixture_elements(engine, config)
+    next_id = create_shows(engine, config, fixture_id_map, fixture_definitions, workers=workers)
+    return next_id, ET.tostring(engine)
+
+
+@pytest.fixture(scope="module")
+def serial_export():
+    return _export_shows(workers=1)
+
+
+class TestParallelExport:
+
+    def test_identical_to_serial(self, serial_export):
+        assert _export_shows(workers=2) == serial_export
+
+    def test_jobs_cover_every_sequence(self, serial_export):
+        config = Configuration.load(SHOW_PATH)
+        jobs = list(_iter_unified_step_jobs(config, {}))
+        sequences = ET.fromstring(serial_export[1]).findall("Function[@Type='Sequence']")
+        assert len(jobs) >= len(sequences) > 0
+        assert len({key for key, _ in jobs}) == len(jobs)
+
+    def test_no_jobs_skips_pool(self):
+        config = Configuration.load(SHOW_PATH)
+        config.shows = {}
+        assert precompute_unified_steps(config, {}, {}, workers=2) == {}
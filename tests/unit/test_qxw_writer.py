@@ -0,0 +1,75 @@
+# tests/unit/test_qxw_writer.py
+"""QxwWriter must write the same file the old ET.tostring + minidom path did."""
+
+import xml.dom.minidom as minidom
+import xml.etree.ElementTree as ET
+
+import pytest
+
+from utils.to_xml.qxw_writer import QxwWriter
+
+
+def _minidom_output(root):
+    """The serialization create_qlc_workspace used before streaming."""
+    pretty_xml = minidom.parseString(ET.tostring(root, encoding='UTF-8')).toprettyxml(indent="  ")
+    return QxwWriter.HEADER + '\n'.join(pretty_xml.split('\n')[1:])
+
+
+def _sample_workspace():
+    root = ET.Element("Workspace")
+    root.set("xmlns", "http://www.qlcplus.org/Workspace")
+    root.set("CurrentWindow", "VirtualConsole")
+    creator = ET.SubElement(root, "Creator")
+    ET.SubElement(creator, "Name").text = "Q Light Controller Plus"
+    ET.SubElement(creator, "Author").text = "R&D <\"lights\">"
+    engine = ET.SubElement(root, "Engine")
+    func = ET.SubElement(engine, "Function", ID="0", Type="Show", Name='Encore "A&B" <live>')
+    ET.SubElement(func, "TimeDivision", Type="Time", BPM="120")
+    step = ET.SubElement(func, "Step", Number="0")
+    step.text = "0:0,255,1,128"
+    ET.SubElement(func, "Empty").text = ""
+    ET.SubElement(engine, "SimpleDesk").append(ET.Element("Engine"))
+    vc = ET.SubElement(root, "VirtualConsole")
+    ET.SubElement(vc, "Frame", Caption="")
+    return root
+
+
+class TestQxwWriter:
+
+    def test_whole_tree_matches_minidom(self, tmp_path):
+        root = _sample_workspace()
+        expected = _minidom_output(root)
+        path = tmp_path / "workspace.qxw"
+        with QxwWriter(str(path)) as writer:
+            writer.start(root)
+            writer.flush(root)
+            writer.end()
+        assert path.read_text(encoding="UTF-8") == expected
+
+    def test_streamed_containers_match_minidom(self, tmp_path):
+        expected = _minidom_output(_sample_workspace())
+        root = _sample_workspace()
+        creator, engine, vc = list(root)
+        root.remove(engine)
+        root.remove(vc)
+        path = tmp_path / "workspace.qxw"
+        with QxwWriter(str(path)) as writer:
+            writer.start(root)
+            writer.flush(root)
+            writer.start(engine)
+            writer.flush(engine)
+            assert len(engine) == 0
+            writer.end()
+            writer.write(vc)
+            writer.end()
+        assert path.read_text(encoding="UTF-8") == expected
+
+    def test_failed_export_keeps_previous_file(self, tmp_path):
+        path = tmp_path / "workspace.qxw"
+        path.write_text("previous")
+        with pytest.raises(RuntimeError):
+            with QxwWriter(str(path)) as writer:
+                writer.start(ET.Element("Workspace"))
+                raise RuntimeError("boom")
+        assert path.read_text() == "previous"
+        assert list(tmp_path.iterdir()) == [path]
@@ -119,3 +119,96 @@ class TestFFmpegAvailability:
         import imageio_ffmpeg
         ffmpeg_path = imageio_ffmpeg.get_ffmpeg_exe()
         assert os.path.exists(ffmpeg_path)
+
+
+class _FakePBO:
+    def __init__(self):
+        self.data = b""
+
+    def read(self):
+        return self.data
+
+    def release(self):
+        pass
+
+
+class _Stream:
+    """FFmpeg stdin stand-in recording written frames."""
+
+    def __init__(self, fail_after=None):
+        self.frames = []
+        self.closed = False
+        self.fail_after = fail_after
+
+    def write(self, data):
+        if self.fail_after is not None and len(self.frames) >= self.fail_after:
+            raise BrokenPipeError()
+        self.frames.append(data)
+
+    def close(self):
+        self.closed = True
+
+
+def _pipeline(stream, buffers=3):
+    from utils.render.frame_pipeline import FramePipeline
+    ctx, fbo = MagicMock(), MagicMock()
+    ctx.buffer.side_effect = lambda **kwargs: _FakePBO()
+    rendered = iter(range(1000))
+    fbo.read_into.side_effect = lambda pbo, **kwargs: setattr(pbo, "data", bytes([next(rendered)]))
+    return FramePipeline(ctx, fbo, (4, 2), stream, buffers=buffers), ctx
+
+
+class TestFramePipeline:
+    """Ring-buffered readback + writer thread in utils/render/frame_pipeline.py."""
+
+    def test_frames_written_in_order(self):
+        stream = _Stream()
+        pipeline, ctx = _pipeline(stream)
+        for _ in range(10):
+            pipeline.push()
+        pipeline.finish(timeout=5.0)
+        assert stream.frames == [bytes([i]) for i in range(10)]
+        assert stream.closed
+        assert ctx.buffer.call_count == 3
+        assert ctx.buffer.call_args.kwargs["reserve"] == 4 * 2 * 3
+
+    def test_readback_lags_by_ring_size(self):
+        stream = _Stream()
+        pipeline, _ = _pipeline(stream, buffers=3)
+        for _ in range(3):
+            pipeline.push()
+        # Nothing mapped yet: all three frames still in flight
+        assert pipeline._queue.qsize() == 0 and stream.frames == []
+        pipeline.push()
+        pipeline.finish(timeout=5.0)
+        assert len(stream.frames) == 4
+
+    def test_writer_error_reaches_render_loop(self):
+        pipeline, _ = _pipeline(_Stream(fail_after=2), buffers=1)
+        with pytest.raises(BrokenPipeError):
+            for _ in range(50):
+                pipeline.push()
+            pipeline.finish(timeout=5.0)
+
+    def test_abort_stops_writer(self):
+        stream = _Stream()
+        pipeline, _ = _pipeline(stream)
+        pipeline.push()
+        pipeline.abort()
+        assert not pipeline._thread.is_alive()
+        assert not stream.closed
+
+
+class TestParallelRender:
+    """Chunking for worker-parallel video renders."""
+
+    def test_split_covers_every_frame_once(self):
+        from utils.render.offline_renderer import split_frame_range
+        ranges = split_frame_range(1001, 4)
+        assert ranges[0][0] == 0 and ranges[-1][1] == 1001
+        assert all(a[1] == b[0] for a, b in zip(ranges, ranges[1:]))
+        assert max(e - s for s, e in ranges) - min(e - s for s, e in ranges) <= 1
+
+    def test_split_never_yields_empty_chunks(self):
+        from utils.render.offline_renderer import split_frame_range
+        assert split_frame_range(3, 8) == [(0, 1), (1, 2), (2, 3)]
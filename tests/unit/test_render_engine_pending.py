@@ -122,3 +122,26 @@ def test_post_init_calls_bypass_buffering(engine):
     engine.fixture_manager.update_fixtures.assert_called_once()
     engine.stage_renderer.set_grid_size.assert_called_once_with(0.5)
     engine.fixture_manager.update_dmx.assert_called_once()
+
+
+def test_dmx_stream_refreshes_universe_overwritten_by_update_dmx(engine):
+    """A full buffer pushed via update_dmx (build-mode preview) diverges
+    from the stream decoder's buffer, so the next stream frame for that
+    universe must refresh every fixture, not just the changed range."""
+    from utils.dmx_stream import DMXStreamEncoder
+
+    engine.fixture_manager = MagicMock()
+    encoder = DMXStreamEncoder()
+    engine.apply_dmx_stream(encoder.encode([(1, bytes(512))], now=0.0))
+
+    engine.update_dmx(1, b"\xff" * 512)
+    data = bytearray(512)
+    data[7] = 1
+    engine.apply_dmx_stream(encoder.encode([(1, data)], now=0.1))
+    universe, _, ranges = engine.fixture_manager.update_dmx_ranges.call_args.args
+    assert (universe, ranges) == (1, [(0, 512)])
+
+    data[8] = 1
+    engine.apply_dmx_stream(encoder.encode([(1, data)], now=0.2))
+    _, _, ranges = engine.fixture_manager.update_dmx_ranges.call_args.args
+    assert ranges == [(8, 9)]
@@ -0,0 +1,125 @@
+# tests/unit/test_sacn_sender.py
+"""Unit tests for utils/artnet/sacn_sender.py - E1.31 packet creation and routing."""
+
+import socket
+import struct
+import uuid
+from unittest.mock import MagicMock
+
+import pytest
+
+from config.models import Universe
+from utils.artnet.sacn_sender import SACNSender, multicast_address
+
+CID = uuid.UUID("12345678-1234-5678-1234-567812345678")
+
+
+@pytest.fixture
+def sender():
+    s = SACNSender(source_name="Test Source", cid=CID)
+    yield s
+    s.universes.clear()  # No termination packets from teardown
+    s.close()
+
+
+def _e131_universe(sacn_universe, multicast=True, ip="", port="5568", priority=None):
+    params = {'universe': str(sacn_universe), 'multicast': str(multicast).lower(), 'ip': ip, 'port': port}
+    if priority is not None:
+        params['priority'] = str(priority)
+    return {'plugin': 'E1.31', 'line': '0', 'parameters': params}
+
+
+class TestCreateDmxPacket:
+
+    def test_layout(self, sender):
+        sender.set_universe(1, 7, priority=150)
+        packet = sender.create_dmx_packet(1, bytes([10, 20, 30]))
+        assert len(packet) == 638
+        # Root layer
+        assert struct.unpack('>HH', packet[0:4]) == (0x0010, 0)
+        assert packet[4:16] == b'ASC-E1.17\x00\x00\x00'
+        assert struct.unpack('>H', packet[16:18])[0] == 0x7000 | 622
+        assert struct.unpack('>I', packet[18:22])[0] == 4
+        assert packet[22:38] == CID.bytes
+        # Framing layer
+        assert struct.unpack('>H', packet[38:40])[0] == 0x7000 | 600
+        assert struct.unpack('>I', packet[40:44])[0] == 2
+        assert packet[44:108].rstrip(b'\x00') == b'Test Source'
+        assert packet[108] == 150
+        assert packet[112] == 0
+        assert struct.unpack('>H', packet[113:115])[0] == 7
+        # DMP layer
+        assert struct.unpack('>HBBHHH', packet[115:125]) == (0x7000 | 523, 2, 0xA1, 0, 1, 513)
+        assert packet[125] == 0  # Start code
+        assert packet[126:129] == bytes([10, 20, 30])
+        assert packet[129:] == bytes(509)
+
+    def test_sequence_is_per_universe(self, sender):
+        sender.set_universe(1, 1)
+        sender.set_universe(2, 2)
+        assert sender.create_dmx_packet(1, bytes(1))[111] == 0
+        assert sender.create_dmx_packet(1, bytes(1))[111] == 1
+        assert sender.create_dmx_packet(2, bytes(1))[111] == 0
+
+    def test_invalid_universe_rejected(self, sender):
+        with pytest.raises(ValueError):
+            sender.set_universe(1, 0)
+        with pytest.raises(ValueError):
+            sender.set_universe(1, 64000)
+
+    def test_multicast_address(self):
+        assert multicast_address(1) == "239.255.0.1"
+        assert multicast_address(300) == "239.255.1.44"
+
+
+class TestConfigureFromConfig:
+
+    def test_only_e131_universes_routed(self, sender):
+        universes = {
+            1: Universe(id=1, name="U1", output=_e131_universe(10)),
+            2: Universe(id=2, name="U2", output={'plugin': 'ArtNet', 'parameters': {}}),
+            3: Universe(id=3, name="U3", output=_e131_universe(11, multicast=False, ip="10.0.0.5",
+                                                              port="5569", priority=180)),
+        }
+        assert sorted(sender.configure_from_config(universes)) == [1, 3]
+        assert (sender.universes[1].ip, sender.universes[1].port) == ("239.255.0.10", 5568)
+        assert (sender.universes[3].ip, sender.universes[3].port) == ("10.0.0.5", 5569)
+        assert sender.universes[3].priority == 180
+
+    def test_config_edits_picked_up(self, sender):
+        sender.socket = MagicMock()
+        universes = {1: Universe(id=1, name="U1", output=_e131_universe(10))}
+        sender.configure_from_config(universes)
+        universes[1].output['parameters']['universe'] = '12'
+        sender.configure_from_config(universes)
+        assert sender.universes[1].universe == 12
+        universes[1].output['plugin'] = 'ArtNet'
+        assert sender.configure_from_config(universes) == []
+        # Removing a universe terminates its stream
+        options = [call.args[0][112] for call in sender.socket.sendto.call_args_list]
+        assert options == [SACNSender.OPTION_STREAM_TERMINATED] * 3
+
+
+class TestSendFrame:
+
+    def test_unconfigured_universes_skipped(self, sender):
+        sender.socket = MagicMock()
+        sender.set_universe(1, 1)
+        assert sender.send_frame([(1, bytes(10)), (2, bytes(10))]) == [1]
+        assert sender.send_frame([(1, bytes(10))]) == []  # Rate limited
+        assert sender.send_dmx(1, bytes(10), force=True) is True
+
+    def test_unicast_over_udp(self, sender):
+        receiver = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        receiver.bind(("127.0.0.1", 0))
+        receiver.settimeout(2.0)
+        try:
+            port = receiver.getsockname()[1]
+            sender.set_universe(1, 1, ip="127.0.0.1", port=port)
+            sender.set_universe(2, 2, ip="127.0.0.1", port=port)
+            assert sender.send_frame([(1, bytes([1] * 512)), (2, bytes([2] * 512))]) == [1, 2]
+            packets = [receiver.recv(1024) for _ in range(2)]
+            assert [struct.unpack('>H', p[113:115])[0] for p in packets] == [1, 2]
+            assert [p[126] for p in packets] == [1, 2]
+        finally:
+            receiver.close()
@@ -63,6 +63,11 @@ def _make_controller(config, callback=None):
     return controller
 
 
+def _wire_universes(sender) -> list[int]:
+    """0-based ArtNet universes handed to the (mocked) sender, in order."""
+    return [u for call in sender.send_frame.call_args_list for u, _ in call.args[0]]
+
+
 def test_callback_fires_once_per_universe(two_universe_config):
     received: list[tuple[int, bytes]] = []
 
@@ -84,9 +89,10 @@ def test_callback_fires_once_per_universe(two_universe_config):
             f"Expected 512-byte DMX buffer, got {len(payload)}"
         )
 
-    # ArtNet sender still gets called per-universe — this is the
-    # belt-and-braces guarantee that the wire path is unaffected.
-    assert controller.artnet_sender.send_dmx.call_count == 2
+    # ArtNet sender still gets every universe (in one batched frame) —
+    # this is the belt-and-braces guarantee that the wire path is unaffected.
+    assert controller.artnet_sender.send_frame.call_count == 1
+    assert _wire_universes(controller.artnet_sender) == [0, 1]
 
 
 def test_callback_exception_does_not_break_send(two_universe_config):
@@ -99,7 +105,7 @@ def test_callback_exception_does_not_break_send(two_universe_config):
     controller._send_all_universes()
 
     # ArtNet sender still got both packets.
-    assert controller.artnet_sender.send_dmx.call_count == 2
+    assert _wire_universes(controller.artnet_sender) == [0, 1]
 
 
 def test_set_local_dmx_callback_swaps_in_place(two_universe_config):
@@ -122,4 +128,43 @@ def test_no_callback_means_zero_overhead(two_universe_config):
     must still send via ArtNet."""
     controller = _make_controller(two_universe_config, callback=None)
     controller._send_all_universes()
-    assert controller.artnet_sender.send_dmx.call_count == 2
+    assert _wire_universes(controller.artnet_sender) == [0, 1]
+
+
+def test_e131_universes_also_sent_via_sacn(two_universe_config):
+    two_universe_config.universes[2].output = {
+        'plugin': 'E1.31', 'parameters': {'universe': '5', 'multicast': 'true'},
+    }
+    controller = _make_controller(two_universe_config, callback=None)
+    controller.sacn_sender.socket = MagicMock()
+    controller._send_all_universes()
+
+    # ArtNet path unchanged, E1.31 universe additionally on its multicast group
+    assert _wire_universes(controller.artnet_sender) == [0, 1]
+    call, = controller.sacn_sender.socket.sendto.call_args_list
+    packet, address = call.args
+    assert address == ("239.255.0.5", 5568)
+    assert bytes(packet)[113:115] == b'\x00\x05'
+    controller.sacn_sender.universes.clear()
+
+
+def test_dmx_stream_callback_gets_deltas(two_universe_config):
+    from utils.dmx_stream import DMXStreamDecoder
+
+    frames: list[bytes] = []
+    controller = _make_controller(two_universe_config, callback=None)
+    controller.set_dmx_stream_callback(frames.append)
+    controller._send_all_universes()
+
+    decoder = DMXStreamDecoder()
+    first = decoder.decode(frames[0])
+    assert sorted(u for u, _, _ in first) == [1, 2]
+
+    # Unchanged universes produce no stream frame
+    controller._send_all_universes()
+    assert len(frames) == 1
+
+    controller.dmx_manager.dmx_state[2][3] = 99
+    controller._send_all_universes()
+    (universe, buffer, ranges), = decoder.decode(frames[1])
+    assert (universe, ranges, buffer[3]) == (2, [(3, 4)], 99)
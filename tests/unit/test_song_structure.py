@@ -251,3 +251,45 @@ class TestGetBeatTimesInRange:
         # Range completely outside the song
         beats = two_part_structure.get_beat_times_in_range(9999.0, 10000.0)
         assert len(beats) == 0
+
+    def test_gradual_part_lists_every_beat(self, gradual_structure):
+        ss = gradual_structure
+        build = ss.parts[1]
+        beats = ss.get_beat_times_in_range(build.start_time, build.start_time + build.duration)
+        # 8 bars of 4/4 = 32 beats plus the closing downbeat
+        assert len(beats) == 33
+        assert abs(beats[-1][0] - (build.start_time + build.duration)) < 1e-9
+        gaps = [b[0] - a[0] for a, b in zip(beats, beats[1:])]
+        assert gaps[0] > gaps[-1]  # Accelerating 120 -> 160 BPM
+
+
+class TestTempoMap:
+
+    def test_instant_time_to_beat(self, two_part_structure):
+        ss = two_part_structure
+        assert ss.time_to_beat(1.0) == pytest.approx(2.0)
+        # Verse starts at beat 16 (8s) and runs at 140 BPM
+        assert ss.time_to_beat(8.0 + 60.0 / 140.0) == pytest.approx(17.0)
+
+    def test_beat_to_time_inverts_time_to_beat(self, gradual_structure):
+        ss = gradual_structure
+        end = ss.get_total_duration()
+        for i in range(200):
+            t = -1.0 + (end + 2.0) * i / 199
+            assert ss.beat_to_time(ss.time_to_beat(t)) == pytest.approx(t, abs=1e-9)
+
+    def test_part_beats_end_at_part_end(self, gradual_structure):
+        ss = gradual_structure
+        # 4 bars + 8 bars of 4/4
+        assert ss.beat_to_time(48.0) == pytest.approx(ss.get_total_duration())
+        assert ss.beat_to_time(16.0) == pytest.approx(ss.parts[1].start_time)
+
+    def test_empty_structure_uses_default_bpm(self):
+        ss = SongStructure()
+        assert ss.time_to_beat(3.0) == pytest.approx(6.0)
+        assert ss.beat_to_time(6.0) == pytest.approx(3.0)
+
+    def test_snap_follows_gradual_curve(self, gradual_structure):
+        ss = gradual_structure
+        beat_time = ss.beat_to_time(21.0)
+        assert ss.find_nearest_beat_time(beat_time + 0.01) == pytest.approx(beat_time)
@@ -15,9 +15,10 @@ class TestMessageType:
         assert MessageType.UPDATE.value == "update"
         assert MessageType.HEARTBEAT.value == "heartbeat"
         assert MessageType.ACK.value == "ack"
+        assert MessageType.DMX.value == "dmx"
 
     def test_all_members(self):
-        expected = {"STAGE", "FIXTURES", "GROUPS", "UPDATE", "HEARTBEAT", "ACK"}
+        expected = {"STAGE", "FIXTURES", "GROUPS", "UPDATE", "HEARTBEAT", "ACK", "DMX"}
         assert set(m.name for m in MessageType) == expected
 
 
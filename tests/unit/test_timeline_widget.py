@@ -0,0 +1,139 @@
+# tests/unit/test_timeline_widget.py
+"""Static layer cache, playhead strip repaints and off-screen block culling
+(timeline_ui/timeline_widget.py, timeline_ui/light_lane_widget.py)."""
+
+import os
+from unittest.mock import MagicMock
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+
+def _make_song_structure():
+    from config.models import ShowPart
+    from timeline.song_structure import SongStructure
+
+    parts = [ShowPart(name="A", color="#FF0000", signature="4/4",
+                      bpm=120.0, num_bars=8, transition="instant"),
+             ShowPart(name="B", color="#00FF00", signature="3/4",
+                      bpm=90.0, num_bars=8, transition="gradual")]
+    ss = SongStructure()
+    ss.load_from_show_parts(parts)
+    return ss
+
+
+@pytest.fixture
+def timeline(qapp):
+    from timeline_ui import timeline_widget
+
+    tw = timeline_widget.TimelineWidget()
+    tw.resize(tw.minimumWidth(), 60)
+    tw.set_song_structure(_make_song_structure())
+    yield tw
+    tw.deleteLater()
+
+
+class TestLayerCache:
+    def test_tiles_reused_until_zoom_changes(self, timeline, monkeypatch):
+        from timeline_ui import timeline_widget
+        monkeypatch.setattr(timeline_widget, "USE_LAYER_CACHE", True)
+
+        calls = []
+        draw = timeline.draw_static_layers
+        timeline.draw_static_layers = lambda *args: (calls.append(args), draw(*args))
+
+        timeline.grab()
+        rendered = len(calls)
+        assert rendered > 0
+        timeline.grab()
+        assert len(calls) == rendered
+
+        timeline.set_zoom_factor(2.0)
+        timeline.resize(timeline.minimumWidth(), 60)
+        timeline.grab()
+        assert len(calls) > rendered
+
+    def test_tile_count_is_bounded(self, timeline, monkeypatch):
+        from timeline_ui import timeline_widget
+        monkeypatch.setattr(timeline_widget, "USE_LAYER_CACHE", True)
+
+        timeline.grab()
+        assert 0 < len(timeline._layer_tiles) <= timeline_widget.LAYER_CACHE_TILES
+
+    def test_set_song_structure_invalidates(self, timeline, monkeypatch):
+        from timeline_ui import timeline_widget
+        monkeypatch.setattr(timeline_widget, "USE_LAYER_CACHE", True)
+
+        timeline.grab()
+        assert timeline._layer_tiles
+        timeline.set_song_structure(timeline.song_structure)
+        assert not timeline._layer_tiles
+
+
+class TestPlayheadRepaint:
+    def test_only_old_and_new_strips_repaint(self, timeline):
+        timeline.update = MagicMock()
+        timeline.set_playhead_position(1.0)
+        timeline.set_playhead_position(2.0)
+
+        rects = [c.args[0] for c in timeline.update.call_args_list]
+        assert len(rects) == 4
+        width = 2 * timeline.playhead_margin + 1
+        assert all(r.width() == width for r in rects)
+        x = round(timeline.time_to_pixel(2.0))
+        assert rects[-1].contains(x, 0)
+
+    def test_unchanged_pixel_does_not_repaint(self, timeline):
+        timeline.set_playhead_position(1.0)
+        timeline.update = MagicMock()
+        timeline.set_playhead_position(1.0 + 0.1 / timeline.pixels_per_second)
+        timeline.update.assert_not_called()
+
+
+class TestBlockCulling:
+    @pytest.fixture
+    def lane(self, qapp):
+        from timeline.light_lane import LightLane
+        from timeline_ui import LightLaneWidget
+
+        lane_model = LightLane(name="L1", fixture_targets=["TestGroup"])
+        lane_model.add_light_block(0.0, 4.0, "bars.static")
+        lane_model.add_light_block(100.0, 4.0, "bars.static")
+        w = LightLaneWidget(lane_model, ["TestGroup"])
+        yield w
+        w.deleteLater()
+
+    def test_zoom_lays_out_only_blocks_in_view(self, lane):
+        near, far = lane.light_block_widgets
+        lane.timeline_widget.visible_time_range = lambda margin=0.0: (0.0, 10.0)
+
+        lane.set_zoom_factor(2.0)
+        assert not near.culled
+        assert near.x() == 0
+        assert far.culled and far.isHidden()
+
+        lane.on_visible_range_changed(90.0, 110.0)
+        assert not far.culled
+        assert far.x() == int(lane.timeline_widget.time_to_pixel(100.0))
+
+    def test_lane_not_shown_lays_out_everything(self, lane):
+        lane.timeline_widget.visible_time_range = lambda margin=0.0: None
+        lane.set_zoom_factor(0.5)
+        assert not any(w.culled for w in lane.light_block_widgets)
+
+    def test_click_on_culled_block_old_rect_is_empty(self, lane):
+        from PyQt6.QtCore import QPoint
+
+        near, far = lane.light_block_widgets
+        lane.show()
+        old_center = far.geometry().center()
+        assert lane.block_widget_at(old_center) is far
+
+        lane.timeline_widget.visible_time_range = lambda margin=0.0: (0.0, 10.0)
+        lane.set_zoom_factor(2.0)
+        assert far.culled and far.geometry().center() == old_center
+        # The hidden block keeps its old rect but must not swallow the click
+        assert lane.block_widget_at(old_center) is None
+        assert lane.block_widget_at(near.geometry().center()) is near
+        assert lane.block_widget_at(QPoint(near.geometry().right() + 5, 5)) is None
@@ -142,6 +142,55 @@ class TestWaveformAnalyzerCache:
         assert not os.path.exists(fake_file)
 
 
+class TestBinaryLevelCache:
+
+    def _cached(self, temp_cache_dir, sample_audio_data):
+        analyzer = WaveformAnalyzer(cache_dir=temp_cache_dir)
+        wd = WaveformData("fake_path.mp3", 44100, 1.0)
+        for peaks in analyzer._generate_levels(sample_audio_data, [128, 2048]):
+            wd.add_peak_level(peaks)
+        assert analyzer._save_to_cache(wd)
+        return analyzer, wd
+
+    def test_levels_load_lazily(self, temp_cache_dir, sample_audio_data):
+        analyzer, wd = self._cached(temp_cache_dir, sample_audio_data)
+        loaded = analyzer._load_from_cache("fake_path.mp3")
+        assert loaded.resolutions == [128, 2048]
+        assert loaded.peak_levels == {}
+
+        peaks = loaded.get_peaks_for_zoom(44100 / 2048)
+        assert peaks.resolution == 2048
+        assert list(loaded.peak_levels) == [2048]
+        assert isinstance(peaks.min_peaks, np.memmap)
+        assert np.array_equal(peaks.max_peaks, wd.peak_levels[2048].max_peaks)
+
+    def test_index_is_small(self, temp_cache_dir, sample_audio_data):
+        analyzer, _ = self._cached(temp_cache_dir, sample_audio_data)
+        index_path = analyzer._get_cache_path("fake_path.mp3")
+        assert os.path.getsize(index_path) < 1024
+
+    def test_old_json_cache_ignored(self, temp_cache_dir):
+        analyzer = WaveformAnalyzer(cache_dir=temp_cache_dir)
+        with open(analyzer._get_cache_path("fake_path.mp3"), 'w') as f:
+            json.dump({'file_path': "fake_path.mp3", 'sample_rate': 44100,
+                       'duration': 1.0, 'peak_levels': {}}, f)
+        assert analyzer._load_from_cache("fake_path.mp3") is None
+
+    def test_clear_cache_removes_levels(self, temp_cache_dir, sample_audio_data):
+        analyzer, _ = self._cached(temp_cache_dir, sample_audio_data)
+        analyzer.clear_cache()
+        assert os.listdir(temp_cache_dir) == []
+
+    def test_single_pass_matches_per_level(self, sample_audio_data, temp_cache_dir):
+        analyzer = WaveformAnalyzer(cache_dir=temp_cache_dir)
+        data = sample_audio_data[:10000]
+        for peaks in analyzer._generate_levels(data, [128, 512, 3000]):
+            chunks = [data[i:i + peaks.resolution].mean(axis=1)
+                      for i in range(0, len(data), peaks.resolution)]
+            assert np.allclose(peaks.min_peaks, [c.min() for c in chunks], atol=1e-6)
+            assert np.allclose(peaks.rms_peaks, [np.sqrt(np.mean(c ** 2)) for c in chunks], atol=1e-6)
+
+
 class TestGenerateSimpleOverview:
 
     def test_basic_overview(self, sample_audio_data):
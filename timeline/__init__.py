@@ -4,5 +4,6 @@
 from .song_structure import SongStructure
 from .playback_engine import PlaybackEngine
 from .light_lane import LightLane
+from .block_index import LaneBlockIndex
 
-__all__ = ['SongStructure', 'PlaybackEngine', 'LightLane']
+__all__ = ['SongStructure', 'PlaybackEngine', 'LightLane', 'LaneBlockIndex']
@@ -0,0 +1,249 @@
+# timeline/block_index.py
+# Time index over a lane's light blocks and sublane blocks for playback scanning
+
+import math
+from bisect import bisect_right
+from typing import Dict, List, Optional, Tuple
+
+# Sublane block lists on a LightBlock, in the order playback processes them
+SUBLANE_TYPES = ('dimmer', 'colour', 'movement', 'special')
+
+# Kind used for the LightBlock envelopes themselves (PlaybackEngine signals)
+ENVELOPE = 'light'
+
+
+class IntervalTrack:
+    """Sorted start/end lists for one kind of block on a lane.
+
+    Entries are stored sorted by start time. A block is active at time ``t``
+    when ``start_time <= t < end_time`` (same rule the playback loops used
+    when they scanned every block).
+    """
+
+    def __init__(self, entries: List[Tuple[float, float, int, object]]):
+        """
+        Args:
+            entries: (start_time, end_time, lane_order, block) tuples.
+                ``lane_order`` is the block's position in a full walk of the
+                lane, used to keep LTP ordering identical to a linear scan.
+        """
+        entries = sorted(entries, key=lambda e: (e[0], e[2]))
+        self.starts: List[float] = [e[0] for e in entries]
+        self.ends: List[float] = [e[1] for e in entries]
+        self.orders: List[int] = [e[2] for e in entries]
+        self.blocks: List[object] = [e[3] for e in entries]
+
+        # Entry indices sorted by end time, for retiring blocks as time advances
+        self.by_end: List[int] = sorted(range(len(entries)), key=lambda i: self.ends[i])
+        self.end_times: List[float] = [self.ends[i] for i in self.by_end]
+
+        # Longest block bounds how far back a still-active block can start
+        self.max_duration = max((e[1] - e[0] for e in entries), default=0.0)
+
+    def __len__(self) -> int:
+        return len(self.blocks)
+
+    def active_indices(self, t: float) -> List[int]:
+        """Entry indices active at ``t``, in lane order."""
+        hi = bisect_right(self.starts, t)
+        earliest = t - self.max_duration
+        result = []
+        i = hi - 1
+        while i >= 0 and self.starts[i] >= earliest:
+            if self.ends[i] > t:
+                result.append(i)
+            i -= 1
+        result.sort(key=lambda idx: self.orders[idx])
+        return result
+
+    def active_at(self, t: float) -> List[object]:
+        """Blocks active at ``t``, in lane order."""
+        return [self.blocks[i] for i in self.active_indices(t)]
+
+
+class LaneBlockIndex:
+    """Per-lane time index over light blocks and their sublane blocks.
+
+    Built once from ``lane.light_blocks`` and reused across ticks so the
+    per-frame cost depends on how many blocks are active, not on the length
+    of the show. The index is a snapshot: edits that move or resize blocks
+    in place must invalidate it (see ``LightLane.invalidate_block_index``).
+    """
+
+    def __init__(self, light_blocks: list):
+        """
+        Args:
+            light_blocks: List of LightBlock instances (lane order)
+        """
+        self._source = light_blocks
+        self._source_len = len(light_blocks)
+        self._source_last = light_blocks[-1] if light_blocks else None
+
+        envelope_entries = []
+        sublane_entries: Dict[str, list] = {t: [] for t in SUBLANE_TYPES}
+        order = 0
+        for light_block in light_blocks:
+            envelope_entries.append((light_block.start_time, light_block.end_time, order, light_block))
+            order += 1
+            for sublane_type in SUBLANE_TYPES:
+                for block in getattr(light_block, f"{sublane_type}_blocks"):
+                    sublane_entries[sublane_type].append((block.start_time, block.end_time, order, block))
+                    order += 1
+
+        self.tracks: Dict[str, IntervalTrack] = {ENVELOPE: IntervalTrack(envelope_entries)}
+        for sublane_type in SUBLANE_TYPES:
+            self.tracks[sublane_type] = IntervalTrack(sublane_entries[sublane_type])
+
+    def is_stale(self, light_blocks: list) -> bool:
+        """Cheap structural check for blocks added or removed since the build.
+
+        In-place time edits are not detected here; they go through explicit
+        invalidation.
+        """
+        if light_blocks is not self._source or len(light_blocks) != self._source_len:
+            return True
+        # Remove + append keeps the length but changes the tail
+        return bool(light_blocks) and light_blocks[-1] is not self._source_last
+
+    def active_at(self, kind: str, t: float) -> List[object]:
+        """Blocks of ``kind`` ('light' or a sublane type) active at ``t``."""
+        return self.tracks[kind].active_at(t)
+
+    def cursor(self) -> 'LaneBlockCursor':
+        """Create a cursor for incremental forward scanning."""
+        return LaneBlockCursor(self)
+
+    def hold_schedule(self, kind: str, fps: float) -> 'HoldSchedule':
+        """Per-frame held block of sublane ``kind`` for ticks at ``frame / fps``."""
+        return HoldSchedule(self.tracks[kind], fps)
+
+
+class LaneBlockCursor:
+    """Moving cursor over a LaneBlockIndex.
+
+    Keeps the active set of every sublane type and updates it from the
+    start/end event lists as time moves forward, so a tick only touches
+    blocks entering or leaving. Moving backwards (seek) re-queries the index.
+    """
+
+    def __init__(self, index: LaneBlockIndex):
+        self.index = index
+        self.time = None
+        # kind -> {id(block): (lane_order, block)}
+        self.active: Dict[str, Dict[int, Tuple[int, object]]] = {t: {} for t in SUBLANE_TYPES}
+        self._start_ptr: Dict[str, int] = {t: 0 for t in SUBLANE_TYPES}
+        self._end_ptr: Dict[str, int] = {t: 0 for t in SUBLANE_TYPES}
+
+    def advance(self, t: float):
+        """Move the cursor to time ``t`` and update the active sets."""
+        if self.time is None or t < self.time:
+            self._reset(t)
+        else:
+            for kind in SUBLANE_TYPES:
+                track = self.index.tracks[kind]
+                active = self.active[kind]
+
+                start_hi = bisect_right(track.starts, t)
+                for i in range(self._start_ptr[kind], start_hi):
+                    if track.ends[i] > t:
+                        active[id(track.blocks[i])] = (track.orders[i], track.blocks[i])
+                self._start_ptr[kind] = start_hi
+
+                end_hi = bisect_right(track.end_times, t)
+                for j in range(self._end_ptr[kind], end_hi):
+                    active.pop(id(track.blocks[track.by_end[j]]), None)
+                self._end_ptr[kind] = end_hi
+        self.time = t
+
+    def _reset(self, t: float):
+        for kind in SUBLANE_TYPES:
+            track = self.index.tracks[kind]
+            self.active[kind] = {
+                id(track.blocks[i]): (track.orders[i], track.blocks[i])
+                for i in track.active_indices(t)
+            }
+            self._start_ptr[kind] = bisect_right(track.starts, t)
+            self._end_ptr[kind] = bisect_right(track.end_times, t)
+
+    def entered(self, kind: str, previous_ids: set) -> List[object]:
+        """Active blocks of ``kind`` not in ``previous_ids``, in lane order."""
+        new = [entry for block_id, entry in self.active[kind].items() if block_id not in previous_ids]
+        if len(new) > 1:
+            new.sort(key=lambda entry: entry[0])
+        return [block for _, block in new]
+
+
+def first_frame_at(t: float, fps: float) -> int:
+    """Smallest frame index ``j >= 0`` whose tick time ``j / fps`` is >= ``t``.
+
+    Uses the same ``j / fps`` expression as the frame loops, so block
+    boundaries fall on exactly the frames a tick-by-tick scan sees.
+    """
+    j = max(0, math.ceil(t * fps))
+    while j > 0 and (j - 1) / fps >= t:
+        j -= 1
+    while j / fps < t:
+        j += 1
+    return j
+
+
+class HoldSchedule:
+    """Block a frame-stepped playback loop holds on one sublane, per frame.
+
+    The tick loops call ``DMXManager.block_started`` for every block that
+    enters the active set (in lane order) and ``block_ended`` only once the
+    sublane has no active block left. With overlapping blocks the sublane
+    therefore holds the most recently entered block, even past its end
+    while an earlier block still runs, which made the held block depend on
+    every tick before it. The schedule derives it from the block times
+    alone, so any frame can be evaluated without replaying the ones before.
+    """
+
+    def __init__(self, track: IntervalTrack, fps: float):
+        """
+        Args:
+            track: Blocks of one sublane
+            fps: Tick rate; frame ``j`` is evaluated at ``j / fps``
+        """
+        # Frames each block is active on: [first, last]
+        spans = []
+        for start, end, order, block in zip(track.starts, track.ends, track.orders, track.blocks):
+            first = first_frame_at(start, fps)
+            last = first_frame_at(end, fps) - 1
+            if first <= last:
+                spans.append((first, order, last, block))
+        spans.sort(key=lambda span: (span[0], span[1]))
+
+        # Segments (first frame, last frame, held block). A run of frames
+        # with at least one active block holds the block that entered last;
+        # among blocks entering on the same frame, the last in lane order.
+        self.firsts: List[int] = []
+        self.lasts: List[int] = []
+        self.blocks: List[object] = []
+        run_end = -1
+        for first, _, last, block in spans:
+            if self.firsts and first <= run_end + 1:
+                if first == self.firsts[-1]:
+                    self.blocks[-1] = block
+                else:
+                    self.lasts[-1] = first - 1
+                    self._open(first, block)
+            else:
+                if self.firsts:
+                    self.lasts[-1] = run_end
+                self._open(first, block)
+            run_end = max(run_end, last)
+        if self.firsts:
+            self.lasts[-1] = run_end
+
+    def _open(self, first: int, block: object):
+        self.firsts.append(first)
+        self.lasts.append(first)
+        self.blocks.append(block)
+
+    def block_at(self, frame: int) -> Optional[object]:
+        """Block held at ``frame``, or None when the sublane is idle."""
+        i = bisect_right(self.firsts, frame) - 1
+        if i >= 0 and frame <= self.lasts[i]:
+            return self.blocks[i]
+        return None
@@ -3,6 +3,7 @@
 
 from typing import List, Optional
 from config.models import LightBlock
+from .block_index import LaneBlockIndex
 
 
 class LightLane:
@@ -24,6 +25,7 @@ class LightLane:
         self.muted = False
         self.solo = False
         self.light_blocks: List[LightBlock] = []
+        self._block_index: Optional[LaneBlockIndex] = None
 
     @property
     def fixture_group(self) -> str:
@@ -109,6 +111,23 @@ class LightLane:
         if block in self.light_blocks:
             self.light_blocks.remove(block)
 
+    def get_block_index(self) -> LaneBlockIndex:
+        """Get the time index over this lane's blocks, rebuilding if needed.
+
+        Blocks added or removed are picked up automatically; in-place time
+        edits need an explicit invalidate_block_index() call.
+
+        Returns:
+            LaneBlockIndex for the current light blocks
+        """
+        if self._block_index is None or self._block_index.is_stale(self.light_blocks):
+            self._block_index = LaneBlockIndex(self.light_blocks)
+        return self._block_index
+
+    def invalidate_block_index(self):
+        """Drop the cached block index after blocks were moved or edited."""
+        self._block_index = None
+
     def get_block_at_time(self, time: float) -> Optional[LightBlock]:
         """Get the block at a specific time.
 
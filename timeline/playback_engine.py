@@ -3,9 +3,11 @@
 # Simplified for light show playback (removed MIDI/audio specific code)
 
 from PyQt6.QtCore import QObject, QTimer, pyqtSignal
-from typing import List, Optional, Set
+from bisect import bisect_right
+from typing import Dict, List, Optional, Set, Tuple
 from .song_structure import SongStructure
 from .light_lane import LightLane
+from .block_index import ENVELOPE, LaneBlockIndex
 
 
 class PlaybackEngine(QObject):
@@ -41,6 +43,8 @@ class PlaybackEngine(QObject):
         # Track light blocks that have been triggered
         self._triggered_blocks: Set[int] = set()  # Blocks that have started (by id)
         self._ended_blocks: Set[int] = set()  # Blocks that have ended (by id)
+        # lane id -> (block index, position in its end-sorted list)
+        self._end_cursors: Dict[int, Tuple[LaneBlockIndex, int]] = {}
 
     def set_song_structure(self, song_structure: SongStructure):
         """Set song structure for BPM-aware playback.
@@ -96,6 +100,7 @@ class PlaybackEngine(QObject):
         # Clear block tracking
         self._triggered_blocks.clear()
         self._ended_blocks.clear()
+        self._end_cursors.clear()
 
         self.set_position(0.0)
         self.playback_stopped.emit()
@@ -112,6 +117,7 @@ class PlaybackEngine(QObject):
         # Clear block tracking when seeking
         self._triggered_blocks.clear()
         self._ended_blocks.clear()
+        self._end_cursors.clear()
 
     def update_playback(self):
         """Update playback position with dynamic BPM.
@@ -158,23 +164,29 @@ class PlaybackEngine(QObject):
         Args:
             lane: LightLane to process
         """
-        for block in lane.light_blocks:
+        index = lane.get_block_index()
+        track = index.tracks[ENVELOPE]
+
+        # Trigger block start for blocks active now and not already triggered
+        for block in track.active_at(self.current_position):
+            block_id = id(block)
+            if block_id not in self._triggered_blocks:
+                self.block_triggered.emit(lane, block)
+                self._triggered_blocks.add(block_id)
+
+        # Trigger block end for blocks whose end has passed. The cursor walks
+        # the end-sorted list so each block is looked at once per pass; it
+        # restarts when the index is rebuilt or tracking is cleared.
+        cached = self._end_cursors.get(id(lane))
+        position = cached[1] if cached is not None and cached[0] is index else 0
+        end_hi = bisect_right(track.end_times, self.current_position)
+        for j in range(position, end_hi):
+            block = track.blocks[track.by_end[j]]
             block_id = id(block)
-            block_end_time = block.end_time
-
-            # Check if block should start
-            if block.start_time <= self.current_position < block_end_time:
-                # Trigger block start if not already triggered
-                if block_id not in self._triggered_blocks:
-                    self.block_triggered.emit(lane, block)
-                    self._triggered_blocks.add(block_id)
-
-            # Check if block should end
-            if self.current_position >= block_end_time:
-                # Trigger block end if not already ended
-                if block_id not in self._ended_blocks:
-                    self.block_ended.emit(lane, block)
-                    self._ended_blocks.add(block_id)
+            if block_id not in self._ended_blocks:
+                self.block_ended.emit(lane, block)
+                self._ended_blocks.add(block_id)
+        self._end_cursors[id(lane)] = (index, max(position, end_hi))
 
     def get_current_bpm(self) -> float:
         """Get the current BPM at playhead position.
@@ -2,20 +2,25 @@
 # Adapted from midimaker_and_show_structure/core/song_structure.py
 # Modified to use ShowPart from config.models instead of internal SongPart
 
+import math
 from typing import List, Optional
 from config.models import ShowPart
+from timeline.tempo_map import GRADUAL_CURVE, TempoMap, beats_per_bar
 
 
 class SongStructure:
     """Manages song structure timing and BPM calculations.
 
     Works with ShowPart objects from the main configuration and calculates
-    timing information (start_time, duration) for each part.
+    timing information (start_time, duration) for each part. Lookups by
+    time or beat go through a TempoMap compiled on load, so they stay
+    O(log n) in the number of parts.
     """
 
     def __init__(self):
         self.parts: List[ShowPart] = []
         self.default_bpm = 120.0
+        self.tempo_map = TempoMap([], self.default_bpm)
 
     def load_from_show_parts(self, show_parts: List[ShowPart]):
         """Load structure from a list of ShowPart objects.
@@ -40,6 +45,8 @@ class SongStructure:
             current_time += duration
             previous_bpm = part.bpm
 
+        self.tempo_map = TempoMap(self.parts, self.default_bpm)
+
     def calculate_part_duration(self, part: ShowPart, previous_bpm: Optional[float]) -> float:
         """Calculate the duration of a song part in seconds.
 
@@ -77,11 +84,7 @@ class SongStructure:
         Returns:
             Number of beats per bar
         """
-        try:
-            numerator, denominator = map(int, signature.split('/'))
-            return (numerator * 4) / denominator
-        except (ValueError, ZeroDivisionError):
-            return 4.0  # Default to 4/4
+        return beats_per_bar(signature)
 
     def _calculate_gradual_transition_duration(self, part: ShowPart, start_bpm: float) -> float:
         """Calculate duration for gradual BPM transition.
@@ -100,7 +103,7 @@ class SongStructure:
 
         for bar in range(part.num_bars):
             # Calculate BPM progression using curved formula
-            current_progress = (bar / part.num_bars) ** 0.52
+            current_progress = (bar / part.num_bars) ** GRADUAL_CURVE
             current_bpm = start_bpm + (part.bpm - start_bpm) * current_progress
 
             # Calculate time for this bar
@@ -119,48 +122,47 @@ class SongStructure:
         Returns:
             BPM at the specified time
         """
-        current_part = self.get_part_at_time(time)
-        if not current_part:
+        index = self.tempo_map.part_index(time)
+        if index < 0:
             return self.default_bpm
+        return self.tempo_map.bpm_at(index, time)
 
-        if current_part.transition == "instant":
-            return current_part.bpm
-
-        # For gradual transitions, calculate interpolated BPM
-        part_index = self.parts.index(current_part)
-        previous_bpm = (self.parts[part_index - 1].bpm
-                        if part_index > 0 else current_part.bpm)
+    def get_part_at_time(self, time: float) -> Optional[ShowPart]:
+        """Get the song part at a specific time.
 
-        # Calculate progress within the part
-        time_in_part = time - current_part.start_time
-        if current_part.duration > 0:
-            progress = time_in_part / current_part.duration
-            progress = min(1.0, max(0.0, progress))
-        else:
-            progress = 0.0
+        Args:
+            time: Time position in seconds
 
-        # Apply the same curve as in duration calculation
-        curved_progress = progress ** 0.52
-        interpolated_bpm = previous_bpm + (current_part.bpm - previous_bpm) * curved_progress
+        Returns:
+            ShowPart at the specified time (the last part at or past the
+            end), or None before the first part
+        """
+        index = self.tempo_map.part_index(time)
+        return self.parts[index] if index >= 0 else None
 
-        return interpolated_bpm
+    def time_to_beat(self, time: float) -> float:
+        """Convert a time to a beat position counted from the song start.
 
-    def get_part_at_time(self, time: float) -> Optional[ShowPart]:
-        """Get the song part at a specific time.
+        Follows every tempo change, including gradual transitions.
 
         Args:
             time: Time position in seconds
 
         Returns:
-            ShowPart at the specified time, or None if outside all parts
+            Beat position (fractional)
         """
-        for part in self.parts:
-            if part.start_time <= time < part.start_time + part.duration:
-                return part
-        # Return last part if time is at or past the end
-        if self.parts and time >= self.parts[-1].start_time + self.parts[-1].duration:
-            return self.parts[-1]
-        return None
+        return self.tempo_map.time_to_beat(time)
+
+    def beat_to_time(self, beat: float) -> float:
+        """Convert a beat position counted from the song start to a time.
+
+        Args:
+            beat: Beat position (fractional)
+
+        Returns:
+            Time position in seconds
+        """
+        return self.tempo_map.beat_to_time(beat)
 
     def get_total_duration(self) -> float:
         """Get total duration of the song structure.
@@ -194,34 +196,27 @@ class SongStructure:
             return step_index * seconds_per_step
 
         # Find which part contains the target time
-        target_part = self.get_part_at_time(target_time)
-        if not target_part:
-            # Time is before first part or after last
-            if target_time < 0:
-                return 0.0
-            return target_time
-
-        if target_part.transition == "instant":
-            seconds_per_step = (60.0 / target_part.bpm) / subdivision
-            time_in_part = target_time - target_part.start_time
-            step_in_part = time_in_part / seconds_per_step
-
-            floor_step = int(step_in_part)
-            ceil_step = floor_step + 1
-
-            floor_time = target_part.start_time + (floor_step * seconds_per_step)
-            ceil_time = target_part.start_time + (ceil_step * seconds_per_step)
-
-            if abs(target_time - floor_time) <= abs(target_time - ceil_time):
-                return floor_time
-            return ceil_time
-        else:
-            # For gradual transitions, precise sub-beat snapping is complex; punt.
-            return target_time
+        index = self.tempo_map.part_index(target_time)
+        if index < 0:
+            # Time is before the first part
+            return 0.0
+
+        # Steps count from the part's start; gradual parts follow the curve
+        step_in_part = self.tempo_map.beat_in_part(index, target_time) * subdivision
+        floor_step = math.floor(step_in_part)
+        floor_time = self.tempo_map.time_in_part(index, floor_step / subdivision)
+        ceil_time = self.tempo_map.time_in_part(index, (floor_step + 1) / subdivision)
+
+        if abs(target_time - floor_time) <= abs(target_time - ceil_time):
+            return floor_time
+        return ceil_time
 
     def get_beat_times_in_range(self, start_time: float, end_time: float) -> List[tuple]:
         """Get all beat times in a time range for grid drawing.
 
+        Only the parts and beats inside the range are visited. Gradual
+        transitions list every beat along their tempo curve.
+
         Args:
             start_time: Start of range in seconds
             end_time: End of range in seconds
@@ -230,42 +225,17 @@ class SongStructure:
             List of (time, is_bar) tuples where is_bar indicates bar boundary
         """
         beat_times = []
-
-        for part in self.parts:
-            part_end = part.start_time + part.duration
-
-            # Skip parts outside our range
-            if part_end < start_time or part.start_time > end_time:
-                continue
-
-            beats_per_bar = self._get_beats_per_bar(part.signature)
-            total_beats = int(part.num_bars * beats_per_bar)
-
-            if part.transition == "instant":
-                seconds_per_beat = 60.0 / part.bpm
-
-                for beat_index in range(total_beats + 1):
-                    beat_time = part.start_time + (beat_index * seconds_per_beat)
-
-                    if start_time <= beat_time <= end_time:
-                        is_bar = (beat_index % beats_per_bar) == 0
-                        beat_times.append((beat_time, is_bar))
-            else:
-                # For gradual transitions, just mark bar boundaries
-                part_index = self.parts.index(part)
-                previous_bpm = (self.parts[part_index - 1].bpm
-                               if part_index > 0 else part.bpm)
-
-                accumulated_time = part.start_time
-                for bar in range(part.num_bars + 1):
-                    if start_time <= accumulated_time <= end_time:
-                        beat_times.append((accumulated_time, True))
-
-                    if bar < part.num_bars:
-                        progress = (bar / part.num_bars) ** 0.52
-                        current_bpm = previous_bpm + (part.bpm - previous_bpm) * progress
-                        seconds_per_beat = 60.0 / current_bpm
-                        bar_duration = beats_per_bar * seconds_per_beat
-                        accumulated_time += bar_duration
+        tempo_map = self.tempo_map
+
+        for index in tempo_map.part_range(start_time, end_time):
+            beats_per_bar = tempo_map.beats_per_bar[index]
+            total_beats = int(tempo_map.beat_counts[index])
+            low, high = tempo_map.step_range(index, start_time, end_time)
+
+            for beat_index in range(max(0, low), min(total_beats, high) + 1):
+                beat_time = tempo_map.time_in_part(index, beat_index)
+                if start_time <= beat_time <= end_time:
+                    is_bar = (beat_index % beats_per_bar) == 0
+                    beat_times.append((beat_time, is_bar))
 
         return beat_times
@@ -0,0 +1,148 @@
+# timeline/tempo_map.py
+# Compiled beat grid of a song structure for O(log n) time <-> beat conversion
+
+import math
+from bisect import bisect_right
+from typing import List, Optional, Tuple
+
+# Exponent of the gradual-transition BPM curve (see SongStructure)
+GRADUAL_CURVE = 0.52
+
+
+def beats_per_bar(signature: str) -> float:
+    """Quarter-note beats per bar of a time signature (e.g. "6/8" -> 3.0)."""
+    try:
+        numerator, denominator = map(int, signature.split('/'))
+        return (numerator * 4) / denominator
+    except (ValueError, ZeroDivisionError):
+        return 4.0  # Default to 4/4
+
+
+class TempoMap:
+    """Beat positions of a list of timed parts, indexed for bisect lookups.
+
+    Beat 0 is the start of the first part; beats count on through every
+    part. Instant parts have a constant tempo. Gradual parts (after the
+    first) change tempo bar by bar along the same curve
+    SongStructure.calculate_part_duration uses, so each part's beats end
+    exactly at its end time. Times before the first part and beyond the
+    last one extrapolate the nearest part's tempo.
+
+    Parts must already carry start_time and duration and must not change
+    afterwards; SongStructure rebuilds its map on every load.
+    """
+
+    def __init__(self, parts: list, default_bpm: float = 120.0):
+        self.parts = list(parts)
+        self.default_bpm = default_bpm
+
+        self.starts: List[float] = []
+        self.first_beats: List[float] = []    # Absolute beat at each part's start
+        self.beat_counts: List[float] = []    # Beats in each part
+        self.beats_per_bar: List[float] = []
+        self.prev_bpms: List[float] = []      # BPM the part's curve starts from
+        # Gradual parts: absolute bar start times and seconds per beat per
+        # bar. Instant parts: ([start], [seconds per beat]).
+        self._bar_times: List[List[float]] = []
+        self._bar_spbs: List[List[float]] = []
+
+        beat = 0.0
+        previous_bpm: Optional[float] = None
+        for part in self.parts:
+            bpb = beats_per_bar(part.signature)
+            self.starts.append(part.start_time)
+            self.first_beats.append(beat)
+            self.beat_counts.append(part.num_bars * bpb)
+            self.beats_per_bar.append(bpb)
+            self.prev_bpms.append(previous_bpm if previous_bpm is not None else part.bpm)
+
+            if part.transition == "gradual" and previous_bpm is not None and part.num_bars > 0:
+                # Same accumulation as SongStructure._calculate_gradual_transition_duration
+                bar_times, bar_spbs = [], []
+                t = part.start_time
+                for bar in range(part.num_bars):
+                    progress = (bar / part.num_bars) ** GRADUAL_CURVE
+                    bpm = previous_bpm + (part.bpm - previous_bpm) * progress
+                    bar_times.append(t)
+                    bar_spbs.append(60.0 / bpm)
+                    t += bpb * (60.0 / bpm)
+            else:
+                bar_times, bar_spbs = [part.start_time], [60.0 / part.bpm]
+            self._bar_times.append(bar_times)
+            self._bar_spbs.append(bar_spbs)
+
+            beat += part.num_bars * bpb
+            previous_bpm = part.bpm
+
+    def __len__(self) -> int:
+        return len(self.parts)
+
+    # --- part lookup ---
+
+    def part_index(self, time: float) -> int:
+        """Index of the part at ``time``; the last part at or past the end, -1 before the first."""
+        return bisect_right(self.starts, time) - 1
+
+    def part_range(self, start_time: float, end_time: float) -> range:
+        """Indices of the parts overlapping [start_time, end_time]."""
+        first = max(0, self.part_index(start_time))
+        last = self.part_index(end_time)
+        return range(first, last + 1)
+
+    def bpm_at(self, index: int, time: float) -> float:
+        """BPM of part ``index`` at ``time``, following the smooth transition curve."""
+        part = self.parts[index]
+        if part.transition == "instant":
+            return part.bpm
+        previous_bpm = self.prev_bpms[index]
+        if part.duration > 0:
+            progress = min(1.0, max(0.0, (time - part.start_time) / part.duration))
+        else:
+            progress = 0.0
+        return previous_bpm + (part.bpm - previous_bpm) * progress ** GRADUAL_CURVE
+
+    # --- beats within one part ---
+
+    def beat_in_part(self, index: int, time: float) -> float:
+        """Beats from the start of part ``index`` to ``time`` (may lie outside the part)."""
+        bar_times = self._bar_times[index]
+        bar = min(max(0, bisect_right(bar_times, time) - 1), len(bar_times) - 1)
+        bar_beat = bar * self.beats_per_bar[index] if len(bar_times) > 1 else 0.0
+        return bar_beat + (time - bar_times[bar]) / self._bar_spbs[index][bar]
+
+    def time_in_part(self, index: int, beat: float) -> float:
+        """Time of ``beat`` counted from the start of part ``index``."""
+        bar_times = self._bar_times[index]
+        if len(bar_times) == 1:
+            return bar_times[0] + beat * self._bar_spbs[index][0]
+        bpb = self.beats_per_bar[index]
+        bar = min(max(0, int(math.floor(beat / bpb))), len(bar_times) - 1) if bpb > 0 else 0
+        return bar_times[bar] + (beat - bar * bpb) * self._bar_spbs[index][bar]
+
+    # --- absolute beats ---
+
+    def time_to_beat(self, time: float) -> float:
+        """Beat position (from the first part's start) of ``time`` in seconds."""
+        if not self.parts:
+            return time * self.default_bpm / 60.0
+        index = max(0, self.part_index(time))
+        return self.first_beats[index] + self.beat_in_part(index, time)
+
+    def beat_to_time(self, beat: float) -> float:
+        """Time in seconds of a beat position; inverse of time_to_beat."""
+        if not self.parts:
+            return beat * 60.0 / self.default_bpm
+        index = max(0, bisect_right(self.first_beats, beat) - 1)
+        return self.time_in_part(index, beat - self.first_beats[index])
+
+    def step_range(self, index: int, start_time: float, end_time: float,
+                   steps_per_beat: int = 1) -> Tuple[int, int]:
+        """Grid step indices of part ``index`` that may fall in [start_time, end_time].
+
+        Steps are ``1 / steps_per_beat`` beats apart from the part's start.
+        The range is padded by one step on either side; callers filter exact
+        times themselves.
+        """
+        low = int(math.floor(self.beat_in_part(index, start_time) * steps_per_beat)) - 1
+        high = int(math.ceil(self.beat_in_part(index, end_time) * steps_per_beat)) + 1
+        return low, high
@@ -75,6 +75,9 @@ class LightBlockWidget(QWidget):
         # Multi-selection state
         self._is_multi_selected = False
 
+        # Hidden with a stale geometry while off screen (see cull())
+        self.culled = False
+
         # Right-button marquee selection of sublane blocks within this effect.
         # Pending = right-button down but drag hasn't crossed threshold yet.
         # Active = drawing the marquee. On release with active marquee, the
@@ -163,6 +166,20 @@ class LightBlockWidget(QWidget):
         # Position at top of timeline (y=0)
         self.setGeometry(x, 0, width, height)
 
+        if self.culled:
+            self.culled = False
+            self.show()
+
+    def cull(self):
+        """Hide this block while it is off screen.
+
+        Its geometry is left stale until update_position() is called again,
+        which LightLaneWidget does once the block scrolls into view.
+        """
+        if not self.culled:
+            self.culled = True
+            self.hide()
+
     def set_snap_to_grid(self, snap: bool):
         """Enable/disable snap to grid."""
         self.snap_to_grid = snap
@@ -1627,6 +1644,9 @@ class LightBlockWidget(QWidget):
             self.resizing_right = False
             self.drag_start_pos = None
 
+            # Drags and resizes edit block times in place
+            self._invalidate_lane_block_index()
+
             # Clear sublane interaction state
             self.clicked_sublane_type = None
             self.resizing_sublane = None
@@ -1854,6 +1874,13 @@ class LightBlockWidget(QWidget):
                 self.selected_sublane_type = None
             self.block.modified = True
             self.update_display()
+            self._invalidate_lane_block_index()
+
+    def _invalidate_lane_block_index(self):
+        """Tell the owning lane its playback time index is out of date."""
+        lane = getattr(self.lane_widget, 'lane', None)
+        if lane is not None and hasattr(lane, 'invalidate_block_index'):
+            lane.invalidate_block_index()
 
     # ── Right-click sublane marquee helpers ───────────────────────────────
 
@@ -89,6 +89,7 @@ class LightLaneWidget(QFrame):
         self.timeline_widget.playhead_moved.connect(self.playhead_moved.emit)
         self.timeline_widget.paste_requested.connect(self.paste_effect_at_time)
         self.timeline_widget.riff_dropped.connect(self.on_riff_dropped)
+        self.timeline_widget.visible_range_changed.connect(self.on_visible_range_changed)
 
         # Create light block widgets for existing blocks
         for block in self.lane.light_blocks:
@@ -316,8 +317,7 @@ class LightLaneWidget(QFrame):
         self.timeline_widget.set_zoom_factor(zoom_factor)
 
         # Update light block positions
-        for block_widget in self.light_block_widgets:
-            block_widget.update_position()
+        self.update_block_positions()
 
     def sync_scroll_position(self, position: int):
         """Sync scroll position with master timeline."""
@@ -333,6 +333,7 @@ class LightLaneWidget(QFrame):
         block_widget.remove_requested.connect(self.remove_light_block_widget)
         block_widget.position_changed.connect(self.on_block_position_changed)
         block_widget.duration_changed.connect(self.on_block_duration_changed)
+        block_widget.block_edited.connect(self.lane.invalidate_block_index)
         block_widget.block_edited.connect(self.block_edited)  # Forward to lane signal
 
         self.light_block_widgets.append(block_widget)
@@ -417,18 +418,42 @@ class LightLaneWidget(QFrame):
 
     def on_timeline_zoom_changed(self, zoom_factor):
         """Handle timeline zoom changes."""
+        self.update_block_positions()
+
+    def update_block_positions(self):
+        """Reposition block widgets for the current zoom.
+
+        Only blocks within a viewport width of the visible area are laid
+        out now; the others are culled and laid out by
+        on_visible_range_changed() once they come near the view. Without a
+        visible area (lane not shown yet) every block is laid out.
+        """
+        visible = self.timeline_widget.visible_time_range(margin=1.0)
+        for block_widget in self.light_block_widgets:
+            block_start, block_end = block_widget.get_block_time_bounds()
+            if visible is None or (block_start <= visible[1] and block_end >= visible[0]):
+                block_widget.update_position()
+            else:
+                block_widget.cull()
+
+    def on_visible_range_changed(self, start_time, end_time):
+        """Lay out culled blocks that scrolled near the view."""
         for block_widget in self.light_block_widgets:
-            block_widget.update_position()
+            if not block_widget.culled:
+                continue
+            block_start, block_end = block_widget.get_block_time_bounds()
+            if block_start <= end_time and block_end >= start_time:
+                block_widget.update_position()
 
     def on_block_position_changed(self, block_widget, new_start_time):
         """Handle block position change."""
         # Block's start_time is already updated in the widget
-        pass
+        self.lane.invalidate_block_index()
 
     def on_block_duration_changed(self, block_widget, new_duration):
         """Handle block duration change."""
         # Block's duration is already updated in the widget
-        pass
+        self.lane.invalidate_block_index()
 
     # Event handlers
     def on_name_changed(self, text):
@@ -762,6 +787,25 @@ class LightLaneWidget(QFrame):
                 intersecting.append(widget)
         return intersecting
 
+    def block_widget_at(self, pos):
+        """Get the block widget under a position in the timeline widget.
+
+        Culled and hidden blocks are skipped: their geometry is left over
+        from an earlier zoom and no longer matches their time.
+
+        Args:
+            pos: Position relative to timeline_widget
+
+        Returns:
+            The LightBlockWidget at pos, or None
+        """
+        for widget in self.light_block_widgets:
+            if widget.culled or not widget.isVisible():
+                continue
+            if widget.rect().contains(widget.mapFrom(self.timeline_widget, pos)):
+                return widget
+        return None
+
     def get_all_block_widgets(self) -> list:
         """Get all block widgets in this lane.
 
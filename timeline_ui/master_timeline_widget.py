@@ -22,6 +22,9 @@ class MasterTimelineWidget(TimelineWidget):
 
     playhead_moved = pyqtSignal(float)  # Emits new playhead position in seconds
 
+    # Covers the playhead triangle
+    playhead_margin = 10
+
     def __init__(self, parent=None):
         # Initialize attributes before calling super()
         self.song_structure = None
@@ -41,8 +44,7 @@ class MasterTimelineWidget(TimelineWidget):
 
     def set_playhead_position(self, position: float):
         """Set playhead position and update display."""
-        self.playhead_position = position
-        self.update()
+        self._move_playhead(position)
 
         # Auto-scroll to keep playhead visible
         self.ensure_playhead_visible()
@@ -84,6 +86,14 @@ class MasterTimelineWidget(TimelineWidget):
         width = self.width()
         height = self.height()
 
+        # Song structure and grid, from the layer cache
+        self.paint_static_layers(painter, event.rect(), width, height)
+
+        # Draw playhead
+        self.draw_playhead(painter, width, height)
+
+    def draw_static_layers(self, painter, width, height):
+        """Draw song structure segments and grid (cached by paint_static_layers)."""
         # Draw song structure parts as colored backgrounds
         if self.song_structure and hasattr(self.song_structure, 'parts') and self.song_structure.parts:
             try:
@@ -94,17 +104,15 @@ class MasterTimelineWidget(TimelineWidget):
         # Draw grid
         self.draw_grid(painter, width, height)
 
-        # Draw playhead
-        self.draw_playhead(painter, width, height)
-
     def draw_song_structure(self, painter, width, height):
         """Draw song structure parts as colored segments with labels."""
+        left, right = self._paint_span(painter, width)
         try:
             for part in self.song_structure.parts:
                 start_x = self.time_to_pixel(part.start_time)
                 end_x = self.time_to_pixel(part.start_time + part.duration)
 
-                if end_x < 0 or start_x > width:
+                if end_x < left or start_x > right:
                     continue
 
                 # Draw colored background
@@ -160,8 +168,15 @@ class MasterTimelineWidget(TimelineWidget):
 
                 subdivision = max(1, int(getattr(self, "grid_subdivision", 1)))
 
+                # Only the parts and steps in view, placed on the tempo map
+                tempo_map = self.song_structure.tempo_map
+                left, right = self._paint_span(painter, width)
+                view_start = self.pixel_to_time(left)
+                view_end = self.pixel_to_time(right)
+
                 num_parts = len(self.song_structure.parts)
-                for part_idx, part in enumerate(self.song_structure.parts):
+                for part_idx in tempo_map.part_range(view_start, view_end):
+                    part = self.song_structure.parts[part_idx]
                     beats_per_bar = self._get_beats_per_bar(part.signature)
                     total_beats_in_part = int(part.num_bars * beats_per_bar)
                     seconds_per_beat = 60.0 / part.bpm
@@ -170,17 +185,17 @@ class MasterTimelineWidget(TimelineWidget):
                     min_px = getattr(self, "min_subdivision_pixels", 12)
                     draw_subs = subdivision > 1 and pixels_per_step >= min_px
                     steps_per_beat = subdivision if draw_subs else 1
-                    seconds_per_step = seconds_per_beat / steps_per_beat
 
                     is_last_part = (part_idx == num_parts - 1)
                     max_beat_index = total_beats_in_part if is_last_part else total_beats_in_part - 1
                     total_steps = max_beat_index * steps_per_beat + (steps_per_beat if is_last_part else 1)
+                    first_step, last_step = tempo_map.step_range(part_idx, view_start, view_end, steps_per_beat)
 
-                    for step_index in range(total_steps + 1):
-                        step_time = part.start_time + (step_index * seconds_per_step)
+                    for step_index in range(max(0, first_step), min(total_steps, last_step) + 1):
+                        step_time = tempo_map.time_in_part(part_idx, step_index / steps_per_beat)
                         step_x_rounded = round(self.time_to_pixel(step_time))
 
-                        if not (0 <= step_x_rounded <= width):
+                        if not (left <= step_x_rounded <= right):
                             continue
 
                         is_beat = (step_index % steps_per_beat == 0)
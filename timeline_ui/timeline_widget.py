@@ -3,9 +3,20 @@
 # Adapted from midimaker_and_show_structure/ui/lane_widget.py
 
 import json
+import math
+import os
+from collections import OrderedDict
 from PyQt6.QtWidgets import QWidget, QMenu
-from PyQt6.QtCore import Qt, pyqtSignal
-from PyQt6.QtGui import QPainter, QPen, QColor, QWheelEvent, QBrush
+from PyQt6.QtCore import Qt, pyqtSignal, QRect, QTimer
+from PyQt6.QtGui import QPainter, QPen, QColor, QWheelEvent, QBrush, QPixmap
+
+# Set TIMELINE_LAYER_CACHE=0 to redraw background and grid on every paint
+USE_LAYER_CACHE = os.environ.get('TIMELINE_LAYER_CACHE', '1') != '0'
+
+# Static layers are cached in tiles this wide (logical pixels), at most
+# LAYER_CACHE_TILES per widget, least recently drawn dropped first
+LAYER_TILE_WIDTH = 512
+LAYER_CACHE_TILES = 16
 
 
 class TimelineWidget(QWidget):
@@ -19,6 +30,10 @@ class TimelineWidget(QWidget):
     playhead_moved = pyqtSignal(float)  # Emits playhead position in seconds
     paste_requested = pyqtSignal(float)  # Emits time position when paste requested
     riff_dropped = pyqtSignal(str, float)  # Emits (riff_path, drop_time) when riff dropped
+    visible_range_changed = pyqtSignal(float, float)  # Emits (start, end) seconds shown, with margin
+
+    # Half-width in pixels of the strip repainted when the playhead moves
+    playhead_margin = 3
 
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -50,6 +65,16 @@ class TimelineWidget(QWidget):
         self._drag_preview_time = None  # Time position for drag preview
         self._drag_preview_length = None  # Length of riff being dragged (in beats)
 
+        # Static layer cache (song structure, grid, sublanes): tile index -> QPixmap
+        self._layer_tiles = OrderedDict()
+        self._layer_key = None
+        # Last visible pixel span reported through visible_range_changed
+        self._visible_span = None
+        self._visible_range_timer = QTimer(self)
+        self._visible_range_timer.setSingleShot(True)
+        self._visible_range_timer.setInterval(0)
+        self._visible_range_timer.timeout.connect(self._emit_visible_range)
+
         self.setMinimumHeight(60)
         self.update_timeline_width()
         # Background and border come from the active theme via the
@@ -86,6 +111,8 @@ class TimelineWidget(QWidget):
     def set_song_structure(self, song_structure):
         """Set song structure for this timeline."""
         self.song_structure = song_structure
+        # Parts may have been edited in place (colours, names)
+        self.invalidate_layer_cache()
         self.update_timeline_width()
         self.update()
 
@@ -113,8 +140,37 @@ class TimelineWidget(QWidget):
 
     def set_playhead_position(self, position: float):
         """Set playhead position and update display."""
+        self._move_playhead(position)
+
+    def _move_playhead(self, position: float):
+        """Move the playhead, repainting only the strips it leaves and enters."""
+        old_x = round(self.time_to_pixel(self.playhead_position))
         self.playhead_position = position
-        self.update()
+        new_x = round(self.time_to_pixel(position))
+        if new_x != old_x:
+            self.update(self._playhead_strip(old_x))
+            self.update(self._playhead_strip(new_x))
+
+    def _playhead_strip(self, x: int) -> QRect:
+        """Area covered by the playhead drawn at pixel ``x``."""
+        margin = self.playhead_margin
+        return QRect(x - margin, 0, 2 * margin + 1, self.height())
+
+    def visible_time_range(self, margin: float = 0.0):
+        """Time span currently on screen, or None if the widget is not shown.
+
+        Args:
+            margin: Extra span on either side, in viewport widths
+
+        Returns:
+            Tuple of (start_time, end_time) in seconds, or None
+        """
+        rect = self.visibleRegion().boundingRect()
+        if rect.isEmpty():
+            return None
+        pad = rect.width() * margin
+        return (self.pixel_to_time(max(0.0, rect.left() - pad)),
+                self.pixel_to_time(rect.right() + 1 + pad))
 
     def get_current_bpm(self) -> float:
         """Get BPM at current playhead position."""
@@ -217,9 +273,8 @@ class TimelineWidget(QWidget):
             time_position = self.find_nearest_beat_time(time_position)
 
         time_position = max(0.0, time_position)
-        self.playhead_position = time_position
+        self._move_playhead(time_position)
         self.playhead_moved.emit(time_position)
-        self.update()
 
     def find_nearest_beat_time(self, target_time: float) -> float:
         """Find the nearest snap position using song structure if available.
@@ -259,8 +314,16 @@ class TimelineWidget(QWidget):
 
         subdivision = max(1, int(self.grid_subdivision))
 
+        # Only the parts and steps in view; step times follow the tempo map,
+        # so lines track gradual transitions too
+        tempo_map = self.song_structure.tempo_map
+        left, right = self._paint_span(painter, width)
+        view_start = self.pixel_to_time(left)
+        view_end = self.pixel_to_time(right)
+
         num_parts = len(self.song_structure.parts)
-        for part_idx, part in enumerate(self.song_structure.parts):
+        for part_idx in tempo_map.part_range(view_start, view_end):
+            part = self.song_structure.parts[part_idx]
             beats_per_bar = self._get_beats_per_bar(part.signature)
             total_beats_in_part = int(part.num_bars * beats_per_bar)
             seconds_per_beat = 60.0 / part.bpm
@@ -273,7 +336,7 @@ class TimelineWidget(QWidget):
 
             # Draw part boundary
             start_x = round(self.time_to_pixel(part.start_time))
-            if 0 <= start_x <= width:
+            if left <= start_x <= right:
                 painter.setPen(part_pen)
                 painter.drawLine(start_x, 0, start_x, height)
 
@@ -282,14 +345,14 @@ class TimelineWidget(QWidget):
             max_beat = total_beats_in_part if is_last_part else total_beats_in_part - 1
 
             steps_per_beat = subdivision if draw_subs else 1
-            seconds_per_step = seconds_per_beat / steps_per_beat
             total_steps = max_beat * steps_per_beat + (steps_per_beat if is_last_part else 1)
+            first_step, last_step = tempo_map.step_range(part_idx, view_start, view_end, steps_per_beat)
 
-            for step_index in range(total_steps + 1):
-                step_time = part.start_time + (step_index * seconds_per_step)
+            for step_index in range(max(0, first_step), min(total_steps, last_step) + 1):
+                step_time = tempo_map.time_in_part(part_idx, step_index / steps_per_beat)
                 step_x = round(self.time_to_pixel(step_time))
 
-                if not (0 <= step_x <= width):
+                if not (left <= step_x <= right):
                     continue
 
                 is_beat = (step_index % steps_per_beat == 0)
@@ -313,9 +376,10 @@ class TimelineWidget(QWidget):
         steps_per_beat = subdivision if draw_subs else 1
         seconds_per_step = seconds_per_beat / steps_per_beat
 
-        max_time = width / self.pixels_per_second
-        step_count = 0
-        step_time = 0.0
+        left, right = self._paint_span(painter, width)
+        max_time = self.pixel_to_time(right)
+        step_count = max(0, int(math.floor(self.pixel_to_time(left) / seconds_per_step)))
+        step_time = step_count * seconds_per_step
         while step_time <= max_time:
             x = round(self.time_to_pixel(step_time))
             if step_count % steps_per_beat != 0:
@@ -341,12 +405,13 @@ class TimelineWidget(QWidget):
         if not (self.song_structure and hasattr(self.song_structure, 'parts') and self.song_structure.parts):
             return
 
+        left, right = self._paint_span(painter, width)
         try:
             for part in self.song_structure.parts:
                 start_x = self.time_to_pixel(part.start_time)
                 end_x = self.time_to_pixel(part.start_time + part.duration)
 
-                if end_x < 0 or start_x > width:
+                if end_x < left or start_x > right:
                     continue
 
                 # Draw colored background with lower alpha for subtle effect
@@ -421,16 +486,13 @@ class TimelineWidget(QWidget):
             painter.setPen(QPen(QColor(40, 40, 40)))
             painter.drawText(x_pos, y_pos, label)
 
-    def paintEvent(self, event):
-        """Draw the timeline."""
-        super().paintEvent(event)
-
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-
-        width = self.width()
-        height = self.height()
+    def draw_static_layers(self, painter, width, height):
+        """Draw everything that does not move during playback.
 
+        The result is cached per zoom level (see paint_static_layers), so
+        anything drawn here must only depend on state covered by
+        _layer_cache_key() or call invalidate_layer_cache() when it changes.
+        """
         # Draw song structure backgrounds first (subtle colors)
         self.draw_song_structure_background(painter, width, height)
 
@@ -443,12 +505,116 @@ class TimelineWidget(QWidget):
         # Draw sublane labels
         self.draw_sublane_labels(painter, width, height)
 
+    def paintEvent(self, event):
+        """Draw the timeline."""
+        super().paintEvent(event)
+
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+
+        width = self.width()
+        height = self.height()
+
+        # Song structure, grid and sublanes, from the layer cache
+        self.paint_static_layers(painter, event.rect(), width, height)
+
         # Draw drag preview (if dragging a riff)
         self.draw_drag_preview(painter, width, height)
 
         # Draw playhead
         self.draw_playhead(painter, width, height)
 
+        self._check_visible_range()
+
+    # =========================================================================
+    # STATIC LAYER CACHE AND VIEWPORT
+    # =========================================================================
+
+    def _paint_span(self, painter, width):
+        """Horizontal pixel range worth drawing: the painter's clip, if any,
+        padded for the widest grid pen, within [0, width]."""
+        if painter.hasClipping():
+            clip = painter.clipBoundingRect()
+            return max(0.0, clip.left() - 2), min(float(width), clip.right() + 2)
+        return 0.0, float(width)
+
+    def _layer_cache_key(self) -> tuple:
+        """State the static layers are drawn from; cached tiles are dropped
+        when it changes."""
+        return (self.pixels_per_second, self.width(), self.height(),
+                self.devicePixelRatioF(), self.bpm, self.grid_subdivision,
+                self.min_subdivision_pixels, id(self.song_structure),
+                getattr(self.song_structure, 'tempo_map', None),
+                self.num_sublanes, self.sublane_height, self.capabilities)
+
+    def invalidate_layer_cache(self):
+        """Drop cached static layers, e.g. after song structure parts changed in place."""
+        self._layer_tiles.clear()
+        self._layer_key = None
+
+    def paint_static_layers(self, painter, rect, width, height):
+        """Draw the static layers over ``rect`` from cached tiles, rendering missing ones."""
+        if not USE_LAYER_CACHE:
+            painter.save()
+            painter.setClipRect(rect)
+            self.draw_static_layers(painter, width, height)
+            painter.restore()
+            return
+
+        key = self._layer_cache_key()
+        if key != self._layer_key:
+            self.invalidate_layer_cache()
+            self._layer_key = key
+
+        first = max(0, rect.left() // LAYER_TILE_WIDTH)
+        last = min(rect.right(), width - 1) // LAYER_TILE_WIDTH
+        for index in range(first, last + 1):
+            tile = self._layer_tiles.get(index)
+            if tile is None:
+                tile = self._render_layer_tile(index, width, height)
+                self._layer_tiles[index] = tile
+                if len(self._layer_tiles) > LAYER_CACHE_TILES:
+                    self._layer_tiles.popitem(last=False)
+            else:
+                self._layer_tiles.move_to_end(index)
+            painter.drawPixmap(index * LAYER_TILE_WIDTH, 0, tile)
+
+    def _render_layer_tile(self, index, width, height) -> QPixmap:
+        """Render the static layers of one tile into a transparent pixmap."""
+        x = index * LAYER_TILE_WIDTH
+        tile_width = min(LAYER_TILE_WIDTH, width - x)
+        ratio = self.devicePixelRatioF()
+        tile = QPixmap(math.ceil(tile_width * ratio), math.ceil(height * ratio))
+        tile.setDevicePixelRatio(ratio)
+        tile.fill(Qt.GlobalColor.transparent)
+
+        painter = QPainter(tile)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.translate(-x, 0)
+        painter.setClipRect(x, 0, tile_width, height)
+        self.draw_static_layers(painter, width, height)
+        painter.end()
+        return tile
+
+    def _check_visible_range(self):
+        """Schedule visible_range_changed if the on-screen span moved.
+
+        Called from paintEvent, which runs whenever scrolling, resizing or
+        zooming exposes new area. The signal is emitted from the event loop
+        because receivers reposition child widgets.
+        """
+        rect = self.visibleRegion().boundingRect()
+        span = (rect.left(), rect.right(), self.pixels_per_second)
+        if span != self._visible_span and not self._visible_range_timer.isActive():
+            self._visible_range_timer.start()
+
+    def _emit_visible_range(self):
+        rect = self.visibleRegion().boundingRect()
+        self._visible_span = (rect.left(), rect.right(), self.pixels_per_second)
+        visible = self.visible_time_range(margin=1.0)
+        if visible is not None:
+            self.visible_range_changed.emit(*visible)
+
     def _get_beats_per_bar(self, signature: str) -> float:
         """Calculate beats per bar from time signature."""
         try:
@@ -173,6 +173,7 @@ class MoveBlockCommand(QUndoCommand):
 
     def _update_block_widget(self):
         """Update the block widget's position."""
+        self.lane_widget.lane.invalidate_block_index()
         for widget in self.lane_widget.light_block_widgets:
             if widget.block is self.block:
                 widget.update_position()
@@ -219,6 +220,7 @@ class ResizeBlockCommand(QUndoCommand):
 
     def _update_block_widget(self):
         """Update the block widget's size."""
+        self.lane_widget.lane.invalidate_block_index()
         for widget in self.lane_widget.light_block_widgets:
             if widget.block is self.block:
                 widget.update_position()
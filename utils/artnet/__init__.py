@@ -2,8 +2,10 @@
 # ArtNet DMX output utilities
 
 from .sender import ArtNetSender
+from .sacn_sender import SACNSender
+from .output_scheduler import OutputScheduler, SchedulerStats
 from .dmx_manager import DMXManager, FixtureChannelMap
 from .output_controller import ArtNetOutputController
 from .shows_artnet_controller import ShowsArtNetController
 
-__all__ = ['ArtNetSender', 'DMXManager', 'FixtureChannelMap', 'ArtNetOutputController', 'ShowsArtNetController']
+__all__ = ['ArtNetSender', 'SACNSender', 'OutputScheduler', 'SchedulerStats', 'DMXManager', 'FixtureChannelMap', 'ArtNetOutputController', 'ShowsArtNetController']
@@ -3,13 +3,15 @@
 
 import time
 import math
+import numpy as np
 from typing import Dict, List, Optional, Tuple, Any
 from config.models import Configuration, Fixture, LightBlock, DimmerBlock, ColourBlock, MovementBlock, SpecialBlock
-from utils.effects_utils import get_channels_by_property
-from utils.orientation import calculate_pan_tilt, pan_tilt_to_dmx
+from utils.channel_index import get_channel_index
+from utils.orientation import get_inverse_orientation, calculate_pan_tilt_batch, pan_tilt_to_dmx_batch
 from effects import (
-    DimmerContext, DimmerResult, MovementContext, MovementResult,
+    DimmerResult, DimmerBatchContext, MovementContext,
     DIMMER_REGISTRY, MOVEMENT_REGISTRY, parse_speed, get_bpm, movement_total_cycles,
+    evaluate_dimmer_batch, dimmer_batch_segmented,
 )
 
 # Debug flag - set to False to disable verbose prints (improves performance significantly)
@@ -46,64 +48,33 @@ class FixtureChannelMap:
 
     def _build_channel_map(self):
         """Build channel mapping from fixture definition."""
-        # Query channels by property using effects_utils
-        # Include "Intensity" as a group name that some fixtures use for dimmer
-        properties = [
-            "IntensityMasterDimmer", "IntensityDimmer", "Intensity",
-            "IntensityRed", "IntensityGreen", "IntensityBlue", "IntensityWhite",
-            "IntensityAmber", "IntensityCyan", "IntensityMagenta", "IntensityYellow",
-            "IntensityUV", "IntensityLime",
-            "PositionPan", "PositionTilt", "PositionPanFine", "PositionTiltFine",
-            "ColorWheel", "ColorMacro", "Colour",
-            "GoboWheel", "Gobo", "Gobo1", "Gobo2",
-            "PrismRotation", "Prism",
-            "BeamFocusNearFar", "BeamZoomSmallBig", "BeamIrisCloseOpen",
-            "ShutterStrobeOpen", "ShutterStrobeFast", "ShutterStrobeRandom", "Shutter"
-        ]
-
-        channels_dict = get_channels_by_property(self.fixture_def, self.mode_name, properties)
+        # Offsets come from the cached per-mode channel index; properties are
+        # listed in priority order (e.g. "Intensity" group for fixtures that
+        # use that naming for their dimmer)
+        index = get_channel_index(self.fixture_def, self.mode_name)
 
         # Store channel mappings (property -> list of channel offsets)
-        # Include "Intensity" group for fixtures that use that naming
-        self.dimmer_channels = self._get_channel_offsets(channels_dict, ["IntensityMasterDimmer", "IntensityDimmer", "Intensity"])
-        self.red_channels = self._get_channel_offsets(channels_dict, ["IntensityRed"])
-        self.green_channels = self._get_channel_offsets(channels_dict, ["IntensityGreen"])
-        self.blue_channels = self._get_channel_offsets(channels_dict, ["IntensityBlue"])
-        self.white_channels = self._get_channel_offsets(channels_dict, ["IntensityWhite"])
-        self.amber_channels = self._get_channel_offsets(channels_dict, ["IntensityAmber"])
-        self.cyan_channels = self._get_channel_offsets(channels_dict, ["IntensityCyan"])
-        self.magenta_channels = self._get_channel_offsets(channels_dict, ["IntensityMagenta"])
-        self.yellow_channels = self._get_channel_offsets(channels_dict, ["IntensityYellow"])
-        self.uv_channels = self._get_channel_offsets(channels_dict, ["IntensityUV"])
-        self.lime_channels = self._get_channel_offsets(channels_dict, ["IntensityLime"])
-        self.pan_channels = self._get_channel_offsets(channels_dict, ["PositionPan"])
-        self.tilt_channels = self._get_channel_offsets(channels_dict, ["PositionTilt"])
-        self.pan_fine_channels = self._get_channel_offsets(channels_dict, ["PositionPanFine"])
-        self.tilt_fine_channels = self._get_channel_offsets(channels_dict, ["PositionTiltFine"])
-        self.color_wheel_channels = self._get_channel_offsets(channels_dict, ["ColorWheel", "ColorMacro", "Colour"])
-        self.gobo_channels = self._get_channel_offsets(channels_dict, ["GoboWheel", "Gobo", "Gobo1"])
-        self.prism_channels = self._get_channel_offsets(channels_dict, ["Prism"])
-        self.focus_channels = self._get_channel_offsets(channels_dict, ["BeamFocusNearFar"])
-        self.zoom_channels = self._get_channel_offsets(channels_dict, ["BeamZoomSmallBig"])
-        self.strobe_channels = self._get_channel_offsets(channels_dict, ["ShutterStrobeOpen", "ShutterStrobeFast", "ShutterStrobeRandom", "Shutter", "ShutterOpen"])
-
-    def _get_channel_offsets(self, channels_dict: dict, properties: List[str]) -> List[int]:
-        """
-        Get channel offsets for given properties.
-
-        Args:
-            channels_dict: Dictionary from get_channels_by_property
-            properties: List of property names to look for
-
-        Returns:
-            List of channel offsets (0-indexed)
-        """
-        offsets = []
-        for prop in properties:
-            if prop in channels_dict:
-                for ch_info in channels_dict[prop]:
-                    offsets.append(ch_info['channel'])
-        return offsets
+        self.dimmer_channels = index.offsets(["IntensityMasterDimmer", "IntensityDimmer", "Intensity"])
+        self.red_channels = index.offsets(["IntensityRed"])
+        self.green_channels = index.offsets(["IntensityGreen"])
+        self.blue_channels = index.offsets(["IntensityBlue"])
+        self.white_channels = index.offsets(["IntensityWhite"])
+        self.amber_channels = index.offsets(["IntensityAmber"])
+        self.cyan_channels = index.offsets(["IntensityCyan"])
+        self.magenta_channels = index.offsets(["IntensityMagenta"])
+        self.yellow_channels = index.offsets(["IntensityYellow"])
+        self.uv_channels = index.offsets(["IntensityUV"])
+        self.lime_channels = index.offsets(["IntensityLime"])
+        self.pan_channels = index.offsets(["PositionPan"])
+        self.tilt_channels = index.offsets(["PositionTilt"])
+        self.pan_fine_channels = index.offsets(["PositionPanFine"])
+        self.tilt_fine_channels = index.offsets(["PositionTiltFine"])
+        self.color_wheel_channels = index.offsets(["ColorWheel", "ColorMacro", "Colour"])
+        self.gobo_channels = index.offsets(["GoboWheel", "Gobo", "Gobo1"])
+        self.prism_channels = index.offsets(["Prism"])
+        self.focus_channels = index.offsets(["BeamFocusNearFar"])
+        self.zoom_channels = index.offsets(["BeamZoomSmallBig"])
+        self.strobe_channels = index.offsets(["ShutterStrobeOpen", "ShutterStrobeFast", "ShutterStrobeRandom", "Shutter"])
 
     def get_absolute_address(self, channel_offset: int) -> Tuple[int, int]:
         """
@@ -127,7 +98,8 @@ class DMXManager:
     Handles overlapping blocks with LTP (Latest Takes Priority).
     """
 
-    def __init__(self, config: Configuration, fixture_definitions: dict, song_structure=None):
+    def __init__(self, config: Configuration, fixture_definitions: dict, song_structure=None,
+                 incremental: bool = True):
         """
         Initialize DMX manager.
 
@@ -135,10 +107,24 @@ class DMXManager:
             config: Configuration with fixtures and universes
             fixture_definitions: Dictionary of parsed fixture definitions
             song_structure: Optional SongStructure for BPM-aware timing
+            incremental: If True, update_dmx restores a precomputed idle frame
+                and replays cached writes for static blocks instead of
+                recomputing every channel each tick
         """
         self.config = config
         self.fixture_definitions = fixture_definitions
         self.song_structure = song_structure
+        self.incremental = incremental
+
+        # Static block cache: (lane_key, block_type) -> (block, writes, segment_state, fixtures)
+        # writes is a list of (universe buffer, channel, value) recorded the
+        # first tick the block was rendered; segment_state holds the
+        # _segment_intensities a static dimmer leaves on each fixture map
+        self._static_cache: Dict[Tuple[str, str], Tuple[object, list, Optional[list], list]] = {}
+        self._recording: Optional[list] = None
+
+        # Last frame handed to the output per universe (for dirty detection)
+        self._sent_frames: Dict[int, bytes] = {}
 
         # DMX state - universe_id -> 512-byte array
         self.dmx_state: Dict[int, bytearray] = {}
@@ -156,6 +142,10 @@ class DMXManager:
         self.fixture_maps: Dict[str, FixtureChannelMap] = {}
         self._build_fixture_maps()
 
+        # Per-universe idle frame (zeros + safe control values), rebuilt with the maps
+        self._idle_frames: Dict[int, bytes] = {}
+        self._build_idle_frames()
+
         # Track active blocks (LTP - Latest Takes Priority)
         # Dictionary: lane_key -> {sublane_type -> (fixtures, block, start_time)}
         # fixtures is a list of Fixture objects resolved from the lane's targets
@@ -166,6 +156,9 @@ class DMXManager:
         self._prev_pan: Dict[str, float] = {}  # fixture_key -> last pan DMX
         self._prev_tilt: Dict[str, float] = {}  # fixture_key -> last tilt DMX
 
+        # Pan/tilt solver geometry: fixture name -> (placement, inverse orientation)
+        self._ik_cache: Dict[str, Tuple[tuple, np.ndarray]] = {}
+
         # Stage planes for world-space movement (set by live mode)
         self._stage_planes: Dict[str, 'StagePlane'] = {}
 
@@ -178,6 +171,16 @@ class DMXManager:
     def set_stage_planes(self, planes: dict):
         """Set stage planes dict (name -> StagePlane) for world-space movement."""
         self._stage_planes = planes
+        self.invalidate_static_cache()
+
+    def set_incremental(self, enabled: bool):
+        """Enable or disable incremental rendering in update_dmx."""
+        self.incremental = enabled
+        self.invalidate_static_cache()
+
+    def invalidate_static_cache(self):
+        """Drop cached static block output, e.g. after a block was edited."""
+        self._static_cache.clear()
 
     def set_song_structure(self, song_structure):
         """
@@ -223,6 +226,11 @@ class DMXManager:
         if new_universes:
             print(f"DMXManager: Added universe(s) {new_universes}")
 
+        # Idle frames, cached static output and solver geometry depend on the fixtures
+        self._build_idle_frames()
+        self.invalidate_static_cache()
+        self._ik_cache.clear()
+
     def clear_all_dmx(self):
         """Clear all DMX values to 0."""
         # PERFORMANCE: Use fill() instead of creating new bytearray objects
@@ -236,6 +244,7 @@ class DMXManager:
         block state doesn't persist into the new show.
         """
         self.active_blocks.clear()
+        self._static_cache.clear()
 
     def set_fixtures_visible(self):
         """Set all fixtures to a visible idle state (dimmer at 255, white color, shutter open, centered)."""
@@ -293,33 +302,41 @@ class DMXManager:
         but prevents strobe modes and other unwanted behavior by setting control channels
         to safe defaults.
         """
-        for fixture_name, fixture_map in self.fixture_maps.items():
-            universe = fixture_map.universe
+        for universe, channel, value in self._safe_idle_writes():
+            self.set_dmx_value(universe, channel, value)
 
+    def _safe_idle_writes(self):
+        """Yield (universe, channel, value) writes for the safe idle state."""
+        for fixture_name, fixture_map in self.fixture_maps.items():
             # Keep dimmers at 0 (already cleared by clear_all_dmx)
             # But ensure shutter is open to prevent strobe modes
             for ch_offset in fixture_map.strobe_channels:
-                _, channel = fixture_map.get_absolute_address(ch_offset)
-                self.set_dmx_value(universe, channel, 255)  # 255 = shutter open
+                universe, channel = fixture_map.get_absolute_address(ch_offset)
+                yield universe, channel, 255  # 255 = shutter open
 
             # Set color wheel to first position (white/open) to prevent weird colors
             for ch_offset in fixture_map.color_wheel_channels:
-                _, channel = fixture_map.get_absolute_address(ch_offset)
-                self.set_dmx_value(universe, channel, 0)  # 0 = white/open
+                universe, channel = fixture_map.get_absolute_address(ch_offset)
+                yield universe, channel, 0  # 0 = white/open
 
             # Set pan/tilt to center so moving heads don't snap around
-            for ch_offset in fixture_map.pan_channels:
-                _, channel = fixture_map.get_absolute_address(ch_offset)
-                self.set_dmx_value(universe, channel, 127)
-            for ch_offset in fixture_map.tilt_channels:
-                _, channel = fixture_map.get_absolute_address(ch_offset)
-                self.set_dmx_value(universe, channel, 127)
-            for ch_offset in fixture_map.pan_fine_channels:
-                _, channel = fixture_map.get_absolute_address(ch_offset)
-                self.set_dmx_value(universe, channel, 127)
-            for ch_offset in fixture_map.tilt_fine_channels:
-                _, channel = fixture_map.get_absolute_address(ch_offset)
-                self.set_dmx_value(universe, channel, 127)
+            for ch_offset in (fixture_map.pan_channels + fixture_map.tilt_channels +
+                              fixture_map.pan_fine_channels + fixture_map.tilt_fine_channels):
+                universe, channel = fixture_map.get_absolute_address(ch_offset)
+                yield universe, channel, 127
+
+    def _build_idle_frames(self):
+        """Precompute the idle frame of every universe.
+
+        Written once per fixture map rebuild; incremental update_dmx restores
+        it with one slice copy per universe instead of clearing and rewriting
+        the idle channels of every fixture on every tick.
+        """
+        frames = {universe_id: bytearray(512) for universe_id in self.dmx_state}
+        for universe, channel, value in self._safe_idle_writes():
+            if universe in frames and 0 <= channel < 512:
+                frames[universe][channel] = value
+        self._idle_frames = {universe_id: bytes(frame) for universe_id, frame in frames.items()}
 
     def set_dmx_value(self, universe: int, channel: int, value: int):
         """
@@ -335,7 +352,10 @@ class DMXManager:
             return
 
         if 0 <= channel < 512:
-            self.dmx_state[universe][channel] = max(0, min(255, value))
+            value = max(0, min(255, value))
+            self.dmx_state[universe][channel] = value
+            if self._recording is not None:
+                self._recording.append((universe, channel, value))
 
     def get_dmx_data(self, universe: int) -> bytes:
         """
@@ -352,6 +372,32 @@ class DMXManager:
 
         return bytes(self.dmx_state[universe])
 
+    def is_universe_dirty(self, universe: int) -> bool:
+        """
+        Check whether a universe changed since it was last marked as sent.
+
+        Args:
+            universe: Universe ID
+
+        Returns:
+            True if the current DMX data differs from the last sent frame
+        """
+        state = self.dmx_state.get(universe)
+        if state is None:
+            return False
+        return self._sent_frames.get(universe) != state
+
+    def mark_universe_sent(self, universe: int):
+        """
+        Record the current DMX data of a universe as sent.
+
+        Args:
+            universe: Universe ID
+        """
+        state = self.dmx_state.get(universe)
+        if state is not None:
+            self._sent_frames[universe] = bytes(state)
+
     def block_started(self, lane_key: str, fixtures: List[Fixture], block: object, block_type: str, current_time: float):
         """
         Called when a block starts playback.
@@ -369,6 +415,8 @@ class DMXManager:
 
         # Store fixtures, block, and start time (LTP)
         self.active_blocks[lane_key][block_type] = (fixtures, block, current_time)
+        # A new block on this sublane is rendered (and cached if static) on the next tick
+        self._static_cache.pop((lane_key, block_type), None)
 
     def block_ended(self, lane_key: str, block_type: str):
         """
@@ -381,6 +429,7 @@ class DMXManager:
         if lane_key in self.active_blocks:
             if block_type in self.active_blocks[lane_key]:
                 del self.active_blocks[lane_key][block_type]
+        self._static_cache.pop((lane_key, block_type), None)
 
     def update_dmx(self, current_time: float):
         """
@@ -389,12 +438,21 @@ class DMXManager:
         Args:
             current_time: Current playback time in seconds
         """
-        # Clear all DMX values first - only fixtures with active blocks should be lit
-        self.clear_all_dmx()
+        if self.incremental:
+            # Restore the precomputed idle frame (zeros + safe control values)
+            for universe_id, state in self.dmx_state.items():
+                idle = self._idle_frames.get(universe_id)
+                if idle is not None:
+                    state[:] = idle
+                else:
+                    state[:] = b'\x00' * 512
+        else:
+            # Clear all DMX values first - only fixtures with active blocks should be lit
+            self.clear_all_dmx()
 
-        # Set safe default values for ALL fixtures to prevent strobe/weird modes
-        # This ensures shutters are open, dimmers at 0, etc. for non-targeted fixtures
-        self._set_safe_idle_state()
+            # Set safe default values for ALL fixtures to prevent strobe/weird modes
+            # This ensures shutters are open, dimmers at 0, etc. for non-targeted fixtures
+            self._set_safe_idle_state()
 
         # Process each lane's active blocks
         # Make a copy of items to avoid issues during iteration
@@ -456,13 +514,10 @@ class DMXManager:
                             print(f"  DMX state universes: {list(self.dmx_state.keys())}")
                             print("=== END DMX WASH DEBUG ===\n")
 
-                for fixture_index, fixture in enumerate(sorted_fixtures):
-                    if fixture.name not in self.fixture_maps:
-                        continue
-
-                    fixture_map = self.fixture_maps[fixture.name]
-                    self._apply_dimmer_block(fixture_map, dimmer_block, current_time,
-                                            fixture_index, total_fixtures)
+                if not self._replay_static(lane_key, 'dimmer', dimmer_block):
+                    recording = self._begin_static_recording('dimmer', dimmer_block, sorted_fixtures)
+                    self._apply_dimmer_block(sorted_fixtures, dimmer_block, current_time)
+                    self._end_static_recording(recording, lane_key, 'dimmer', dimmer_block, sorted_fixtures)
 
             # Apply colour block to its resolved fixtures
             if colour_block and colour_fixtures:
@@ -479,17 +534,19 @@ class DMXManager:
                             print(f"  Fixtures: {colour_fixture_names}")
                             print("=== END COLOUR WASH DEBUG ===\n")
 
-                for fixture in colour_fixtures:
-                    if fixture.name not in self.fixture_maps:
-                        continue
-                    fixture_map = self.fixture_maps[fixture.name]
-                    self._apply_colour_block(fixture_map, colour_block, current_time)
+                if not self._replay_static(lane_key, 'colour', colour_block):
+                    recording = self._begin_static_recording('colour', colour_block, colour_fixtures)
+                    for fixture in colour_fixtures:
+                        if fixture.name not in self.fixture_maps:
+                            continue
+                        fixture_map = self.fixture_maps[fixture.name]
+                        self._apply_colour_block(fixture_map, colour_block, current_time)
+                    self._end_static_recording(recording, lane_key, 'colour', colour_block, colour_fixtures)
 
             # Apply movement block to its resolved fixtures
             if movement_block and movement_fixtures:
                 # Sort fixtures by x-position for consistent phase offset ordering
                 sorted_movement_fixtures = sorted(movement_fixtures, key=lambda f: f.x)
-                total_movement_fixtures = len(sorted_movement_fixtures)
 
                 # Debug: log movement block application once
                 if DEBUG_PRINTS and not hasattr(self, '_debug_movement_logged'):
@@ -500,38 +557,109 @@ class DMXManager:
                           f"phase_offset={movement_block.phase_offset_enabled}, "
                           f"phase_degrees={movement_block.phase_offset_degrees}")
 
-                for fixture_index, fixture in enumerate(sorted_movement_fixtures):
-                    if fixture.name not in self.fixture_maps:
-                        continue
-                    fixture_map = self.fixture_maps[fixture.name]
-                    self._apply_movement_block(fixture_map, movement_block, current_time,
-                                               fixture_index, total_movement_fixtures)
+                if not self._replay_static(lane_key, 'movement', movement_block):
+                    recording = self._begin_static_recording('movement', movement_block, sorted_movement_fixtures)
+                    self._apply_movement_block(sorted_movement_fixtures, movement_block, current_time)
+                    self._end_static_recording(recording, lane_key, 'movement', movement_block,
+                                               sorted_movement_fixtures)
 
             # Apply special block to its resolved fixtures
             if special_block and special_fixtures:
-                for fixture in special_fixtures:
-                    if fixture.name not in self.fixture_maps:
-                        continue
-                    fixture_map = self.fixture_maps[fixture.name]
-                    self._apply_special_block(fixture_map, special_block, current_time)
-
-    def _apply_dimmer_block(self, fixture_map: FixtureChannelMap, block: DimmerBlock, current_time: float,
-                            fixture_index: int = 0, total_fixtures: int = 1):
-        """Apply dimmer block to fixture channels.
+                if not self._replay_static(lane_key, 'special', special_block):
+                    recording = self._begin_static_recording('special', special_block, special_fixtures)
+                    for fixture in special_fixtures:
+                        if fixture.name not in self.fixture_maps:
+                            continue
+                        fixture_map = self.fixture_maps[fixture.name]
+                        self._apply_special_block(fixture_map, special_block, current_time)
+                    self._end_static_recording(recording, lane_key, 'special', special_block, special_fixtures)
+
+    def _is_static_block(self, block_type: str, block) -> bool:
+        """Whether a block's output is independent of time (cacheable)."""
+        if block_type in ('colour', 'special'):
+            return True
+        if block_type == 'dimmer':
+            return block.effect_type == 'static' or block.effect_type not in DIMMER_REGISTRY
+        if block_type == 'movement':
+            # Speed limiting carries state between frames. Spot and plane
+            # targets depend on fixture and spot placement, which can be
+            # edited on the Stage tab without restarting the block.
+            if block.target_spot_name or block.target_plane_name:
+                return False
+            return self._max_pan_tilt_speed <= 0 and (
+                block.effect_type == 'static' or block.effect_type not in MOVEMENT_REGISTRY)
+        return False
+
+    def _segments_pending(self, fixtures: List[Fixture]) -> bool:
+        """Whether any fixture carries per-segment intensities from a dimmer effect."""
+        for fixture in fixtures:
+            fixture_map = self.fixture_maps.get(fixture.name)
+            if fixture_map is not None and hasattr(fixture_map, '_segment_intensities'):
+                return True
+        return False
+
+    def _replay_static(self, lane_key: str, block_type: str, block) -> bool:
+        """
+        Replay the cached output of a static block.
 
-        Args:
-            fixture_map: Channel mapping for this fixture
-            block: DimmerBlock with effect settings
-            current_time: Current playback time in seconds
-            fixture_index: This fixture's index within the group (for group effects)
-            total_fixtures: Total fixtures in the group (for group effects)
+        Returns:
+            True if cached writes were applied, False if the block must be rendered
         """
-        # Clear any previous segment intensities
-        # (will be set again if the effect produces segment intensities)
-        if hasattr(fixture_map, '_segment_intensities'):
-            delattr(fixture_map, '_segment_intensities')
+        if not self.incremental:
+            return False
+        entry = self._static_cache.get((lane_key, block_type))
+        if entry is None or entry[0] is not block:
+            return False
+        _, writes, segment_state, fixtures = entry
+
+        # Colour output scales with segment intensities written by this tick's dimmers
+        if block_type == 'colour' and self._segments_pending(fixtures):
+            return False
+
+        for state, channel, value in writes:
+            state[channel] = value
+
+        if segment_state is not None:
+            for fixture_map, segments in segment_state:
+                if segments is None:
+                    if hasattr(fixture_map, '_segment_intensities'):
+                        delattr(fixture_map, '_segment_intensities')
+                else:
+                    fixture_map._segment_intensities = segments
+        return True
+
+    def _begin_static_recording(self, block_type: str, block, fixtures: List[Fixture]) -> bool:
+        """Start recording channel writes if this block can be cached."""
+        if not self.incremental or not self._is_static_block(block_type, block):
+            return False
+        if block_type == 'colour' and self._segments_pending(fixtures):
+            return False
+        self._recording = []
+        return True
+
+    def _end_static_recording(self, recording: bool, lane_key: str, block_type: str,
+                              block, fixtures: List[Fixture]):
+        """Store the writes recorded for a static block."""
+        if not recording:
+            return
+        writes = [(self.dmx_state[universe], channel, value)
+                  for universe, channel, value in self._recording]
+        self._recording = None
+
+        segment_state = None
+        if block_type == 'dimmer':
+            segment_state = [
+                (self.fixture_maps[f.name], getattr(self.fixture_maps[f.name], '_segment_intensities', None))
+                for f in fixtures if f.name in self.fixture_maps
+            ]
+        self._static_cache[(lane_key, block_type)] = (block, writes, segment_state, fixtures)
 
-        # Determine fixture type and segment info
+    def _dimmer_segment_info(self, fixture_map: FixtureChannelMap) -> Tuple[bool, bool, bool, bool, int]:
+        """Work out how a dimmer effect maps onto a fixture's channels.
+
+        Returns:
+            (is_segmented, is_pixelbar, has_color_segments, is_dimmer_only, num_segments)
+        """
         fixture_type = getattr(fixture_map.fixture, 'type', '')
         is_pixelbar = fixture_type in ('PIXELBAR', 'BAR')
         is_segmented_type = fixture_type in ('PIXELBAR', 'BAR', 'SUNSTRIP')
@@ -557,40 +685,77 @@ class DMXManager:
             num_segments = max(len(fixture_map.dimmer_channels), 1)
             is_dimmer_only = True
 
-        # Build context
+        return is_segmented, is_pixelbar, has_color_segments, is_dimmer_only, num_segments
+
+    def _apply_dimmer_block(self, fixtures: List[Fixture], block: DimmerBlock, current_time: float):
+        """Apply dimmer block to a group of fixtures.
+
+        The effect is evaluated with the batched kernels: fixtures sharing a
+        segment layout are computed in one call per frame instead of one
+        effect call per fixture.
+
+        Args:
+            fixtures: Fixtures sorted in effect order (index = position in group)
+            block: DimmerBlock with effect settings
+            current_time: Current playback time in seconds
+        """
         speed_multiplier = parse_speed(block.effect_speed)
         bpm = get_bpm(self.song_structure, current_time)
+        fixture_names = [f.name for f in fixtures]
+
+        # Group fixtures by segment layout so each group is one kernel call
+        groups: Dict[Tuple[bool, int], List[Tuple[int, FixtureChannelMap, tuple]]] = {}
+        for fixture_index, fixture in enumerate(fixtures):
+            fixture_map = self.fixture_maps.get(fixture.name)
+            if fixture_map is None:
+                continue
+
+            # Clear any previous segment intensities
+            # (will be set again if the effect produces segment intensities)
+            if hasattr(fixture_map, '_segment_intensities'):
+                delattr(fixture_map, '_segment_intensities')
+
+            info = self._dimmer_segment_info(fixture_map)
+            groups.setdefault((info[0], info[4]), []).append((fixture_index, fixture_map, info))
+
+        for (is_segmented, num_segments), members in groups.items():
+            ctx = DimmerBatchContext(
+                block_duration=block.end_time - block.start_time,
+                speed_multiplier=speed_multiplier,
+                bpm=bpm,
+                total_fixtures=len(fixtures),
+                num_segments=num_segments,
+                block_start_time=block.start_time,
+                is_segmented=is_segmented,
+                fixture_names=fixture_names,
+                direction=getattr(block, 'direction', 'down'),
+                chase_scope=getattr(block, 'chase_scope', 'fixture'),
+                phase_offset_per_fixture=getattr(block, 'phase_offset_per_fixture', False),
+                build_fraction=getattr(block, 'build_fraction', 0.7),
+            )
+            intensities = evaluate_dimmer_batch(
+                block.effect_type, ctx,
+                current_time - block.start_time,
+                np.array([m[0] for m in members])[:, None],
+                np.arange(num_segments)[None, :],
+            )
+            per_segment = dimmer_batch_segmented(block.effect_type, ctx)
 
-        ctx = DimmerContext(
-            time_in_block=current_time - block.start_time,
-            block_duration=block.end_time - block.start_time,
-            intensity=block.intensity,
-            speed_multiplier=speed_multiplier,
-            bpm=bpm,
-            fixture_index=fixture_index,
-            total_fixtures=total_fixtures,
-            num_segments=num_segments,
-            fixture_name=fixture_map.fixture.name,
-            block_start_time=block.start_time,
-            is_segmented=is_segmented,
-            direction=getattr(block, 'direction', 'down'),
-            chase_scope=getattr(block, 'chase_scope', 'fixture'),
-            phase_offset_per_fixture=getattr(block, 'phase_offset_per_fixture', False),
-            build_fraction=getattr(block, 'build_fraction', 0.7),
-        )
-
-        # Dispatch to effect function
-        effect_fn = DIMMER_REGISTRY.get(block.effect_type, DIMMER_REGISTRY["static"])
-        result = effect_fn(ctx)
-
-        # Apply result to DMX channels
-        self._apply_dimmer_result(fixture_map, block, result, is_segmented, is_pixelbar,
-                                   has_color_segments, is_dimmer_only)
-
-        # For fixtures with shutter channels (like moving heads), ensure shutter is open
-        for ch_offset in fixture_map.strobe_channels:
-            universe, channel = fixture_map.get_absolute_address(ch_offset)
-            self.set_dmx_value(universe, channel, 255)
+            for row, (_, fixture_map, info) in zip(intensities, members):
+                _, is_pixelbar, has_color_segments, is_dimmer_only, _ = info
+                if per_segment:
+                    result = DimmerResult(segment_intensities=row.tolist())
+                else:
+                    result = DimmerResult(intensity_multiplier=float(row[0]))
+
+                # Apply result to DMX channels
+                self._apply_dimmer_result(fixture_map, block, result, is_segmented, is_pixelbar,
+                                          has_color_segments, is_dimmer_only)
+
+                # For fixtures with shutter channels (like moving heads), ensure shutter is open
+                for ch_offset in fixture_map.strobe_channels:
+                    universe, channel = fixture_map.get_absolute_address(ch_offset)
+                    self.set_dmx_value(universe, channel, 255)
 
     def _apply_dimmer_result(self, fixture_map: FixtureChannelMap, block: DimmerBlock,
                               result: DimmerResult, is_segmented: bool, is_pixelbar: bool,
@@ -707,17 +872,56 @@ class DMXManager:
                     universe, channel = fixture_map.get_absolute_address(ch_offset)
                     self.set_dmx_value(universe, channel, int(wheel_value))
 
-    def _apply_movement_block(self, fixture_map: FixtureChannelMap, block: MovementBlock, current_time: float,
-                               fixture_index: int = 0, total_fixtures: int = 1):
-        """Apply movement block to fixture channels with real-time shape calculation.
+    def _ik_geometry(self, fixture: Fixture) -> Tuple[Tuple[float, float, float], np.ndarray]:
+        """Position and inverse orientation of a fixture for pan/tilt solving.
+
+        The rotation matrix is cached per fixture and rebuilt only when the
+        fixture's position, mounting or orientation changes (e.g. it is moved
+        or rotated in the Stage tab), so it is not rebuilt every tick.
+        """
+        group = self.config.groups.get(fixture.group) if fixture.group else None
+        mounting, yaw, pitch, roll = fixture.get_effective_orientation(group)
+        placement = (fixture.x, fixture.y, fixture.get_effective_z(group), mounting, yaw, pitch, roll)
+        cached = self._ik_cache.get(fixture.name)
+        if cached is None or cached[0] != placement:
+            cached = (placement, get_inverse_orientation(yaw, pitch, roll))
+            self._ik_cache[fixture.name] = cached
+        return placement[:3], cached[1]
+
+    def _solve_pan_tilt_dmx(self, fixtures: List[Fixture], targets) -> Tuple[np.ndarray, np.ndarray]:
+        """Solve pan/tilt DMX values for several fixtures in one batch.
+
+        Args:
+            fixtures: Fixtures to aim
+            targets: (N, 3) target per fixture, or one (3,) target for all
+
+        Returns:
+            Tuple of (pan_dmx, tilt_dmx) arrays, one entry per fixture
+        """
+        geometry = [self._ik_geometry(f) for f in fixtures]
+        positions = np.array([g[0] for g in geometry], dtype=float)
+        inverse_orientations = np.array([g[1] for g in geometry])
+        pan_degrees, tilt_degrees = calculate_pan_tilt_batch(positions, inverse_orientations, targets)
+        return pan_tilt_to_dmx_batch(pan_degrees, tilt_degrees)
+
+    def _apply_movement_block(self, fixtures: List[Fixture], block: MovementBlock, current_time: float):
+        """Apply movement block to a group of fixtures with real-time shape calculation.
+
+        Shapes are evaluated per fixture; plane and spot targets are then
+        converted to pan/tilt for the whole group in one batched solve.
 
         Args:
-            fixture_map: Channel mapping for this fixture
+            fixtures: Fixtures sorted in effect order (index = position in group, for phase offset)
             block: MovementBlock with effect settings
             current_time: Current playback time in seconds
-            fixture_index: This fixture's index within the group (for phase offset)
-            total_fixtures: Total fixtures in the group (for phase offset)
         """
+        members = [(fixture_index, self.fixture_maps[fixture.name])
+                   for fixture_index, fixture in enumerate(fixtures)
+                   if fixture.name in self.fixture_maps]
+        if not members:
+            return
+        total_fixtures = len(fixtures)
+
         time_in_block = current_time - block.start_time
         block_duration = block.end_time - block.start_time
         pan_min = block.pan_min
@@ -737,12 +941,26 @@ class DMXManager:
             progress = time_in_block / block_duration
         else:
             progress = 0
-        t = 2 * math.pi * total_cycles * progress
+        base_t = 2 * math.pi * total_cycles * progress
 
-        # Apply phase offset for t-based shapes
-        if block.phase_offset_enabled and total_fixtures > 1:
-            phase_offset_radians = block.phase_offset_degrees * math.pi / 180.0
-            t = t + (fixture_index * phase_offset_radians)
+        shape_fn = MOVEMENT_REGISTRY.get(block.effect_type, MOVEMENT_REGISTRY["static"])
+
+        def run_shape(fixture_index, center_pan, center_tilt, pan_amplitude, tilt_amplitude):
+            t = base_t
+            # Apply phase offset for t-based shapes
+            if block.phase_offset_enabled and total_fixtures > 1:
+                phase_offset_radians = block.phase_offset_degrees * math.pi / 180.0
+                t = t + (fixture_index * phase_offset_radians)
+            ctx = MovementContext(
+                t=t, progress=progress, total_cycles=total_cycles,
+                center_pan=center_pan, center_tilt=center_tilt,
+                pan_amplitude=pan_amplitude, tilt_amplitude=tilt_amplitude,
+                fixture_index=fixture_index, total_fixtures=total_fixtures,
+                phase_offset_enabled=block.phase_offset_enabled,
+                phase_offset_degrees=block.phase_offset_degrees,
+                lissajous_ratio=block.lissajous_ratio,
+            )
+            return shape_fn(ctx)
 
         # Check for plane-based world-space rendering
         plane = None
@@ -751,106 +969,62 @@ class DMXManager:
 
         if plane:
             # ── World-space plane rendering ──
-            # Run shape with normalized center/amplitude to extract offsets
+            # Run shape with normalized center/amplitude to extract offsets (-1 to +1)
             norm_center = 127.5
             norm_amplitude = 50.0
-            ctx = MovementContext(
-                t=t, progress=progress, total_cycles=total_cycles,
-                center_pan=norm_center, center_tilt=norm_center,
-                pan_amplitude=norm_amplitude, tilt_amplitude=norm_amplitude,
-                fixture_index=fixture_index, total_fixtures=total_fixtures,
-                phase_offset_enabled=block.phase_offset_enabled,
-                phase_offset_degrees=block.phase_offset_degrees,
-                lissajous_ratio=block.lissajous_ratio,
-            )
-            shape_fn = MOVEMENT_REGISTRY.get(block.effect_type, MOVEMENT_REGISTRY["static"])
-            result = shape_fn(ctx)
-
-            # Extract normalized offsets (-1 to +1)
-            if norm_amplitude > 0:
-                u_offset = (result.pan - norm_center) / norm_amplitude
-                v_offset = (result.tilt - norm_center) / norm_amplitude
-            else:
-                u_offset = 0.0
-                v_offset = 0.0
+            u_offsets = np.empty(len(members))
+            v_offsets = np.empty(len(members))
+            for row, (fixture_index, _) in enumerate(members):
+                result = run_shape(fixture_index, norm_center, norm_center, norm_amplitude, norm_amplitude)
+                u_offsets[row] = (result.pan - norm_center) / norm_amplitude
+                v_offsets[row] = (result.tilt - norm_center) / norm_amplitude
 
             # Convert amplitude from DMX-like units to meters on plane
             amplitude_meters = block.pan_amplitude / 20.0
 
-            # Compute world-space target on the plane
-            target_x = plane.point[0] + u_offset * amplitude_meters * plane.u_axis[0] + v_offset * amplitude_meters * plane.v_axis[0]
-            target_y = plane.point[1] + u_offset * amplitude_meters * plane.u_axis[1] + v_offset * amplitude_meters * plane.v_axis[1]
-            target_z = plane.point[2] + u_offset * amplitude_meters * plane.u_axis[2] + v_offset * amplitude_meters * plane.v_axis[2]
-
-            # Convert world target to pan/tilt for this fixture
-            fixture = fixture_map.fixture
-            group = self.config.groups.get(fixture.group) if fixture.group else None
-            mounting, yaw, pitch, roll = fixture.get_effective_orientation(group)
-            fixture_z = fixture.get_effective_z(group)
-
-            pan_degrees, tilt_degrees = calculate_pan_tilt(
-                fixture_x=fixture.x, fixture_y=fixture.y, fixture_z=fixture_z,
-                target_x=target_x, target_y=target_y, target_z=target_z,
-                mounting=mounting, yaw=yaw, pitch=pitch, roll=roll
-            )
-            pan_dmx, tilt_dmx = pan_tilt_to_dmx(pan_degrees, tilt_degrees)
+            # Compute world-space targets on the plane
+            targets = (np.asarray(plane.point, dtype=float)
+                       + (u_offsets * amplitude_meters)[:, None] * np.asarray(plane.u_axis, dtype=float)
+                       + (v_offsets * amplitude_meters)[:, None] * np.asarray(plane.v_axis, dtype=float))
 
-            pan = max(pan_min, min(pan_max, float(pan_dmx)))
-            tilt = max(tilt_min, min(tilt_max, float(tilt_dmx)))
-        else:
-            # ── Standard DMX-space rendering ──
-            # Resolve center position (target spot or manual)
-            if block.target_spot_name and self.config and hasattr(self.config, 'spots'):
-                spot = self.config.spots.get(block.target_spot_name)
-                if spot:
-                    fixture = fixture_map.fixture
-                    group = self.config.groups.get(fixture.group) if fixture.group else None
-                    mounting, yaw, pitch, roll = fixture.get_effective_orientation(group)
-                    fixture_z = fixture.get_effective_z(group)
-
-                    pan_degrees, tilt_degrees = calculate_pan_tilt(
-                        fixture_x=fixture.x, fixture_y=fixture.y, fixture_z=fixture_z,
-                        target_x=spot.x, target_y=spot.y, target_z=spot.z,
-                        mounting=mounting, yaw=yaw, pitch=pitch, roll=roll
-                    )
-                    pan_dmx, tilt_dmx = pan_tilt_to_dmx(pan_degrees, tilt_degrees)
-
-                    if DEBUG_PRINTS:
+            # Convert world targets to pan/tilt for all fixtures at once
+            pan_dmx, tilt_dmx = self._solve_pan_tilt_dmx([fm.fixture for _, fm in members], targets)
+
+            for row, (_, fixture_map) in enumerate(members):
+                pan = max(pan_min, min(pan_max, float(pan_dmx[row])))
+                tilt = max(tilt_min, min(tilt_max, float(tilt_dmx[row])))
+                self._write_pan_tilt(fixture_map, pan, tilt)
+            return
+
+        # ── Standard DMX-space rendering ──
+        # Resolve center position (target spot or manual)
+        centers = [(block.pan, block.tilt)] * len(members)
+        if block.target_spot_name and self.config and hasattr(self.config, 'spots'):
+            spot = self.config.spots.get(block.target_spot_name)
+            if spot:
+                pan_dmx, tilt_dmx = self._solve_pan_tilt_dmx(
+                    [fm.fixture for _, fm in members], (spot.x, spot.y, spot.z))
+                centers = list(zip(pan_dmx.astype(float).tolist(), tilt_dmx.astype(float).tolist()))
+
+                if DEBUG_PRINTS:
+                    for (_, fixture_map), center in zip(members, centers):
+                        fixture = fixture_map.fixture
                         debug_key = f"_spot_debug_{fixture.name}"
                         if not hasattr(self, debug_key):
                             setattr(self, debug_key, True)
-                            print(f"[SPOT TARGET] {fixture.name} at ({fixture.x}, {fixture.y}, {fixture_z}) "
+                            print(f"[SPOT TARGET] {fixture.name} at ({fixture.x}, {fixture.y}) "
                                   f"-> Spot '{block.target_spot_name}' at ({spot.x}, {spot.y}, {spot.z})")
-                            print(f"  orientation: mounting={mounting}, yaw={yaw}, pitch={pitch}, roll={roll}")
-                            print(f"  calculated: pan={pan_degrees:.1f}°, tilt={tilt_degrees:.1f}°")
-                            print(f"  DMX: pan={pan_dmx}, tilt={tilt_dmx}")
-
-                    center_pan = float(pan_dmx)
-                    center_tilt = float(tilt_dmx)
-                else:
-                    center_pan = block.pan
-                    center_tilt = block.tilt
-            else:
-                center_pan = block.pan
-                center_tilt = block.tilt
-
-            # Build context and dispatch to shape function
-            ctx = MovementContext(
-                t=t, progress=progress, total_cycles=total_cycles,
-                center_pan=center_pan, center_tilt=center_tilt,
-                pan_amplitude=block.pan_amplitude, tilt_amplitude=block.tilt_amplitude,
-                fixture_index=fixture_index, total_fixtures=total_fixtures,
-                phase_offset_enabled=block.phase_offset_enabled,
-                phase_offset_degrees=block.phase_offset_degrees,
-                lissajous_ratio=block.lissajous_ratio,
-            )
-
-            shape_fn = MOVEMENT_REGISTRY.get(block.effect_type, MOVEMENT_REGISTRY["static"])
-            result = shape_fn(ctx)
+                            print(f"  DMX: pan={center[0]}, tilt={center[1]}")
 
+        for (fixture_index, fixture_map), (center_pan, center_tilt) in zip(members, centers):
+            result = run_shape(fixture_index, center_pan, center_tilt,
+                               block.pan_amplitude, block.tilt_amplitude)
             pan = max(pan_min, min(pan_max, result.pan))
             tilt = max(tilt_min, min(tilt_max, result.tilt))
+            self._write_pan_tilt(fixture_map, pan, tilt)
 
+    def _write_pan_tilt(self, fixture_map: FixtureChannelMap, pan: float, tilt: float):
+        """Apply speed limiting and write pan/tilt channels for one fixture."""
         # Apply speed limiting (max degrees/sec)
         if self._max_pan_tilt_speed > 0:
             fixture_key = f"{fixture_map.fixture.universe}_{fixture_map.fixture.address}"
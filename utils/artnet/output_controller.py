@@ -211,12 +211,13 @@ class ArtNetOutputController(QObject):
             traceback.print_exc()
 
     def _send_all_universes(self):
-        """Send DMX data for all configured universes."""
-        for universe_id in self.config.universes.keys():
-            # Ensure universe_id is int (YAML may load as string)
-            universe_int = int(universe_id)
-            dmx_data = self.dmx_manager.get_dmx_data(universe_int)
-            self.artnet_sender.send_dmx(universe_int - 1, dmx_data)  # Convert 1-based internal to 0-based ArtNet
+        """Send DMX data for all configured universes in one batch."""
+        # Ensure universe_id is int (YAML may load as string);
+        # convert 1-based internal to 0-based ArtNet
+        self.artnet_sender.send_frame([
+            (int(universe_id) - 1, self.dmx_manager.get_dmx_data(int(universe_id)))
+            for universe_id in self.config.universes.keys()
+        ])
 
     def set_target_ip(self, ip: str):
         """
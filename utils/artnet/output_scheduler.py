@@ -0,0 +1,181 @@
+# utils/artnet/output_scheduler.py
+# Deadline-based frame scheduler for the DMX output threads
+
+import math
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+
+@dataclass
+class SchedulerStats:
+    """Timing statistics of an OutputScheduler since start or the last reset."""
+    rate_hz: float
+    frames: int = 0
+    late_frames: int = 0          # Ticks that started later than late_threshold after their deadline
+    skipped_frames: int = 0       # Deadlines dropped because a tick overran a whole interval
+    mean_jitter_ms: float = 0.0   # Mean |actual start - deadline|
+    rms_jitter_ms: float = 0.0
+    max_jitter_ms: float = 0.0
+
+
+class OutputScheduler:
+    """
+    Calls tick() on a background thread at a fixed rate.
+
+    Frame k is due at start + k * interval on the monotonic clock, so
+    timing errors never accumulate the way ``sleep(interval - elapsed)``
+    loops drift. The thread sleeps until shortly before each deadline and
+    spins (yielding the GIL) for the last stretch, which keeps wake-up
+    jitter well below the OS sleep granularity. A tick that overruns a
+    whole interval skips the missed deadlines instead of bursting to catch
+    up.
+    """
+
+    MAX_RATE_HZ = 200.0
+
+    def __init__(self, tick: Callable[[], None], rate_hz: float = 30.0,
+                 name: str = "DMXOutput", spin_threshold: float = 0.0015,
+                 late_threshold: float = 0.002):
+        """
+        Args:
+            tick: Called once per frame on the scheduler thread (exceptions are caught)
+            rate_hz: Frames per second (up to MAX_RATE_HZ)
+            name: Thread name
+            spin_threshold: Seconds before a deadline to stop sleeping and spin
+            late_threshold: Seconds after a deadline from which a frame counts as late
+        """
+        self._tick = tick
+        self.name = name
+        self.spin_threshold = spin_threshold
+        self.late_threshold = late_threshold
+        self._interval = 1.0 / 30.0
+        self.set_rate(rate_hz)
+
+        self._thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+        self._stats_lock = threading.Lock()
+        self.reset_stats()
+
+    @property
+    def rate_hz(self) -> float:
+        return 1.0 / self._interval
+
+    @property
+    def interval(self) -> float:
+        return self._interval
+
+    def set_rate(self, rate_hz: float):
+        """Change the frame rate (applies from the next deadline)."""
+        if rate_hz <= 0:
+            raise ValueError(f"Output rate must be positive, got {rate_hz}")
+        self._interval = 1.0 / min(rate_hz, self.MAX_RATE_HZ)
+
+    def is_running(self) -> bool:
+        return (self._thread is not None and self._thread.is_alive()
+                and not self._stop_event.is_set())
+
+    def start(self, timeout: float = 2.0) -> bool:
+        """Start the scheduler thread (no-op if already running).
+
+        If a stopped thread is still finishing its tick, waits up to
+        ``timeout`` seconds for it to exit, so two threads never send on
+        the same sockets.
+
+        Returns:
+            True if the scheduler is running, False if the previous thread
+            did not exit in time
+        """
+        if self.is_running():
+            return True
+        if self._thread is not None:
+            if self._thread is not threading.current_thread():
+                self._thread.join(timeout=timeout)
+            if self._thread.is_alive():
+                print(f"{self.name}: previous thread has not exited, not starting another")
+                return False
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+        self._thread.start()
+        return True
+
+    def stop(self, timeout: float = 2.0):
+        """Stop the scheduler thread and wait for the current tick to finish."""
+        if self._thread is None:
+            return
+        self._stop_event.set()
+        if self._thread.is_alive() and self._thread is not threading.current_thread():
+            self._thread.join(timeout=timeout)
+        if not self._thread.is_alive():
+            self._thread = None
+
+    # ── Statistics ────────────────────────────────────────────────────
+
+    def reset_stats(self):
+        with self._stats_lock:
+            self._frames = 0
+            self._late = 0
+            self._skipped = 0
+            self._jitter_sum = 0.0
+            self._jitter_sq_sum = 0.0
+            self._jitter_max = 0.0
+
+    def stats(self) -> SchedulerStats:
+        """Snapshot of the timing statistics."""
+        with self._stats_lock:
+            frames = self._frames
+            return SchedulerStats(
+                rate_hz=self.rate_hz,
+                frames=frames,
+                late_frames=self._late,
+                skipped_frames=self._skipped,
+                mean_jitter_ms=self._jitter_sum / frames * 1000.0 if frames else 0.0,
+                rms_jitter_ms=math.sqrt(self._jitter_sq_sum / frames) * 1000.0 if frames else 0.0,
+                max_jitter_ms=self._jitter_max * 1000.0,
+            )
+
+    def _record(self, jitter: float, skipped: int):
+        with self._stats_lock:
+            self._frames += 1
+            self._skipped += skipped
+            if jitter > self.late_threshold:
+                self._late += 1
+            jitter = abs(jitter)
+            self._jitter_sum += jitter
+            self._jitter_sq_sum += jitter * jitter
+            if jitter > self._jitter_max:
+                self._jitter_max = jitter
+
+    # ── Loop ──────────────────────────────────────────────────────────
+
+    def _wait_until(self, deadline: float) -> bool:
+        """Block until deadline. Returns False if stop() was requested."""
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return not self._stop_event.is_set()
+            if remaining > self.spin_threshold:
+                if self._stop_event.wait(remaining - self.spin_threshold):
+                    return False
+            else:
+                # Spin out the tail; sleep(0) releases the GIL between polls
+                time.sleep(0)
+
+    def _run(self):
+        deadline = time.monotonic()
+        skipped = 0
+        while self._wait_until(deadline):
+            self._record(time.monotonic() - deadline, skipped)
+            try:
+                self._tick()
+            except Exception as e:
+                print(f"{self.name} tick error: {e}")
+
+            deadline += self._interval
+            now = time.monotonic()
+            skipped = 0
+            if now - deadline >= self._interval:
+                # Overran at least one whole frame: drop the missed deadlines
+                skipped = int((now - deadline) // self._interval)
+                deadline += skipped * self._interval
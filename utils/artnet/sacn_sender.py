@@ -0,0 +1,326 @@
+# utils/artnet/sacn_sender.py
+# E1.31 (sACN) DMX packet sender with per-universe destinations and priority
+
+import ctypes
+import socket
+import struct
+import time
+import uuid
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .sender import PacketBatch
+
+
+@dataclass
+class SACNUniverse:
+    """Where and how one universe is sent."""
+    universe: int                # E1.31 universe number (1-63999)
+    ip: str                      # Multicast group or unicast target
+    port: int
+    priority: int
+
+
+def multicast_address(universe: int) -> str:
+    """E1.31 multicast group for a universe: 239.255.<hi>.<lo>."""
+    return f"239.255.{(universe >> 8) & 0xFF}.{universe & 0xFF}"
+
+
+class SACNSender:
+    """
+    Sends DMX data via E1.31 / Streaming ACN (data packets, start code 0).
+
+    E1.31 Data Packet Format (638 bytes for 512 slots):
+    - Bytes 0-37: Root layer (preamble, "ASC-E1.17" identifier, vector 4, 16-byte CID)
+    - Bytes 38-114: Framing layer (vector 2, 64-byte source name, priority,
+      sync address, sequence number, options, universe)
+    - Bytes 115-125: DMP layer (vector 2, property count 513, start code 0)
+    - Bytes 126+: DMX data (512 bytes)
+
+    Universes are keyed like the ArtNet sender's (the caller's universe id)
+    and mapped to an E1.31 universe and destination with set_universe().
+    Like ArtNetSender, every universe has one preallocated packet in which
+    only the sequence number and the payload are patched per send, and
+    send_frame() flushes a whole frame in one batch. Rate limited per
+    universe to max_rate_hz (44Hz by default; E1.31 itself allows more).
+    """
+
+    SACN_PORT = 5568
+    DEFAULT_PRIORITY = 100
+    MAX_PRIORITY = 200
+    MAX_UNIVERSE = 63999
+    DMX_LENGTH = 512
+    PACKET_SIZE = 126 + DMX_LENGTH
+
+    # Framing layer option bits
+    OPTION_STREAM_TERMINATED = 0x40
+
+    MAX_SEND_RATE_HZ = 44
+    MIN_SEND_INTERVAL = 1.0 / MAX_SEND_RATE_HZ
+    # Slack for scheduler jitter (see ArtNetSender.RATE_LIMIT_TOLERANCE)
+    RATE_LIMIT_TOLERANCE = 0.002
+
+    # Router hops multicast packets may cross
+    MULTICAST_TTL = 8
+
+    ACN_PACKET_IDENTIFIER = b'ASC-E1.17\x00\x00\x00'
+    VECTOR_ROOT_E131_DATA = 0x00000004
+    VECTOR_E131_DATA_PACKET = 0x00000002
+    VECTOR_DMP_SET_PROPERTY = 0x02
+
+    # Offsets of the per-send fields
+    _PRIORITY_OFFSET = 108
+    _SEQUENCE_OFFSET = 111
+    _OPTIONS_OFFSET = 112
+    _UNIVERSE_OFFSET = 113
+    _DATA_OFFSET = 126
+
+    def __init__(self, source_name: str = "QLC+ Show Creator", cid: Optional[uuid.UUID] = None,
+                 max_rate_hz: float = MAX_SEND_RATE_HZ):
+        """
+        Initialize sACN sender.
+
+        Args:
+            source_name: Source name shown by receivers (max 63 UTF-8 bytes)
+            cid: Component identifier; defaults to one derived from the host
+                name so receivers see the same source across restarts
+            max_rate_hz: Per-universe send rate limit
+        """
+        self.source_name = source_name
+        self.min_send_interval = 1.0 / max_rate_hz
+        self.cid = cid or uuid.uuid5(uuid.NAMESPACE_DNS, f"{socket.gethostname()}/{source_name}")
+
+        self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.socket.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_TTL, self.MULTICAST_TTL)
+        # Loop multicast back so a receiver on this machine sees the stream
+        self.socket.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_LOOP, 1)
+
+        # key -> destination, packet buffer and sequence number (per universe, as E1.31 requires)
+        self.universes: Dict[int, SACNUniverse] = {}
+        self._packets: Dict[int, ctypes.Array] = {}
+        self._packet_views: Dict[int, memoryview] = {}
+        self._sequences: Dict[int, int] = {}
+        self.last_send_time: Dict[int, float] = {}
+
+        self._batch = PacketBatch()
+        self._config_fingerprint = None
+
+    def set_max_rate(self, max_rate_hz: float):
+        """Change the per-universe send rate limit."""
+        self.min_send_interval = 1.0 / max_rate_hz
+
+    # ── Universe setup ────────────────────────────────────────────────
+
+    def set_universe(self, key: int, universe: int, ip: Optional[str] = None,
+                     port: int = SACN_PORT, priority: int = DEFAULT_PRIORITY):
+        """
+        Configure where a universe is sent.
+
+        Args:
+            key: Caller's universe id (what send_dmx/send_frame are called with)
+            universe: E1.31 universe number (1-63999)
+            ip: Unicast target, or None for the universe's multicast group
+            port: UDP port (default 5568)
+            priority: Per-universe priority (0-200, default 100)
+        """
+        if not 1 <= universe <= self.MAX_UNIVERSE:
+            raise ValueError(f"E1.31 universe must be 1-{self.MAX_UNIVERSE}, got {universe}")
+        priority = max(0, min(self.MAX_PRIORITY, priority))
+        target = SACNUniverse(universe=universe, ip=ip or multicast_address(universe),
+                              port=port, priority=priority)
+        if self.universes.get(key) == target:
+            return
+        self.universes[key] = target
+
+        view = self._packet_view(key)
+        view[self._PRIORITY_OFFSET] = priority
+        struct.pack_into('>H', view, self._UNIVERSE_OFFSET, universe)
+
+    def remove_universe(self, key: int):
+        """Stop sending a universe (receivers are told the stream ended)."""
+        if key in self.universes:
+            self._send_termination([key])
+            del self.universes[key]
+            self._packets.pop(key, None)
+            self._packet_views.pop(key, None)
+            self._sequences.pop(key, None)
+            self.last_send_time.pop(key, None)
+
+    def configure_from_config(self, universes: dict) -> List[int]:
+        """
+        Set up every E1.31 universe of a Configuration.universes dict.
+
+        Universes whose output plugin is "E1.31" are sent via sACN using their
+        'universe', 'multicast', 'ip', 'port' and optional 'priority'
+        parameters; all others are removed. Cheap when nothing changed, so it
+        can be called every frame to pick up edits from the Configuration tab.
+
+        Returns:
+            Config universe ids now sent via sACN
+        """
+        wanted = {}
+        for universe_id, universe in universes.items():
+            output = universe.output or {}
+            if output.get('plugin') != 'E1.31':
+                continue
+            params = output.get('parameters') or {}
+            wanted[int(universe_id)] = (
+                params.get('universe'), params.get('multicast', 'true'),
+                params.get('ip'), params.get('port'), params.get('priority'),
+            )
+        fingerprint = tuple(sorted(wanted.items()))
+        if fingerprint == self._config_fingerprint:
+            return list(self.universes)
+        self._config_fingerprint = fingerprint
+
+        for key in [k for k in self.universes if k not in wanted]:
+            self.remove_universe(key)
+        for key, (sacn_universe, multicast, ip, port, priority) in wanted.items():
+            try:
+                multicast = str(multicast).lower() == 'true'
+                self.set_universe(
+                    key,
+                    int(sacn_universe) if sacn_universe not in (None, '') else key,
+                    ip=None if multicast or not ip else ip,
+                    # Receivers only listen on 5568 for multicast
+                    port=self.SACN_PORT if multicast or not port else int(port),
+                    priority=int(priority) if priority not in (None, '') else self.DEFAULT_PRIORITY,
+                )
+            except ValueError as e:
+                print(f"sACN: skipping universe {key}: {e}")
+                self.remove_universe(key)
+        return list(self.universes)
+
+    # ── Packets ───────────────────────────────────────────────────────
+
+    def _packet_view(self, key: int) -> memoryview:
+        """Writable view of the preallocated packet for a universe."""
+        view = self._packet_views.get(key)
+        if view is None:
+            packet = (ctypes.c_ubyte * self.PACKET_SIZE)()
+            view = memoryview(packet).cast('B')
+            # Root layer
+            struct.pack_into('>HH', view, 0, 0x0010, 0x0000)
+            view[4:16] = self.ACN_PACKET_IDENTIFIER
+            struct.pack_into('>HI', view, 16, 0x7000 | (self.PACKET_SIZE - 16), self.VECTOR_ROOT_E131_DATA)
+            view[22:38] = self.cid.bytes
+            # Framing layer (priority, sequence, options, universe patched later)
+            struct.pack_into('>HI', view, 38, 0x7000 | (self.PACKET_SIZE - 38), self.VECTOR_E131_DATA_PACKET)
+            name = self.source_name.encode('utf-8')[:63]
+            view[44:44 + len(name)] = name
+            view[self._PRIORITY_OFFSET] = self.DEFAULT_PRIORITY
+            # DMP layer
+            struct.pack_into('>HBBHHH', view, 115, 0x7000 | (self.PACKET_SIZE - 115),
+                             self.VECTOR_DMP_SET_PROPERTY, 0xA1, 0x0000, 0x0001, self.DMX_LENGTH + 1)
+            # Byte 125: DMX start code 0
+            self._packets[key] = packet
+            self._packet_views[key] = view
+            self._sequences[key] = 0
+        return view
+
+    def _fill_packet(self, key: int, dmx_data, options: int = 0) -> memoryview:
+        """Patch sequence, options and DMX payload into the universe's packet."""
+        view = self._packet_views[key]
+        sequence = self._sequences[key]
+        view[self._SEQUENCE_OFFSET] = sequence
+        self._sequences[key] = (sequence + 1) % 256
+        view[self._OPTIONS_OFFSET] = options
+
+        length = min(len(dmx_data), self.DMX_LENGTH)
+        payload_end = self._DATA_OFFSET + length
+        view[self._DATA_OFFSET:payload_end] = memoryview(dmx_data).cast('B')[:length]
+        if length < self.DMX_LENGTH:
+            view[payload_end:] = bytes(self.DMX_LENGTH - length)
+        return view
+
+    def create_dmx_packet(self, key: int, dmx_data: bytes) -> bytes:
+        """
+        Create an E1.31 data packet for a configured universe.
+
+        Args:
+            key: Universe id passed to set_universe()
+            dmx_data: DMX data bytes (up to 512 bytes, padded/truncated to 512)
+
+        Returns:
+            Complete E1.31 packet as bytes
+        """
+        return bytes(self._fill_packet(key, dmx_data))
+
+    # ── Sending ───────────────────────────────────────────────────────
+
+    def send_dmx(self, key: int, dmx_data: bytes, force: bool = False) -> bool:
+        """
+        Send DMX data for one configured universe.
+
+        Returns:
+            True if the packet was sent, False if rate-limited, unconfigured or failed
+        """
+        return bool(self.send_frame([(key, dmx_data)], force=force))
+
+    def send_frame(self, frame: Iterable[Tuple[int, bytes]], force: bool = False) -> List[int]:
+        """
+        Send one frame of DMX data for several universes in a single batch.
+
+        Args:
+            frame: (key, dmx_data) pairs; keys without set_universe() are ignored
+            force: If True, bypass rate limiting
+
+        Returns:
+            Keys that were sent
+        """
+        current_time = time.monotonic()
+        min_interval = self.min_send_interval - self.RATE_LIMIT_TOLERANCE
+        keys: List[int] = []
+        for key, dmx_data in frame:
+            if key not in self.universes:
+                continue
+            if not force and current_time - self.last_send_time.get(key, float('-inf')) < min_interval:
+                continue
+            self._fill_packet(key, dmx_data)
+            keys.append(key)
+        if not keys:
+            return []
+
+        sent = self._send_keys(keys)
+        for key in keys[:sent]:
+            self.last_send_time[key] = current_time
+        return keys[:sent]
+
+    def _send_keys(self, keys: List[int]) -> int:
+        packets = []
+        for key in keys:
+            target = self.universes[key]
+            packets.append((self._packets[key], (target.ip, target.port)))
+        try:
+            return self._batch.send(self.socket, packets)
+        except Exception as e:
+            print(f"Error sending sACN packet: {e}")
+            return getattr(e, 'sent', 0)
+
+    def _send_termination(self, keys: List[int]):
+        """Tell receivers the streams ended (three packets with Stream_Terminated, per E1.31)."""
+        keys = [k for k in keys if k in self._packet_views]
+        if not keys or self.socket is None:
+            return
+        for _ in range(3):
+            for key in keys:
+                view = self._packet_views[key]
+                view[self._SEQUENCE_OFFSET] = self._sequences[key]
+                self._sequences[key] = (self._sequences[key] + 1) % 256
+                view[self._OPTIONS_OFFSET] = self.OPTION_STREAM_TERMINATED
+            self._send_keys(keys)
+
+    def close(self):
+        """Terminate all streams and close the UDP socket."""
+        if self.socket:
+            try:
+                self._send_termination(list(self.universes))
+            except Exception:
+                pass
+            self.socket.close()
+            self.socket = None
+            print("sACN sender closed")
+
+    def __del__(self):
+        """Cleanup on deletion."""
+        self.close()
@@ -1,10 +1,158 @@
 # utils/artnet/sender.py
 # ArtNet DMX packet sender with 44Hz rate limiting
 
+import ctypes
+import ctypes.util
+import os
 import socket
 import struct
+import sys
 import time
-from typing import Dict, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+# ── sendmmsg(2) batching (Linux) ──────────────────────────────────────
+# Python's socket module has no sendmmsg, so on Linux the frame is handed
+# to libc directly: one syscall for every universe instead of one each.
+
+class _IoVec(ctypes.Structure):
+    _fields_ = [("iov_base", ctypes.c_void_p), ("iov_len", ctypes.c_size_t)]
+
+
+class _MsgHdr(ctypes.Structure):
+    _fields_ = [
+        ("msg_name", ctypes.c_void_p),
+        ("msg_namelen", ctypes.c_uint32),
+        ("msg_iov", ctypes.POINTER(_IoVec)),
+        ("msg_iovlen", ctypes.c_size_t),
+        ("msg_control", ctypes.c_void_p),
+        ("msg_controllen", ctypes.c_size_t),
+        ("msg_flags", ctypes.c_int),
+    ]
+
+
+class _MMsgHdr(ctypes.Structure):
+    _fields_ = [("msg_hdr", _MsgHdr), ("msg_len", ctypes.c_uint)]
+
+
+class _SockAddrIn(ctypes.Structure):
+    _fields_ = [
+        ("sin_family", ctypes.c_ushort),
+        ("sin_port", ctypes.c_uint16),   # network byte order
+        ("sin_addr", ctypes.c_uint8 * 4),
+        ("sin_zero", ctypes.c_uint8 * 8),
+    ]
+
+
+def _load_sendmmsg():
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        fn = libc.sendmmsg
+    except (OSError, AttributeError):
+        return None
+    fn.argtypes = [ctypes.c_int, ctypes.c_void_p, ctypes.c_uint, ctypes.c_int]
+    fn.restype = ctypes.c_int
+    return fn
+
+
+_SENDMMSG = _load_sendmmsg()
+
+
+class PacketBatch:
+    """
+    Sends a list of prepared UDP packets in one go.
+
+    Packets are ctypes byte arrays (fixed address, patched in place by the
+    protocol senders). With sendmmsg available the whole list goes out in
+    one syscall; otherwise, or for sockets without a real descriptor, the
+    same buffers are sent with back-to-back sendto() calls.
+    """
+
+    def __init__(self):
+        self._capacity = 0
+        self._headers = None
+        self._iovecs = None
+        # (ip, port) -> sockaddr_in, None when the host does not resolve
+        self._addresses: Dict[Tuple[str, int], Optional[_SockAddrIn]] = {}
+
+    def _sockaddr(self, address: Tuple[str, int]) -> Optional[_SockAddrIn]:
+        if address not in self._addresses:
+            try:
+                packed_ip = socket.inet_aton(socket.gethostbyname(address[0]))
+            except OSError:
+                self._addresses[address] = None
+            else:
+                addr = _SockAddrIn()
+                addr.sin_family = socket.AF_INET
+                addr.sin_port = socket.htons(address[1])
+                addr.sin_addr[:] = list(packed_ip)
+                self._addresses[address] = addr
+        return self._addresses[address]
+
+    def send(self, sock, packets: List[Tuple[ctypes.Array, Tuple[str, int]]]) -> int:
+        """
+        Send (packet, (ip, port)) pairs in order.
+
+        Returns:
+            Number of packets sent (always all of them unless an error is raised)
+
+        Raises:
+            OSError: on a send error; its ``sent`` attribute counts the packets
+                that went out before it
+        """
+        sent = self._sendmmsg(sock, packets)
+        if sent is not None:
+            return sent
+        sent = 0
+        sendto = sock.sendto
+        try:
+            for packet, address in packets:
+                sendto(packet, address)
+                sent += 1
+        except OSError as e:
+            e.sent = sent
+            raise
+        return sent
+
+    def _sendmmsg(self, sock, packets) -> Optional[int]:
+        if _SENDMMSG is None:
+            return None
+        fd = sock.fileno()
+        if not isinstance(fd, int) or fd < 0:
+            return None
+        addresses = [self._sockaddr(address) for _, address in packets]
+        if None in addresses:
+            return None
+
+        count = len(packets)
+        if count > self._capacity:
+            self._capacity = count
+            self._headers = (_MMsgHdr * count)()
+            self._iovecs = (_IoVec * count)()
+            for i in range(count):
+                hdr = self._headers[i].msg_hdr
+                hdr.msg_iov = ctypes.pointer(self._iovecs[i])
+                hdr.msg_iovlen = 1
+                hdr.msg_namelen = ctypes.sizeof(_SockAddrIn)
+        headers = self._headers
+        iovecs = self._iovecs
+        for i, (packet, _) in enumerate(packets):
+            iovecs[i].iov_base = ctypes.addressof(packet)
+            iovecs[i].iov_len = ctypes.sizeof(packet)
+            headers[i].msg_hdr.msg_name = ctypes.addressof(addresses[i])
+
+        sent = 0
+        while sent < count:
+            n = _SENDMMSG(fd, ctypes.addressof(headers) + sent * ctypes.sizeof(_MMsgHdr), count - sent, 0)
+            if n < 0:
+                errno = ctypes.get_errno()
+                error = OSError(errno, os.strerror(errno))
+                error.sent = sent
+                raise error
+            sent += n
+        return sent
 
 
 class ArtNetSender:
@@ -22,17 +170,26 @@ class ArtNetSender:
     - Bytes 18+: DMX data (up to 512 bytes)
 
     Rate limited to 44Hz (22.7ms minimum interval) to avoid overloading receivers.
+
+    ArtSync (OpSync, 14 bytes) can be appended to a frame so nodes in
+    synchronous mode latch all universes of the frame at the same moment.
     """
 
     # ArtNet constants
     ARTNET_HEADER = b'Art-Net\x00'
     ARTNET_OPCODE_DMX = 0x5000
+    ARTNET_OPCODE_SYNC = 0x5200
     ARTNET_PROTOCOL_VERSION = 0x000e
     ARTNET_PORT = 6454
+    DMX_LENGTH = 512
+    PACKET_SIZE = 18 + DMX_LENGTH
 
     # Rate limiting
     MAX_SEND_RATE_HZ = 44
     MIN_SEND_INTERVAL = 1.0 / MAX_SEND_RATE_HZ  # ~22.7ms
+    # Slack for scheduler jitter so a frame due exactly on the 44Hz cadence
+    # is not dropped for arriving a fraction of a millisecond early
+    RATE_LIMIT_TOLERANCE = 0.002
 
     def __init__(self, target_ip: str = "255.255.255.255", target_port: int = ARTNET_PORT):
         """
@@ -55,60 +212,75 @@ class ArtNetSender:
         # Rate limiting - track last send time per universe
         self.last_send_time: Dict[int, float] = {}
 
+        # Preallocated OpDmx packets per universe. Only the sequence byte and
+        # the DMX payload change between frames; they are patched in place.
+        # ctypes arrays keep a fixed address for the sendmmsg iovecs.
+        self._packets: Dict[int, ctypes.Array] = {}
+        self._packet_views: Dict[int, memoryview] = {}
+
+        # OpSync: header, opcode, protocol version, two aux bytes (0)
+        self._sync_packet = (ctypes.c_ubyte * 14)()
+        sync_view = memoryview(self._sync_packet).cast('B')
+        sync_view[:8] = self.ARTNET_HEADER
+        struct.pack_into('<H', sync_view, 8, self.ARTNET_OPCODE_SYNC)
+        struct.pack_into('>H', sync_view, 10, self.ARTNET_PROTOCOL_VERSION)
+
+        self._batch = PacketBatch()
+
         print(f"ArtNet sender initialized: {target_ip}:{target_port}")
 
+    def _packet_view(self, universe: int) -> memoryview:
+        """Writable view of the preallocated packet for a universe."""
+        view = self._packet_views.get(universe)
+        if view is None:
+            packet = (ctypes.c_ubyte * self.PACKET_SIZE)()
+            view = memoryview(packet).cast('B')
+            view[:8] = self.ARTNET_HEADER
+            struct.pack_into('<H', view, 8, self.ARTNET_OPCODE_DMX)
+            struct.pack_into('>H', view, 10, self.ARTNET_PROTOCOL_VERSION)
+            # Byte 12 (sequence) is set per send, byte 13 (physical port) stays 0
+            # Universe: bits 0-14, bit 15 reserved (0)
+            struct.pack_into('<H', view, 14, universe & 0x7FFF)
+            struct.pack_into('>H', view, 16, self.DMX_LENGTH)
+            self._packets[universe] = packet
+            self._packet_views[universe] = view
+        return view
+
+    def _fill_packet(self, universe: int, dmx_data) -> memoryview:
+        """
+        Patch sequence and DMX payload into the universe's packet buffer.
+
+        The returned view is only valid until the next fill for the same universe.
+        """
+        view = self._packet_view(universe)
+        view[12] = self.sequence
+        length = min(len(dmx_data), self.DMX_LENGTH)
+        payload_end = 18 + length
+        view[18:payload_end] = memoryview(dmx_data).cast('B')[:length]
+        if length < self.DMX_LENGTH:
+            # Pad to 512 bytes
+            view[payload_end:] = bytes(self.DMX_LENGTH - length)
+
+        # Increment sequence counter (wraps at 255)
+        self.sequence = (self.sequence + 1) % 256
+        return view
+
     def create_dmx_packet(self, universe: int, dmx_data: bytes) -> bytes:
         """
         Create an ArtNet OpDmx packet.
 
         Args:
             universe: Universe number (0-32767, 15-bit)
-            dmx_data: DMX data bytes (up to 512 bytes)
+            dmx_data: DMX data bytes (up to 512 bytes, padded/truncated to 512)
 
         Returns:
             Complete ArtNet packet as bytes
         """
-        # Ensure DMX data is not longer than 512 bytes
-        if len(dmx_data) > 512:
-            dmx_data = dmx_data[:512]
-
-        # Pad to 512 bytes if shorter
-        if len(dmx_data) < 512:
-            dmx_data = dmx_data + bytes(512 - len(dmx_data))
-
-        # Build packet
-        packet = bytearray()
-
-        # Header: "Art-Net\0" (8 bytes)
-        packet.extend(self.ARTNET_HEADER)
-
-        # OpCode: 0x5000 (little-endian, 2 bytes)
-        packet.extend(struct.pack('<H', self.ARTNET_OPCODE_DMX))
-
-        # Protocol version: 14 (big-endian, 2 bytes)
-        packet.extend(struct.pack('>H', self.ARTNET_PROTOCOL_VERSION))
-
-        # Sequence: 0-255 (1 byte)
-        packet.append(self.sequence)
-
-        # Physical port: 0 (1 byte)
-        packet.append(0)
-
-        # Universe: 15-bit value (little-endian, 2 bytes)
-        # Bits 0-14: Universe number
-        # Bit 15: Reserved (0)
-        packet.extend(struct.pack('<H', universe & 0x7FFF))
+        return bytes(self._fill_packet(universe, dmx_data))
 
-        # Length: DMX data length (big-endian, 2 bytes)
-        packet.extend(struct.pack('>H', len(dmx_data)))
-
-        # DMX data (512 bytes)
-        packet.extend(dmx_data)
-
-        # Increment sequence counter (wraps at 255)
-        self.sequence = (self.sequence + 1) % 256
-
-        return bytes(packet)
+    def _is_rate_limited(self, universe: int, current_time: float) -> bool:
+        elapsed = current_time - self.last_send_time.get(universe, float('-inf'))
+        return elapsed < self.MIN_SEND_INTERVAL - self.RATE_LIMIT_TOLERANCE
 
     def send_dmx(self, universe: int, dmx_data: bytes, force: bool = False) -> bool:
         """
@@ -124,19 +296,14 @@ class ArtNetSender:
         Returns:
             True if packet was sent, False if rate-limited
         """
-        current_time = time.time()
+        current_time = time.monotonic()
 
         # Check rate limiting (unless forced)
-        if not force:
-            last_time = self.last_send_time.get(universe, 0)
-            time_since_last = current_time - last_time
-
-            if time_since_last < self.MIN_SEND_INTERVAL:
-                # Rate limited - too soon since last send
-                return False
+        if not force and self._is_rate_limited(universe, current_time):
+            # Rate limited - too soon since last send
+            return False
 
-        # Create and send packet
-        packet = self.create_dmx_packet(universe, dmx_data)
+        packet = self._fill_packet(universe, dmx_data)
 
         try:
             self.socket.sendto(packet, (self.target_ip, self.target_port))
@@ -146,6 +313,56 @@ class ArtNetSender:
             print(f"Error sending ArtNet packet: {e}")
             return False
 
+    def send_frame(self, frame: Iterable[Tuple[int, bytes]], force: bool = False,
+                   sync: bool = False) -> List[int]:
+        """
+        Send one frame of DMX data for several universes in a single batch.
+
+        Packets are patched in place and flushed with one sendmmsg() call
+        where available (Linux), otherwise with back-to-back sendto() calls.
+        Same per-universe rate limiting as send_dmx().
+
+        Args:
+            frame: (universe, dmx_data) pairs, universe 0-32767
+            force: If True, bypass rate limiting
+            sync: If True, follow the frame with an ArtSync packet in the same batch
+
+        Returns:
+            Universes that were sent (rate-limited or failed ones are omitted)
+        """
+        current_time = time.monotonic()
+        universes: List[int] = []
+        for universe, dmx_data in frame:
+            if not force and self._is_rate_limited(universe, current_time):
+                continue
+            self._fill_packet(universe, dmx_data)
+            universes.append(universe)
+        if not universes:
+            return []
+
+        address = (self.target_ip, self.target_port)
+        packets = [(self._packets[u], address) for u in universes]
+        if sync:
+            packets.append((self._sync_packet, address))
+        try:
+            sent = self._batch.send(self.socket, packets)
+        except Exception as e:
+            print(f"Error sending ArtNet packet: {e}")
+            sent = getattr(e, 'sent', 0)
+
+        for universe in universes[:sent]:
+            self.last_send_time[universe] = current_time
+        return universes[:sent]
+
+    def send_sync(self) -> bool:
+        """Send a standalone ArtSync packet. Returns True if it was sent."""
+        try:
+            self.socket.sendto(self._sync_packet, (self.target_ip, self.target_port))
+            return True
+        except Exception as e:
+            print(f"Error sending ArtSync packet: {e}")
+            return False
+
     def close(self):
         """Close the UDP socket."""
         if self.socket:
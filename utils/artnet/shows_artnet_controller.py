@@ -2,15 +2,18 @@
 # Simplified ArtNet controller for ShowsTab integration
 # Uses a dedicated thread for DMX updates to avoid Qt event loop blocking
 
-import threading
 import time
 from PyQt6.QtCore import QObject
 from typing import Optional, Dict, Tuple, List, Callable
 from config.models import Configuration, Fixture
 from timeline.light_lane import LightLane
+from timeline.block_index import SUBLANE_TYPES, LaneBlockIndex, LaneBlockCursor
 from .dmx_manager import DMXManager
 from .sender import ArtNetSender
+from .sacn_sender import SACNSender
+from .output_scheduler import OutputScheduler, SchedulerStats
 from utils.target_resolver import resolve_targets_unique
+from utils.dmx_stream import DMXStreamEncoder
 
 # Debug flag - set to False to disable verbose prints (improves performance significantly)
 DEBUG_PRINTS = False
@@ -25,6 +28,8 @@ class ShowsArtNetController(QObject):
     from UI responsiveness.
     """
 
+    DEFAULT_OUTPUT_RATE_HZ = 30.0
+
     def __init__(self, config: Configuration, fixture_definitions: dict,
                  song_structure=None, target_ip: str = "255.255.255.255",
                  local_dmx_callback: Optional[Callable[[int, bytes], None]] = None):
@@ -48,20 +53,35 @@ class ShowsArtNetController(QObject):
         self.fixture_definitions = fixture_definitions
         self._local_dmx_callback = local_dmx_callback
 
+        # Delta-compressed stream of the same frames for visualizers
+        # (see set_dmx_stream_callback)
+        self._dmx_stream_callback: Optional[Callable[[bytes], None]] = None
+        self._dmx_stream_encoder = DMXStreamEncoder()
+
         # Create DMX manager with song structure
         self.dmx_manager = DMXManager(config, fixture_definitions, song_structure)
 
         # Create ArtNet sender
         self.artnet_sender = ArtNetSender(target_ip=target_ip)
 
+        # Universes configured as E1.31 are additionally sent via sACN
+        # from the same output loop (see _send_all_universes)
+        self.sacn_sender = SACNSender()
+
         # Output enabled flag
         self.output_enabled = False
 
-        # Threading for DMX updates (bypasses Qt event loop for consistent timing)
-        self._dmx_thread: Optional[threading.Thread] = None
-        self._stop_thread = threading.Event()
-        self._thread_lock = threading.Lock()
-        self._update_interval = 0.033  # 30Hz (33ms)
+        # Deadline-scheduled DMX thread (bypasses Qt event loop for consistent timing)
+        self._scheduler = OutputScheduler(self._dmx_tick, rate_hz=self.DEFAULT_OUTPUT_RATE_HZ,
+                                          name="ShowsDMXOutput")
+
+        # Follow multi-universe frames with ArtSync so nodes latch them together
+        self.artsync_enabled = True
+
+        # Unchanged universes are skipped by the update loop but resent at
+        # least this often so receivers don't time out (seconds)
+        self.keepalive_interval = 1.0
+        self._last_universe_send: Dict[int, float] = {}
 
         # Current playback time (set from ShowsTab or callback)
         self.current_time = 0.0
@@ -77,6 +97,10 @@ class ShowsArtNetController(QObject):
         # Reference to light lanes (set from ShowsTab)
         self.light_lanes = []
 
+        # PERFORMANCE: Per-lane block cursors over each lane's time index
+        # lane_id -> (index, cursor); a rebuilt index gets a fresh cursor
+        self._block_cursors: Dict[int, Tuple[LaneBlockIndex, LaneBlockCursor]] = {}
+
         # PERFORMANCE: Cache resolved fixtures per lane to avoid resolving on every frame
         # lane_id -> (targets_tuple, resolved_fixtures, sorted_fixtures)
         self._resolved_fixtures_cache: Dict[int, Tuple[tuple, List, List]] = {}
@@ -125,6 +149,23 @@ class ShowsArtNetController(QObject):
         self.light_lanes = lanes
         # Clear resolved fixtures cache when lanes change
         self._resolved_fixtures_cache.clear()
+        self._block_cursors.clear()
+
+    def _get_block_cursor(self, lane) -> LaneBlockCursor:
+        """
+        Get the block cursor for a lane, recreating it when the lane's
+        block index has been rebuilt after an edit.
+        """
+        index = lane.get_block_index()
+        cached = self._block_cursors.get(id(lane))
+        if cached is not None:
+            if cached[0] is index:
+                return cached[1]
+            # Lane was edited - cached static block output may be stale too
+            self.dmx_manager.invalidate_static_cache()
+        cursor = index.cursor()
+        self._block_cursors[id(lane)] = (index, cursor)
+        return cursor
 
     def _get_resolved_fixtures_cached(self, lane) -> Tuple[List, List]:
         """
@@ -199,52 +240,59 @@ class ShowsArtNetController(QObject):
         self._send_all_universes()
         print("ArtNet output disabled")
 
-    def _start_dmx_thread(self):
-        """Start the DMX update thread."""
-        if self._dmx_thread is not None and self._dmx_thread.is_alive():
-            return  # Already running
-
-        self._stop_thread.clear()
-        self._dmx_thread = threading.Thread(target=self._dmx_update_loop, daemon=True)
-        self._dmx_thread.start()
+    def _start_dmx_thread(self) -> bool:
+        """Start the DMX update thread. False if the previous one is still stuck in a tick."""
+        self._scheduler.reset_stats()
+        return self._scheduler.start()
 
     def _stop_dmx_thread(self):
         """Stop the DMX update thread."""
-        if self._dmx_thread is None:
-            return
+        self._scheduler.stop(timeout=0.5)
 
-        self._stop_thread.set()
-        if self._dmx_thread.is_alive():
-            self._dmx_thread.join(timeout=0.5)
-        self._dmx_thread = None
-
-    def _dmx_update_loop(self):
+    def _dmx_tick(self):
         """
-        DMX update loop running in a separate thread.
+        One DMX frame, called by the output scheduler on its own thread.
 
         This runs independently of Qt's event loop, ensuring consistent
         DMX output timing even when the UI is slow.
         """
-        while not self._stop_thread.is_set():
-            start_time = time.perf_counter()
+        try:
+            self._update_and_send_dmx()
+        except Exception as e:
+            if DEBUG_PRINTS:
+                print(f"DMX update error: {e}")
 
-            try:
-                self._update_and_send_dmx()
-            except Exception as e:
-                if DEBUG_PRINTS:
-                    print(f"DMX update error: {e}")
-
-            # Calculate sleep time to maintain consistent interval
-            elapsed = time.perf_counter() - start_time
-            sleep_time = max(0, self._update_interval - elapsed)
-            if sleep_time > 0:
-                time.sleep(sleep_time)
-
-    def start_playback(self):
-        """Start ArtNet output during playback."""
-        if self.output_enabled:
-            self._start_dmx_thread()
-            print("ArtNet output started")
+    def set_output_rate(self, rate_hz: float):
+        """
+        Set the DMX frame rate (default 30Hz).
+
+        ArtNet stays limited to 44Hz per universe; higher rates only speed
+        up universes sent via sACN.
+
+        Args:
+            rate_hz: Frames per second
+        """
+        self._scheduler.set_rate(rate_hz)
+        self.sacn_sender.set_max_rate(max(self._scheduler.rate_hz, SACNSender.MAX_SEND_RATE_HZ))
+
+    def output_stats(self) -> SchedulerStats:
+        """Frame timing statistics (jitter, late frames) since playback started."""
+        return self._scheduler.stats()
+
+    def start_playback(self) -> bool:
+        """
+        Start ArtNet output during playback.
+
+        Returns:
+            False if output is enabled but the DMX thread could not start
+        """
+        if not self.output_enabled:
+            return True
+        if not self._start_dmx_thread():
+            print("ArtNet output not started: previous DMX thread is still running")
+            return False
+        print("ArtNet output started")
+        return True
 
     def stop_playback(self):
         """Stop ArtNet output and reset fixtures to visible state."""
@@ -256,6 +304,7 @@ class ShowsArtNetController(QObject):
             self._send_all_universes()
         # Clear both controller and DMX manager block tracking
         self.active_block_ids.clear()
+        self._block_cursors.clear()
         self.dmx_manager.clear_active_blocks()
         print("ArtNet output stopped - fixtures reset to visible")
 
@@ -348,80 +397,40 @@ class ShowsArtNetController(QObject):
                     'special': set()
                 }
 
-            # Track which blocks are currently active
-            currently_active = {
-                'dimmer': set(),
-                'colour': set(),
-                'movement': set(),
-                'special': set()
-            }
-
-            # Process all light blocks in the lane
-            for light_block in lane.light_blocks:
-                # Check dimmer blocks
-                for dimmer_block in light_block.dimmer_blocks:
-                    block_id = id(dimmer_block)
-                    if dimmer_block.start_time <= self.current_time < dimmer_block.end_time:
-                        currently_active['dimmer'].add(block_id)
-
-                        # Start block if not already active
-                        if block_id not in self.active_block_ids[lane_key]['dimmer']:
-                            if DEBUG_PRINTS:
-                                fixture_names = [f.name for f in resolved_fixtures]
-                                print(f"[{self.current_time:.2f}s] Starting {dimmer_block.effect_type} on {fixture_names} ({dimmer_block.start_time:.2f}s-{dimmer_block.end_time:.2f}s)")
-                            self.dmx_manager.block_started(lane_key, resolved_fixtures, dimmer_block, 'dimmer', self.current_time)
-                            self.active_block_ids[lane_key]['dimmer'].add(block_id)
-
-                # Check colour blocks
-                for colour_block in light_block.colour_blocks:
-                    block_id = id(colour_block)
-                    if colour_block.start_time <= self.current_time < colour_block.end_time:
-                        currently_active['colour'].add(block_id)
-
-                        if block_id not in self.active_block_ids[lane_key]['colour']:
-                            self.dmx_manager.block_started(lane_key, resolved_fixtures, colour_block, 'colour', self.current_time)
-                            self.active_block_ids[lane_key]['colour'].add(block_id)
-
-                # Check movement blocks
-                for movement_block in light_block.movement_blocks:
-                    block_id = id(movement_block)
-                    if movement_block.start_time <= self.current_time < movement_block.end_time:
-                        currently_active['movement'].add(block_id)
-
-                        if block_id not in self.active_block_ids[lane_key]['movement']:
-                            self.dmx_manager.block_started(lane_key, resolved_fixtures, movement_block, 'movement', self.current_time)
-                            self.active_block_ids[lane_key]['movement'].add(block_id)
-
-                # Check special blocks
-                for special_block in light_block.special_blocks:
-                    block_id = id(special_block)
-                    if special_block.start_time <= self.current_time < special_block.end_time:
-                        currently_active['special'].add(block_id)
-
-                        if block_id not in self.active_block_ids[lane_key]['special']:
-                            self.dmx_manager.block_started(lane_key, resolved_fixtures, special_block, 'special', self.current_time)
-                            self.active_block_ids[lane_key]['special'].add(block_id)
-
-            # End blocks that are no longer active (granular ending per sublane type)
-            for sublane_type in ['dimmer', 'colour', 'movement', 'special']:
-                ended_blocks = self.active_block_ids[lane_key][sublane_type] - currently_active[sublane_type]
-                if ended_blocks:
-                    # Only clear the sublane if there are NO currently active blocks
-                    # If there are active blocks, they will maintain the state
-                    if not currently_active[sublane_type]:
-                        # No active blocks remaining, clear the sublane
-                        if DEBUG_PRINTS:
-                            fixture_names = [f.name for f in resolved_fixtures]
-                            print(f"[{self.current_time:.2f}s] Ending {sublane_type} blocks on {fixture_names}")
-                        self.dmx_manager.block_ended(lane_key, sublane_type)
-                    # Always update tracking to reflect current active blocks
-                    self.active_block_ids[lane_key][sublane_type] = currently_active[sublane_type]
+            # Advance the lane's block cursor - only blocks entering or
+            # leaving since the last tick are touched
+            cursor = self._get_block_cursor(lane)
+            cursor.advance(self.current_time)
+            lane_tracking = self.active_block_ids[lane_key]
+
+            for sublane_type in SUBLANE_TYPES:
+                previous_ids = lane_tracking[sublane_type]
+
+                # Start blocks that just became active (lane order keeps LTP)
+                for block in cursor.entered(sublane_type, previous_ids):
+                    if DEBUG_PRINTS:
+                        fixture_names = [f.name for f in resolved_fixtures]
+                        print(f"[{self.current_time:.2f}s] Starting {sublane_type} block on {fixture_names} ({block.start_time:.2f}s-{block.end_time:.2f}s)")
+                    self.dmx_manager.block_started(lane_key, resolved_fixtures, block, sublane_type, self.current_time)
+
+                # End blocks that are no longer active (granular ending per sublane type)
+                # Only clear the sublane if there are NO currently active blocks
+                # If there are active blocks, they will maintain the state
+                currently_active = cursor.active[sublane_type]
+                if previous_ids and not currently_active:
+                    if DEBUG_PRINTS:
+                        fixture_names = [f.name for f in resolved_fixtures]
+                        print(f"[{self.current_time:.2f}s] Ending {sublane_type} blocks on {fixture_names}")
+                    self.dmx_manager.block_ended(lane_key, sublane_type)
+
+                # Always update tracking to reflect current active blocks
+                lane_tracking[sublane_type] = set(currently_active)
 
     def _update_and_send_dmx(self):
         """
         Update DMX state and send via ArtNet.
 
-        Called periodically by update_timer at ~44Hz.
+        Called by the output scheduler once per frame.
         """
         if not self.output_enabled:
             return
@@ -440,11 +449,26 @@ class ShowsArtNetController(QObject):
         # Update DMX state based on current time and active blocks
         self.dmx_manager.update_dmx(self.current_time)
 
-        # Send DMX for all universes
-        self._send_all_universes()
+        # Send DMX for universes that changed (plus keep-alive resends)
+        self._send_all_universes(only_changed=True)
 
-    def _send_all_universes(self):
-        """Send DMX data for all configured universes."""
+    def set_keepalive_interval(self, seconds: float):
+        """
+        Set how often unchanged universes are resent during playback.
+
+        Args:
+            seconds: Keep-alive interval in seconds (0 = resend every frame)
+        """
+        self.keepalive_interval = max(0.0, seconds)
+
+    def _send_all_universes(self, only_changed: bool = False):
+        """
+        Send DMX data for all configured universes.
+
+        Args:
+            only_changed: If True, skip universes whose data is unchanged since
+                the last send unless the keep-alive interval has elapsed
+        """
         # Debug: Check universe 2 data once around 137s
         if DEBUG_PRINTS and 137.0 < self.current_time < 137.5 and not hasattr(self, '_debug_universe2_sent'):
             self._debug_universe2_sent = True
@@ -458,11 +482,30 @@ class ShowsArtNetController(QObject):
                 print(f"  Universe {universe_int}: {non_zero} non-zero bytes, first 12: {first_12}")
             print("=== END UNIVERSE 2 DEBUG ===\n")
 
+        now = time.monotonic()
+        frame = []
         for universe_id in self.config.universes.keys():
             # Ensure universe_id is int (YAML may load as string)
             universe_int = int(universe_id)
-            dmx_data = self.dmx_manager.get_dmx_data(universe_int)
-            self.artnet_sender.send_dmx(universe_int - 1, dmx_data)  # Convert 1-based internal to 0-based ArtNet
+            if (only_changed and not self.dmx_manager.is_universe_dirty(universe_int)
+                    and now - self._last_universe_send.get(universe_int, 0.0) < self.keepalive_interval):
+                continue
+            frame.append((universe_int, self.dmx_manager.get_dmx_data(universe_int)))
+        if not frame:
+            return
+
+        # All universes of the frame go out in one batch, followed by ArtSync
+        # when the show spans several universes.
+        # Convert 1-based internal to 0-based ArtNet
+        sync = self.artsync_enabled and len(self.config.universes) > 1
+        sent = set(self.artnet_sender.send_frame([(u - 1, data) for u, data in frame], sync=sync))
+        self._send_sacn(frame)
+
+        for universe_int, dmx_data in frame:
+            if universe_int - 1 in sent:
+                # A rate-limited send stays dirty and is retried next frame
+                self.dmx_manager.mark_universe_sent(universe_int)
+                self._last_universe_send[universe_int] = now
             # Forward the same frame to the in-process visualizer if one
             # is wired up. Wrap in try/except so a misbehaving callback
             # can't kill the DMX thread mid-show.
@@ -473,12 +516,43 @@ class ShowsArtNetController(QObject):
                     if DEBUG_PRINTS:
                         print(f"local_dmx_callback raised: {e}")
 
+        if self._dmx_stream_callback is not None:
+            stream_frame = self._dmx_stream_encoder.encode(frame)
+            if stream_frame is not None:
+                try:
+                    self._dmx_stream_callback(stream_frame)
+                except Exception as e:
+                    if DEBUG_PRINTS:
+                        print(f"dmx_stream_callback raised: {e}")
+
+    def _send_sacn(self, frame: List[Tuple[int, bytes]]):
+        """Send the E1.31 universes of a frame via sACN (keyed by config universe id)."""
+        sacn_universes = set(self.sacn_sender.configure_from_config(self.config.universes))
+        if sacn_universes:
+            self.sacn_sender.send_frame([(u, data) for u, data in frame if u in sacn_universes])
+
     def set_local_dmx_callback(
         self, callback: Optional[Callable[[int, bytes], None]]
     ) -> None:
         """Update or clear the embedded-visualizer DMX callback after init."""
         self._local_dmx_callback = callback
 
+    def set_dmx_stream_callback(self, callback: Optional[Callable[[bytes], None]]) -> None:
+        """
+        Set or clear the DMX stream callback.
+
+        The callback receives each output frame as a delta-compressed binary
+        frame (utils.dmx_stream) holding only changed channel ranges, with a
+        keyframe every second. It replaces the per-universe
+        local_dmx_callback for visualizers that decode the stream.
+        """
+        self._dmx_stream_callback = callback
+        self._dmx_stream_encoder.request_keyframe()
+
+    def request_dmx_keyframe(self) -> None:
+        """Make the next stream frame a keyframe (e.g. a visualizer just connected)."""
+        self._dmx_stream_encoder.request_keyframe()
+
     def set_target_ip(self, ip: str):
         """
         Set target IP address for ArtNet packets.
@@ -495,4 +569,5 @@ class ShowsArtNetController(QObject):
         self.dmx_manager.clear_all_dmx()
         self._send_all_universes()
         self.artnet_sender.close()
+        self.sacn_sender.close()
         print("ShowsArtNet Controller cleaned up")
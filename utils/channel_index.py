@@ -0,0 +1,143 @@
+# utils/channel_index.py
+# Precompiled per-mode channel lookup tables for fixture definitions
+
+from typing import Dict, List, Iterable, Optional, Tuple
+
+# (manufacturer, model, mode_name) -> (fixture_def the index was built from, index)
+_index_cache: Dict[Tuple[Optional[str], Optional[str], str], Tuple[dict, 'ChannelIndex']] = {}
+
+
+class ChannelIndex:
+    """
+    Channel lookup table for one fixture definition mode.
+
+    Walks the mode's channels once and records every channel under its
+    preset, its group and the presets of its capabilities, so later lookups
+    are dict accesses instead of scans over the definition.
+    """
+
+    def __init__(self, fixture_def: dict, mode_name: str):
+        """
+        Args:
+            fixture_def: Dictionary containing fixture definition
+            mode_name: Name of the mode to index
+        """
+        self.mode_name = mode_name
+        self.mode = next((m for m in fixture_def.get('modes', []) if m['name'] == mode_name), None)
+        self.channel_count = len(self.mode.get('channels', [])) if self.mode else 0
+
+        # Property -> entries in the order get_channels_by_property produces them
+        self._entries: Dict[str, List[dict]] = {}
+
+        # Same entries split by where the property matched, as channel numbers
+        self.preset_channels: Dict[str, List[int]] = {}
+        self.group_channels: Dict[str, List[int]] = {}
+        self.capability_channels: Dict[str, List[int]] = {}
+
+        # Channel number -> channel definition
+        self.channel_defs: Dict[int, dict] = {}
+
+        # Memoized lookup() results per property tuple
+        self._lookups: Dict[Tuple[str, ...], Dict[str, List[dict]]] = {}
+
+        if not self.mode:
+            return
+
+        # First definition wins when names repeat, as with a linear search
+        defs_by_name: Dict[str, dict] = {}
+        for channel_def in fixture_def.get('channels', []):
+            defs_by_name.setdefault(channel_def['name'], channel_def)
+
+        for channel_mapping in self.mode['channels']:
+            channel_number = channel_mapping['number']
+            channel_def = defs_by_name.get(channel_mapping['name'])
+            if not channel_def:
+                continue
+            self.channel_defs[channel_number] = channel_def
+
+            preset = channel_def.get('preset')
+            if preset is not None:
+                self._add(preset, {'channel': channel_number})
+                self.preset_channels.setdefault(preset, []).append(channel_number)
+
+            group = channel_def.get('group')
+            if group is not None:
+                self._add(group, {'channel': channel_number})
+                self.group_channels.setdefault(group, []).append(channel_number)
+
+            for capability in channel_def.get('capabilities', []):
+                cap_preset = capability.get('preset')
+                if cap_preset is not None:
+                    self._add(cap_preset, {
+                        'channel': channel_number,
+                        'min': capability.get('min'),
+                        'max': capability.get('max')
+                    })
+                    self.capability_channels.setdefault(cap_preset, []).append(channel_number)
+
+    def _add(self, prop: str, entry: dict):
+        self._entries.setdefault(prop, []).append(entry)
+
+    def __contains__(self, prop: str) -> bool:
+        return prop in self._entries
+
+    def lookup(self, properties: Iterable[str]) -> Dict[str, List[dict]]:
+        """
+        Channels matching any of the given properties.
+
+        Returns the same structure (and key order) as get_channels_by_property:
+        property -> list of {'channel': n} dicts, with 'min'/'max' for
+        capability matches. The result is memoized per property list and
+        shared between callers, so treat it as read-only.
+        """
+        key = tuple(properties)
+        result = self._lookups.get(key)
+        if result is None:
+            wanted = set(key)
+            result = {prop: entries for prop, entries in self._entries.items() if prop in wanted}
+            self._lookups[key] = result
+        return result
+
+    def channel_numbers(self, properties: Iterable[str]) -> Dict[str, List[int]]:
+        """Like lookup() but with plain channel numbers per property."""
+        wanted = set(properties)
+        return {prop: [e['channel'] for e in entries]
+                for prop, entries in self._entries.items() if prop in wanted}
+
+    def offsets(self, properties: Iterable[str]) -> List[int]:
+        """Channel numbers for the given properties, in the order the properties are listed."""
+        offsets = []
+        for prop in properties:
+            for entry in self._entries.get(prop, ()):
+                offsets.append(entry['channel'])
+        return offsets
+
+
+def get_channel_index(fixture_def: dict, mode_name: str) -> ChannelIndex:
+    """
+    Get the cached ChannelIndex for a fixture definition mode.
+
+    Indexes are keyed by (manufacturer, model, mode) and rebuilt if a
+    different definition object is passed for the same key (e.g. after the
+    definitions were reloaded).
+
+    Args:
+        fixture_def: Dictionary containing fixture definition
+        mode_name: Name of the mode
+
+    Returns:
+        ChannelIndex for the mode (empty if the mode does not exist)
+    """
+    key = (fixture_def.get('manufacturer'), fixture_def.get('model'), mode_name)
+    cached = _index_cache.get(key)
+    if cached is not None and cached[0] is fixture_def:
+        return cached[1]
+
+    index = ChannelIndex(fixture_def, mode_name)
+    _index_cache[key] = (fixture_def, index)
+    return index
+
+
+def clear_channel_index_cache():
+    """Drop all cached channel indexes."""
+    _index_cache.clear()
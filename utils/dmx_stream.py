@@ -0,0 +1,178 @@
+# utils/dmx_stream.py
+# Delta-compressed binary DMX frame stream for the visualizers
+
+"""
+The embedded and standalone visualizers used to receive every universe as a
+full 512-byte buffer each frame and re-apply it to every fixture. On a
+mostly static rig almost none of those bytes change.
+
+DMXStreamEncoder turns the controller's per-frame universe data into one
+binary frame holding only the changed channel ranges of each universe, with
+a keyframe (all universes, full range) at a fixed interval so late joiners
+and receivers that missed a frame resynchronise. DMXStreamDecoder keeps
+the receiver's universe buffers and reports which ranges each frame touched,
+so consumers only update fixtures whose channels changed.
+
+Frame layout (little-endian):
+    header   "QDMX", version u8, flags u8 (bit 0: keyframe),
+             universe count u16, sequence u32
+    universe id u16, range count u16
+    range    start u16, length u16, <length> bytes
+"""
+
+import struct
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+STREAM_MAGIC = b'QDMX'
+STREAM_VERSION = 1
+FLAG_KEYFRAME = 0x01
+DMX_LENGTH = 512
+
+_HEADER = struct.Struct('<4sBBHI')
+_UNIVERSE = struct.Struct('<HH')
+_RANGE = struct.Struct('<HH')
+
+# Unchanged bytes bridged between two changed runs rather than starting a new
+# range (a range header costs 4 bytes)
+_MERGE_GAP = _RANGE.size
+
+
+def changed_ranges(old: np.ndarray, new: np.ndarray) -> List[Tuple[int, int]]:
+    """[start, end) channel ranges where new differs from old."""
+    changed = np.flatnonzero(old != new)
+    if changed.size == 0:
+        return []
+    breaks = np.flatnonzero(np.diff(changed) > _MERGE_GAP + 1)
+    starts = changed[np.concatenate(([0], breaks + 1))]
+    ends = changed[np.concatenate((breaks, [changed.size - 1]))] + 1
+    return list(zip(starts.tolist(), ends.tolist()))
+
+
+class DMXStreamEncoder:
+    """Encodes successive DMX frames as delta frames with periodic keyframes."""
+
+    def __init__(self, keyframe_interval: float = 1.0):
+        """
+        Args:
+            keyframe_interval: Seconds between keyframes
+        """
+        self.keyframe_interval = keyframe_interval
+        self._buffers: Dict[int, np.ndarray] = {}
+        self._sequence = 0
+        self._last_keyframe: Optional[float] = None
+
+    def request_keyframe(self):
+        """Make the next encode() emit a keyframe (e.g. a receiver just connected)."""
+        self._last_keyframe = None
+
+    def encode(self, frame: Iterable[Tuple[int, bytes]], now: Optional[float] = None) -> Optional[bytes]:
+        """
+        Encode one frame.
+
+        Args:
+            frame: (universe, dmx_data) pairs; universes not in the frame
+                keep their last value
+            now: Monotonic timestamp (default: time.monotonic())
+
+        Returns:
+            The binary frame, or None if nothing changed and no keyframe is due
+        """
+        if now is None:
+            now = time.monotonic()
+        keyframe = self._last_keyframe is None or now - self._last_keyframe >= self.keyframe_interval
+
+        changes: Dict[int, List[Tuple[int, int]]] = {}
+        for universe, dmx_data in frame:
+            new = np.zeros(DMX_LENGTH, dtype=np.uint8)
+            length = min(len(dmx_data), DMX_LENGTH)
+            new[:length] = np.frombuffer(dmx_data, dtype=np.uint8, count=length)
+            old = self._buffers.get(universe)
+            self._buffers[universe] = new
+            if old is None:
+                changes[universe] = [(0, DMX_LENGTH)]
+            else:
+                ranges = changed_ranges(old, new)
+                if ranges:
+                    changes[universe] = ranges
+
+        if keyframe:
+            self._last_keyframe = now
+            changes = {universe: [(0, DMX_LENGTH)] for universe in self._buffers}
+        elif not changes:
+            return None
+
+        parts = [_HEADER.pack(STREAM_MAGIC, STREAM_VERSION, FLAG_KEYFRAME if keyframe else 0,
+                              len(changes), self._sequence)]
+        for universe, ranges in changes.items():
+            buffer = self._buffers[universe]
+            parts.append(_UNIVERSE.pack(universe, len(ranges)))
+            for start, end in ranges:
+                parts.append(_RANGE.pack(start, end - start))
+                parts.append(buffer[start:end].tobytes())
+        self._sequence = (self._sequence + 1) & 0xFFFFFFFF
+        return b''.join(parts)
+
+
+class DMXStreamDecoder:
+    """Applies stream frames to per-universe buffers."""
+
+    def __init__(self):
+        self.buffers: Dict[int, bytearray] = {}
+        self._expected_sequence: Optional[int] = None
+        # Delta frames ignored while waiting for a keyframe after a gap
+        self.dropped_frames = 0
+
+    def decode(self, payload: bytes) -> List[Tuple[int, bytearray, List[Tuple[int, int]]]]:
+        """
+        Apply one frame.
+
+        Returns:
+            (universe, buffer, changed [start, end) ranges) per universe the
+            frame touched. The buffers are updated in place and reused.
+
+        Raises:
+            ValueError: If the payload is not a valid stream frame
+        """
+        view = memoryview(payload)
+        if len(view) < _HEADER.size:
+            raise ValueError("DMX stream frame too short")
+        magic, version, flags, universe_count, sequence = _HEADER.unpack_from(view, 0)
+        if magic != STREAM_MAGIC or version != STREAM_VERSION:
+            raise ValueError(f"Not a DMX stream frame (magic {magic!r}, version {version})")
+
+        keyframe = bool(flags & FLAG_KEYFRAME)
+        if not keyframe and sequence != self._expected_sequence:
+            # Missed a frame (or joined mid-stream): deltas no longer apply
+            self._expected_sequence = None
+            self.dropped_frames += 1
+            return []
+        self._expected_sequence = (sequence + 1) & 0xFFFFFFFF
+
+        changes = []
+        offset = _HEADER.size
+        try:
+            for _ in range(universe_count):
+                universe, range_count = _UNIVERSE.unpack_from(view, offset)
+                offset += _UNIVERSE.size
+                buffer = self.buffers.get(universe)
+                if buffer is None:
+                    buffer = self.buffers[universe] = bytearray(DMX_LENGTH)
+                ranges = []
+                for _ in range(range_count):
+                    start, length = _RANGE.unpack_from(view, offset)
+                    offset += _RANGE.size
+                    end = start + length
+                    if end > DMX_LENGTH or offset + length > len(view):
+                        raise ValueError(f"Bad range {start}+{length} in universe {universe}")
+                    buffer[start:end] = view[offset:offset + length]
+                    offset += length
+                    ranges.append((start, end))
+                changes.append((universe, buffer, ranges))
+        except (struct.error, ValueError) as e:
+            # Buffers may be half-applied: wait for the next keyframe
+            self._expected_sequence = None
+            raise ValueError(f"Corrupt DMX stream frame: {e}") from e
+        return changes
@@ -1,3 +1,6 @@
+from utils.channel_index import get_channel_index
+
+
 def get_channels_by_property(fixture_def, mode_name, properties):
     """
     Extracts channels with specific properties from a fixture definition
@@ -8,53 +11,9 @@ def get_channels_by_property(fixture_def, mode_name, properties):
     Returns:
         dict: Dictionary of channel numbers by property
     """
-    channels = {}
-
-    # Find the specified mode from modes list
-    mode = next((m for m in fixture_def['modes'] if m['name'] == mode_name), None)
-
-    if not mode:
-        return channels
-
-    # For each channel in the mode
-    for channel_mapping in mode['channels']:
-        channel_number = channel_mapping['number']
-        channel_name = channel_mapping['name']
-
-        # Find the channel definition
-        channel_def = next((ch for ch in fixture_def['channels'] if ch['name'] == channel_name), None)
-
-        if not channel_def:
-            continue
-
-        # Check preset property
-        if channel_def.get('preset') in properties:
-            if channel_def['preset'] not in channels:
-                channels[channel_def['preset']] = []
-            channels[channel_def['preset']].append({
-                'channel': channel_number
-            })
-
-        # Check group property
-        if channel_def.get('group') in properties:
-            if channel_def['group'] not in channels:
-                channels[channel_def['group']] = []
-            channels[channel_def['group']].append({
-                'channel': channel_number
-            })
-
-        # Check capabilities for properties
-        for capability in channel_def.get('capabilities', []):
-            if capability.get('preset') in properties:
-                if capability['preset'] not in channels:
-                    channels[capability['preset']] = []
-                channels[capability['preset']].append({
-                    'channel': channel_number,
-                    'min': capability.get('min'),
-                    'max': capability.get('max')
-                })
-
-    return channels
+    # Served from the cached per-mode index; copy so callers may modify the result
+    shared = get_channel_index(fixture_def, mode_name).lookup(properties)
+    return {prop: list(entries) for prop, entries in shared.items()}
 
 
 def find_closest_color_dmx(channels_dict, hex_color, fixture_def=None):
@@ -25,6 +25,8 @@ from dataclasses import dataclass, field
 from enum import Enum
 from typing import Dict, List, Optional, Tuple
 
+from utils.fixture_db import get_fixture_database
+
 
 QLC_NS = {'': 'http://www.qlcplus.org/FixtureDefinition'}
 
@@ -1231,22 +1233,12 @@ def _find_and_parse_qxf(manufacturer: str, model: str) -> Optional[ET.Element]:
         search_dirs.append(os.path.expanduser('~/Library/Application Support/QLC+/Fixtures'))
         search_dirs.append('/Applications/QLC+.app/Contents/Resources/Fixtures')
 
-    for dir_path in search_dirs:
-        if not os.path.exists(dir_path):
-            continue
-        for entry in os.listdir(dir_path):
-            entry_path = os.path.join(dir_path, entry)
-            if entry.endswith('.qxf') and os.path.isfile(entry_path):
-                root = _try_parse_qxf_match(entry_path, manufacturer, model)
-                if root is not None:
-                    return root
-            elif os.path.isdir(entry_path):
-                for fname in os.listdir(entry_path):
-                    if fname.endswith('.qxf'):
-                        root = _try_parse_qxf_match(os.path.join(entry_path, fname), manufacturer, model)
-                        if root is not None:
-                            return root
-    return None
+    # The compiled fixture database resolves manufacturer/model to a file
+    # without parsing every QXF; only the matching file is parsed here
+    record = get_fixture_database().find(search_dirs, manufacturer, model)
+    if record is None:
+        return None
+    return _try_parse_qxf_match(record.path, manufacturer, model)
 
 
 def _try_parse_qxf_match(
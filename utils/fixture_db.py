@@ -0,0 +1,291 @@
+# utils/fixture_db.py
+# Persistent compiled cache of QLC+ fixture definition (.qxf) files
+
+"""
+Every consumer of QLC+ fixture files (export definitions, capability
+detection, the visualizer protocol, the fixture browser scan) used to walk
+the fixture directories and parse each .qxf with ElementTree just to read
+its manufacturer and model. A stock QLC+ install ships thousands of files,
+so this dominated cold start and the first export.
+
+FixtureDatabase parses each file once into a QxfRecord holding everything
+those consumers need and keeps the records in a pickle under
+``~/.qlcautoshow``. Records are keyed by path and reused while the file's
+mtime and size are unchanged. Consumers keep their own directory lists and
+first/last-match rules and only swap the parsing for record lookups.
+"""
+
+import os
+import pickle
+import xml.etree.ElementTree as ET
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Optional, Tuple
+
+QXF_NAMESPACE = 'http://www.qlcplus.org/FixtureDefinition'
+_NS = {'': QXF_NAMESPACE}
+
+# Bump when QxfRecord or the compiled definition format changes
+_DB_VERSION = 1
+_DEFAULT_DB_PATH = os.path.join(os.path.expanduser("~"), ".qlcautoshow", "fixture_db.pickle")
+
+# Color name to RGB mapping for capabilities that only name their colour
+_COLOR_NAME_TO_RGB = {
+    "White": "#FFFFFF",
+    "Red": "#FF0000",
+    "Green": "#00FF00",
+    "Blue": "#0000FF",
+    "Cyan": "#00FFFF",
+    "Magenta": "#FF00FF",
+    "Yellow": "#FFFF00",
+    "Amber": "#FFBF00",
+    "Orange": "#FF7F00",
+    "Purple": "#7F00FF",
+    "Pink": "#FF007F",
+    "UV": "#8000FF",
+    "Lime": "#BFFF00"
+}
+
+
+@dataclass
+class QxfRecord:
+    """Compiled contents of one .qxf file."""
+    path: str
+    manufacturer: Optional[str] = None
+    model: Optional[str] = None
+    # Channels/modes dict as returned by load_fixture_definitions_from_qlc
+    definition: Optional[dict] = None
+    # [{'name': mode name, 'channels': channel count}] for the fixture browser
+    modes: Optional[List[dict]] = None
+    # determine_fixture_type() result
+    fixture_type: Optional[str] = None
+    # <Physical><Layout> as {'width', 'height'}
+    layout: Optional[Dict[str, int]] = None
+    # Set when the file could not be parsed (or partly compiled)
+    error: Optional[str] = None
+
+
+def iter_qxf_files(dirs: List[str]) -> Iterator[str]:
+    """
+    Yield .qxf paths in the order the fixture scanners have always used:
+    per directory, top-level .qxf files and manufacturer subdirectories in
+    os.listdir() order.
+    """
+    for dir_path in dirs:
+        if not os.path.exists(dir_path):
+            continue
+        for item in os.listdir(dir_path):
+            item_path = os.path.join(dir_path, item)
+            if item.endswith('.qxf') and os.path.isfile(item_path):
+                yield item_path
+            elif os.path.isdir(item_path):
+                for fixture_file in os.listdir(item_path):
+                    if fixture_file.endswith('.qxf'):
+                        yield os.path.join(item_path, fixture_file)
+
+
+def _find_element(parent, tag):
+    """Find element with or without namespace."""
+    elem = parent.find(tag, _NS)
+    if elem is None:
+        elem = parent.find(tag)
+    return elem
+
+
+def _compile_definition(root: ET.Element, manufacturer: str, model: str) -> dict:
+    """Channels and modes in the format the export and DMX code consume."""
+    channels_info = []
+    for channel in root.findall('.//Channel', _NS):
+        channel_data = {
+            'name': channel.get('Name'),
+            'preset': channel.get('Preset'),
+            'group': channel.find('Group', _NS).text if channel.find('Group', _NS) is not None else None,
+            'capabilities': []
+        }
+
+        for capability in channel.findall('Capability', _NS):
+            cap_data = {
+                'min': int(capability.get('Min')),
+                'max': int(capability.get('Max')),
+                'preset': capability.get('Preset'),
+                'name': capability.text
+            }
+
+            # Extract color information if present
+            if capability.get('Color1') or capability.get('Color2'):
+                cap_data['color'] = capability.get('Color1')
+            elif capability.get('Res1'):
+                cap_data['color'] = capability.get('Res1')
+            elif capability.text and any(color in capability.text for color in _COLOR_NAME_TO_RGB):
+                for color_name, hex_value in _COLOR_NAME_TO_RGB.items():
+                    if color_name.lower() in capability.text.lower():
+                        cap_data['color'] = hex_value
+                        break
+
+            channel_data['capabilities'].append(cap_data)
+
+        channels_info.append(channel_data)
+
+    modes_info = []
+    for mode in root.findall('.//Mode', _NS):
+        mode_data = {
+            'name': mode.get('Name'),
+            'channels': []
+        }
+        for channel in mode.findall('Channel', _NS):
+            mode_data['channels'].append({
+                'number': int(channel.get('Number')),
+                'name': channel.text
+            })
+        modes_info.append(mode_data)
+
+    return {
+        'manufacturer': manufacturer,
+        'model': model,
+        'channels': channels_info,
+        'modes': modes_info
+    }
+
+
+def compile_qxf(path: str) -> QxfRecord:
+    """Parse one .qxf file into a QxfRecord. Never raises."""
+    from utils.fixture_utils import determine_fixture_type
+
+    record = QxfRecord(path=path)
+    try:
+        root = ET.parse(path).getroot()
+    except (ET.ParseError, OSError) as e:
+        record.error = str(e)
+        print(f"Error parsing fixture file {path}: {e}")
+        return record
+
+    manufacturer_elem = _find_element(root, './/Manufacturer')
+    model_elem = _find_element(root, './/Model')
+    record.manufacturer = manufacturer_elem.text if manufacturer_elem is not None else None
+    record.model = model_elem.text if model_elem is not None else None
+
+    layout = {'width': 1, 'height': 1}
+    physical = _find_element(root, './/Physical')
+    if physical is not None:
+        layout_elem = _find_element(physical, 'Layout')
+        if layout_elem is not None:
+            try:
+                layout = {'width': int(layout_elem.get('Width', 1)),
+                          'height': int(layout_elem.get('Height', 1))}
+            except ValueError:
+                pass
+    record.layout = layout
+
+    # The definition/mode parsers only ever read namespaced files
+    if root.find('.//Manufacturer', _NS) is None or record.model is None:
+        return record
+
+    try:
+        record.definition = _compile_definition(root, record.manufacturer, record.model)
+        record.fixture_type = determine_fixture_type(root)
+        record.modes = [{'name': mode.get('Name'), 'channels': len(mode.findall('Channel', _NS))}
+                        for mode in root.findall('.//Mode', _NS)]
+    except Exception as e:
+        record.error = str(e)
+        print(f"Error processing fixture file {path}: {e}")
+
+    return record
+
+
+class FixtureDatabase:
+    """On-disk cache of compiled QxfRecords, keyed by path + mtime + size."""
+
+    def __init__(self, db_path: Optional[str] = _DEFAULT_DB_PATH):
+        """
+        Args:
+            db_path: Pickle file to persist records in (None keeps them in memory only)
+        """
+        self.db_path = db_path
+        # path -> ((mtime_ns, size), record)
+        self._entries: Dict[str, Tuple[Tuple[int, int], QxfRecord]] = {}
+        self._dirty = False
+        self._load()
+
+    def _load(self):
+        if not self.db_path or not os.path.exists(self.db_path):
+            return
+        try:
+            with open(self.db_path, 'rb') as f:
+                data = pickle.load(f)
+            if data.get('version') == _DB_VERSION:
+                self._entries = data['entries']
+        except Exception as e:
+            print(f"Ignoring unreadable fixture cache {self.db_path}: {e}")
+
+    def save(self):
+        """Write the records to disk if anything changed since the last save."""
+        if not self._dirty or not self.db_path:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+            # Per-process temp name: export workers may rebuild the cache at the same time
+            tmp_path = f"{self.db_path}.{os.getpid()}.tmp"
+            try:
+                with open(tmp_path, 'wb') as f:
+                    pickle.dump({'version': _DB_VERSION, 'entries': self._entries}, f,
+                                protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp_path, self.db_path)
+            except OSError:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                raise
+            self._dirty = False
+        except OSError as e:
+            print(f"Error saving fixture cache {self.db_path}: {e}")
+
+    def record(self, path: str) -> Optional[QxfRecord]:
+        """Compiled record for one file, recompiled if it changed on disk."""
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        stamp = (st.st_mtime_ns, st.st_size)
+        entry = self._entries.get(path)
+        if entry is not None and entry[0] == stamp:
+            return entry[1]
+        record = compile_qxf(path)
+        self._entries[path] = (stamp, record)
+        self._dirty = True
+        return record
+
+    def records(self, dirs: List[str]) -> List[QxfRecord]:
+        """Records for every .qxf under dirs, in scan order. Persists new compilations."""
+        records = []
+        for path in iter_qxf_files(dirs):
+            record = self.record(path)
+            if record is not None:
+                records.append(record)
+        self.save()
+        return records
+
+    def find(self, dirs: List[str], manufacturer: str, model: str) -> Optional[QxfRecord]:
+        """First record in scan order matching manufacturer and model."""
+        match = None
+        for path in iter_qxf_files(dirs):
+            record = self.record(path)
+            if record is not None and record.manufacturer == manufacturer and record.model == model:
+                match = record
+                break
+        self.save()
+        return match
+
+
+_database: Optional[FixtureDatabase] = None
+
+
+def get_fixture_database() -> FixtureDatabase:
+    """Process-wide FixtureDatabase backed by the default cache file."""
+    global _database
+    if _database is None:
+        _database = FixtureDatabase()
+    return _database
+
+
+def set_fixture_database(database: Optional[FixtureDatabase]):
+    """Replace the process-wide database (None: reload from the default file on next use)."""
+    global _database
+    _database = database
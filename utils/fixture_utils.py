@@ -1,6 +1,7 @@
+import copy
 import os
 import sys
-import xml.etree.ElementTree as ET
+from utils.fixture_db import get_fixture_database
 
 # Module-level cache for fixture definitions to avoid repeated file system scans
 _fixture_definitions_cache = {}
@@ -56,7 +57,6 @@ def load_fixture_definitions_from_qlc(models_in_config, use_cache=True):
         dict: Dictionary of fixture definitions
     """
     fixture_definitions = {}
-    ns = {'': 'http://www.qlcplus.org/FixtureDefinition'}
 
     # Get QLC+ fixture directories based on OS
     qlc_fixture_dirs = []
@@ -89,115 +89,12 @@ def load_fixture_definitions_from_qlc(models_in_config, use_cache=True):
         # System fixtures: /Applications/QLC+.app/Contents/Resources/Fixtures
         qlc_fixture_dirs.append('/Applications/QLC+.app/Contents/Resources/Fixtures')
 
-    # Color name to RGB mapping for standard colors
-    color_name_to_rgb = {
-        "White": "#FFFFFF",
-        "Red": "#FF0000",
-        "Green": "#00FF00",
-        "Blue": "#0000FF",
-        "Cyan": "#00FFFF",
-        "Magenta": "#FF00FF",
-        "Yellow": "#FFFF00",
-        "Amber": "#FFBF00",
-        "Orange": "#FF7F00",
-        "Purple": "#7F00FF",
-        "Pink": "#FF007F",
-        "UV": "#8000FF",
-        "Lime": "#BFFF00"
-    }
-
-    def _parse_fixture_file(fixture_path, ns, models_in_config, color_name_to_rgb, fixture_definitions):
-        """Parse a single fixture file and add to definitions if in config."""
-        try:
-            tree = ET.parse(fixture_path)
-            root = tree.getroot()
-
-            manufacturer = root.find('.//Manufacturer', ns).text
-            model = root.find('.//Model', ns).text
-
-            # Only process if this fixture is in our configuration
-            if (manufacturer, model) not in models_in_config:
-                return
-
-            # Get channels information
-            channels_info = []
-            for channel in root.findall('.//Channel', ns):
-                channel_data = {
-                    'name': channel.get('Name'),
-                    'preset': channel.get('Preset'),
-                    'group': channel.find('Group', ns).text if channel.find('Group', ns) is not None else None,
-                    'capabilities': []
-                }
-
-                # Get capabilities
-                for capability in channel.findall('Capability', ns):
-                    cap_data = {
-                        'min': int(capability.get('Min')),
-                        'max': int(capability.get('Max')),
-                        'preset': capability.get('Preset'),
-                        'name': capability.text
-                    }
-
-                    # Extract color information if present
-                    if capability.get('Color1') or capability.get('Color2'):
-                        cap_data['color'] = capability.get('Color1')
-                    elif capability.get('Res1'):
-                        cap_data['color'] = capability.get('Res1')
-                    elif capability.text and any(color in capability.text for color in color_name_to_rgb):
-                        for color_name, hex_value in color_name_to_rgb.items():
-                            if color_name.lower() in capability.text.lower():
-                                cap_data['color'] = hex_value
-                                break
-
-                    channel_data['capabilities'].append(cap_data)
-
-                channels_info.append(channel_data)
-
-            # Get modes information
-            modes_info = []
-            for mode in root.findall('.//Mode', ns):
-                mode_data = {
-                    'name': mode.get('Name'),
-                    'channels': []
-                }
-                for channel in mode.findall('Channel', ns):
-                    mode_data['channels'].append({
-                        'number': int(channel.get('Number')),
-                        'name': channel.text
-                    })
-                modes_info.append(mode_data)
-
-            # Store the fixture definition
-            key = f"{manufacturer}_{model}"
-            fixture_definitions[key] = {
-                'manufacturer': manufacturer,
-                'model': model,
-                'channels': channels_info,
-                'modes': modes_info
-            }
-
-        except ET.ParseError as e:
-            print(f"Error parsing fixture file {fixture_path}: {e}")
-        except Exception as e:
-            print(f"Error processing fixture file {fixture_path}: {e}")
-
-    for dir_path in qlc_fixture_dirs:
-        if not os.path.exists(dir_path):
-            continue
-
-        for item in os.listdir(dir_path):
-            item_path = os.path.join(dir_path, item)
-
-            # Check if it's a .qxf file directly in the directory
-            if item.endswith('.qxf') and os.path.isfile(item_path):
-                _parse_fixture_file(item_path, ns, models_in_config, color_name_to_rgb, fixture_definitions)
-
-            # Check if it's a manufacturer subdirectory
-            elif os.path.isdir(item_path):
-                for fixture_file in os.listdir(item_path):
-                    if fixture_file.endswith('.qxf'):
-                        fixture_path = os.path.join(item_path, fixture_file)
-                        _parse_fixture_file(fixture_path, ns, models_in_config, color_name_to_rgb, fixture_definitions)
+    # Definitions are compiled once per file and cached on disk; later
+    # files override earlier ones for the same manufacturer/model
+    for record in get_fixture_database().records(qlc_fixture_dirs):
+        if record.definition is not None and (record.manufacturer, record.model) in models_in_config:
+            key = f"{record.manufacturer}_{record.model}"
+            fixture_definitions[key] = copy.deepcopy(record.definition)
 
     return fixture_definitions
 
@@ -521,7 +418,6 @@ def get_fixture_layout(manufacturer: str, model: str) -> dict:
     Returns:
         dict with 'width' and 'height' keys (defaults to 1, 1 if not found)
     """
-    ns = {'': 'http://www.qlcplus.org/FixtureDefinition'}
     default_layout = {'width': 1, 'height': 1}
 
     # Get QLC+ fixture directories based on OS
@@ -543,61 +439,8 @@ def get_fixture_layout(manufacturer: str, model: str) -> dict:
         qlc_fixture_dirs.append(os.path.expanduser('~/Library/Application Support/QLC+/Fixtures'))
         qlc_fixture_dirs.append('/Applications/QLC+.app/Contents/Resources/Fixtures')
 
-    def _find_element(parent, tag, ns):
-        """Find element with or without namespace."""
-        elem = parent.find(tag, ns)
-        if elem is None:
-            elem = parent.find(tag)
-        return elem
-
-    def _check_fixture_file(fixture_path):
-        """Check if this is the right fixture and return layout if found."""
-        try:
-            tree = ET.parse(fixture_path)
-            root = tree.getroot()
-
-            file_manufacturer = _find_element(root, './/Manufacturer', ns)
-            file_model = _find_element(root, './/Model', ns)
-
-            if file_manufacturer is None or file_model is None:
-                return None
-
-            if file_manufacturer.text == manufacturer and file_model.text == model:
-                # Found the fixture, get layout
-                physical = _find_element(root, './/Physical', ns)
-                if physical is not None:
-                    layout = _find_element(physical, 'Layout', ns)
-                    if layout is not None:
-                        return {
-                            'width': int(layout.get('Width', 1)),
-                            'height': int(layout.get('Height', 1))
-                        }
-                return default_layout
-
-        except Exception:
-            pass
-
-        return None
-
-    # Search through fixture directories
-    for dir_path in qlc_fixture_dirs:
-        if not os.path.exists(dir_path):
-            continue
-
-        for item in os.listdir(dir_path):
-            item_path = os.path.join(dir_path, item)
-
-            if item.endswith('.qxf') and os.path.isfile(item_path):
-                result = _check_fixture_file(item_path)
-                if result is not None:
-                    return result
-
-            elif os.path.isdir(item_path):
-                for fixture_file in os.listdir(item_path):
-                    if fixture_file.endswith('.qxf'):
-                        fixture_path = os.path.join(item_path, fixture_file)
-                        result = _check_fixture_file(fixture_path)
-                        if result is not None:
-                            return result
+    record = get_fixture_database().find(qlc_fixture_dirs, manufacturer, model)
+    if record is not None and record.layout is not None:
+        return dict(record.layout)
 
     return default_layout
@@ -77,6 +77,43 @@ def get_rotation_matrix(mounting: str, yaw: float, pitch: float, roll: float) ->
     return Rz @ Ry @ Rx
 
 
+def get_inverse_orientation(yaw: float, pitch: float, roll: float) -> np.ndarray:
+    """
+    Build the matrix that takes a world direction into fixture-local space.
+
+    Uses the visualizer convention (Y-up): yaw around Y, pitch around X,
+    roll around Z, combined as Ry @ Rx @ Rz. The inverse of a rotation is
+    its transpose.
+
+    Args:
+        yaw, pitch, roll: Fixture orientation angles (degrees) - already includes mounting
+
+    Returns:
+        3x3 numpy matrix (world -> fixture-local)
+    """
+    yaw_rad = math.radians(yaw)
+    pitch_rad = math.radians(pitch)
+    roll_rad = math.radians(roll)
+
+    # Rotation matrices (same as visualizer)
+    cy, sy = math.cos(yaw_rad), math.sin(yaw_rad)
+    cp, sp = math.cos(pitch_rad), math.sin(pitch_rad)
+    cr, sr = math.cos(roll_rad), math.sin(roll_rad)
+
+    # Yaw around Y: [[cy, 0, sy], [0, 1, 0], [-sy, 0, cy]]
+    Ry = np.array([[cy, 0, sy], [0, 1, 0], [-sy, 0, cy]])
+
+    # Pitch around X: [[1, 0, 0], [0, cp, -sp], [0, sp, cp]]
+    Rx = np.array([[1, 0, 0], [0, cp, -sp], [0, sp, cp]])
+
+    # Roll around Z: [[cr, -sr, 0], [sr, cr, 0], [0, 0, 1]]
+    Rz = np.array([[cr, -sr, 0], [sr, cr, 0], [0, 0, 1]])
+
+    # Combined fixture orientation: Ry @ Rx @ Rz (same order as visualizer)
+    fixture_orientation = Ry @ Rx @ Rz
+    return fixture_orientation.T
+
+
 def calculate_pan_tilt(
     fixture_x: float, fixture_y: float, fixture_z: float,
     target_x: float, target_y: float, target_z: float,
@@ -123,32 +160,8 @@ def calculate_pan_tilt(
     # Stage X -> 3D X, Stage Y -> 3D Z, Stage Z -> 3D Y
     target_dir_3d = np.array([dx_stage, dz_stage, dy_stage])
 
-    # Build inverse fixture orientation matrix to transform world direction to local space
-    # Visualizer applies: yaw around Y, pitch around X, roll around Z (in that order)
-    # We need the inverse to go from world to local
-    yaw_rad = math.radians(yaw)
-    pitch_rad = math.radians(pitch)
-    roll_rad = math.radians(roll)
-
-    # Rotation matrices (same as visualizer)
-    cy, sy = math.cos(yaw_rad), math.sin(yaw_rad)
-    cp, sp = math.cos(pitch_rad), math.sin(pitch_rad)
-    cr, sr = math.cos(roll_rad), math.sin(roll_rad)
-
-    # Yaw around Y: [[cy, 0, sy], [0, 1, 0], [-sy, 0, cy]]
-    Ry = np.array([[cy, 0, sy], [0, 1, 0], [-sy, 0, cy]])
-
-    # Pitch around X: [[1, 0, 0], [0, cp, -sp], [0, sp, cp]]
-    Rx = np.array([[1, 0, 0], [0, cp, -sp], [0, sp, cp]])
-
-    # Roll around Z: [[cr, -sr, 0], [sr, cr, 0], [0, 0, 1]]
-    Rz = np.array([[cr, -sr, 0], [sr, cr, 0], [0, 0, 1]])
-
-    # Combined fixture orientation: Ry @ Rx @ Rz (same order as visualizer)
-    fixture_orientation = Ry @ Rx @ Rz
-
     # Transform target direction to fixture-local space
-    local_dir = fixture_orientation.T @ target_dir_3d
+    local_dir = get_inverse_orientation(yaw, pitch, roll) @ target_dir_3d
 
     # Now we need to find pan and tilt such that:
     # pan_mat @ tilt_mat @ [1, 0, 0] = local_dir
@@ -187,6 +200,65 @@ def calculate_pan_tilt(
     return pan_degrees, tilt_degrees
 
 
+def calculate_pan_tilt_batch(
+    fixture_positions: np.ndarray,
+    inverse_orientations: np.ndarray,
+    targets: np.ndarray,
+    pan_range: float = 540.0, tilt_range: float = 270.0
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Vectorized calculate_pan_tilt for many fixtures and target points.
+
+    Fixture geometry is passed in precomputed form so callers can cache it
+    (see get_inverse_orientation) and solve every fixture and every target
+    in one array operation.
+
+    Args:
+        fixture_positions: (N, 3) fixture positions in stage space (meters)
+        inverse_orientations: (N, 3, 3) world -> fixture-local matrices
+        targets: (..., N, 3) target positions in stage space; a single (3,)
+            target is broadcast to all fixtures
+        pan_range: Total pan range in degrees (default 540)
+        tilt_range: Total tilt range in degrees (default 270)
+
+    Returns:
+        Tuple of (pan_degrees, tilt_degrees) arrays of shape (..., N)
+    """
+    direction = np.asarray(targets, dtype=float) - fixture_positions
+    direction = np.broadcast_to(direction, np.broadcast_shapes(direction.shape, np.shape(fixture_positions)))
+    dx, dy, dz = direction[..., 0], direction[..., 1], direction[..., 2]
+
+    length = np.sqrt(dx*dx + dy*dy + dz*dz)
+    at_fixture = length < 0.001  # Target is at fixture position
+    safe_length = np.where(at_fixture, 1.0, length)
+
+    # Normalize and convert to visualizer 3D coordinates (Y-up):
+    # Stage X -> 3D X, Stage Y -> 3D Z, Stage Z -> 3D Y
+    d0 = dx / safe_length
+    d1 = dz / safe_length
+    d2 = dy / safe_length
+
+    # local_dir = inverse_orientation @ target_dir_3d, row by row
+    m = inverse_orientations
+    lx = m[:, 0, 0] * d0 + m[:, 0, 1] * d1 + m[:, 0, 2] * d2
+    ly = m[:, 1, 0] * d0 + m[:, 1, 1] * d1 + m[:, 1, 2] * d2
+    lz = m[:, 2, 0] * d0 + m[:, 2, 1] * d1 + m[:, 2, 2] * d2
+
+    tilt_rad = np.arcsin(np.clip(lz, -1.0, 1.0))
+    tilt_degrees = np.degrees(tilt_rad)
+
+    # Beam pointing straight up or down: pan is undefined
+    pan_degrees = np.where(np.abs(np.cos(tilt_rad)) < 0.001, 0.0, np.degrees(np.arctan2(ly, lx)))
+
+    # Clamp to fixture's range
+    half_pan = pan_range / 2
+    half_tilt = tilt_range / 2
+    pan_degrees = np.where(at_fixture, 0.0, np.clip(pan_degrees, -half_pan, half_pan))
+    tilt_degrees = np.where(at_fixture, 0.0, np.clip(tilt_degrees, -half_tilt, half_tilt))
+
+    return pan_degrees, tilt_degrees
+
+
 def pan_tilt_to_dmx(
     pan_degrees: float, tilt_degrees: float,
     pan_range: float = 540.0, tilt_range: float = 270.0,
@@ -232,6 +304,35 @@ def pan_tilt_to_dmx(
     return pan_dmx, tilt_dmx
 
 
+def pan_tilt_to_dmx_batch(
+    pan_degrees: np.ndarray, tilt_degrees: np.ndarray,
+    pan_range: float = 540.0, tilt_range: float = 270.0,
+    pan_inverted: bool = False, tilt_inverted: bool = False
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Vectorized pan_tilt_to_dmx.
+
+    Returns:
+        Tuple of (pan_dmx, tilt_dmx) integer arrays in range 0-255
+    """
+    half_pan = pan_range / 2
+    half_tilt = tilt_range / 2
+
+    pan_normalized = np.asarray(pan_degrees, dtype=float) / half_pan if half_pan > 0 else np.zeros(np.shape(pan_degrees))
+    tilt_normalized = np.asarray(tilt_degrees, dtype=float) / half_tilt if half_tilt > 0 else np.zeros(np.shape(tilt_degrees))
+
+    if pan_inverted:
+        pan_normalized = -pan_normalized
+    if tilt_inverted:
+        tilt_normalized = -tilt_normalized
+
+    # int() truncates toward zero
+    pan_dmx = np.trunc(127 + pan_normalized * 127).astype(int)
+    tilt_dmx = np.trunc(127 + tilt_normalized * 127).astype(int)
+
+    return np.clip(pan_dmx, 0, 255), np.clip(tilt_dmx, 0, 255)
+
+
 def get_beam_direction(mounting: str, yaw: float, pitch: float, roll: float) -> np.ndarray:
     """
     Get the beam direction vector in world space for a fixture.
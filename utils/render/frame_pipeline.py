@@ -0,0 +1,129 @@
+# utils/render/frame_pipeline.py
+# Pipelined framebuffer readback and encoder feed for the offline renderer
+
+import queue
+import threading
+from typing import BinaryIO, Optional, Tuple
+
+import moderngl
+
+
+class FramePipeline:
+    """
+    Overlaps GPU rendering, pixel readback and FFmpeg encoding.
+
+    ``push()`` starts an asynchronous readback of the current framebuffer
+    into the next pixel buffer object (PBO) of a ring and hands the oldest
+    finished frame to a writer thread. The writer feeds the encoder's stdin
+    so a stalled pipe never blocks the render loop, except as backpressure
+    once ``max_pending`` frames are queued. With the default three buffers
+    the GPU renders frame N while frame N-2 is mapped and frame N-3 is
+    being written.
+
+    Frames leave in render order, ``buffers - 1`` pushes behind; ``finish()``
+    drains the rest. Rows are written exactly as stored in the framebuffer,
+    so the caller renders with a vertically flipped projection to get the
+    top-down rows video expects.
+    """
+
+    def __init__(self, ctx: moderngl.Context, fbo: moderngl.Framebuffer,
+                 size: Tuple[int, int], stream: BinaryIO,
+                 buffers: int = 3, max_pending: int = 3, components: int = 3):
+        """
+        Args:
+            ctx: Context owning ``fbo``
+            fbo: Framebuffer read after every rendered frame
+            size: (width, height) of the framebuffer
+            stream: Binary stream the frames are written to (FFmpeg stdin)
+            buffers: PBOs in the readback ring (1 = readback waits for each frame)
+            max_pending: Frames queued for the writer before push() blocks
+            components: Color components read per pixel
+        """
+        if buffers < 1:
+            raise ValueError(f"Need at least one readback buffer, got {buffers}")
+        self._fbo = fbo
+        self._components = components
+        frame_bytes = size[0] * size[1] * components
+        self._buffers = [ctx.buffer(reserve=frame_bytes) for _ in range(buffers)]
+        self._next = 0       # Ring slot of the next readback
+        self._in_flight = 0  # Readbacks started but not yet handed to the writer
+
+        self._stream = stream
+        self._queue: "queue.Queue[Optional[bytes]]" = queue.Queue(maxsize=max(1, max_pending))
+        self._error: Optional[BaseException] = None
+        self._aborted = threading.Event()
+        self.frames_written = 0
+        self._thread = threading.Thread(target=self._write_loop, name="FrameWriter", daemon=True)
+        self._thread.start()
+
+    def push(self):
+        """Queue a readback of the framebuffer's current contents.
+
+        Raises the writer's error (e.g. BrokenPipeError) if it failed.
+        """
+        self._raise_error()
+        slot = self._buffers[self._next]
+        if self._in_flight == len(self._buffers):
+            # The slot still holds the oldest frame in flight
+            self._enqueue(slot.read())
+            self._in_flight -= 1
+        self._fbo.read_into(slot, components=self._components)
+        self._next = (self._next + 1) % len(self._buffers)
+        self._in_flight += 1
+
+    def finish(self, timeout: Optional[float] = None):
+        """Hand over the remaining frames, wait for the writer and close the stream.
+
+        Raises the writer's error if it failed.
+        """
+        n = len(self._buffers)
+        for k in range(self._in_flight, 0, -1):
+            self._enqueue(self._buffers[(self._next - k) % n].read())
+        self._in_flight = 0
+        self._enqueue(None)
+        self._thread.join(timeout=timeout)
+        self._raise_error()
+        self._stream.close()
+
+    def abort(self):
+        """Stop writing without flushing queued frames."""
+        self._aborted.set()
+        try:
+            while True:
+                self._queue.get_nowait()
+        except queue.Empty:
+            pass
+        self._queue.put(None)
+        self._thread.join(timeout=5.0)
+
+    def release(self):
+        """Release the readback buffers."""
+        for buffer in self._buffers:
+            buffer.release()
+        self._buffers = []
+
+    def _enqueue(self, frame: Optional[bytes]):
+        # Wait for room, but give up if the writer died meanwhile
+        while True:
+            self._raise_error()
+            try:
+                self._queue.put(frame, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    def _raise_error(self):
+        if self._error is not None:
+            raise self._error
+
+    def _write_loop(self):
+        while True:
+            frame = self._queue.get()
+            if frame is None or self._aborted.is_set():
+                return
+            try:
+                self._stream.write(frame)
+            except BaseException as e:
+                self._error = e
+                return
+            self.frames_written += 1
@@ -1,11 +1,18 @@
 # utils/render/offline_renderer.py
 # Headless offline rendering of shows to MP4 video files
 
+import contextlib
+import io
+import multiprocessing
 import os
+import queue
+import shutil
 import subprocess
+import tempfile
 import numpy as np
 import time
-from typing import Dict, List, Optional, Callable, Any
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Callable, Any, Tuple
 
 import moderngl
 import glm
@@ -15,12 +22,45 @@ from utils.fixture_utils import load_fixture_definitions_from_qlc
 from utils.target_resolver import resolve_targets_unique
 from utils.artnet.dmx_manager import DMXManager
 from utils.render.camera_presets import CAMERA_PRESETS
+from utils.render.frame_pipeline import FramePipeline
 from timeline.song_structure import SongStructure
+from timeline.block_index import SUBLANE_TYPES, LaneBlockIndex, first_frame_at
+
+
+def split_frame_range(total_frames: int, chunks: int) -> List[Tuple[int, int]]:
+    """Split [0, total_frames) into up to ``chunks`` contiguous, near-equal ranges."""
+    chunks = max(1, min(chunks, total_frames))
+    bounds = [total_frames * i // chunks for i in range(chunks + 1)]
+    return [(bounds[i], bounds[i + 1]) for i in range(chunks)]
+
+
+def _render_segment_job(job: Dict[str, Any]) -> bool:
+    """Worker entry point of a parallel render: encode one frame range."""
+    index = job.pop('index')
+    start_frame = job.pop('start_frame')
+    end_frame = job.pop('end_frame')
+    progress = job.pop('progress')
+    cancel_event = job.pop('cancel_event')
+
+    renderer: Optional[OfflineRenderer] = None
+
+    def report(current: int, total: int, message: str):
+        progress.put((index, current))
+        if cancel_event.is_set():
+            renderer.cancel()
+
+    renderer = OfflineRenderer(progress_callback=report, **job)
+    with contextlib.redirect_stdout(io.StringIO()):
+        return renderer.render_segment(start_frame, end_frame)
 
 
 class OfflineRenderer:
     """Renders a show to an MP4 video file using headless OpenGL + FFmpeg."""
 
+    # Parallel renders give every worker at least this much show time, so
+    # process and context start-up stays small next to the rendering
+    MIN_CHUNK_SECONDS = 10
+
     def __init__(
         self,
         config: Configuration,
@@ -33,6 +73,9 @@ class OfflineRenderer:
         fps: int = 30,
         progress_callback: Optional[Callable[[int, int, str], None]] = None,
         show_gizmos: bool = True,
+        pipelined: bool = True,
+        readback_buffers: int = 3,
+        workers: int = 1,
     ):
         self.config = config
         self.show = show
@@ -46,12 +89,22 @@ class OfflineRenderer:
         # When False, per-fixture debug axis triads (moving-head chassis) are
         # suppressed — for clean README stills/clips. See _init_renderers.
         self.show_gizmos = show_gizmos
+        # Video renders read frames back through a ring of pixel buffers
+        # and feed FFmpeg from a writer thread (see FramePipeline), so GPU,
+        # readback and encoder overlap. False reads and writes each frame
+        # synchronously.
+        self.pipelined = pipelined
+        self.readback_buffers = readback_buffers
+        # Worker processes for video renders; each renders a time chunk in
+        # its own GL context and the segments are joined without re-encoding
+        self.workers = max(1, workers)
 
         self._ctx = None
         self._fbo = None
         self._stage_renderer = None
         self._fixture_manager = None
         self._dmx_manager = None
+        self._pipeline: Optional[FramePipeline] = None
         self._cancelled = False
 
     def cancel(self):
@@ -61,6 +114,9 @@ class OfflineRenderer:
     def render(self) -> bool:
         """Execute the full render pipeline.
 
+        With ``workers`` > 1 the show is split into time chunks that
+        separate processes render in parallel (see _render_parallel).
+
         Returns:
             True if completed successfully, False if cancelled or failed.
         """
@@ -68,8 +124,7 @@ class OfflineRenderer:
             self._report_progress(0, 1, "Initializing renderer...")
 
             # Calculate show duration
-            song_structure = SongStructure()
-            song_structure.load_from_show_parts(self.show.parts)
+            song_structure = self._load_song_structure()
             duration = song_structure.get_total_duration()
             if duration <= 0:
                 print("Show has no duration, nothing to render")
@@ -78,94 +133,238 @@ class OfflineRenderer:
             total_frames = int(duration * self.fps)
             print(f"Rendering {self.show.name}: {duration:.1f}s, {total_frames} frames at {self.fps}fps")
 
-            # Initialize OpenGL context and renderers
-            self._init_gl_context()
-            self._init_renderers()
+            # Resolve audio path
+            audio_path = self._resolve_audio_path()
 
-            # Initialize DMX manager
-            self._init_dmx(song_structure)
+            chunks = min(self.workers, total_frames // (self.MIN_CHUNK_SECONDS * self.fps))
+            if chunks > 1:
+                return self._render_parallel(total_frames, duration, audio_path, chunks)
+            return self._render_frames(song_structure, 0, total_frames, audio_path, duration)
 
-            # Set up camera
-            mvp = self._setup_camera()
+        except Exception as e:
+            print(f"Render error: {e}")
+            import traceback
+            traceback.print_exc()
+            return False
 
-            # Resolve audio path
-            audio_path = self._resolve_audio_path()
+        finally:
+            self._cleanup()
 
-            # Start FFmpeg process
-            ffmpeg_proc = self._start_ffmpeg(audio_path)
-            if ffmpeg_proc is None:
-                return False
+    def render_segment(self, start_frame: int, end_frame: int) -> bool:
+        """Render frames [start_frame, end_frame) to ``output_path``, video only.
 
-            self._report_progress(0, total_frames, "Rendering frames...")
+        DMX state is computed per frame without history (see _init_dmx), so
+        a segment renders exactly the frames a full render would. Used by
+        the worker processes of a parallel render.
 
-            try:
-                for frame_idx in range(total_frames):
-                    if self._cancelled:
-                        print("Render cancelled")
-                        ffmpeg_proc.stdin.close()
-                        ffmpeg_proc.terminate()
-                        return False
-
-                    time_s = frame_idx / self.fps
-
-                    # Compute DMX for this time
-                    self._update_dmx_at_time(time_s, song_structure)
-
-                    # Apply DMX to fixture visuals
-                    self._apply_dmx_to_fixtures()
-
-                    # Render frame
-                    self._render_frame(mvp)
-
-                    # Read pixels and pipe to FFmpeg
-                    pixels = self._fbo.read(components=3)
-                    # Flip vertically (OpenGL origin is bottom-left, video is top-left)
-                    pixel_array = np.frombuffer(pixels, dtype=np.uint8).reshape(self.height, self.width, 3)
-                    pixel_array = np.flipud(pixel_array)
-                    ffmpeg_proc.stdin.write(pixel_array.tobytes())
-
-                    # Report progress periodically
-                    if frame_idx % self.fps == 0 or frame_idx == total_frames - 1:
-                        elapsed_s = time_s
-                        self._report_progress(
-                            frame_idx + 1, total_frames,
-                            f"Frame {frame_idx + 1}/{total_frames} ({elapsed_s:.1f}s / {duration:.1f}s)"
-                        )
+        Returns:
+            True if completed successfully, False if cancelled or failed.
+        """
+        try:
+            song_structure = self._load_song_structure()
+            return self._render_frames(song_structure, start_frame, end_frame, None,
+                                       (end_frame - start_frame) / self.fps)
+        except Exception as e:
+            print(f"Render error: {e}")
+            import traceback
+            traceback.print_exc()
+            return False
+        finally:
+            self._cleanup()
 
-                # Finalize
-                ffmpeg_proc.stdin.close()
-                # Timeout scales with video length: at least 60s, plus 1s per second of video
-                finalize_timeout = max(60, int(duration) + 60)
-                self._report_progress(total_frames, total_frames, f"Encoding final output ({finalize_timeout}s timeout)...")
-                ffmpeg_proc.wait(timeout=finalize_timeout)
+    def _render_frames(self, song_structure: SongStructure, start_frame: int, end_frame: int,
+                       audio_path: Optional[str], duration: float) -> bool:
+        """Render and encode frames [start_frame, end_frame) to ``output_path``."""
+        # Initialize OpenGL context and renderers
+        self._init_gl_context()
+        self._init_renderers()
+
+        # Initialize DMX manager
+        self._init_dmx(song_structure)
+
+        # Set up camera
+        mvp = self._setup_camera()
+
+        # Start FFmpeg process
+        ffmpeg_proc = self._start_ffmpeg(audio_path)
+        if ffmpeg_proc is None:
+            return False
+
+        total_frames = end_frame - start_frame
+        self._report_progress(0, total_frames, "Rendering frames...")
+
+        try:
+            if self.pipelined:
+                self._pipeline = FramePipeline(
+                    self._ctx, self._fbo, (self.width, self.height), ffmpeg_proc.stdin,
+                    buffers=self.readback_buffers,
+                )
 
-                if ffmpeg_proc.returncode != 0:
-                    print(f"FFmpeg error (exit code {ffmpeg_proc.returncode})")
+            for frame_idx in range(start_frame, end_frame):
+                if self._cancelled:
+                    print("Render cancelled")
+                    self._abort_ffmpeg(ffmpeg_proc)
                     return False
 
-                self._report_progress(total_frames, total_frames, "Done!")
-                print(f"Render complete: {self.output_path}")
-                return True
+                # Compute DMX for this frame
+                self._update_dmx_at_frame(frame_idx)
+
+                # Apply DMX to fixture visuals
+                self._apply_dmx_to_fixtures()
+
+                # Render frame
+                self._render_frame(mvp)
+
+                # Read pixels and pipe to FFmpeg. Rows are already
+                # top-down (see _setup_camera), so no flip or copy.
+                if self._pipeline is not None:
+                    self._pipeline.push()
+                else:
+                    ffmpeg_proc.stdin.write(self._fbo.read(components=3))
+
+                # Report progress periodically
+                done = frame_idx - start_frame + 1
+                if frame_idx % self.fps == 0 or done == total_frames:
+                    self._report_progress(
+                        done, total_frames,
+                        f"Frame {done}/{total_frames} ({done / self.fps:.1f}s / {duration:.1f}s)"
+                    )
+
+            # Finalize
+            if self._pipeline is not None:
+                self._pipeline.finish()
+            else:
+                ffmpeg_proc.stdin.close()
+            # Timeout scales with video length: at least 60s, plus 1s per second of video
+            finalize_timeout = max(60, int(duration) + 60)
+            self._report_progress(total_frames, total_frames, f"Encoding final output ({finalize_timeout}s timeout)...")
+            ffmpeg_proc.wait(timeout=finalize_timeout)
 
-            except BrokenPipeError:
-                print("FFmpeg pipe broken — encoding may have failed")
+            if ffmpeg_proc.returncode != 0:
+                print(f"FFmpeg error (exit code {ffmpeg_proc.returncode})")
                 return False
 
-        except Exception as e:
-            print(f"Render error: {e}")
-            import traceback
-            traceback.print_exc()
+            self._report_progress(total_frames, total_frames, "Done!")
+            print(f"Render complete: {self.output_path}")
+            return True
+
+        except BrokenPipeError:
+            print("FFmpeg pipe broken — encoding may have failed")
+            self._abort_ffmpeg(ffmpeg_proc)
             return False
 
+    def _render_parallel(self, total_frames: int, duration: float,
+                         audio_path: Optional[str], chunks: int) -> bool:
+        """Render time chunks in worker processes, then join them losslessly.
+
+        Every worker has its own standalone GL context and FFmpeg and writes
+        one video-only segment. FFmpeg's concat demuxer then copies the
+        segments' H.264 streams into ``output_path`` without re-encoding and
+        muxes the audio in the same pass.
+        """
+        ranges = split_frame_range(total_frames, chunks)
+        output_dir = os.path.dirname(os.path.abspath(self.output_path))
+        os.makedirs(output_dir, exist_ok=True)
+        segment_dir = tempfile.mkdtemp(prefix=".segments_", dir=output_dir)
+        segment_paths = [os.path.join(segment_dir, f"segment_{i:03d}.mp4") for i in range(len(ranges))]
+        print(f"Rendering {len(ranges)} chunks in parallel")
+
+        # spawn: the parent may be the Qt GUI, whose threads make fork unsafe
+        mp_context = multiprocessing.get_context("spawn")
+        try:
+            with mp_context.Manager() as manager:
+                progress = manager.Queue()
+                cancel_event = manager.Event()
+                renderer_args = dict(
+                    config=self.config, show=self.show,
+                    fixture_definitions=self.fixture_definitions,
+                    camera_preset_name=self.camera_preset_name,
+                    width=self.width, height=self.height, fps=self.fps,
+                    show_gizmos=self.show_gizmos, pipelined=self.pipelined,
+                    readback_buffers=self.readback_buffers,
+                )
+                jobs = [
+                    dict(renderer_args, output_path=path, index=i, start_frame=start, end_frame=end,
+                         progress=progress, cancel_event=cancel_event)
+                    for i, (path, (start, end)) in enumerate(zip(segment_paths, ranges))
+                ]
+
+                with ProcessPoolExecutor(max_workers=len(jobs), mp_context=mp_context) as pool:
+                    futures = [pool.submit(_render_segment_job, job) for job in jobs]
+                    done_frames = [0] * len(jobs)
+                    while not all(f.done() for f in futures):
+                        if self._cancelled:
+                            cancel_event.set()
+                        try:
+                            index, done = progress.get(timeout=0.25)
+                        except queue.Empty:
+                            continue
+                        done_frames[index] = done
+                        rendered = sum(done_frames)
+                        self._report_progress(
+                            rendered, total_frames,
+                            f"Frame {rendered}/{total_frames} ({len(jobs)} workers)"
+                        )
+                    results = [f.result() for f in futures]
+
+            if self._cancelled:
+                print("Render cancelled")
+                return False
+            if not all(results):
+                print("A render worker failed")
+                return False
+
+            self._report_progress(total_frames, total_frames, "Joining segments...")
+            if not self._concat_segments(segment_paths, audio_path, duration):
+                return False
+
+            self._report_progress(total_frames, total_frames, "Done!")
+            print(f"Render complete: {self.output_path}")
+            return True
         finally:
-            self._cleanup()
+            shutil.rmtree(segment_dir, ignore_errors=True)
+
+    def _concat_segments(self, segment_paths: List[str], audio_path: Optional[str],
+                         duration: float) -> bool:
+        """Join encoded segments into ``output_path`` with the concat demuxer."""
+        ffmpeg_path = self._ffmpeg_exe()
+        if ffmpeg_path is None:
+            return False
+
+        list_path = os.path.join(os.path.dirname(segment_paths[0]), "segments.txt")
+        with open(list_path, "w", encoding="utf-8") as f:
+            for path in segment_paths:
+                escaped = path.replace("'", "'\\''")
+                f.write(f"file '{escaped}'\n")
+
+        cmd = [ffmpeg_path, '-y', '-f', 'concat', '-safe', '0', '-i', list_path]
+        if audio_path:
+            cmd.extend(['-i', audio_path])
+        cmd.extend(['-map', '0:v', '-c:v', 'copy'])  # Lossless: no re-encode
+        if audio_path:
+            cmd.extend([
+                '-map', '1:a',
+                '-c:a', 'aac',
+                '-b:a', '192k',
+                '-shortest',
+            ])
+        cmd.append(self.output_path)
+
+        result = subprocess.run(
+            cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+            timeout=max(60, int(duration) + 60),
+        )
+        if result.returncode != 0:
+            print(f"FFmpeg concat error (exit code {result.returncode})")
+            return False
+        return True
 
     def capture_stills(self, times: List[float], output_dir: str, prefix: str = "still") -> List[str]:
         """Render PNG stills at the given show times. No FFmpeg required.
 
-        Uses a single monotonic forward pass at ``self.fps`` so the stateful
-        per-block DMX tracking matches real-time playback exactly, grabbing a
-        frame at the pass frame nearest each requested time.
+        Each still is the first frame of the ``self.fps`` grid at or after its
+        requested time, evaluated directly, so it matches the same frame of a
+        video render without stepping through the frames before it.
 
         Returns the list of written file paths (sorted by time).
         """
@@ -173,8 +372,7 @@ class OfflineRenderer:
 
         os.makedirs(output_dir, exist_ok=True)
 
-        song_structure = SongStructure()
-        song_structure.load_from_show_parts(self.show.parts)
+        song_structure = self._load_song_structure()
         duration = song_structure.get_total_duration()
         if duration <= 0:
             print("Show has no duration, nothing to capture")
@@ -191,27 +389,20 @@ class OfflineRenderer:
             mvp = self._setup_camera()
 
             written: List[str] = []
-            ti = 0
-            for frame_idx in range(total_frames):
+            for target in targets:
                 if self._cancelled:
                     break
-                time_s = frame_idx / self.fps
-                self._update_dmx_at_time(time_s, song_structure)
+                frame_idx = min(first_frame_at(target, self.fps), total_frames - 1)
+                self._update_dmx_at_frame(frame_idx)
                 self._apply_dmx_to_fixtures()
 
-                # Only pay for a GL read + encode on frames we actually keep.
-                while ti < len(targets) and targets[ti] <= time_s:
-                    self._render_frame(mvp)
-                    pixels = self._fbo.read(components=3)
-                    arr = np.frombuffer(pixels, dtype=np.uint8).reshape(self.height, self.width, 3)
-                    arr = np.flipud(arr)
-                    path = os.path.join(output_dir, f"{prefix}_{targets[ti]:06.1f}s.png")
-                    Image.fromarray(arr, "RGB").save(path)
-                    written.append(path)
-                    self._report_progress(len(written), len(targets), f"Still at {targets[ti]:.1f}s")
-                    ti += 1
-                if ti >= len(targets):
-                    break
+                self._render_frame(mvp)
+                pixels = self._fbo.read(components=3)
+                arr = np.frombuffer(pixels, dtype=np.uint8).reshape(self.height, self.width, 3)
+                path = os.path.join(output_dir, f"{prefix}_{target:06.1f}s.png")
+                Image.fromarray(arr, "RGB").save(path)
+                written.append(path)
+                self._report_progress(len(written), len(targets), f"Still at {target:.1f}s")
             return written
         finally:
             self._cleanup()
@@ -231,12 +422,13 @@ class OfflineRenderer:
         than a per-frame one) lets GIF frame-diffing + ``optimize`` compress the
         mostly-static dark stage far better.
 
+        Only the sampled frames are evaluated; DMX state needs no history.
+
         Returns True on success.
         """
         from PIL import Image
 
-        song_structure = SongStructure()
-        song_structure.load_from_show_parts(self.show.parts)
+        song_structure = self._load_song_structure()
         duration = song_structure.get_total_duration()
         if duration <= 0:
             print("Show has no duration, nothing to render")
@@ -256,19 +448,16 @@ class OfflineRenderer:
             mvp = self._setup_camera()
 
             rgb_frames = []
-            for frame_idx in range(total_frames):
+            for frame_idx in range(0, total_frames, step):
                 if self._cancelled:
                     return False
                 time_s = frame_idx / self.fps
-                self._update_dmx_at_time(time_s, song_structure)
+                self._update_dmx_at_frame(frame_idx)
                 self._apply_dmx_to_fixtures()
-                if frame_idx % step != 0:
-                    continue
 
                 self._render_frame(mvp)
                 pixels = self._fbo.read(components=3)
                 arr = np.frombuffer(pixels, dtype=np.uint8).reshape(self.height, self.width, 3)
-                arr = np.flipud(arr)
                 img = Image.fromarray(arr, "RGB")
                 if scale < 1.0:
                     img = img.resize((out_w, out_h), Image.LANCZOS)
@@ -307,6 +496,11 @@ class OfflineRenderer:
         finally:
             self._cleanup()
 
+    def _load_song_structure(self) -> SongStructure:
+        song_structure = SongStructure()
+        song_structure.load_from_show_parts(self.show.parts)
+        return song_structure
+
     def _report_progress(self, current: int, total: int, message: str):
         """Report progress via callback."""
         if self.progress_callback:
@@ -378,68 +572,37 @@ class OfflineRenderer:
                         self._lane_fixtures[lane_key] = (lane, resolved)
                         self._light_lanes.append((lane_key, lane, resolved))
 
-        # Track active block IDs per lane (same structure as ShowsArtNetController)
-        self._active_block_ids = {}
+        # Block held per lane and sublane at every frame, derived from the
+        # block times alone; the show is not edited during a render
+        self._hold_schedules = {}
+        for lane_key, lane, _ in self._light_lanes:
+            index = LaneBlockIndex(lane.light_blocks)
+            self._hold_schedules[lane_key] = {
+                sublane_type: index.hold_schedule(sublane_type, self.fps)
+                for sublane_type in SUBLANE_TYPES
+            }
+        self._held_blocks = {}
 
-    def _update_dmx_at_time(self, time_s: float, song_structure: SongStructure):
-        """Compute DMX state at a given time by processing all lane blocks.
+    def _update_dmx_at_frame(self, frame_idx: int):
+        """Compute DMX state at a given frame.
 
-        Maintains persistent block tracking across frames (same as real-time controller).
-        DMX state is NOT cleared — active blocks continuously write their values via update_dmx().
+        Produces the same block starts and ends as the real-time controller
+        stepping through every frame (see HoldSchedule), but needs no state
+        from earlier frames, so frames can be evaluated in any order.
+        DMX state is NOT cleared — held blocks continuously write their values via update_dmx().
         """
+        time_s = frame_idx / self.fps
         for lane_key, lane, resolved_fixtures in self._light_lanes:
-            if lane_key not in self._active_block_ids:
-                self._active_block_ids[lane_key] = {
-                    'dimmer': set(), 'colour': set(), 'movement': set(), 'special': set()
-                }
-
-            currently_active = {
-                'dimmer': set(), 'colour': set(), 'movement': set(), 'special': set()
-            }
-
-            for light_block in lane.light_blocks:
-                # Dimmer blocks
-                for block in light_block.dimmer_blocks:
-                    block_id = id(block)
-                    if block.start_time <= time_s < block.end_time:
-                        currently_active['dimmer'].add(block_id)
-                        if block_id not in self._active_block_ids[lane_key]['dimmer']:
-                            self._dmx_manager.block_started(lane_key, resolved_fixtures, block, 'dimmer', time_s)
-                            self._active_block_ids[lane_key]['dimmer'].add(block_id)
-
-                # Colour blocks
-                for block in light_block.colour_blocks:
-                    block_id = id(block)
-                    if block.start_time <= time_s < block.end_time:
-                        currently_active['colour'].add(block_id)
-                        if block_id not in self._active_block_ids[lane_key]['colour']:
-                            self._dmx_manager.block_started(lane_key, resolved_fixtures, block, 'colour', time_s)
-                            self._active_block_ids[lane_key]['colour'].add(block_id)
-
-                # Movement blocks
-                for block in light_block.movement_blocks:
-                    block_id = id(block)
-                    if block.start_time <= time_s < block.end_time:
-                        currently_active['movement'].add(block_id)
-                        if block_id not in self._active_block_ids[lane_key]['movement']:
-                            self._dmx_manager.block_started(lane_key, resolved_fixtures, block, 'movement', time_s)
-                            self._active_block_ids[lane_key]['movement'].add(block_id)
-
-                # Special blocks
-                for block in light_block.special_blocks:
-                    block_id = id(block)
-                    if block.start_time <= time_s < block.end_time:
-                        currently_active['special'].add(block_id)
-                        if block_id not in self._active_block_ids[lane_key]['special']:
-                            self._dmx_manager.block_started(lane_key, resolved_fixtures, block, 'special', time_s)
-                            self._active_block_ids[lane_key]['special'].add(block_id)
-
-            # End blocks no longer active
-            for sublane_type in ['dimmer', 'colour', 'movement', 'special']:
-                ended = self._active_block_ids[lane_key][sublane_type] - currently_active[sublane_type]
-                if ended and not currently_active[sublane_type]:
+            held = self._held_blocks.setdefault(lane_key, {})
+            for sublane_type, schedule in self._hold_schedules[lane_key].items():
+                block = schedule.block_at(frame_idx)
+                if block is held.get(sublane_type):
+                    continue
+                if block is None:
                     self._dmx_manager.block_ended(lane_key, sublane_type)
-                self._active_block_ids[lane_key][sublane_type] = currently_active[sublane_type]
+                else:
+                    self._dmx_manager.block_started(lane_key, resolved_fixtures, block, sublane_type, time_s)
+                held[sublane_type] = block
 
         # Compute final DMX values
         self._dmx_manager.update_dmx(time_s)
@@ -450,7 +613,14 @@ class OfflineRenderer:
             self._fixture_manager.update_dmx(universe_id, bytes(dmx_data))
 
     def _setup_camera(self) -> glm.mat4:
-        """Set up camera MVP matrix from preset."""
+        """Set up camera MVP matrix from preset.
+
+        The matrix mirrors clip-space Y, so every shader writes the image
+        upside down in GL terms: framebuffer rows then read back top-down,
+        the order video and image files use, without a CPU flip. Nothing
+        in the scene culls faces or uses screen-space derivatives, so the
+        mirrored winding is harmless.
+        """
         preset = CAMERA_PRESETS.get(self.camera_preset_name, CAMERA_PRESETS["Front"])
         params = preset["get_params"](self.config.stage_width, self.config.stage_height)
 
@@ -462,7 +632,8 @@ class OfflineRenderer:
         camera.target = glm.vec3(*params["target"])
         camera.aspect = self.width / self.height
 
-        return camera.get_view_projection_matrix()
+        flip_y = glm.scale(glm.mat4(1.0), glm.vec3(1.0, -1.0, 1.0))
+        return flip_y * camera.get_view_projection_matrix()
 
     def _render_frame(self, mvp: glm.mat4):
         """Render a single frame to the FBO."""
@@ -498,15 +669,20 @@ class OfflineRenderer:
 
         return None
 
-    def _start_ffmpeg(self, audio_path: Optional[str]) -> Optional[subprocess.Popen]:
-        """Start FFmpeg subprocess for encoding."""
+    def _ffmpeg_exe(self) -> Optional[str]:
         try:
             import imageio_ffmpeg
-            ffmpeg_path = imageio_ffmpeg.get_ffmpeg_exe()
+            return imageio_ffmpeg.get_ffmpeg_exe()
         except ImportError:
             print("imageio-ffmpeg not installed, cannot render video")
             return None
 
+    def _start_ffmpeg(self, audio_path: Optional[str]) -> Optional[subprocess.Popen]:
+        """Start FFmpeg subprocess for encoding."""
+        ffmpeg_path = self._ffmpeg_exe()
+        if ffmpeg_path is None:
+            return None
+
         cmd = [
             ffmpeg_path,
             '-y',                           # Overwrite output
@@ -546,8 +722,26 @@ class OfflineRenderer:
             stderr=subprocess.DEVNULL,
         )
 
+    def _abort_ffmpeg(self, ffmpeg_proc: subprocess.Popen):
+        """Stop FFmpeg and the frame writer without finishing the file."""
+        # Terminate first so a writer blocked on a full pipe gets unblocked
+        ffmpeg_proc.terminate()
+        if self._pipeline is not None:
+            self._pipeline.abort()
+        try:
+            ffmpeg_proc.stdin.close()
+        except (OSError, ValueError):
+            pass
+
     def _cleanup(self):
         """Release OpenGL resources."""
+        if self._pipeline:
+            try:
+                self._pipeline.release()
+            except Exception:
+                pass
+            self._pipeline = None
+
         if self._fixture_manager:
             for fix in self._fixture_manager.fixtures.values():
                 try:
@@ -1,6 +1,7 @@
 # utils/tcp/protocol.py
 # Protocol definition for Show Creator <-> Visualizer communication
 
+import base64
 import json
 import os
 import sys
@@ -9,6 +10,7 @@ from enum import Enum
 from typing import Dict, List, Any, Optional, Tuple
 from config.models import Configuration, Fixture, FixtureGroup
 from utils.fixture_capabilities import get_capabilities_for_fixture
+from utils.fixture_db import get_fixture_database
 
 
 class MessageType(Enum):
@@ -19,6 +21,7 @@ class MessageType(Enum):
     UPDATE = "update"
     HEARTBEAT = "heartbeat"
     ACK = "ack"
+    DMX = "dmx"
 
 
 # Cache for parsed fixture definitions
@@ -177,46 +180,8 @@ def _get_qxf_fixture_dirs() -> List[str]:
 
 def _find_qxf_file(manufacturer: str, model: str) -> Optional[str]:
     """Find QXF file for a given manufacturer and model."""
-    for dir_path in _get_qxf_fixture_dirs():
-        if not os.path.exists(dir_path):
-            continue
-
-        # Check direct files in directory
-        for item in os.listdir(dir_path):
-            item_path = os.path.join(dir_path, item)
-
-            if item.endswith('.qxf') and os.path.isfile(item_path):
-                # Check if this file matches
-                try:
-                    tree = ET.parse(item_path)
-                    root = tree.getroot()
-                    ns = {'': 'http://www.qlcplus.org/FixtureDefinition'}
-                    file_mfr = root.find('.//Manufacturer', ns)
-                    file_model = root.find('.//Model', ns)
-                    if file_mfr is not None and file_model is not None:
-                        if file_mfr.text == manufacturer and file_model.text == model:
-                            return item_path
-                except:
-                    pass
-
-            elif os.path.isdir(item_path):
-                # Check subdirectory
-                for fixture_file in os.listdir(item_path):
-                    if fixture_file.endswith('.qxf'):
-                        fixture_path = os.path.join(item_path, fixture_file)
-                        try:
-                            tree = ET.parse(fixture_path)
-                            root = tree.getroot()
-                            ns = {'': 'http://www.qlcplus.org/FixtureDefinition'}
-                            file_mfr = root.find('.//Manufacturer', ns)
-                            file_model = root.find('.//Model', ns)
-                            if file_mfr is not None and file_model is not None:
-                                if file_mfr.text == manufacturer and file_model.text == model:
-                                    return fixture_path
-                        except:
-                            pass
-
-    return None
+    record = get_fixture_database().find(_get_qxf_fixture_dirs(), manufacturer, model)
+    return record.path if record is not None else None
 
 
 def _parse_qxf_for_visualizer(manufacturer: str, model: str, mode_name: str) -> Dict[str, Any]:
@@ -775,6 +740,23 @@ class VisualizerProtocol:
         }
         return json.dumps(message) + "\n"
 
+    @staticmethod
+    def create_dmx_message(frame: bytes) -> str:
+        """
+        Create a DMX stream message.
+
+        Args:
+            frame: Binary frame from utils.dmx_stream.DMXStreamEncoder
+
+        Returns:
+            JSON string with newline delimiter (frame base64-encoded)
+        """
+        message = {
+            "type": MessageType.DMX.value,
+            "frame": base64.b64encode(frame).decode('ascii')
+        }
+        return json.dumps(message) + "\n"
+
     @staticmethod
     def create_heartbeat_message() -> str:
         """
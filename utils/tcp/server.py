@@ -1,6 +1,7 @@
 # utils/tcp/server.py
 # TCP server for sending configuration to Visualizer
 
+import queue
 import socket
 import threading
 import time
@@ -46,6 +47,14 @@ class VisualizerTCPServer(QObject):
         self.clients: Set[socket.socket] = set()
         self.clients_lock = threading.Lock()
 
+        # DMX stream messages are written by their own thread so a slow
+        # client never blocks the DMX output thread. When the queue is full
+        # frames are dropped; clients resync on the next keyframe.
+        self._dmx_queue: queue.Queue = queue.Queue(maxsize=8)
+        self._dmx_thread: Optional[threading.Thread] = None
+        # Held per message so writes from different threads never interleave
+        self._send_lock = threading.Lock()
+
         print(f"TCP Server initialized on port {port}")
 
     def start(self):
@@ -57,6 +66,8 @@ class VisualizerTCPServer(QObject):
         self.running = True
         self.server_thread = threading.Thread(target=self._run_server, daemon=True)
         self.server_thread.start()
+        self._dmx_thread = threading.Thread(target=self._run_dmx_writer, daemon=True)
+        self._dmx_thread.start()
         print(f"TCP Server started on {self.host}:{self.port}")
 
     def stop(self):
@@ -84,9 +95,12 @@ class VisualizerTCPServer(QObject):
                 pass
             self.server_socket = None
 
-        # Wait for server thread to finish
+        # Wait for server threads to finish
         if self.server_thread and self.server_thread.is_alive():
             self.server_thread.join(timeout=2.0)
+        if self._dmx_thread and self._dmx_thread.is_alive():
+            self._dmx_thread.join(timeout=2.0)
+        self._dmx_thread = None
 
         print("TCP Server stopped")
 
@@ -178,7 +192,8 @@ class VisualizerTCPServer(QObject):
                     # Send heartbeat to keep connection alive
                     try:
                         heartbeat = VisualizerProtocol.create_heartbeat_message()
-                        client_socket.sendall(heartbeat.encode('utf-8'))
+                        with self._send_lock:
+                            client_socket.sendall(heartbeat.encode('utf-8'))
                     except Exception:
                         break
                 except Exception as e:
@@ -215,7 +230,8 @@ class VisualizerTCPServer(QObject):
 
             # Send all messages
             for message in messages:
-                client_socket.sendall(message.encode('utf-8'))
+                with self._send_lock:
+                    client_socket.sendall(message.encode('utf-8'))
                 time.sleep(0.01)  # Small delay between messages
 
             print(f"Sent configuration to client ({len(messages)} messages)")
@@ -240,10 +256,44 @@ class VisualizerTCPServer(QObject):
         with self.clients_lock:
             for client_socket in list(self.clients):
                 try:
-                    client_socket.sendall(message.encode('utf-8'))
+                    with self._send_lock:
+                        client_socket.sendall(message.encode('utf-8'))
                 except Exception as e:
                     print(f"Error sending update to client: {e}")
 
+    def send_dmx_frame(self, frame: bytes):
+        """
+        Queue a DMX stream frame for all connected clients.
+
+        Safe to call from the DMX output thread; never blocks.
+
+        Args:
+            frame: Binary frame from utils.dmx_stream.DMXStreamEncoder
+        """
+        if not self.running or not self.clients:
+            return
+        try:
+            self._dmx_queue.put_nowait(frame)
+        except queue.Full:
+            pass
+
+    def _run_dmx_writer(self):
+        """Write queued DMX stream frames to the clients (runs in background thread)."""
+        while self.running:
+            try:
+                frame = self._dmx_queue.get(timeout=0.5)
+            except queue.Empty:
+                continue
+            message = VisualizerProtocol.create_dmx_message(frame).encode('utf-8')
+            with self.clients_lock:
+                clients = list(self.clients)
+            for client_socket in clients:
+                try:
+                    with self._send_lock:
+                        client_socket.sendall(message)
+                except Exception as e:
+                    print(f"Error sending DMX frame to client: {e}")
+
     def update_config(self, config: Configuration):
         """
         Update configuration and send to all clients.
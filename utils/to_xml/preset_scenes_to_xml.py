@@ -4,7 +4,7 @@
 import xml.etree.ElementTree as ET
 from typing import Dict, List, Tuple, Any, Optional
 from config.models import Configuration, FixtureGroup, FixtureGroupCapabilities
-from utils.effects_utils import get_channels_by_property
+from utils.channel_index import get_channel_index
 from utils.sublane_presets import COLOUR_PRESETS, DIMMER_PRESETS, MOVEMENT_PRESETS
 from utils.orientation import calculate_pan_tilt, pan_tilt_to_dmx
 
@@ -27,20 +27,11 @@ def get_fixture_channels_for_preset(
     if not fixture_def:
         return {}, 0
 
-    mode = next((m for m in fixture_def.get('modes', [])
-                 if m['name'] == fixture.current_mode), None)
-    if not mode:
+    index = get_channel_index(fixture_def, fixture.current_mode)
+    if not index.mode:
         return {}, 0
 
-    total_channels = len(mode.get('channels', []))
-    channels_info = get_channels_by_property(fixture_def, fixture.current_mode, preset_names)
-
-    # Convert to simple dict
-    channels_dict = {}
-    for preset, channel_list in channels_info.items():
-        channels_dict[preset] = [c['channel'] for c in channel_list]
-
-    return channels_dict, total_channels
+    return index.channel_numbers(preset_names), index.channel_count
 
 
 def get_color_wheel_channel(fixture, fixture_definitions: Dict[str, Any]) -> Optional[int]:
@@ -262,24 +253,13 @@ def get_fixture_channel_info(
     if not fixture_def:
         return {}, 0
 
-    # Get total channel count
-    mode = next((m for m in fixture_def.get('modes', [])
-                 if m['name'] == fixture.current_mode), None)
-    if not mode:
+    index = get_channel_index(fixture_def, fixture.current_mode)
+    if not index.mode:
         return {}, 0
 
-    total_channels = len(mode.get('channels', []))
-
-    # Get channels by property
+    # Channels by property as preset -> [channel_numbers]
     all_presets = list(COLOUR_PRESETS) + list(DIMMER_PRESETS) + list(MOVEMENT_PRESETS)
-    channels_info = get_channels_by_property(fixture_def, fixture.current_mode, all_presets)
-
-    # Convert to simple dict of preset -> [channel_numbers]
-    channels_by_preset = {}
-    for preset, channel_list in channels_info.items():
-        channels_by_preset[preset] = [c['channel'] for c in channel_list]
-
-    return channels_by_preset, total_channels
+    return index.channel_numbers(all_presets), index.channel_count
 
 
 def get_color_wheel_info(
@@ -0,0 +1,121 @@
+"""Streaming writer for QLC+ workspace (.qxw) files.
+
+`create_qlc_workspace` used to build the whole workspace as one ElementTree,
+serialize it with `ET.tostring`, re-parse that into a `xml.dom.minidom`
+document and pretty-print it. Large tour exports kept three copies of the
+document alive at once (tree, byte string, DOM) plus the pretty string.
+
+`QxwWriter` instead writes elements to the file as soon as they are complete
+and lets the caller drop them: container elements (Workspace, Engine) are
+opened and closed explicitly, everything else is written as a finished
+subtree. The layout matches what `minidom.toprettyxml(indent="  ")` produced,
+so the file content is unchanged:
+
+    * one element per line, two-space indent per level
+    * an element whose only content is text stays on one line
+    * childless elements are written as ``<Tag attr="..."/>``
+    * ``& < > "`` are escaped in text and attribute values
+"""
+from __future__ import annotations
+
+import os
+import xml.etree.ElementTree as ET
+from typing import List
+
+
+def _escape(data: str) -> str:
+    return (data.replace("&", "&amp;").replace("<", "&lt;")
+            .replace("\"", "&quot;").replace(">", "&gt;"))
+
+
+class QxwWriter:
+    """Writes a workspace file incrementally, one element subtree at a time."""
+
+    HEADER = '<?xml version="1.0" encoding="UTF-8"?>\n<!DOCTYPE Workspace>\n'
+
+    def __init__(self, path: str, indent: str = "  "):
+        # Written next to the target and moved into place by close(), so a
+        # failed export never leaves a truncated workspace behind
+        self._path = path
+        self._tmp_path = path + ".part"
+        self._file = open(self._tmp_path, "w", encoding="UTF-8")
+        self._indent = indent
+        self._open_tags: List[str] = []
+        self._file.write(self.HEADER)
+
+    def __enter__(self) -> "QxwWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+    def close(self):
+        """Finish the file and move it to its final path."""
+        if not self._file.closed:
+            self._file.close()
+            os.replace(self._tmp_path, self._path)
+
+    def abort(self):
+        """Discard everything written so far."""
+        if not self._file.closed:
+            self._file.close()
+            os.remove(self._tmp_path)
+
+    def _start_tag(self, elem: ET.Element) -> str:
+        parts = ["<", elem.tag]
+        for name, value in elem.attrib.items():
+            parts.append(f' {name}="{_escape(value)}"')
+        return "".join(parts)
+
+    def start(self, elem: ET.Element):
+        """Open a container element. Its children are written later via write()/flush()."""
+        self._file.write(self._indent * len(self._open_tags) + self._start_tag(elem) + ">\n")
+        self._open_tags.append(elem.tag)
+
+    def end(self):
+        """Close the innermost container opened with start()."""
+        tag = self._open_tags.pop()
+        self._file.write(f"{self._indent * len(self._open_tags)}</{tag}>\n")
+
+    def write(self, elem: ET.Element):
+        """Write a complete element subtree inside the innermost open container."""
+        out: List[str] = []
+        self._serialize(elem, self._indent * len(self._open_tags), out)
+        self._file.write("".join(out))
+
+    def flush(self, parent: ET.Element):
+        """Write the children of an open container and detach them from it."""
+        for child in list(parent):
+            self.write(child)
+            parent.remove(child)
+
+    def _serialize(self, elem: ET.Element, indent: str, out: List[str]):
+        # Same node list minidom would see: text, then each child and its tail
+        nodes = []
+        if elem.text:
+            nodes.append(elem.text)
+        for child in elem:
+            nodes.append(child)
+            if child.tail:
+                nodes.append(child.tail)
+
+        out.append(indent)
+        out.append(self._start_tag(elem))
+        if not nodes:
+            out.append("/>\n")
+            return
+        if len(nodes) == 1 and isinstance(nodes[0], str):
+            out.append(f">{_escape(nodes[0])}</{elem.tag}>\n")
+            return
+
+        out.append(">\n")
+        child_indent = indent + self._indent
+        for node in nodes:
+            if isinstance(node, str):
+                out.append(f"{child_indent}{_escape(node)}\n")
+            else:
+                self._serialize(node, child_indent, out)
+        out.append(f"{indent}</{elem.tag}>\n")
@@ -1,5 +1,9 @@
+import contextlib
+import io
+import multiprocessing
 import os
 import xml.etree.ElementTree as ET
+from concurrent.futures import ProcessPoolExecutor
 from config.models import Configuration
 from utils.to_xml.step_compaction import compact_step_values
 from effects.timing import movement_total_cycles
@@ -755,9 +759,162 @@ def _generate_movement_shape_steps(movement_block, fixture_def, mode_name, fixtu
     return steps
 
 
+def _lane_targets(lane):
+    """Fixture targets of a lane (falls back to the old single fixture_group field)"""
+    targets = getattr(lane, 'fixture_targets', [])
+    if not targets and hasattr(lane, 'fixture_group') and lane.fixture_group:
+        targets = [lane.fixture_group]
+    return targets
+
+
+def _group_fixtures_by_group(fixtures):
+    """Split fixtures into {group_name: [fixtures]}, keeping first-seen group order"""
+    fixtures_by_group = {}
+    for fixture in fixtures:
+        fixtures_by_group.setdefault(fixture.group, []).append(fixture)
+    return fixtures_by_group
+
+
+def _track_export_overrides(export_overrides, group_name):
+    """Per-track export overrides with the group's intensity scaling applied"""
+    track_overrides = dict(export_overrides)
+    track_overrides['group_max_intensity'] = export_overrides.get('group_intensities', {}).get(group_name, 255)
+    return track_overrides
+
+
+def _has_sublane_blocks(block):
+    return bool(block.dimmer_blocks or block.colour_blocks or
+                block.movement_blocks or block.special_blocks)
+
+
+def _light_block_timing(block, song_structure):
+    """Start time of a LightBlock's sublane blocks, plus the BPM and signature there"""
+    block_start_time = min(b.start_time for b in (
+        list(block.dimmer_blocks) +
+        list(block.colour_blocks) +
+        list(block.movement_blocks) +
+        list(block.special_blocks)
+    ))
+    part_at_block = song_structure.get_part_at_time(block_start_time)
+    block_bpm = part_at_block.bpm if part_at_block else 120
+    block_signature = part_at_block.signature if part_at_block else "4/4"
+    return block_start_time, block_bpm, block_signature
+
+
+def _iter_unified_step_jobs(config, export_overrides):
+    """
+    Yields (job_key, kwargs) for every unified sequence create_shows() generates,
+    in export order. kwargs are the generate_unified_sequence_steps() arguments
+    apart from fixture_id_map/fixture_definitions. Mirrors the skip rules of
+    create_tracks_from_timeline() without its logging.
+    """
+    from timeline.song_structure import SongStructure
+    from utils.target_resolver import resolve_targets_unique
+
+    for show in config.shows.values():
+        if not (show.timeline_data and show.timeline_data.lanes):
+            continue
+        song_structure = SongStructure()
+        song_structure.load_from_show_parts(show.parts)
+
+        for lane in show.timeline_data.lanes:
+            targets = _lane_targets(lane)
+            if not targets:
+                continue
+            resolved_fixtures = resolve_targets_unique(targets, config)
+            if not resolved_fixtures:
+                continue
+            sorted_lane_fixtures = sorted(resolved_fixtures, key=lambda f: f.x)
+
+            for group_name, group_fixtures in _group_fixtures_by_group(resolved_fixtures).items():
+                track_overrides = _track_export_overrides(export_overrides, group_name)
+                for block in lane.light_blocks:
+                    if not _has_sublane_blocks(block):
+                        continue
+                    _, block_bpm, block_signature = _light_block_timing(block, song_structure)
+                    yield (id(block), group_name), dict(
+                        fixtures=group_fixtures,
+                        light_block=block,
+                        bpm=block_bpm,
+                        signature=block_signature,
+                        all_lane_fixtures=sorted_lane_fixtures,
+                        config=config,
+                        export_overrides=track_overrides
+                    )
+
+
+# Per-process state for export workers, set up once by _init_step_worker
+_step_worker_jobs = []
+_step_worker_maps = ({}, {})
+
+
+def _init_step_worker(config, fixture_id_map, fixture_definitions, export_overrides):
+    global _step_worker_jobs, _step_worker_maps
+    _step_worker_jobs = [kwargs for _, kwargs in _iter_unified_step_jobs(config, export_overrides)]
+    _step_worker_maps = (fixture_id_map, fixture_definitions)
+
+
+def _run_step_job(job_index):
+    from utils.to_xml.unified_sequence import generate_unified_sequence_steps
+
+    fixture_id_map, fixture_definitions = _step_worker_maps
+    # Per-step debug output from many processes would interleave; the parent
+    # still logs the show/lane/block structure while assembling the XML
+    with contextlib.redirect_stdout(io.StringIO()):
+        return generate_unified_sequence_steps(
+            fixture_id_map=fixture_id_map,
+            fixture_definitions=fixture_definitions,
+            **_step_worker_jobs[job_index]
+        )
+
+
+def precompute_unified_steps(config, fixture_id_map, fixture_definitions,
+                             export_overrides: dict = None, workers: int = None):
+    """
+    Generates the unified sequence steps of all shows in a process pool.
+
+    Every worker gets its own copy of the configuration and fixture
+    definitions once, then receives job indexes into the same ordered job
+    list. Function IDs are not assigned here: create_tracks_from_timeline()
+    still builds the XML serially and just picks up the finished steps, so
+    the workspace is identical to a serial export.
+
+    Parameters:
+        config: Configuration object containing show data
+        fixture_id_map: Dictionary mapping fixture (universe, address) to sequential IDs
+        fixture_definitions: Dictionary of fixture definitions loaded from QLC+
+        export_overrides: Optional dict with export-time overrides
+        workers: Number of worker processes (default: CPU count)
+    Returns:
+        dict: (id(light_block), group_name) -> list of Step elements, or the
+        exception raised while generating them
+    """
+    if export_overrides is None:
+        export_overrides = {}
+    job_keys = [key for key, _ in _iter_unified_step_jobs(config, export_overrides)]
+    if not job_keys:
+        return {}
+
+    max_workers = min(workers or os.cpu_count() or 1, len(job_keys))
+    results = {}
+    # spawn: the parent may be the Qt GUI, whose threads make fork unsafe
+    with ProcessPoolExecutor(max_workers=max_workers,
+                             mp_context=multiprocessing.get_context("spawn"),
+                             initializer=_init_step_worker,
+                             initargs=(config, fixture_id_map, fixture_definitions, export_overrides)) as pool:
+        futures = [pool.submit(_run_step_job, job_index) for job_index in range(len(job_keys))]
+        for key, future in zip(job_keys, futures):
+            try:
+                results[key] = future.result()
+            except Exception as e:
+                results[key] = e
+    return results
+
+
 def create_tracks_from_timeline(show_function, engine, show, config, fixture_id_map,
                                 function_id_counter, fixture_definitions,
-                                export_overrides: dict = None):
+                                export_overrides: dict = None,
+                                precomputed_steps: dict = None):
     """
     Creates Track elements from timeline_data (new timeline-based format).
 
@@ -770,11 +927,15 @@ def create_tracks_from_timeline(show_function, engine, show, config, fixture_id_
         function_id_counter: Current function ID counter
         fixture_definitions: Dictionary of fixture definitions loaded from QLC+
         export_overrides: Optional dict with export-time overrides
+        precomputed_steps: Optional dict from precompute_unified_steps(); blocks
+            found in it reuse those steps instead of generating them here
     Returns:
         int: Next available function ID
     """
     if export_overrides is None:
         export_overrides = {}
+    if precomputed_steps is None:
+        precomputed_steps = {}
     from timeline.song_structure import SongStructure
     from utils.target_resolver import resolve_targets_unique, validate_targets, detect_targets_capabilities
 
@@ -798,9 +959,7 @@ def create_tracks_from_timeline(show_function, engine, show, config, fixture_id_
         print(f"    light_blocks count: {len(lane.light_blocks)}")
 
         # Get fixture targets (with backward compatibility for old fixture_group field)
-        targets = getattr(lane, 'fixture_targets', [])
-        if not targets and hasattr(lane, 'fixture_group') and lane.fixture_group:
-            targets = [lane.fixture_group]
+        targets = _lane_targets(lane)
 
         print(f"    Resolved targets: {targets}")
 
@@ -828,12 +987,7 @@ def create_tracks_from_timeline(show_function, engine, show, config, fixture_id_
 
         # Group fixtures by their fixture group for separate track processing
         # This handles multi-target lanes by creating one track per fixture group
-        fixtures_by_group = {}
-        for fixture in resolved_fixtures:
-            group_name = fixture.group
-            if group_name not in fixtures_by_group:
-                fixtures_by_group[group_name] = []
-            fixtures_by_group[group_name].append(fixture)
+        fixtures_by_group = _group_fixtures_by_group(resolved_fixtures)
 
         print(f"    fixtures_by_group: {list(fixtures_by_group.keys())}")
 
@@ -894,9 +1048,8 @@ def create_tracks_from_timeline(show_function, engine, show, config, fixture_id_
             has_movement = group_capabilities.has_movement if group_capabilities else False
 
             # Build per-group export overrides with group-specific intensity scaling
-            track_overrides = dict(export_overrides)
-            group_intensity = export_overrides.get('group_intensities', {}).get(group_name, 255)
-            track_overrides['group_max_intensity'] = group_intensity
+            track_overrides = _track_export_overrides(export_overrides, group_name)
+            group_intensity = track_overrides['group_max_intensity']
 
             # Process light blocks using unified sequence approach
             # This creates ONE sequence per LightBlock with ALL effects combined
@@ -906,12 +1059,7 @@ def create_tracks_from_timeline(show_function, engine, show, config, fixture_id_
 
             for block_idx, block in enumerate(lane.light_blocks):
                 # Check if this block has any sublane blocks
-                has_any_blocks = (
-                    block.dimmer_blocks or
-                    block.colour_blocks or
-                    block.movement_blocks or
-                    block.special_blocks
-                )
+                has_any_blocks = _has_sublane_blocks(block)
 
                 print(f"      Block {block_idx}: dimmer={len(block.dimmer_blocks)}, colour={len(block.colour_blocks)}, movement={len(block.movement_blocks)}, special={len(block.special_blocks)}, has_any={has_any_blocks}")
 
@@ -919,40 +1067,34 @@ def create_tracks_from_timeline(show_function, engine, show, config, fixture_id_
                     print(f"      Skipping block {block_idx} - no sublane blocks")
                     continue
 
-                # Find the time range of all blocks in this LightBlock
-                all_sublane_blocks = (
-                    list(block.dimmer_blocks) +
-                    list(block.colour_blocks) +
-                    list(block.movement_blocks) +
-                    list(block.special_blocks)
-                )
-
-                block_start_time = min(b.start_time for b in all_sublane_blocks)
-                block_end_time = max(b.end_time for b in all_sublane_blocks)
+                # Find the start of all blocks in this LightBlock, and the BPM
+                # and song part there
+                block_start_time, block_bpm, block_signature = _light_block_timing(block, song_structure)
                 block_start_time_ms = int(block_start_time * 1000)
 
-                # Find BPM and song part at block start
-                part_at_block = song_structure.get_part_at_time(block_start_time)
-                block_bpm = part_at_block.bpm if part_at_block else 120
-                block_signature = part_at_block.signature if part_at_block else "4/4"
-
                 # Generate unified sequence steps
                 # Pass all_lane_fixtures (sorted by position) for cross-group effects like ping-pong
                 print(f"      Generating unified steps: bpm={block_bpm}, signature={block_signature}")
                 print(f"        fixtures count: {len(group_fixtures)}, fixture_id_map has {len(fixture_id_map)} entries")
                 print(f"        fixture_definitions has {len(fixture_definitions)} entries")
                 try:
-                    steps = generate_unified_sequence_steps(
-                        fixtures=group_fixtures,
-                        fixture_id_map=fixture_id_map,
-                        fixture_definitions=fixture_definitions,
-                        light_block=block,
-                        bpm=block_bpm,
-                        signature=block_signature,
-                        all_lane_fixtures=sorted_lane_fixtures,  # All fixtures in lane for cross-group effects
-                        config=config,  # Pass config for spot targeting
-                        export_overrides=track_overrides
-                    )
+                    job_key = (id(block), group_name)
+                    if job_key in precomputed_steps:
+                        steps = precomputed_steps[job_key]
+                        if isinstance(steps, Exception):
+                            raise steps
+                    else:
+                        steps = generate_unified_sequence_steps(
+                            fixtures=group_fixtures,
+                            fixture_id_map=fixture_id_map,
+                            fixture_definitions=fixture_definitions,
+                            light_block=block,
+                            bpm=block_bpm,
+                            signature=block_signature,
+                            all_lane_fixtures=sorted_lane_fixtures,  # All fixtures in lane for cross-group effects
+                            config=config,  # Pass config for spot targeting
+                            export_overrides=track_overrides
+                        )
 
                     print(f"      Generated {len(steps) if steps else 0} steps")
 
@@ -996,7 +1138,7 @@ def create_tracks_from_timeline(show_function, engine, show, config, fixture_id_
 
 
 def create_shows(engine, config: Configuration, fixture_id_map: dict, fixture_definitions: dict,
-                  export_overrides: dict = None):
+                  export_overrides: dict = None, workers: int = 1, on_show_created=None):
     """
     Creates show function elements from Configuration data
 
@@ -1006,6 +1148,10 @@ def create_shows(engine, config: Configuration, fixture_id_map: dict, fixture_de
         fixture_id_map: Dictionary mapping fixture object IDs to their sequential IDs
         fixture_definitions: Dictionary of fixture definitions loaded from QLC+
         export_overrides: Optional dict with export-time overrides (e.g. group_intensities)
+        workers: Worker processes for step generation; 1 generates serially,
+            0/None uses one per CPU. Output is the same either way.
+        on_show_created: Optional callback invoked after each show's functions
+            were added to engine (used to stream them to disk and free them)
     Returns:
         int: Next available function ID
     """
@@ -1013,6 +1159,12 @@ def create_shows(engine, config: Configuration, fixture_id_map: dict, fixture_de
         export_overrides = {}
     function_id_counter = 0
 
+    precomputed_steps = None
+    if workers != 1:
+        print(f"\n>>> Generating sequence steps with {workers or os.cpu_count()} worker processes")
+        precomputed_steps = precompute_unified_steps(config, fixture_id_map, fixture_definitions,
+                                                     export_overrides, workers)
+
     # Process each show in the configuration
     for show_name, show in config.shows.items():
         # Debug info
@@ -1046,12 +1198,16 @@ def create_shows(engine, config: Configuration, fixture_id_map: dict, fixture_de
                 fixture_id_map,
                 function_id_counter,
                 fixture_definitions,
-                export_overrides=export_overrides
+                export_overrides=export_overrides,
+                precomputed_steps=precomputed_steps
             )
             print(f"Successfully created show from timeline: {show_name}")
         else:
             print(f"    Skipping show '{show_name}' - no timeline data")
 
+        if on_show_created:
+            on_show_created()
+
     return function_id_counter
 
 
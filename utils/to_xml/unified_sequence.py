@@ -1,13 +1,22 @@
 # unified_sequence.py
 # Functions for creating unified QLC+ sequences that combine all effect types
 
+import bisect
 import math
 import xml.etree.ElementTree as ET
 from typing import List, Dict, Any, Optional, Tuple
-from utils.effects_utils import get_channels_by_property, find_closest_color_dmx
-from utils.orientation import calculate_pan_tilt, pan_tilt_to_dmx
+from utils.effects_utils import find_closest_color_dmx
+from utils.channel_index import get_channel_index
+from utils.orientation import (
+    calculate_pan_tilt, pan_tilt_to_dmx,
+    get_inverse_orientation, calculate_pan_tilt_batch, pan_tilt_to_dmx_batch,
+)
 from utils.to_xml.step_compaction import compact_step_values
-from effects.timing import movement_total_cycles
+from effects.timing import movement_total_cycles, parse_speed
+from effects.types import DimmerBatchContext
+from effects.dimmer_kernels import evaluate_dimmer_batch
+
+import numpy as np
 
 
 def _map_rgb_to_color_wheel(r: int, g: int, b: int) -> int:
@@ -721,6 +730,161 @@ def sample_dimmer_at_time(
     return base_intensity
 
 
+# Export effects whose per-fixture math is identical to the batched kernels
+# (sparkle and waterfall use export-specific seeds and stay scalar)
+_EXPORT_KERNEL_EFFECTS = {
+    "static", "strobe", "ping_pong", "random_stroke", "chase",
+    "stroke", "pulse", "wave", "heartbeat",
+}
+# Effects sample_dimmer_at_time handles explicitly; anything else exports as static
+_EXPORT_DIMMER_EFFECTS = _EXPORT_KERNEL_EFFECTS | {"sparkle", "waterfall"}
+
+# Dimmer effects whose exported value changes within a block; every other
+# effect exports as a constant intensity (see sample_dimmer_at_time)
+_ANIMATED_DIMMER_EFFECTS = _EXPORT_DIMMER_EFFECTS - {"static"}
+# These hold the block's base intensity when the lane has a single fixture
+_SINGLE_FIXTURE_STATIC_DIMMER_EFFECTS = {"ping_pong", "random_stroke", "chase"}
+# Movement shapes; any other movement effect holds the center position
+_ANIMATED_MOVEMENT_EFFECTS = {
+    "circle", "diamond", "square", "triangle", "figure_8", "lissajous", "random", "bounce",
+}
+
+
+def calculate_change_steps(
+    step_times_ms: List[int],
+    dimmer_blocks: List,
+    colour_blocks: List,
+    movement_blocks: List,
+    special_blocks: List,
+    total_fixtures: int,
+    dimmer_rows: Optional[List[List[Optional[int]]]] = None
+) -> List[int]:
+    """
+    Find the grid steps at which the sequence output can change.
+
+    Colour and special blocks, static movement and non-animated dimmer
+    effects produce the same values for their whole duration, so between
+    block boundaries only animated blocks need every grid step sampled.
+    If the dimmer values for the whole grid are known, animated dimmer
+    effects only count where those values actually change (e.g. strobe
+    toggles). A step that is not returned is guaranteed to equal the step
+    before it.
+
+    Args:
+        step_times_ms: Step grid from calculate_unified_step_grid
+        dimmer_blocks: List of DimmerBlock objects
+        colour_blocks: List of ColourBlock objects
+        movement_blocks: List of MovementBlock objects
+        special_blocks: List of SpecialBlock objects
+        total_fixtures: Number of fixtures dimmer effects are spread across
+        dimmer_rows: Optional sample_dimmer_matrix result for every grid step
+
+    Returns:
+        Sorted grid indices, always starting with 0 when the grid is non-empty
+    """
+    if not step_times_ms:
+        return []
+    # Same float times build_unified_step compares block bounds against
+    times_s = [t / 1000.0 for t in step_times_ms]
+    total_steps = len(times_s)
+
+    animated_dimmer = _ANIMATED_DIMMER_EFFECTS
+    if total_fixtures <= 1:
+        animated_dimmer = animated_dimmer - _SINGLE_FIXTURE_STATIC_DIMMER_EFFECTS
+
+    change_steps = {0}
+    for blocks, animated_effects in ((dimmer_blocks, animated_dimmer),
+                                     (movement_blocks, _ANIMATED_MOVEMENT_EFFECTS),
+                                     (colour_blocks, ()),
+                                     (special_blocks, ())):
+        for block in blocks:
+            # First step at which the block is active / no longer active
+            first = bisect.bisect_left(times_s, block.start_time)
+            stop = bisect.bisect_left(times_s, block.end_time)
+            change_steps.add(first)
+            change_steps.add(stop)
+            if getattr(block, 'effect_type', None) not in animated_effects:
+                continue
+            if dimmer_rows is not None and blocks is dimmer_blocks and block.effect_type in _EXPORT_KERNEL_EFFECTS:
+                # The step only depends on the sampled intensities here
+                change_steps.update(i for i in range(first + 1, stop) if dimmer_rows[i] != dimmer_rows[i - 1])
+            else:
+                change_steps.update(range(first, stop))
+
+    return sorted(i for i in change_steps if i < total_steps)
+
+
+def sample_dimmer_matrix(
+    times_s: List[float],
+    dimmer_blocks: List,
+    fixture_indices: List[int],
+    total_fixtures: int,
+    bpm: float = 120.0,
+    max_intensity: int = 255
+) -> List[List[Optional[int]]]:
+    """
+    Sample dimmer intensities for many steps and fixtures at once.
+
+    Produces the same values as calling sample_dimmer_at_time for every
+    (time, fixture) pair, but evaluates each block's effect with one
+    batched kernel call instead of one Python call per sample.
+
+    Args:
+        times_s: Step times in seconds
+        dimmer_blocks: List of DimmerBlock objects
+        fixture_indices: Index of each fixture in the group (for per-fixture effects)
+        total_fixtures: Total number of fixtures in the group
+        bpm: Beats per minute for timing calculations
+        max_intensity: Maximum intensity for this group (0-255), scales proportionally
+
+    Returns:
+        One row per time with one intensity (0-255) or None per fixture
+    """
+    times = np.asarray(times_s, dtype=float)
+    result: List[List[Optional[int]]] = [[None] * len(fixture_indices) for _ in range(len(times))]
+    if len(times) == 0 or not fixture_indices:
+        return result
+
+    # First matching block wins, as in sample_dimmer_at_time
+    unassigned = np.ones(len(times), dtype=bool)
+    fixture_array = np.asarray(fixture_indices)[None, :]
+    for block in dimmer_blocks:
+        mask = unassigned & (times >= block.start_time) & (times < block.end_time)
+        if not mask.any():
+            continue
+        unassigned &= ~mask
+        step_indices = np.nonzero(mask)[0]
+
+        effect_type = block.effect_type
+        if effect_type not in _EXPORT_DIMMER_EFFECTS:
+            effect_type = "static"
+        if effect_type not in _EXPORT_KERNEL_EFFECTS or (effect_type == "wave" and total_fixtures <= 1):
+            for step_idx in step_indices:
+                for col, fixture_idx in enumerate(fixture_indices):
+                    result[step_idx][col] = sample_dimmer_at_time(
+                        float(times[step_idx]), [block], fixture_idx, total_fixtures,
+                        int(step_idx), len(times), bpm, max_intensity=max_intensity)
+            continue
+
+        base_intensity = int(int(block.intensity) * max_intensity / 255)
+        ctx = DimmerBatchContext(
+            block_duration=block.end_time - block.start_time,
+            speed_multiplier=parse_speed(block.effect_speed),
+            bpm=bpm,
+            total_fixtures=total_fixtures,
+            num_segments=1,
+            block_start_time=block.start_time,
+            is_segmented=False,
+        )
+        multipliers = evaluate_dimmer_batch(
+            effect_type, ctx, times[step_indices][:, None] - block.start_time, fixture_array, 0)
+        values = (base_intensity * multipliers).astype(int)
+        for row, step_idx in zip(values.tolist(), step_indices):
+            result[step_idx] = row
+
+    return result
+
+
 def sample_movement_at_time(
     time_s: float,
     movement_blocks: List,
@@ -731,7 +895,8 @@ def sample_movement_at_time(
     bpm: float = 120.0,
     signature: str = "4/4",
     config: Any = None,
-    fixture: Any = None
+    fixture: Any = None,
+    spot_centers: Optional[Dict[int, Tuple[float, float]]] = None
 ) -> Optional[Tuple[int, int]]:
     """
     Sample the pan/tilt position at a given time.
@@ -747,6 +912,8 @@ def sample_movement_at_time(
         signature: Time signature (e.g., "4/4")
         config: Configuration object (for spot lookup)
         fixture: Fixture object (for position and orientation)
+        spot_centers: Precomputed spot-target centers for this fixture, keyed by
+                      id(block) (from resolve_spot_centers)
 
     Returns:
         Tuple of (pan, tilt) values (0-255) or None if no movement block at this time
@@ -764,7 +931,9 @@ def sample_movement_at_time(
     effect_type = active_block.effect_type
 
     # Check if we have a target spot - if so, calculate pan/tilt to point at it
-    if active_block.target_spot_name and config and fixture and hasattr(config, 'spots'):
+    if spot_centers is not None and id(active_block) in spot_centers:
+        center_pan, center_tilt = spot_centers[id(active_block)]
+    elif active_block.target_spot_name and config and fixture and hasattr(config, 'spots'):
         spot = config.spots.get(active_block.target_spot_name)
         if spot:
             # Get effective orientation (considering group defaults)
@@ -933,6 +1102,58 @@ def sample_movement_at_time(
     return (int(pan), int(tilt))
 
 
+def resolve_spot_centers(
+    movement_blocks: List,
+    fixtures: List,
+    config: Any = None
+) -> List[Dict[int, Tuple[float, float]]]:
+    """
+    Solve spot-targeted movement centers for all fixtures up front.
+
+    A spot target does not move during a block, so each block's pan/tilt
+    center is solved once for every fixture in a single batched call instead
+    of once per step per fixture.
+
+    Args:
+        movement_blocks: List of MovementBlock objects
+        fixtures: Fixture objects (one result entry per fixture, same order)
+        config: Configuration object (for spot and group lookup)
+
+    Returns:
+        Per fixture, a dict of id(block) -> (center_pan, center_tilt) DMX values
+    """
+    centers: List[Dict[int, Tuple[float, float]]] = [{} for _ in fixtures]
+    if not fixtures or not config or not hasattr(config, 'spots'):
+        return centers
+
+    spot_blocks = [
+        (block, config.spots.get(block.target_spot_name))
+        for block in movement_blocks if block.target_spot_name
+    ]
+    spot_blocks = [(block, spot) for block, spot in spot_blocks if spot]
+    if not spot_blocks:
+        return centers
+
+    # Fixture geometry is shared by every block
+    positions = np.empty((len(fixtures), 3))
+    inverse_orientations = np.empty((len(fixtures), 3, 3))
+    for idx, fixture in enumerate(fixtures):
+        group = config.groups.get(fixture.group) if fixture.group else None
+        mounting, yaw, pitch, roll = fixture.get_effective_orientation(group)
+        positions[idx] = (fixture.x, fixture.y, fixture.get_effective_z(group))
+        inverse_orientations[idx] = get_inverse_orientation(yaw, pitch, roll)
+
+    # (blocks, 1, 3) targets broadcast against (fixtures, 3) positions
+    targets = np.array([[(spot.x, spot.y, spot.z)] for _, spot in spot_blocks], dtype=float)
+    pan_degrees, tilt_degrees = calculate_pan_tilt_batch(positions, inverse_orientations, targets)
+    pan_dmx, tilt_dmx = pan_tilt_to_dmx_batch(pan_degrees, tilt_degrees)
+
+    for row, (block, _) in enumerate(spot_blocks):
+        for idx in range(len(fixtures)):
+            centers[idx][id(block)] = (float(pan_dmx[row, idx]), float(tilt_dmx[row, idx]))
+    return centers
+
+
 def sample_colour_at_time(
     time_s: float,
     colour_blocks: List
@@ -1021,7 +1242,9 @@ def build_unified_step(
     bpm: float = 120.0,  # BPM for timing calculations
     signature: str = "4/4",  # Time signature for movement calculations
     config: Any = None,  # Configuration object for spot targeting
-    export_overrides: dict = None
+    export_overrides: dict = None,
+    dimmer_values: Optional[List[Optional[int]]] = None,  # Precomputed per-fixture dimmer values
+    spot_centers: Optional[List[Dict[int, Tuple[float, float]]]] = None  # Precomputed spot centers
 ) -> ET.Element:
     """
     Build a single unified step with all channel values for all fixtures.
@@ -1042,6 +1265,9 @@ def build_unified_step(
         bpm: BPM for timing calculations
         signature: Time signature for movement calculations
         config: Configuration object for spot targeting
+        dimmer_values: Dimmer value per entry in fixtures (from sample_dimmer_matrix);
+                       sampled per fixture when None
+        spot_centers: Spot-target centers per entry in fixtures (from resolve_spot_centers)
 
     Returns:
         ET.Element for the Step
@@ -1093,7 +1319,8 @@ def build_unified_step(
             "SpeedPanTiltSlowFast", "SpeedPanTiltFastSlow"
         ]
 
-        channels_dict = get_channels_by_property(fixture_def, fixture.current_mode, all_presets)
+        # Shared, memoized lookup from the per-mode channel index (read-only)
+        channels_dict = get_channel_index(fixture_def, fixture.current_mode).lookup(all_presets)
         if not channels_dict:
             values.append(f"{fixture_id}:")
             continue
@@ -1104,8 +1331,12 @@ def build_unified_step(
         # Sample all effect types at this time
         # Use global_fixture_idx and total_fixtures_for_effects for cross-group effects
         _max_intensity = export_overrides.get('group_max_intensity', 255) if export_overrides else 255
-        dimmer_value = sample_dimmer_at_time(time_s, dimmer_blocks, global_fixture_idx, total_fixtures_for_effects, step_idx, total_steps, bpm, max_intensity=_max_intensity)
-        movement_values = sample_movement_at_time(time_s, movement_blocks, global_fixture_idx, total_fixtures_for_effects, step_idx, total_steps, bpm, signature, config, fixture)
+        if dimmer_values is not None:
+            dimmer_value = dimmer_values[fixture_idx]
+        else:
+            dimmer_value = sample_dimmer_at_time(time_s, dimmer_blocks, global_fixture_idx, total_fixtures_for_effects, step_idx, total_steps, bpm, max_intensity=_max_intensity)
+        movement_values = sample_movement_at_time(time_s, movement_blocks, global_fixture_idx, total_fixtures_for_effects, step_idx, total_steps, bpm, signature, config, fixture,
+                                                  spot_centers=spot_centers[fixture_idx] if spot_centers is not None else None)
         colour_values = sample_colour_at_time(time_s, colour_blocks)
         special_values = sample_special_at_time(time_s, special_blocks)
 
@@ -1508,8 +1739,31 @@ def generate_unified_sequence_steps(
     total_steps = len(step_times_ms)
     steps = []
 
-    for step_idx, step_time_ms in enumerate(step_times_ms):
+    # Sample the dimmer effect for every step and fixture in one batch
+    fixture_to_global_idx = {id(f): idx for idx, f in enumerate(all_lane_fixtures)}
+    max_intensity = export_overrides.get('group_max_intensity', 255) if export_overrides else 255
+    dimmer_matrix = sample_dimmer_matrix(
+        [t / 1000.0 for t in step_times_ms],
+        dimmer_blocks,
+        [fixture_to_global_idx.get(id(f), idx) for idx, f in enumerate(fixtures)],
+        len(all_lane_fixtures),
+        bpm,
+        max_intensity=max_intensity,
+    )
+
+    # Only build steps where the output can change; every skipped grid step
+    # repeats the previous one, so it is folded into that step's hold time
+    change_steps = calculate_change_steps(
+        step_times_ms, dimmer_blocks, colour_blocks, movement_blocks, special_blocks,
+        len(all_lane_fixtures), dimmer_rows=dimmer_matrix
+    )
+    print(f"        [unified_sequence] change points={len(change_steps)} of {total_steps} grid steps")
+    spot_centers = resolve_spot_centers(movement_blocks, fixtures, config)
+
+    for row, step_idx in enumerate(change_steps):
+        step_time_ms = step_times_ms[step_idx]
         time_s = step_time_ms / 1000.0
+        next_step_idx = change_steps[row + 1] if row + 1 < len(change_steps) else total_steps
 
         step = build_unified_step(
             step_idx=step_idx,
@@ -1527,8 +1781,11 @@ def generate_unified_sequence_steps(
             bpm=bpm,  # Pass BPM for timing-based effects like ping-pong
             signature=signature,  # Pass signature for movement timing
             config=config,  # Pass config for spot targeting
-            export_overrides=export_overrides
+            export_overrides=export_overrides,
+            dimmer_values=dimmer_matrix[step_idx],
+            spot_centers=spot_centers
         )
+        step.set("Hold", str(step_duration_ms * (next_step_idx - step_idx)))
 
         steps.append(step)
 
@@ -4,7 +4,7 @@
 import xml.etree.ElementTree as ET
 from typing import Dict, List, Tuple, Any, Optional
 from config.models import Configuration, FixtureGroup, FixtureGroupCapabilities
-from utils.effects_utils import get_channels_by_property
+from utils.channel_index import get_channel_index
 from utils.sublane_presets import COLOUR_PRESETS, DIMMER_PRESETS, MOVEMENT_PRESETS, SPECIAL_PRESETS
 from utils.orientation import calculate_pan_tilt, pan_tilt_to_dmx
 from utils.to_xml.preset_scenes_to_xml import MOVEMENT_PRESETS_POS
@@ -411,20 +411,11 @@ def get_fixture_channels_for_preset(
     if not fixture_def:
         return {}, 0
 
-    mode = next((m for m in fixture_def.get('modes', [])
-                 if m['name'] == fixture.current_mode), None)
-    if not mode:
+    index = get_channel_index(fixture_def, fixture.current_mode)
+    if not index.mode:
         return {}, 0
 
-    total_channels = len(mode.get('channels', []))
-    channels_info = get_channels_by_property(fixture_def, fixture.current_mode, preset_names)
-
-    # Convert to simple dict
-    channels_dict = {}
-    for preset, channel_list in channels_info.items():
-        channels_dict[preset] = [c['channel'] for c in channel_list]
-
-    return channels_dict, total_channels
+    return index.channel_numbers(preset_names), index.channel_count
 
 
 def get_color_wheel_channel(fixture, fixture_definitions: Dict[str, Any]) -> Optional[int]:
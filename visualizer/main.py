@@ -3,10 +3,12 @@
 #
 # Real-time 3D visualization of lighting effects.
 # - Receives configuration via TCP from Show Creator
-# - Receives DMX data via ArtNet from Show Creator or QLC+
+# - Receives DMX data via ArtNet from Show Creator or QLC+, or as a
+#   delta-compressed stream over the TCP connection
 
 import sys
 import os
+import time
 
 # Add parent directory to path for shared module imports
 parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -38,8 +40,14 @@ class VisualizerWindow(QMainWindow):
     - Receiving stage/fixture configuration via TCP
     - Receiving DMX data via ArtNet
     - Rendering fixtures and volumetric beams
+
+    While Show Creator streams DMX over TCP, ArtNet for the same show is
+    ignored so fixtures are not updated twice per frame.
     """
 
+    # Seconds after the last TCP DMX frame during which ArtNet is ignored
+    DMX_STREAM_HOLD = 2.0
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("QLC+ Visualizer")
@@ -54,6 +62,7 @@ class VisualizerWindow(QMainWindow):
         # Connection state
         self.tcp_connected: bool = False
         self.artnet_receiving: bool = False
+        self._last_dmx_stream_frame: float = float('-inf')
 
         # TCP client for receiving configuration
         self.tcp_client = VisualizerTCPClient()
@@ -83,6 +92,7 @@ class VisualizerWindow(QMainWindow):
         self.tcp_client.fixtures_received.connect(self.set_fixtures)
         self.tcp_client.groups_received.connect(self.set_groups)
         self.tcp_client.update_received.connect(self._on_config_update)
+        self.tcp_client.dmx_stream_received.connect(self._on_dmx_stream_received)
 
     def _connect_artnet_signals(self):
         """Connect ArtNet listener signals to UI handlers."""
@@ -93,12 +103,20 @@ class VisualizerWindow(QMainWindow):
 
     def _on_dmx_received(self, universe: int, dmx_data: bytes):
         """Handle DMX data received from ArtNet."""
+        if time.monotonic() - self._last_dmx_stream_frame < self.DMX_STREAM_HOLD:
+            return
         # Convert 0-based ArtNet universe to 1-based internal universe
         internal_universe = universe + 1
         # Update render engine with DMX data
         if hasattr(self, 'render_engine') and self.render_engine:
             self.render_engine.update_dmx(internal_universe, dmx_data)
 
+    def _on_dmx_stream_received(self, frame: bytes):
+        """Handle a delta-compressed DMX frame received over TCP."""
+        self._last_dmx_stream_frame = time.monotonic()
+        if hasattr(self, 'render_engine') and self.render_engine:
+            self.render_engine.apply_dmx_stream(frame)
+
     def _on_artnet_started(self):
         """Handle ArtNet receiving started."""
         self._update_artnet_indicator(True)
@@ -5,6 +5,11 @@ to render one :class:`Emission` (volumetric beam, gobo modulation, etc.).
 The :class:`FixtureRenderer` iterates the EmitterRunner's emissions and
 calls ``render_emission`` once per emission.
 
+:class:`BeamInstanceBatch` is the instanced path used by ``FixtureManager``:
+every beam of a frame is collected as one row of a shared instance buffer
+and drawn with one ``vao.render(instances=N)`` per beam mesh, sharing one
+program per shader variant and a single additive-blend state switch.
+
 Variants mirror the natural factoring of the existing renderers:
 - :class:`GlowBeam` — short glow cone (PAR / wash fallback)
 - :class:`CylindricalBeam` — stubby column (PAR canister)
@@ -19,9 +24,10 @@ will swap callers from the old ``FixtureRenderer`` subclasses over to these.
 from __future__ import annotations
 
 import math
+import struct
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import List, Optional, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple
 
 import glm
 import moderngl
@@ -29,12 +35,17 @@ import numpy as np
 
 from utils.geometry import GeometryBuilder
 from visualizer.renderer.emitters import Emission
+from visualizer.renderer.gl_cache import GLResourceCache, resource_cache
 from visualizer.renderer.gl_state import set_depth_mask
 from visualizer.renderer.shaders import (
     BEAM_FRAGMENT_SHADER,
     BEAM_VERTEX_SHADER,
     GOBO_BEAM_FRAGMENT_SHADER,
     GOBO_BEAM_VERTEX_SHADER,
+    INSTANCED_BEAM_FRAGMENT_SHADER,
+    INSTANCED_BEAM_VERTEX_SHADER,
+    INSTANCED_GOBO_BEAM_FRAGMENT_SHADER,
+    INSTANCED_GOBO_BEAM_VERTEX_SHADER,
 )
 
 
@@ -72,12 +83,35 @@ _DEFAULT_MODIFIERS = BeamModifiers()
 class BeamComponent(ABC):
     """Owns the GL resources for one beam shape. Renders one emission at a time."""
 
+    #: Drawn with the gobo / focus shader pair instead of the plain beam shader.
+    uses_gobo: bool = False
+
     def __init__(self, ctx: moderngl.Context):
         self.ctx = ctx
         self.program: Optional[moderngl.Program] = None
         self.vao: Optional[moderngl.VertexArray] = None
         self.vbo: Optional[moderngl.Buffer] = None
         self.abo: Optional[moderngl.Buffer] = None  # alpha buffer
+        self.resources = resource_cache(ctx)
+        # (kind, *GeometryBuilder args) — identical keys share one instanced mesh
+        self.mesh_key: Tuple = ()
+
+    def _init_mesh(self, mesh_key: Tuple) -> None:
+        """Acquire the shared mesh for ``mesh_key`` + program, and build this beam's VAO."""
+        self.mesh_key = mesh_key
+        if self.uses_gobo:
+            vertex_shader, fragment_shader = GOBO_BEAM_VERTEX_SHADER, GOBO_BEAM_FRAGMENT_SHADER
+        else:
+            vertex_shader, fragment_shader = BEAM_VERTEX_SHADER, BEAM_FRAGMENT_SHADER
+        self.program = self.resources.program(vertex_shader, fragment_shader)
+        self.vbo, self.abo = acquire_beam_mesh(self.resources, mesh_key)
+        self.vao = self.ctx.vertex_array(
+            self.program,
+            [
+                (self.vbo, '3f', 'in_position'),
+                (self.abo, '1f', 'in_alpha'),
+            ],
+        )
 
     @abstractmethod
     def render_emission(
@@ -89,15 +123,26 @@ class BeamComponent(ABC):
     ) -> None:
         """Render one emission."""
 
+    def collect_instances(
+        self,
+        batch: 'BeamInstanceBatch',
+        fixture_model: glm.mat4,
+        emission: Emission,
+        modifiers: BeamModifiers = _DEFAULT_MODIFIERS,
+    ) -> None:
+        """Queue one emission on ``batch`` instead of drawing it now."""
+        if emission.dimmer < 0.01:
+            return
+        batch.add(
+            self,
+            fixture_model * emission.local_transform,
+            emission.color,
+            emission.dimmer * modifiers.brightness_scale,
+        )
+
     def release(self) -> None:
-        if self.vao:
-            self.vao.release()
-        if self.vbo:
-            self.vbo.release()
-        if self.abo:
-            self.abo.release()
-        if self.program:
-            self.program.release()
+        for resource in (self.vao, self.vbo, self.abo, self.program):
+            self.resources.release(resource)
 
 
 # ---------------------------------------------------------------------------
@@ -105,6 +150,27 @@ class BeamComponent(ABC):
 # ---------------------------------------------------------------------------
 
 
+_MESH_BUILDERS = {
+    'cone': GeometryBuilder.create_beam_cone,          # (radius, length, segments)
+    'cylinder': GeometryBuilder.create_beam_cylinder,  # (radius, length, segments)
+    'box': GeometryBuilder.create_beam_box,            # (width, height, length)
+}
+
+
+def build_beam_mesh(mesh_key: Tuple) -> Tuple[np.ndarray, np.ndarray]:
+    """Build ``(vertices, alphas)`` for a ``BeamComponent.mesh_key``."""
+    kind, *args = mesh_key
+    return _MESH_BUILDERS[kind](*args)
+
+
+def acquire_beam_mesh(
+    resources: GLResourceCache,
+    mesh_key: Tuple,
+) -> Tuple[moderngl.Buffer, moderngl.Buffer]:
+    """Shared ``(vertex, alpha)`` buffers for a ``BeamComponent.mesh_key``."""
+    return resources.mesh(('beam',) + mesh_key, lambda: build_beam_mesh(mesh_key))
+
+
 def _to_mvp_bytes(mvp: glm.mat4, fixture_model: glm.mat4, local: glm.mat4) -> bytes:
     """Compose chassis × local, then mvp × model, into 16 floats."""
     final_mvp = mvp * fixture_model * local
@@ -147,21 +213,7 @@ class GlowBeam(BeamComponent):
         self.cone_angle_deg = cone_angle_deg
 
         radius = length_m * math.tan(math.radians(cone_angle_deg / 2.0))
-        verts, alphas = GeometryBuilder.create_beam_cone(radius, length_m, segments=16)
-
-        self.program = ctx.program(
-            vertex_shader=BEAM_VERTEX_SHADER,
-            fragment_shader=BEAM_FRAGMENT_SHADER,
-        )
-        self.vbo = ctx.buffer(verts.tobytes())
-        self.abo = ctx.buffer(alphas.tobytes())
-        self.vao = ctx.vertex_array(
-            self.program,
-            [
-                (self.vbo, '3f', 'in_position'),
-                (self.abo, '1f', 'in_alpha'),
-            ],
-        )
+        self._init_mesh(('cone', radius, length_m, 16))
 
     def render_emission(
         self,
@@ -201,21 +253,7 @@ class CylindricalBeam(BeamComponent):
         self.radius_m = radius_m
         self.length_m = length_m
 
-        verts, alphas = GeometryBuilder.create_beam_cylinder(radius_m, length_m, segments=20)
-
-        self.program = ctx.program(
-            vertex_shader=BEAM_VERTEX_SHADER,
-            fragment_shader=BEAM_FRAGMENT_SHADER,
-        )
-        self.vbo = ctx.buffer(verts.tobytes())
-        self.abo = ctx.buffer(alphas.tobytes())
-        self.vao = ctx.vertex_array(
-            self.program,
-            [
-                (self.vbo, '3f', 'in_position'),
-                (self.abo, '1f', 'in_alpha'),
-            ],
-        )
+        self._init_mesh(('cylinder', radius_m, length_m, 20))
 
     def render_emission(
         self,
@@ -255,6 +293,8 @@ class ConeBeam(BeamComponent):
     PRISM_TILT_DEG = 10.0
     PRISM_INTENSITY_PER_FACET = 0.4
 
+    uses_gobo = True
+
     def __init__(
         self,
         ctx: moderngl.Context,
@@ -266,21 +306,7 @@ class ConeBeam(BeamComponent):
         self.cone_angle_deg = cone_angle_deg
 
         radius = length_m * math.tan(math.radians(cone_angle_deg / 2.0))
-        verts, alphas = GeometryBuilder.create_beam_cone(radius, length_m, segments=24)
-
-        self.program = ctx.program(
-            vertex_shader=GOBO_BEAM_VERTEX_SHADER,
-            fragment_shader=GOBO_BEAM_FRAGMENT_SHADER,
-        )
-        self.vbo = ctx.buffer(verts.tobytes())
-        self.abo = ctx.buffer(alphas.tobytes())
-        self.vao = ctx.vertex_array(
-            self.program,
-            [
-                (self.vbo, '3f', 'in_position'),
-                (self.abo, '1f', 'in_alpha'),
-            ],
-        )
+        self._init_mesh(('cone', radius, length_m, 24))
 
     def render_emission(
         self,
@@ -324,6 +350,32 @@ class ConeBeam(BeamComponent):
         finally:
             _restore_state(self.ctx)
 
+    def collect_instances(
+        self,
+        batch: 'BeamInstanceBatch',
+        fixture_model: glm.mat4,
+        emission: Emission,
+        modifiers: BeamModifiers = _DEFAULT_MODIFIERS,
+    ) -> None:
+        if emission.dimmer < 0.01:
+            return
+        intensity = emission.dimmer * modifiers.brightness_scale
+        if modifiers.prism_active and modifiers.prism_facets > 1:
+            locals_ = self._prism_facet_transforms(emission.local_transform, modifiers.prism_facets)
+            intensity *= self.PRISM_INTENSITY_PER_FACET
+        else:
+            locals_ = (emission.local_transform,)
+        for local in locals_:
+            batch.add(
+                self,
+                fixture_model * local,
+                emission.color,
+                intensity,
+                gobo_pattern=modifiers.gobo_pattern,
+                gobo_rotation=modifiers.gobo_rotation_rad,
+                focus_sharpness=modifiers.focus_sharpness,
+            )
+
     def _render_prism_facets(
         self,
         mvp: glm.mat4,
@@ -331,14 +383,21 @@ class ConeBeam(BeamComponent):
         emission: Emission,
         modifiers: BeamModifiers,
     ) -> None:
-        """Render N facet beams at evenly-spaced rotations around the beam axis.
+        """Render N facet beams at evenly-spaced rotations around the beam axis."""
+        for local in self._prism_facet_transforms(emission.local_transform, modifiers.prism_facets):
+            self._render_one(
+                mvp, fixture_model, local, emission, modifiers,
+                intensity_scale=self.PRISM_INTENSITY_PER_FACET,
+            )
+
+    def _prism_facet_transforms(self, local_transform: glm.mat4, n: int) -> Iterator[glm.mat4]:
+        """Local transforms of N prism facets around the beam axis.
 
         Beam cone is built along +Z, so:
         - rotation around the beam axis = rotation around local Z
         - outward tilt = rotation around local Y, applied first
         These are pre-multiplied into the emission's local_transform.
         """
-        n = modifiers.prism_facets
         tilt_mat = glm.rotate(
             glm.mat4(1.0),
             glm.radians(self.PRISM_TILT_DEG),
@@ -351,11 +410,7 @@ class ConeBeam(BeamComponent):
                 glm.radians(offset_deg),
                 glm.vec3(0, 0, 1),
             )
-            local = emission.local_transform * rot_mat * tilt_mat
-            self._render_one(
-                mvp, fixture_model, local, emission, modifiers,
-                intensity_scale=self.PRISM_INTENSITY_PER_FACET,
-            )
+            yield local_transform * rot_mat * tilt_mat
 
 
 # ---------------------------------------------------------------------------
@@ -378,21 +433,7 @@ class RectangularBeam(BeamComponent):
         self.height_m = height_m
         self.length_m = length_m
 
-        verts, alphas = GeometryBuilder.create_beam_box(width_m, height_m, length_m)
-
-        self.program = ctx.program(
-            vertex_shader=BEAM_VERTEX_SHADER,
-            fragment_shader=BEAM_FRAGMENT_SHADER,
-        )
-        self.vbo = ctx.buffer(verts.tobytes())
-        self.abo = ctx.buffer(alphas.tobytes())
-        self.vao = ctx.vertex_array(
-            self.program,
-            [
-                (self.vbo, '3f', 'in_position'),
-                (self.abo, '1f', 'in_alpha'),
-            ],
-        )
+        self._init_mesh(('box', width_m, height_m, length_m))
 
     def render_emission(
         self,
@@ -437,21 +478,7 @@ class SegmentedBeam(BeamComponent):
         self.cone_angle_deg = cone_angle_deg
 
         radius = length_m * math.tan(math.radians(cone_angle_deg / 2.0))
-        verts, alphas = GeometryBuilder.create_beam_cone(radius, length_m, segments=12)
-
-        self.program = ctx.program(
-            vertex_shader=BEAM_VERTEX_SHADER,
-            fragment_shader=BEAM_FRAGMENT_SHADER,
-        )
-        self.vbo = ctx.buffer(verts.tobytes())
-        self.abo = ctx.buffer(alphas.tobytes())
-        self.vao = ctx.vertex_array(
-            self.program,
-            [
-                (self.vbo, '3f', 'in_position'),
-                (self.abo, '1f', 'in_alpha'),
-            ],
-        )
+        self._init_mesh(('cone', radius, length_m, 12))
 
     def render_emission(
         self,
@@ -500,23 +527,7 @@ class SegmentedRectBeam(BeamComponent):
         self.cell_height_m = cell_height_m
         self.length_m = length_m
 
-        verts, alphas = GeometryBuilder.create_beam_box(
-            cell_width_m, cell_height_m, length_m,
-        )
-
-        self.program = ctx.program(
-            vertex_shader=BEAM_VERTEX_SHADER,
-            fragment_shader=BEAM_FRAGMENT_SHADER,
-        )
-        self.vbo = ctx.buffer(verts.tobytes())
-        self.abo = ctx.buffer(alphas.tobytes())
-        self.vao = ctx.vertex_array(
-            self.program,
-            [
-                (self.vbo, '3f', 'in_position'),
-                (self.abo, '1f', 'in_alpha'),
-            ],
-        )
+        self._init_mesh(('box', cell_width_m, cell_height_m, length_m))
 
     def render_emission(
         self,
@@ -562,23 +573,7 @@ class SegmentedCylinderBeam(BeamComponent):
         self.radius_m = radius_m
         self.length_m = length_m
 
-        verts, alphas = GeometryBuilder.create_beam_cylinder(
-            radius_m, length_m, segments=10,
-        )
-
-        self.program = ctx.program(
-            vertex_shader=BEAM_VERTEX_SHADER,
-            fragment_shader=BEAM_FRAGMENT_SHADER,
-        )
-        self.vbo = ctx.buffer(verts.tobytes())
-        self.abo = ctx.buffer(alphas.tobytes())
-        self.vao = ctx.vertex_array(
-            self.program,
-            [
-                (self.vbo, '3f', 'in_position'),
-                (self.abo, '1f', 'in_alpha'),
-            ],
-        )
+        self._init_mesh(('cylinder', radius_m, length_m, 10))
 
     def render_emission(
         self,
@@ -600,3 +595,181 @@ class SegmentedCylinderBeam(BeamComponent):
             self.vao.render(moderngl.TRIANGLES)
         finally:
             _restore_state(self.ctx)
+
+
+# ---------------------------------------------------------------------------
+# BeamInstanceBatch — instanced rendering of every beam in a frame
+# ---------------------------------------------------------------------------
+
+
+# Per-instance row after the 64-byte world matrix: rgb, intensity,
+# gobo pattern, gobo rotation, focus sharpness, padding.
+_INSTANCE_TAIL = struct.Struct('<8f')
+INSTANCE_STRIDE = 64 + _INSTANCE_TAIL.size
+
+# (attribute, byte offset in the row); in_gobo only exists in the gobo program.
+_INSTANCE_ATTRIBUTES = (
+    ('in_model_0', 0),
+    ('in_model_1', 16),
+    ('in_model_2', 32),
+    ('in_model_3', 48),
+    ('in_color', 64),
+    ('in_gobo', 80),
+)
+
+
+class _InstancedBeamMesh:
+    """One beam mesh bound to a shared instanced program."""
+
+    def __init__(
+        self,
+        ctx: moderngl.Context,
+        resources: GLResourceCache,
+        program: moderngl.Program,
+        mesh_key: Tuple,
+    ):
+        self.program = program
+        self.resources = resources
+        self.vbo, self.abo = acquire_beam_mesh(resources, mesh_key)
+        self.vao = ctx.vertex_array(
+            program,
+            [
+                (self.vbo, '3f', 'in_position'),
+                (self.abo, '1f', 'in_alpha'),
+            ],
+        )
+        self._locations = [
+            (program[name].location, offset)
+            for name, offset in _INSTANCE_ATTRIBUTES
+            if program.get(name, None) is not None
+        ]
+
+    def bind_instances(self, buffer: moderngl.Buffer, offset: int) -> None:
+        """Point the per-instance attributes at this mesh's rows in ``buffer``."""
+        for location, attr_offset in self._locations:
+            self.vao.bind(
+                location, 'f', buffer, '4f',
+                offset=offset + attr_offset, stride=INSTANCE_STRIDE, divisor=1,
+            )
+
+    def release(self) -> None:
+        for resource in (self.vao, self.vbo, self.abo):
+            self.resources.release(resource)
+
+
+class BeamInstanceBatch:
+    """Collects a frame's beams and draws them instanced.
+
+    Fixtures queue their emissions through
+    :meth:`BeamComponent.collect_instances`; :meth:`flush` then uploads
+    every queued row into one instance buffer and issues one draw per
+    distinct beam mesh (``BeamComponent.mesh_key``), inside a single
+    additive-blend state switch. One program per shader variant and one
+    mesh per key are shared by all fixtures, so a rig of identical
+    fixtures costs one draw call however many beams it has.
+    """
+
+    def __init__(self, ctx: moderngl.Context):
+        self.ctx = ctx
+        self.resources = resource_cache(ctx)
+        self._programs: Dict[bool, moderngl.Program] = {}
+        self._meshes: Dict[Tuple, _InstancedBeamMesh] = {}
+        # (uses_gobo, mesh_key) -> queued instance rows, in first-seen order
+        self._rows: Dict[Tuple, List[bytes]] = {}
+        self._buffer: Optional[moderngl.Buffer] = None
+        self._capacity = 0
+        self.draw_calls = 0  # draws issued by the last flush
+
+    def __len__(self) -> int:
+        return sum(len(rows) for rows in self._rows.values())
+
+    def add(
+        self,
+        beam: BeamComponent,
+        world: glm.mat4,
+        color: Tuple[float, float, float],
+        intensity: float,
+        gobo_pattern: int = 0,
+        gobo_rotation: float = 0.0,
+        focus_sharpness: float = 1.0,
+    ) -> None:
+        """Queue one beam instance with its world matrix (fixture model × local)."""
+        key = (beam.uses_gobo, beam.mesh_key)
+        rows = self._rows.get(key)
+        if rows is None:
+            rows = self._rows[key] = []
+        rows.append(world.to_bytes() + _INSTANCE_TAIL.pack(
+            color[0], color[1], color[2], intensity,
+            float(gobo_pattern), gobo_rotation, focus_sharpness, 0.0,
+        ))
+
+    def flush(self, mvp: glm.mat4) -> None:
+        """Draw every queued instance and clear the queue."""
+        self.draw_calls = 0
+        if not self._rows:
+            return
+        groups = list(self._rows.items())
+        self._rows = {}
+        data = b''.join(b''.join(rows) for _, rows in groups)
+        buffer = self._instance_buffer(len(data))
+        buffer.write(data)
+
+        view_proj = mvp.to_bytes()
+        _setup_additive_blending(self.ctx)
+        try:
+            offset = 0
+            for (uses_gobo, mesh_key), rows in groups:
+                mesh = self._mesh(uses_gobo, mesh_key)
+                mesh.program['view_proj'].write(view_proj)
+                mesh.bind_instances(buffer, offset)
+                mesh.vao.render(moderngl.TRIANGLES, instances=len(rows))
+                offset += len(rows) * INSTANCE_STRIDE
+                self.draw_calls += 1
+        finally:
+            _restore_state(self.ctx)
+
+    def release(self) -> None:
+        for mesh in self._meshes.values():
+            mesh.release()
+        self._meshes.clear()
+        for program in self._programs.values():
+            self.resources.release(program)
+        self._programs.clear()
+        if self._buffer is not None:
+            self._buffer.release()
+            self._buffer = None
+            self._capacity = 0
+        self._rows.clear()
+
+    # --- internal ---
+
+    def _instance_buffer(self, size: int) -> moderngl.Buffer:
+        """The shared instance buffer, grown to a power of two when too small."""
+        if self._buffer is None or self._capacity < size:
+            if self._buffer is not None:
+                self._buffer.release()
+            self._capacity = 1 << max(size - 1, INSTANCE_STRIDE).bit_length()
+            self._buffer = self.ctx.buffer(reserve=self._capacity, dynamic=True)
+        return self._buffer
+
+    def _mesh(self, uses_gobo: bool, mesh_key: Tuple) -> _InstancedBeamMesh:
+        mesh = self._meshes.get((uses_gobo, mesh_key))
+        if mesh is None:
+            mesh = _InstancedBeamMesh(
+                self.ctx, self.resources, self._program(uses_gobo), mesh_key,
+            )
+            self._meshes[(uses_gobo, mesh_key)] = mesh
+        return mesh
+
+    def _program(self, uses_gobo: bool) -> moderngl.Program:
+        program = self._programs.get(uses_gobo)
+        if program is None:
+            if uses_gobo:
+                vertex_shader = INSTANCED_GOBO_BEAM_VERTEX_SHADER
+                fragment_shader = INSTANCED_GOBO_BEAM_FRAGMENT_SHADER
+            else:
+                vertex_shader = INSTANCED_BEAM_VERTEX_SHADER
+                fragment_shader = INSTANCED_BEAM_FRAGMENT_SHADER
+            program = self.resources.program(vertex_shader, fragment_shader)
+            self._programs[uses_gobo] = program
+        return program
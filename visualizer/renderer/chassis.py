@@ -15,6 +15,10 @@ Layout:
   Mirrors :meth:`MovingHeadRenderer._create_geometry` proportions.
 - :func:`make_chassis_geometry` — factory keyed off :class:`Chassis`.
 
+All chassis share the fixture program and identical meshes (same chassis
+type and body dimensions) through :mod:`visualizer.renderer.gl_cache`;
+each instance only owns its VAOs.
+
 Phase D / Phase E may add :class:`ScannerChassisGeometry` (mirror), particle/laser,
 etc. without touching components, emitters, or beams.
 """
@@ -23,7 +27,7 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import Callable, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
 
 import glm
 import moderngl
@@ -31,6 +35,7 @@ import numpy as np
 
 from utils.fixture_capabilities import CellArray, Chassis
 from utils.geometry import GeometryBuilder
+from visualizer.renderer.gl_cache import resource_cache
 from visualizer.renderer.gl_state import set_depth_mask
 from visualizer.renderer.shaders import (
     FIXTURE_FRAGMENT_SHADER,
@@ -191,13 +196,48 @@ def _mat4_bytes(m: glm.mat4) -> bytes:
 
 
 class ChassisGeometry(ABC):
-    """One chassis body, with its own GL program + VAOs.
+    """One chassis body: the shared fixture program + one VAO per mesh part.
 
-    Subclasses own all GPU resources for one fixture's body.
+    Programs and mesh buffers come from the context's
+    :class:`~visualizer.renderer.gl_cache.GLResourceCache`, so identical
+    bodies share them; :meth:`release` drops this chassis' references.
     :meth:`render` is called once per frame, before the beam is rendered
     by the :class:`FixtureRenderer`.
     """
 
+    def _init_resources(self, ctx: moderngl.Context) -> None:
+        self.ctx = ctx
+        self.resources = resource_cache(ctx)
+        self.program = self.resources.program(FIXTURE_VERTEX_SHADER, FIXTURE_FRAGMENT_SHADER)
+        # VAOs + acquired mesh buffers, released together
+        self._gl_objects: List[Any] = []
+
+    def _mesh_vao(
+        self,
+        key: Hashable,
+        build: Callable[[], Tuple[np.ndarray, np.ndarray]],
+    ) -> moderngl.VertexArray:
+        """VAO over the shared ``(vertices, normals)`` mesh identified by ``key``."""
+        vbo, nbo = self.resources.mesh(key, build)
+        vao = self.ctx.vertex_array(
+            self.program,
+            [(vbo, '3f', 'in_position'), (nbo, '3f', 'in_normal')],
+        )
+        self._gl_objects.extend((vao, vbo, nbo))
+        return vao
+
+    def _box_vao(
+        self,
+        width: float,
+        height: float,
+        depth: float,
+        center: Tuple[float, float, float] = (0, 0, 0),
+    ) -> moderngl.VertexArray:
+        return self._mesh_vao(
+            ('box', width, height, depth, tuple(center)),
+            lambda: GeometryBuilder.create_box(width, height, depth, center=center),
+        )
+
     @abstractmethod
     def render(
         self,
@@ -207,9 +247,13 @@ class ChassisGeometry(ABC):
     ) -> None:
         ...
 
-    @abstractmethod
     def release(self) -> None:
-        ...
+        for obj in self._gl_objects:
+            self.resources.release(obj)
+        self._gl_objects.clear()
+        if self.program:
+            self.resources.release(self.program)
+            self.program = None
 
     def beam_origin_transform(
         self,
@@ -246,25 +290,13 @@ class StaticChassisGeometry(ChassisGeometry):
         chassis: Chassis,
         body_dims_m: Tuple[float, float, float],
     ):
-        self.ctx = ctx
+        self._init_resources(ctx)
         self.chassis = chassis
         self.body_dims_m = body_dims_m
 
-        verts, norms = build_chassis_mesh(chassis, body_dims_m)
-        self._vertex_count = len(verts) // 3
-
-        self.program = ctx.program(
-            vertex_shader=FIXTURE_VERTEX_SHADER,
-            fragment_shader=FIXTURE_FRAGMENT_SHADER,
-        )
-        self.vbo = ctx.buffer(verts.tobytes())
-        self.nbo = ctx.buffer(norms.tobytes())
-        self.vao = ctx.vertex_array(
-            self.program,
-            [
-                (self.vbo, '3f', 'in_position'),
-                (self.nbo, '3f', 'in_normal'),
-            ],
+        self.vao = self._mesh_vao(
+            ('chassis', chassis.value, tuple(body_dims_m)),
+            lambda: build_chassis_mesh(chassis, body_dims_m),
         )
 
     def render(
@@ -286,16 +318,6 @@ class StaticChassisGeometry(ChassisGeometry):
         self.program['emissive_strength'].value = float(state.emissive_strength)
         self.vao.render(moderngl.TRIANGLES)
 
-    def release(self) -> None:
-        if self.vao:
-            self.vao.release()
-        if self.vbo:
-            self.vbo.release()
-        if self.nbo:
-            self.nbo.release()
-        if self.program:
-            self.program.release()
-
 
 class MovingYokeChassisGeometry(ChassisGeometry):
     """Compound moving-head chassis: base + yoke + head + lens + debug axes.
@@ -326,7 +348,7 @@ class MovingYokeChassisGeometry(ChassisGeometry):
         ctx: moderngl.Context,
         body_dims_m: Tuple[float, float, float],
     ):
-        self.ctx = ctx
+        self._init_resources(ctx)
         self.body_dims_m = body_dims_m
         width, height, depth = body_dims_m
 
@@ -346,52 +368,33 @@ class MovingYokeChassisGeometry(ChassisGeometry):
         self.yoke_height = yoke_height
         self.head_size_x = head_size_x
 
-        self.program = ctx.program(
-            vertex_shader=FIXTURE_VERTEX_SHADER,
-            fragment_shader=FIXTURE_FRAGMENT_SHADER,
-        )
-
         # --- base ---
-        base_verts, base_norms = GeometryBuilder.create_box(
+        self._base_vao = self._box_vao(
             base_size, base_size, base_thickness,
             center=(0, 0, base_thickness / 2),
         )
-        self._base_vbo = ctx.buffer(base_verts.tobytes())
-        self._base_nbo = ctx.buffer(base_norms.tobytes())
-        self._base_vao = ctx.vertex_array(
-            self.program,
-            [(self._base_vbo, '3f', 'in_position'), (self._base_nbo, '3f', 'in_normal')],
-        )
 
         # --- yoke (two arms, ±Y of head) ---
         yoke_z = base_thickness + yoke_height / 2
-        left_verts, left_norms = GeometryBuilder.create_box(
-            yoke_depth, yoke_thickness, yoke_height,
-            center=(0, -head_size_y / 2 - yoke_thickness / 2, yoke_z),
-        )
-        right_verts, right_norms = GeometryBuilder.create_box(
-            yoke_depth, yoke_thickness, yoke_height,
-            center=(0, head_size_y / 2 + yoke_thickness / 2, yoke_z),
-        )
-        yoke_verts = np.concatenate([left_verts, right_verts])
-        yoke_norms = np.concatenate([left_norms, right_norms])
-        self._yoke_vbo = ctx.buffer(yoke_verts.tobytes())
-        self._yoke_nbo = ctx.buffer(yoke_norms.tobytes())
-        self._yoke_vao = ctx.vertex_array(
-            self.program,
-            [(self._yoke_vbo, '3f', 'in_position'), (self._yoke_nbo, '3f', 'in_normal')],
-        )
+
+        def build_yoke():
+            left_verts, left_norms = GeometryBuilder.create_box(
+                yoke_depth, yoke_thickness, yoke_height,
+                center=(0, -head_size_y / 2 - yoke_thickness / 2, yoke_z),
+            )
+            right_verts, right_norms = GeometryBuilder.create_box(
+                yoke_depth, yoke_thickness, yoke_height,
+                center=(0, head_size_y / 2 + yoke_thickness / 2, yoke_z),
+            )
+            return (
+                np.concatenate([left_verts, right_verts]),
+                np.concatenate([left_norms, right_norms]),
+            )
+
+        self._yoke_vao = self._mesh_vao(('moving_yoke', 'yoke', tuple(body_dims_m)), build_yoke)
 
         # --- head (created at origin; transformed during render) ---
-        head_verts, head_norms = GeometryBuilder.create_box(
-            head_size_x, head_size_y, head_size_z,
-        )
-        self._head_vbo = ctx.buffer(head_verts.tobytes())
-        self._head_nbo = ctx.buffer(head_norms.tobytes())
-        self._head_vao = ctx.vertex_array(
-            self.program,
-            [(self._head_vbo, '3f', 'in_position'), (self._head_nbo, '3f', 'in_normal')],
-        )
+        self._head_vao = self._box_vao(head_size_x, head_size_y, head_size_z)
 
         # --- lens (cylinder rotated to face +X, attached to head front) ---
         lens_radius = min(head_size_y, head_size_z) * 0.35
@@ -400,49 +403,45 @@ class MovingYokeChassisGeometry(ChassisGeometry):
         self.lens_depth = lens_depth
         self.head_size_x = head_size_x
 
-        lens_verts_raw, lens_norms_raw = GeometryBuilder.create_cylinder(
-            lens_radius, lens_depth, segments=24, center=(0, 0, 0),
-        )
-        # Rotate cylinder (Y-aligned by default) to face +X, then translate to head front.
-        lens_verts = []
-        lens_norms = []
-        for i in range(0, len(lens_verts_raw), 3):
-            x, y, z = lens_verts_raw[i], lens_verts_raw[i + 1], lens_verts_raw[i + 2]
-            new_x = y + head_size_x / 2 + lens_depth / 2
-            new_y = -x
-            new_z = z
-            lens_verts.extend([new_x, new_y, new_z])
-        for i in range(0, len(lens_norms_raw), 3):
-            nx, ny, nz = lens_norms_raw[i], lens_norms_raw[i + 1], lens_norms_raw[i + 2]
-            lens_norms.extend([ny, -nx, nz])
-        lens_verts = np.array(lens_verts, dtype='f4')
-        lens_norms = np.array(lens_norms, dtype='f4')
-
-        self._lens_vbo = ctx.buffer(lens_verts.tobytes())
-        self._lens_nbo = ctx.buffer(lens_norms.tobytes())
-        self._lens_vao = ctx.vertex_array(
-            self.program,
-            [(self._lens_vbo, '3f', 'in_position'), (self._lens_nbo, '3f', 'in_normal')],
-        )
+        def build_lens():
+            lens_verts_raw, lens_norms_raw = GeometryBuilder.create_cylinder(
+                lens_radius, lens_depth, segments=24, center=(0, 0, 0),
+            )
+            # Rotate cylinder (Y-aligned by default) to face +X, then translate to head front.
+            lens_verts = []
+            lens_norms = []
+            for i in range(0, len(lens_verts_raw), 3):
+                x, y, z = lens_verts_raw[i], lens_verts_raw[i + 1], lens_verts_raw[i + 2]
+                new_x = y + head_size_x / 2 + lens_depth / 2
+                new_y = -x
+                new_z = z
+                lens_verts.extend([new_x, new_y, new_z])
+            for i in range(0, len(lens_norms_raw), 3):
+                nx, ny, nz = lens_norms_raw[i], lens_norms_raw[i + 1], lens_norms_raw[i + 2]
+                lens_norms.extend([ny, -nx, nz])
+            return np.array(lens_verts, dtype='f4'), np.array(lens_norms, dtype='f4')
+
+        self._lens_vao = self._mesh_vao(('moving_yoke', 'lens', tuple(body_dims_m)), build_lens)
 
         # --- coordinate axes on top of the base (debug overlay) ---
         axis_origin_z = base_thickness + 0.01
-        self._axis_x_vao, self._axis_x_vbo, self._axis_x_nbo = self._build_axis_vao(
-            ctx, 'x', axis_origin_z,
-        )
-        self._axis_y_vao, self._axis_y_vbo, self._axis_y_nbo = self._build_axis_vao(
-            ctx, 'y', axis_origin_z,
-        )
-        self._axis_z_vao, self._axis_z_vbo, self._axis_z_nbo = self._build_axis_vao(
-            ctx, 'z', axis_origin_z,
+        self._axis_x_vao = self._build_axis_vao('x', axis_origin_z)
+        self._axis_y_vao = self._build_axis_vao('y', axis_origin_z)
+        self._axis_z_vao = self._build_axis_vao('z', axis_origin_z)
+
+    def _build_axis_vao(self, axis: str, origin_z: float) -> moderngl.VertexArray:
+        """VAO over one shared axis mesh (shaft + pyramid arrow head)."""
+        key = (
+            'axis', axis, origin_z,
+            self.AXIS_LENGTH, self.AXIS_THICKNESS, self.ARROW_LENGTH, self.ARROW_WIDTH,
         )
+        return self._mesh_vao(key, lambda: self._build_axis_mesh(axis, origin_z))
 
-    def _build_axis_vao(
+    def _build_axis_mesh(
         self,
-        ctx: moderngl.Context,
         axis: str,
         origin_z: float,
-    ) -> Tuple[moderngl.VertexArray, moderngl.Buffer, moderngl.Buffer]:
+    ) -> Tuple[np.ndarray, np.ndarray]:
         """Build one axis (shaft + pyramid arrow head) pointing along +X / +Y / +Z.
 
         Mirrors the legacy ``MovingHeadRenderer._create_geometry`` axis blocks.
@@ -528,14 +527,7 @@ class MovingYokeChassisGeometry(ChassisGeometry):
 
         verts = np.concatenate([shaft_verts, arrow_verts])
         norms = np.concatenate([shaft_norms, arrow_norms])
-
-        vbo = ctx.buffer(verts.tobytes())
-        nbo = ctx.buffer(norms.tobytes())
-        vao = ctx.vertex_array(
-            self.program,
-            [(vbo, '3f', 'in_position'), (nbo, '3f', 'in_normal')],
-        )
-        return vao, vbo, nbo
+        return verts, norms
 
     def render(
         self,
@@ -658,27 +650,6 @@ class MovingYokeChassisGeometry(ChassisGeometry):
         cone_rotation = glm.rotate(glm.mat4(1.0), glm.radians(90.0), glm.vec3(0, 1, 0))
         return pan_mat * head_translate * tilt_mat * lens_offset * cone_rotation
 
-    def release(self) -> None:
-        for vao in (
-            self._base_vao, self._yoke_vao, self._head_vao, self._lens_vao,
-            self._axis_x_vao, self._axis_y_vao, self._axis_z_vao,
-        ):
-            if vao:
-                vao.release()
-        for buf in (
-            self._base_vbo, self._base_nbo,
-            self._yoke_vbo, self._yoke_nbo,
-            self._head_vbo, self._head_nbo,
-            self._lens_vbo, self._lens_nbo,
-            self._axis_x_vbo, self._axis_x_nbo,
-            self._axis_y_vbo, self._axis_y_nbo,
-            self._axis_z_vbo, self._axis_z_nbo,
-        ):
-            if buf:
-                buf.release()
-        if self.program:
-            self.program.release()
-
 
 # ---------------------------------------------------------------------------
 # PixelBarChassisGeometry — body box + per-cell visible emitter slabs
@@ -709,23 +680,12 @@ class PixelBarChassisGeometry(ChassisGeometry):
         body_dims_m: Tuple[float, float, float],
         emitter: CellArray,
     ):
-        self.ctx = ctx
+        self._init_resources(ctx)
         self.body_dims_m = body_dims_m
         self.emitter = emitter
 
-        self.program = ctx.program(
-            vertex_shader=FIXTURE_VERTEX_SHADER,
-            fragment_shader=FIXTURE_FRAGMENT_SHADER,
-        )
-
         width, height, depth = body_dims_m
-        body_verts, body_norms = GeometryBuilder.create_box(width, height, depth)
-        self._body_vbo = ctx.buffer(body_verts.tobytes())
-        self._body_nbo = ctx.buffer(body_norms.tobytes())
-        self._body_vao = ctx.vertex_array(
-            self.program,
-            [(self._body_vbo, '3f', 'in_position'), (self._body_nbo, '3f', 'in_normal')],
-        )
+        self._body_vao = self._box_vao(width, height, depth)
 
         span_w = width * 0.9
         span_h = height * 0.9
@@ -742,25 +702,14 @@ class PixelBarChassisGeometry(ChassisGeometry):
         start_y = -span_h / 2.0 + cell_h / 2.0
 
         self._slab_vaos: list[moderngl.VertexArray] = []
-        self._slab_vbos: list[moderngl.Buffer] = []
-        self._slab_nbos: list[moderngl.Buffer] = []
         for row in range(emitter.height):
             for col in range(emitter.width):
                 cx = start_x + col * cell_w
                 cy = start_y + row * cell_h if emitter.height > 1 else 0.0
-                verts, norms = GeometryBuilder.create_box(
+                self._slab_vaos.append(self._box_vao(
                     slab_w, slab_h, self.SLAB_DEPTH,
                     center=(cx, cy, slab_z),
-                )
-                vbo = ctx.buffer(verts.tobytes())
-                nbo = ctx.buffer(norms.tobytes())
-                vao = ctx.vertex_array(
-                    self.program,
-                    [(vbo, '3f', 'in_position'), (nbo, '3f', 'in_normal')],
-                )
-                self._slab_vbos.append(vbo)
-                self._slab_nbos.append(nbo)
-                self._slab_vaos.append(vao)
+                ))
 
     def render(
         self,
@@ -796,19 +745,6 @@ class PixelBarChassisGeometry(ChassisGeometry):
                 self.program['emissive_strength'].value = 0.0
             vao.render(moderngl.TRIANGLES)
 
-    def release(self) -> None:
-        for vao in (self._body_vao, *self._slab_vaos):
-            if vao:
-                vao.release()
-        for buf in (
-            self._body_vbo, self._body_nbo,
-            *self._slab_vbos, *self._slab_nbos,
-        ):
-            if buf:
-                buf.release()
-        if self.program:
-            self.program.release()
-
 
 # ---------------------------------------------------------------------------
 # SunstripChassisGeometry — body box + per-cell lamp bulbs (cylinders)
@@ -835,23 +771,12 @@ class SunstripChassisGeometry(ChassisGeometry):
         body_dims_m: Tuple[float, float, float],
         emitter: CellArray,
     ):
-        self.ctx = ctx
+        self._init_resources(ctx)
         self.body_dims_m = body_dims_m
         self.emitter = emitter
 
-        self.program = ctx.program(
-            vertex_shader=FIXTURE_VERTEX_SHADER,
-            fragment_shader=FIXTURE_FRAGMENT_SHADER,
-        )
-
         width, height, depth = body_dims_m
-        body_verts, body_norms = GeometryBuilder.create_box(width, height, depth)
-        self._body_vbo = ctx.buffer(body_verts.tobytes())
-        self._body_nbo = ctx.buffer(body_norms.tobytes())
-        self._body_vao = ctx.vertex_array(
-            self.program,
-            [(self._body_vbo, '3f', 'in_position'), (self._body_nbo, '3f', 'in_normal')],
-        )
+        self._body_vao = self._box_vao(width, height, depth)
 
         n_lamps = max(1, emitter.width)
         # Lamp radius — bound to cell width but capped at 3 cm like legacy.
@@ -867,31 +792,32 @@ class SunstripChassisGeometry(ChassisGeometry):
         lamp_z = depth / 2.0 + self.LAMP_HEIGHT / 2.0
 
         self._lamp_vaos: list[moderngl.VertexArray] = []
-        self._lamp_vbos: list[moderngl.Buffer] = []
-        self._lamp_nbos: list[moderngl.Buffer] = []
         for i in range(n_lamps):
             x_offset = start_x + i * cell_w
-            raw_v, raw_n = GeometryBuilder.create_cylinder(
-                lamp_radius, self.LAMP_HEIGHT, segments=12, center=(0, 0, 0),
-            )
-            verts = []
-            norms = []
-            # (x, y, z) → (x, -z, y) then translate to (x_offset, 0, lamp_z)
-            for j in range(0, len(raw_v), 3):
-                x, y, z = raw_v[j], raw_v[j + 1], raw_v[j + 2]
-                verts.extend([x + x_offset, -z, y + lamp_z])
-            for j in range(0, len(raw_n), 3):
-                nx, ny, nz = raw_n[j], raw_n[j + 1], raw_n[j + 2]
-                norms.extend([nx, -nz, ny])
-            vbo = ctx.buffer(np.array(verts, dtype='f4').tobytes())
-            nbo = ctx.buffer(np.array(norms, dtype='f4').tobytes())
-            vao = ctx.vertex_array(
-                self.program,
-                [(vbo, '3f', 'in_position'), (nbo, '3f', 'in_normal')],
-            )
-            self._lamp_vbos.append(vbo)
-            self._lamp_nbos.append(nbo)
-            self._lamp_vaos.append(vao)
+            self._lamp_vaos.append(self._mesh_vao(
+                ('sunstrip_lamp', lamp_radius, self.LAMP_HEIGHT, x_offset, lamp_z),
+                lambda x_offset=x_offset: self._build_lamp_mesh(lamp_radius, x_offset, lamp_z),
+            ))
+
+    def _build_lamp_mesh(
+        self,
+        lamp_radius: float,
+        x_offset: float,
+        lamp_z: float,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        raw_v, raw_n = GeometryBuilder.create_cylinder(
+            lamp_radius, self.LAMP_HEIGHT, segments=12, center=(0, 0, 0),
+        )
+        verts = []
+        norms = []
+        # (x, y, z) → (x, -z, y) then translate to (x_offset, 0, lamp_z)
+        for j in range(0, len(raw_v), 3):
+            x, y, z = raw_v[j], raw_v[j + 1], raw_v[j + 2]
+            verts.extend([x + x_offset, -z, y + lamp_z])
+        for j in range(0, len(raw_n), 3):
+            nx, ny, nz = raw_n[j], raw_n[j + 1], raw_n[j + 2]
+            norms.extend([nx, -nz, ny])
+        return np.array(verts, dtype='f4'), np.array(norms, dtype='f4')
 
     def render(
         self,
@@ -934,19 +860,6 @@ class SunstripChassisGeometry(ChassisGeometry):
                 self.program['emissive_strength'].value = 0.0
             vao.render(moderngl.TRIANGLES)
 
-    def release(self) -> None:
-        for vao in (self._body_vao, *self._lamp_vaos):
-            if vao:
-                vao.release()
-        for buf in (
-            self._body_vbo, self._body_nbo,
-            *self._lamp_vbos, *self._lamp_nbos,
-        ):
-            if buf:
-                buf.release()
-        if self.program:
-            self.program.release()
-
 
 # ---------------------------------------------------------------------------
 # PARChassisGeometry — cylinder body + visible lens slab on the front face
@@ -973,39 +886,23 @@ class PARChassisGeometry(ChassisGeometry):
         ctx: moderngl.Context,
         body_dims_m: Tuple[float, float, float],
     ):
-        self.ctx = ctx
+        self._init_resources(ctx)
         self.body_dims_m = body_dims_m
 
-        self.program = ctx.program(
-            vertex_shader=FIXTURE_VERTEX_SHADER,
-            fragment_shader=FIXTURE_FRAGMENT_SHADER,
-        )
-
         width, height, depth = body_dims_m
         radius = max(width, height) / 2.0
 
-        body_verts, body_norms = GeometryBuilder.create_cylinder(
-            radius=radius, height=depth, segments=24,
-        )
-        self._body_vbo = ctx.buffer(body_verts.tobytes())
-        self._body_nbo = ctx.buffer(body_norms.tobytes())
-        self._body_vao = ctx.vertex_array(
-            self.program,
-            [(self._body_vbo, '3f', 'in_position'), (self._body_nbo, '3f', 'in_normal')],
+        self._body_vao = self._mesh_vao(
+            ('cylinder', radius, depth, 24),
+            lambda: GeometryBuilder.create_cylinder(radius=radius, height=depth, segments=24),
         )
 
         lens_w = width * self.LENS_FACE_FRACTION
         lens_h = height * self.LENS_FACE_FRACTION
         lens_z = depth / 2.0 + self.LENS_DEPTH / 2.0
-        lens_verts, lens_norms = GeometryBuilder.create_box(
+        self._lens_vao = self._box_vao(
             lens_w, lens_h, self.LENS_DEPTH, center=(0, 0, lens_z),
         )
-        self._lens_vbo = ctx.buffer(lens_verts.tobytes())
-        self._lens_nbo = ctx.buffer(lens_norms.tobytes())
-        self._lens_vao = ctx.vertex_array(
-            self.program,
-            [(self._lens_vbo, '3f', 'in_position'), (self._lens_nbo, '3f', 'in_normal')],
-        )
 
     def render(
         self,
@@ -1031,19 +928,6 @@ class PARChassisGeometry(ChassisGeometry):
         self.program['emissive_strength'].value = float(state.emissive_strength)
         self._lens_vao.render(moderngl.TRIANGLES)
 
-    def release(self) -> None:
-        for vao in (self._body_vao, self._lens_vao):
-            if vao:
-                vao.release()
-        for buf in (
-            self._body_vbo, self._body_nbo,
-            self._lens_vbo, self._lens_nbo,
-        ):
-            if buf:
-                buf.release()
-        if self.program:
-            self.program.release()
-
 
 # ---------------------------------------------------------------------------
 # Factory
@@ -43,6 +43,12 @@ GOBO_PATTERN_CROSS = 5
 GOBO_PATTERN_BREAKUP = 6
 
 
+# DMX gather tables (FixtureManager): universe buffers are padded with one
+# zero byte at this index, which channels that are unmapped or past the end
+# of the universe gather from.
+GATHER_SENTINEL = 512
+
+
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
@@ -433,6 +439,10 @@ class GoboComponent(FixtureComponent):
     def rotation_rad(self) -> float:
         return self._rotation_rad
 
+    @property
+    def is_rotating(self) -> bool:
+        return self._rotation_value != 0
+
 
 def _infer_pattern(entry) -> int:
     """Map a gobo entry to one of the seven built-in shader patterns.
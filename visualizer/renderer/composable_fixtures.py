@@ -14,10 +14,13 @@ Layout (rendered per frame in ``render(mvp)``):
 2. ``chassis.render(mvp, model)`` — body mesh
 3. ``emitter_runner.emissions()`` → list of :class:`Emission`s
 4. for each emission: ``beam.render_emission(mvp, model, emission, modifiers)``
+   (or ``beam.collect_instances(batch, ...)`` when ``FixtureManager``
+   draws all beams instanced)
 """
 
 from __future__ import annotations
 
+import time
 from typing import Any, Dict, List, Optional, Tuple
 
 import glm
@@ -32,6 +35,7 @@ from utils.fixture_capabilities import (
 )
 from visualizer.renderer.beams import (
     BeamComponent,
+    BeamInstanceBatch,
     BeamModifiers,
     ConeBeam,
     CylindricalBeam,
@@ -49,6 +53,7 @@ from visualizer.renderer.chassis import (
 )
 from visualizer.renderer.floor_projection import FloorProjectionComponent
 from visualizer.renderer.components import (
+    GATHER_SENTINEL,
     ColorComponent,
     DimmerComponent,
     FixtureComponent,
@@ -266,6 +271,12 @@ class FixtureRenderer:
             else None
         )
 
+        # Components are fixed after construction; DMX fan-out reuses the list.
+        self._dmx_components: Tuple[FixtureComponent, ...] = tuple(self.components)
+
+        # Wall-clock time of the last lighting render, for gobo rotation
+        self._last_frame_time = 0.0
+
     # --- public API ---
 
     @property
@@ -289,6 +300,12 @@ class FixtureRenderer:
         result.append(self.emitter_runner)
         return result
 
+    @property
+    def is_animating(self) -> bool:
+        """True while the beam changes between frames without new DMX
+        (a spinning gobo)."""
+        return self.gobo is not None and self.gobo.is_rotating
+
     def get_model_matrix(self) -> glm.mat4:
         """Chassis model matrix from position + yaw/pitch/roll.
 
@@ -305,9 +322,39 @@ class FixtureRenderer:
 
     def update_dmx(self, dmx_data: bytes) -> None:
         """Fan-out the DMX universe buffer to every component."""
-        for c in self.components:
+        for c in self._dmx_components:
             c.update_dmx(dmx_data, self.address)
 
+    def dmx_footprint(self) -> int:
+        """Number of channels from the fixture address the components read (0 = unknown)."""
+        return self.capabilities.channel_count
+
+    def dmx_gather_indices(self) -> Optional[List[int]]:
+        """Universe buffer indices of the fixture's channel window, for
+        :class:`visualizer.renderer.fixtures.UniverseGatherTable`.
+
+        ``None`` when the channel count is unknown — the components may
+        then read anywhere in the universe, so the fixture keeps taking
+        the full buffer through :meth:`update_dmx`.
+        """
+        count = self.capabilities.channel_count
+        if count <= 0:
+            return None
+        base = self.address - 1
+        return [
+            base + i if 0 <= base + i < GATHER_SENTINEL else GATHER_SENTINEL
+            for i in range(count)
+        ]
+
+    def apply_gathered(self, values: List[int]) -> None:
+        """Fan-out the gathered channel window to every component.
+
+        ``values`` holds the fixture's channels from its address on, so
+        components read it as a buffer addressed at channel 1.
+        """
+        for c in self._dmx_components:
+            c.update_dmx(values, 1)
+
     def render(self, mvp: glm.mat4) -> None:
         """Render lighting (additive light volumes), then chassis (opaque on top).
 
@@ -319,19 +366,30 @@ class FixtureRenderer:
         self.render_lighting(mvp)
         self.render_chassis(mvp)
 
-    def render_lighting(self, mvp: glm.mat4) -> None:
+    def render_lighting(
+        self,
+        mvp: glm.mat4,
+        beam_batch: Optional[BeamInstanceBatch] = None,
+    ) -> None:
         """Render additive light volumes: beam cones + floor projection.
 
         Depth-tested against whatever opaque geometry (stage, previously
         drawn chassis) sits in the depth buffer, but does NOT write depth
         itself — so later chassis draws can overwrite the additive
         contributions at their own silhouette pixels.
+
+        With ``beam_batch`` the beams are only queued on it; the caller
+        draws them all with :meth:`BeamInstanceBatch.flush`.
         """
+        self._advance_animation()
         model = self.get_model_matrix()
         modifiers = self._build_modifiers()
 
         for emission in self.emitter_runner.emissions(self.color, self.dimmer):
-            self.beam.render_emission(mvp, model, emission, modifiers)
+            if beam_batch is not None:
+                self.beam.collect_instances(beam_batch, model, emission, modifiers)
+            else:
+                self.beam.render_emission(mvp, model, emission, modifiers)
 
         if self.floor_projection is not None:
             self._render_floor_projection(mvp, model, modifiers)
@@ -355,6 +413,16 @@ class FixtureRenderer:
 
     # --- internal ---
 
+    # Longest step a gobo rotates in one frame. A render-on-demand view may
+    # not have drawn for a while when rotation starts.
+    MAX_ANIMATION_STEP_S = 0.25
+
+    def _advance_animation(self) -> None:
+        now = time.time()
+        if self.gobo is not None and self._last_frame_time > 0:
+            self.gobo.advance_rotation(min(now - self._last_frame_time, self.MAX_ANIMATION_STEP_S))
+        self._last_frame_time = now
+
     # --- Floor projection (MOVING_YOKE only) ---
 
     def _render_floor_projection(
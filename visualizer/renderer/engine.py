@@ -1,6 +1,7 @@
 # visualizer/renderer/engine.py
 # ModernGL render engine with PyQt6 integration
 
+import os
 import time
 import moderngl
 from typing import Optional
@@ -15,6 +16,12 @@ from .stage import StageRenderer
 from .gizmo import CoordinateGizmo
 from .fixtures import FixtureManager
 from .hdr import HDRPipeline
+from .frame_pacing import FramePacer
+from utils.dmx_stream import DMXStreamDecoder
+
+# Repaint only when the scene changed or a fixture animates.
+# Set RENDER_ON_DEMAND=0 to render every timer tick.
+USE_RENDER_ON_DEMAND = os.environ.get('RENDER_ON_DEMAND', '1') != '0'
 
 
 class RenderEngine(QOpenGLWidget):
@@ -27,6 +34,7 @@ class RenderEngine(QOpenGLWidget):
     - Stage floor with grid
     - FPS counter
     - Window resize handling
+    - Render-on-demand with an adaptive frame-rate cap (FramePacer)
     """
 
     def __init__(self, parent: Optional[QWidget] = None):
@@ -67,6 +75,20 @@ class RenderEngine(QOpenGLWidget):
         self._pending_fixtures: Optional[list] = None
         self._pending_dmx: dict[int, bytes] = {}
 
+        # Universe buffers for the delta-compressed DMX stream. Universes
+        # written directly via update_dmx (e.g. the build-mode preview) no
+        # longer match those buffers and get fully refreshed by the next
+        # stream frame that touches them.
+        self._dmx_stream = DMXStreamDecoder()
+        self._dmx_stream_stale: set[int] = set()
+        # Last frame per universe written via update_dmx; identical
+        # frames (a static look resent at 30 Hz) don't trigger a repaint.
+        self._last_dmx: dict[int, bytes] = {}
+
+        # Qt's FBO wrapped once per surface; resizeGL invalidates it.
+        self._qt_fbo = None
+        self._qt_fbo_id: Optional[int] = None
+
         # Mouse tracking
         self.setMouseTracking(True)
         self.last_mouse_pos = None
@@ -79,10 +101,12 @@ class RenderEngine(QOpenGLWidget):
         self.last_frame_time = time.time()
         self._first_frame = True  # Debug flag
 
-        # Render timer (60 FPS target)
+        # Render timer. Each tick asks the pacer whether a repaint is due;
+        # the pacer also lowers the tick rate when the UI thread is busy.
+        self.pacer = FramePacer(on_demand=USE_RENDER_ON_DEMAND)
         self.render_timer = QTimer()
-        self.render_timer.timeout.connect(self.update)
-        self.render_timer.start(16)  # ~60 FPS
+        self.render_timer.timeout.connect(self._on_render_tick)
+        self.render_timer.start(self.pacer.interval_ms)
 
         # Enable keyboard focus
         self.setFocusPolicy(Qt.FocusPolicy.StrongFocus)
@@ -96,8 +120,7 @@ class RenderEngine(QOpenGLWidget):
 
             # Get Qt's framebuffer object ID for rendering
             # QOpenGLWidget uses an FBO, not the default framebuffer
-            self.qt_fbo_id = self.defaultFramebufferObject()
-            print(f"Qt FBO ID: {self.qt_fbo_id}")
+            print(f"Qt FBO ID: {self.defaultFramebufferObject()}")
 
             # Enable depth testing
             self.ctx.enable(moderngl.DEPTH_TEST)
@@ -120,8 +143,8 @@ class RenderEngine(QOpenGLWidget):
             self.fixture_manager = FixtureManager(self.ctx)
 
             # HDR offscreen + tonemap pass so additive beam contributions
-            # don't clip the framebuffer to flat white. Sized lazily in
-            # paintGL from the current widget dimensions.
+            # don't clip the framebuffer to flat white. Sized in paintGL
+            # whenever the Qt surface is (re)bound.
             self.hdr = HDRPipeline(self.ctx)
 
             # Set camera to fit stage
@@ -129,6 +152,7 @@ class RenderEngine(QOpenGLWidget):
 
             # Flush any state pushed before this widget was first shown.
             self._flush_pending_state()
+            self.request_redraw()
 
             print(f"OpenGL initialized: {self.ctx.info['GL_RENDERER']}")
             print(f"  Stage size: {self.stage_width}m x {self.stage_height}m")
@@ -146,7 +170,10 @@ class RenderEngine(QOpenGLWidget):
         if height > 0:
             self.camera.set_aspect(width / height)
 
-        # Note: Viewport is set per-frame when binding the FBO
+        # Qt recreates its FBO on resize; re-detect it (and resize the
+        # HDR target) on the next frame. Viewport is set per-frame.
+        self._qt_fbo = None
+        self.request_redraw()
 
     def paintGL(self):
         """Render frame."""
@@ -167,17 +194,16 @@ class RenderEngine(QOpenGLWidget):
                 pass
             self._first_frame = False
 
+        frame_start = time.perf_counter()
+
         # Calculate FPS
         self._update_fps()
 
-        # Resolve the Qt LDR FBO once so we can target it for the tonemap
-        # and for LDR-only overlays (gizmo). Qt's FBO ID can change on
-        # resize.
-        qt_fbo_id = self.defaultFramebufferObject()
-        qt_fbo = self.ctx.detect_framebuffer(qt_fbo_id)
-        self.ctx.fbo = qt_fbo
-
+        # The Qt LDR FBO is the target for the tonemap and for LDR-only
+        # overlays (gizmo).
         w, h = self.width(), self.height()
+        qt_fbo = self._bind_qt_surface(w, h)
+        self.ctx.fbo = qt_fbo
         self.ctx.viewport = (0, 0, w, h)
 
         # Get view-projection matrix
@@ -185,7 +211,6 @@ class RenderEngine(QOpenGLWidget):
 
         # --- Scene pass: render to HDR offscreen ---
         if self.hdr is not None:
-            self.hdr.resize(w, h)
             self.hdr.bind()
             self.ctx.viewport = (0, 0, w, h)
             self.hdr.clear(0.05, 0.05, 0.08, 1.0)
@@ -213,6 +238,56 @@ class RenderEngine(QOpenGLWidget):
             view_matrix = self.camera.get_view_matrix()
             self.gizmo_renderer.render(view_matrix, w, h)
 
+        self.pacer.frame_rendered(time.perf_counter() - frame_start)
+
+    def _bind_qt_surface(self, width: int, height: int):
+        """Qt's framebuffer, detected again only when it may have changed.
+
+        ``detect_framebuffer`` and the HDR resize used to run every
+        frame; Qt only replaces its FBO on resize (``resizeGL`` clears
+        the cached one) and its ID is checked each frame for safety.
+        """
+        qt_fbo_id = self.defaultFramebufferObject()
+        if self._qt_fbo is None or qt_fbo_id != self._qt_fbo_id:
+            self._qt_fbo = self.ctx.detect_framebuffer(qt_fbo_id)
+            self._qt_fbo_id = qt_fbo_id
+            if self.hdr is not None:
+                self.hdr.resize(width, height)
+        return self._qt_fbo
+
+    # --- Frame pacing ---
+
+    def _on_render_tick(self):
+        """Render timer slot: repaint if due, then retune the interval."""
+        animating = self.fixture_manager is not None and self.fixture_manager.is_animating()
+        if self.pacer.tick(time.perf_counter(), animating):
+            self.update()
+        interval = self.pacer.interval_ms
+        if self.render_timer.interval() != interval:
+            self.render_timer.setInterval(interval)
+
+    def request_redraw(self):
+        """Mark the scene as changed so the next render tick repaints."""
+        self.pacer.invalidate()
+
+    def set_max_fps(self, fps: float):
+        """
+        Cap the preview frame rate.
+
+        The effective rate may drop below the cap while the UI thread is
+        busy and recovers once it is idle again.
+
+        Args:
+            fps: Maximum frames per second
+        """
+        self.pacer.set_max_fps(fps)
+        self.render_timer.setInterval(self.pacer.interval_ms)
+
+    def set_render_on_demand(self, enabled: bool):
+        """Switch between render-on-demand and rendering every tick."""
+        self.pacer.on_demand = enabled
+        self.request_redraw()
+
     def _update_fps(self):
         """Update FPS counter."""
         self.frame_count += 1
@@ -228,7 +303,9 @@ class RenderEngine(QOpenGLWidget):
         self.last_frame_time = current_time
 
     def get_fps(self) -> float:
-        """Get current FPS."""
+        """Get current FPS (0 while render-on-demand is idle)."""
+        if time.time() - self.last_frame_time >= 1.0:
+            return 0.0
         return self.fps
 
     def set_stage_size(self, width: float, height: float):
@@ -250,6 +327,7 @@ class RenderEngine(QOpenGLWidget):
             self.doneCurrent()
 
         self.camera.set_stage_size(width, height)
+        self.request_redraw()
         print(f"RenderEngine: Stage size update complete")
 
     def set_grid_size(self, grid_size: float):
@@ -267,6 +345,7 @@ class RenderEngine(QOpenGLWidget):
             print(f"RenderEngine: Grid size updated to {grid_size}m")
         else:
             self._pending_grid_size = grid_size
+        self.request_redraw()
 
     def update_fixtures(self, fixtures_data: list):
         """
@@ -281,6 +360,7 @@ class RenderEngine(QOpenGLWidget):
             self.doneCurrent()
         else:
             self._pending_fixtures = fixtures_data
+        self.request_redraw()
 
     def update_dmx(self, universe: int, dmx_data: bytes):
         """
@@ -294,6 +374,36 @@ class RenderEngine(QOpenGLWidget):
             self.fixture_manager.update_dmx(universe, dmx_data)
         else:
             self._pending_dmx[universe] = dmx_data
+        self._dmx_stream_stale.add(universe)
+        if self._last_dmx.get(universe) != dmx_data:
+            self._last_dmx[universe] = bytes(dmx_data)
+            self.request_redraw()
+
+    def apply_dmx_stream(self, payload: bytes):
+        """
+        Apply one frame of the delta-compressed DMX stream (utils.dmx_stream).
+
+        Only fixtures whose channels changed are updated.
+
+        Args:
+            payload: Binary stream frame
+        """
+        try:
+            changes = self._dmx_stream.decode(payload)
+        except ValueError as e:
+            print(f"Ignoring DMX stream frame: {e}")
+            return
+        for universe, dmx_data, ranges in changes:
+            # The stream moved this universe away from the last direct frame
+            self._last_dmx.pop(universe, None)
+            self.request_redraw()
+            if universe in self._dmx_stream_stale:
+                self._dmx_stream_stale.discard(universe)
+                ranges = [(0, len(dmx_data))]
+            if self.fixture_manager:
+                self.fixture_manager.update_dmx_ranges(universe, dmx_data, ranges)
+            else:
+                self._pending_dmx[universe] = bytes(dmx_data)
 
     def _flush_pending_state(self):
         """Apply state captured before initializeGL fired.
@@ -315,6 +425,7 @@ class RenderEngine(QOpenGLWidget):
     def reset_camera(self):
         """Reset camera to default position."""
         self.camera.reset()
+        self.request_redraw()
 
     # --- Mouse Event Handlers ---
 
@@ -350,11 +461,13 @@ class RenderEngine(QOpenGLWidget):
             self.camera.pan(delta_x, delta_y)
 
         self.last_mouse_pos = pos
+        self.request_redraw()
 
     def wheelEvent(self, event):
         """Handle mouse wheel scroll."""
         delta = event.angleDelta().y() / 120.0  # Normalize to +/- 1
         self.camera.zoom(delta)
+        self.request_redraw()
 
     def keyPressEvent(self, event):
         """Handle key press."""
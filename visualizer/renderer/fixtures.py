@@ -10,6 +10,9 @@ from typing import Dict, List, Any, Optional, Tuple
 from abc import ABC, abstractmethod
 
 from utils.geometry import GeometryBuilder
+from visualizer.renderer.beams import BeamInstanceBatch
+from visualizer.renderer.components import GATHER_SENTINEL
+from visualizer.renderer.gl_cache import resource_cache
 
 
 # ---------------------------------------------------------------------------
@@ -29,6 +32,11 @@ from utils.geometry import GeometryBuilder
 FIXTURE_RENDERER_MODE = os.environ.get('FIXTURE_RENDERER', 'composable').lower()
 USE_COMPOSABLE_RENDERER = FIXTURE_RENDERER_MODE == 'composable'
 
+# Composable beams are drawn instanced (one draw per beam mesh per frame,
+# see :class:`visualizer.renderer.beams.BeamInstanceBatch`). Set
+# ``BEAM_INSTANCING=0`` to fall back to one draw per emission.
+USE_BEAM_INSTANCING = os.environ.get('BEAM_INSTANCING', '1') != '0'
+
 
 # Warm white color temperature (~2700K)
 WARM_WHITE_COLOR = (1.0, 0.85, 0.6)  # RGB approximation of warm white
@@ -488,6 +496,8 @@ class FixtureRenderer(ABC):
             fixture_data: Fixture data from TCP message
         """
         self.ctx = ctx
+        # Shader programs are shared per context (see gl_cache)
+        self.resources = resource_cache(ctx)
         self.fixture_data = fixture_data
 
         # Extract common properties
@@ -504,6 +514,12 @@ class FixtureRenderer(ABC):
         self.universe = fixture_data.get('universe', 1)
         self.address = fixture_data.get('address', 1)
         self.channel_mapping = fixture_data.get('channel_mapping', {})
+        # Gather table compiled from channel_mapping/layout, per address
+        # (see dmx_gather_indices)
+        self._gather_indices: List[int] = []
+        self._gather_funcs: Tuple[str, ...] = ()
+        self._gather_segment_end = 0
+        self._gather_address: Optional[int] = None
 
         # Physical dimensions (in meters)
         physical = fixture_data.get('physical', {'width': 0.3, 'height': 0.3, 'depth': 0.2})
@@ -539,6 +555,11 @@ class FixtureRenderer(ABC):
         self.beam_abo: Optional[moderngl.Buffer] = None
         self.beam_vertex_count: int = 0
 
+    @property
+    def is_animating(self) -> bool:
+        """True while the fixture changes between frames without new DMX."""
+        return False
+
     def get_model_matrix(self) -> glm.mat4:
         """Get the model transformation matrix for this fixture."""
         # Start with identity
@@ -575,40 +596,71 @@ class FixtureRenderer(ABC):
         Args:
             dmx_data: 512 bytes of DMX data for the universe
         """
-        # Convert channel mapping (string keys from JSON to int)
-        # ch_num is 0-indexed (channel offset within fixture mode)
-        # self.address is 1-indexed DMX address
-        for ch_str, func in self.channel_mapping.items():
-            try:
-                ch_num = int(ch_str)
-                # Calculate array index: (address - 1) converts to 0-indexed, + ch_num for offset
-                index = (self.address - 1) + ch_num
-                if 0 <= index < 512:
-                    self.dmx_values[func] = dmx_data[index]
-            except (ValueError, IndexError):
-                pass
+        data_length = len(dmx_data)
+        self.apply_gathered([dmx_data[index] if index < data_length else 0
+                             for index in self.dmx_gather_indices()])
 
-        # Also store raw DMX values for segment-based fixtures
-        # (sunstrips, LED bars with per-segment control)
-        self._update_segment_dmx(dmx_data)
+    def dmx_gather_indices(self) -> List[int]:
+        """
+        Universe buffer indices apply_gathered() expects, in order.
 
-    def _update_segment_dmx(self, dmx_data: bytes):
+        Mapped channels first (in channel_mapping order), then one channel
+        per layout segment, then _extra_gather_indices(). Channels past the
+        end of the universe point at GATHER_SENTINEL, which reads as 0.
+        Compiled once per address; FixtureManager concatenates these into a
+        per-universe UniverseGatherTable.
+        """
+        if self._gather_address != self.address:
+            base_index = self.address - 1  # Convert to 0-indexed
+            indices = []
+            funcs = []
+            # Channel mapping keys are mode-relative 0-indexed offsets
+            # (strings after JSON)
+            for ch_str, func in self.channel_mapping.items():
+                try:
+                    index = base_index + int(ch_str)
+                except (TypeError, ValueError):
+                    continue
+                if 0 <= index < 512:
+                    indices.append(index)
+                    funcs.append(func)
+            self._gather_funcs = tuple(funcs)
+
+            # Raw channel values for segment-based fixtures
+            # (sunstrips, LED bars with per-segment control)
+            for i in range(self.segment_cols * self.segment_rows):
+                index = base_index + i
+                indices.append(index if 0 <= index < 512 else GATHER_SENTINEL)
+            self._gather_segment_end = len(indices)
+
+            indices.extend(self._extra_gather_indices(base_index))
+            self._gather_indices = indices
+            self._gather_address = self.address
+        return self._gather_indices
+
+    def _extra_gather_indices(self, base_index: int) -> List[int]:
+        """Additional buffer indices appended to the gather table. Override in subclasses."""
+        return []
+
+    def apply_gathered(self, values: List[int]):
         """
-        Update per-segment DMX values. Override in segment-based fixtures.
+        Update fixture state from gathered channel values.
 
         Args:
-            dmx_data: 512 bytes of DMX data
+            values: Values at dmx_gather_indices(), in the same order
         """
-        # Default: store raw channel values for segment count
-        # Subclasses can override for specific behavior
-        self.segment_values = []
-        base_index = self.address - 1  # Convert to 0-indexed
-
-        for i in range(self.segment_cols * self.segment_rows):
-            if base_index + i < 512:
-                self.segment_values.append(dmx_data[base_index + i])
-            else:
-                self.segment_values.append(0)
+        funcs = self._gather_funcs
+        self.dmx_values.update(zip(funcs, values[:len(funcs)]))
+        self.segment_values = values[len(funcs):self._gather_segment_end]
+
+    def dmx_footprint(self) -> int:
+        """Number of channels from the fixture address that update_dmx reads (0 = unknown)."""
+        base_index = self.address - 1
+        footprint = self.segment_cols * self.segment_rows
+        for index in self.dmx_gather_indices():
+            if index != GATHER_SENTINEL:
+                footprint = max(footprint, index - base_index + 1)
+        return footprint
 
     def get_color(self) -> Tuple[float, float, float]:
         """Get current RGB color from DMX values (0-1 range)."""
@@ -631,10 +683,7 @@ class FixtureRenderer(ABC):
             beam_angle: Beam spread angle in degrees (default 40 - wide spread)
         """
         # Create beam shader program
-        self.beam_program = self.ctx.program(
-            vertex_shader=BEAM_VERTEX_SHADER,
-            fragment_shader=BEAM_FRAGMENT_SHADER
-        )
+        self.beam_program = self.resources.program(BEAM_VERTEX_SHADER, BEAM_FRAGMENT_SHADER)
 
         # Calculate beam radius at end based on angle
         beam_radius = beam_length * math.tan(math.radians(beam_angle / 2))
@@ -708,24 +757,12 @@ class FixtureRenderer(ABC):
         pass
 
     def release(self):
-        """Release GPU resources."""
-        if self.vao:
-            self.vao.release()
-        if self.vbo:
-            self.vbo.release()
-        if self.nbo:
-            self.nbo.release()
-        if self.program:
-            self.program.release()
-        # Release beam resources
-        if self.beam_vao:
-            self.beam_vao.release()
-        if self.beam_vbo:
-            self.beam_vbo.release()
-        if self.beam_abo:
-            self.beam_abo.release()
-        if self.beam_program:
-            self.beam_program.release()
+        """Release GPU resources (shared programs/meshes drop one reference)."""
+        for attr in ('vao', 'vbo', 'nbo', 'program',
+                     'beam_vao', 'beam_vbo', 'beam_abo', 'beam_program'):
+            # Cleared so subclass release() loops can't release them twice.
+            self.resources.release(getattr(self, attr))
+            setattr(self, attr, None)
 
 
 class LEDBarRenderer(FixtureRenderer):
@@ -742,10 +779,7 @@ class LEDBarRenderer(FixtureRenderer):
     def _create_geometry(self):
         """Create bar body and segment geometry."""
         # Create shader program
-        self.program = self.ctx.program(
-            vertex_shader=FIXTURE_VERTEX_SHADER,
-            fragment_shader=FIXTURE_FRAGMENT_SHADER
-        )
+        self.program = self.resources.program(FIXTURE_VERTEX_SHADER, FIXTURE_FRAGMENT_SHADER)
 
         # Create bar body (housing)
         body_verts, body_norms = GeometryBuilder.create_box(
@@ -917,10 +951,7 @@ class LEDBarRenderer(FixtureRenderer):
 
     def _create_segment_beams(self):
         """Create per-segment rectangular beams."""
-        self.beam_program = self.ctx.program(
-            vertex_shader=BEAM_VERTEX_SHADER,
-            fragment_shader=BEAM_FRAGMENT_SHADER
-        )
+        self.beam_program = self.resources.program(BEAM_VERTEX_SHADER, BEAM_FRAGMENT_SHADER)
 
         beam_length = 0.3  # Short glow near fixture face
         beam_width = self.segment_width * 0.7
@@ -1049,25 +1080,25 @@ class LEDBarRenderer(FixtureRenderer):
         """Release GPU resources."""
         super().release()
         if hasattr(self, 'segment_vao') and self.segment_vao:
-            self.segment_vao.release()
+            self.resources.release(self.segment_vao)
         if hasattr(self, 'segment_vbo') and self.segment_vbo:
-            self.segment_vbo.release()
+            self.resources.release(self.segment_vbo)
         if hasattr(self, 'segment_nbo') and self.segment_nbo:
-            self.segment_nbo.release()
+            self.resources.release(self.segment_nbo)
         # Segment beam resources
         if hasattr(self, 'segment_beam_vao') and self.segment_beam_vao:
-            self.segment_beam_vao.release()
+            self.resources.release(self.segment_beam_vao)
         if hasattr(self, 'segment_beam_vbo') and self.segment_beam_vbo:
-            self.segment_beam_vbo.release()
+            self.resources.release(self.segment_beam_vbo)
         if hasattr(self, 'segment_beam_abo') and self.segment_beam_abo:
-            self.segment_beam_abo.release()
+            self.resources.release(self.segment_beam_abo)
         # Coordinate axes resources
         for attr in ['x_axis_vao', 'x_axis_vbo', 'x_axis_nbo',
                      'y_axis_vao', 'y_axis_vbo', 'y_axis_nbo',
                      'z_axis_vao', 'z_axis_vbo', 'z_axis_nbo']:
             obj = getattr(self, attr, None)
             if obj:
-                obj.release()
+                self.resources.release(obj)
 
 
 class PixelBarRenderer(FixtureRenderer):
@@ -1115,10 +1146,7 @@ class PixelBarRenderer(FixtureRenderer):
     def _create_geometry(self):
         """Create bar body and segment geometry."""
         # Create shader program
-        self.program = self.ctx.program(
-            vertex_shader=FIXTURE_VERTEX_SHADER,
-            fragment_shader=FIXTURE_FRAGMENT_SHADER
-        )
+        self.program = self.resources.program(FIXTURE_VERTEX_SHADER, FIXTURE_FRAGMENT_SHADER)
 
         # Create bar body (housing)
         body_verts, body_norms = GeometryBuilder.create_box(
@@ -1290,10 +1318,7 @@ class PixelBarRenderer(FixtureRenderer):
 
     def _create_segment_beams(self):
         """Create per-segment rectangular beams (one VAO per segment for individual colors)."""
-        self.beam_program = self.ctx.program(
-            vertex_shader=BEAM_VERTEX_SHADER,
-            fragment_shader=BEAM_FRAGMENT_SHADER
-        )
+        self.beam_program = self.resources.program(BEAM_VERTEX_SHADER, BEAM_FRAGMENT_SHADER)
 
         beam_length = 0.3  # Short glow near fixture face
         beam_width = self.segment_width * 0.7
@@ -1333,40 +1358,29 @@ class PixelBarRenderer(FixtureRenderer):
             self.segment_beam_abos.append(abo)
             self.segment_beam_vaos.append(vao)
 
-    def update_dmx(self, dmx_data: bytes):
+    def _extra_gather_indices(self, base_index: int) -> List[int]:
+        """RGBW buffer indices of each pixel segment, from pixel_segments."""
+        indices = []
+        for segment in self.pixel_segments[:self.segment_cols]:
+            for color in ('red', 'green', 'blue', 'white'):
+                # RGBW channel indices are relative to the fixture address
+                channel = segment.get(color)
+                index = base_index + channel if channel is not None else GATHER_SENTINEL
+                indices.append(index if 0 <= index < 512 else GATHER_SENTINEL)
+        return indices
+
+    def apply_gathered(self, values: List[int]):
         """Update DMX values and calculate per-segment colors."""
-        super().update_dmx(dmx_data)
+        super().apply_gathered(values)
 
         # Get master dimmer (if any)
-        master_dimmer = self.dmx_values.get('dimmer', 255) / 255.0
-
-        # Update per-segment colors from pixel_segments channel mapping
-        base_address = self.address - 1  # Convert to 0-indexed
-
-        new_colors = []
-        for i, segment in enumerate(self.pixel_segments):
-            if i >= self.segment_cols:
-                break
-
-            # Get RGBW channel indices relative to fixture address
-            r_ch = segment.get('red')
-            g_ch = segment.get('green')
-            b_ch = segment.get('blue')
-            w_ch = segment.get('white')
-
-            # Read DMX values for this segment
-            r = dmx_data[base_address + r_ch] / 255.0 if r_ch is not None and base_address + r_ch < 512 else 0.0
-            g = dmx_data[base_address + g_ch] / 255.0 if g_ch is not None and base_address + g_ch < 512 else 0.0
-            b = dmx_data[base_address + b_ch] / 255.0 if b_ch is not None and base_address + b_ch < 512 else 0.0
-            w = dmx_data[base_address + w_ch] / 255.0 if w_ch is not None and base_address + w_ch < 512 else 0.0
+        scale = self.dmx_values.get('dimmer', 255) / (255.0 * 255.0)
 
-            # Apply master dimmer
-            r *= master_dimmer
-            g *= master_dimmer
-            b *= master_dimmer
-            w *= master_dimmer
-
-            new_colors.append((r, g, b, w))
+        rgbw = values[self._gather_segment_end:]
+        new_colors = [
+            (rgbw[i] * scale, rgbw[i + 1] * scale, rgbw[i + 2] * scale, rgbw[i + 3] * scale)
+            for i in range(0, len(rgbw) - 3, 4)
+        ]
 
         # Pad with zeros if fewer segments parsed than layout width
         while len(new_colors) < self.segment_cols:
@@ -1474,30 +1488,30 @@ class PixelBarRenderer(FixtureRenderer):
         # Release segment VAOs
         for vao in getattr(self, 'segment_vaos', []):
             if vao:
-                vao.release()
+                self.resources.release(vao)
         for vbo in getattr(self, 'segment_vbos', []):
             if vbo:
-                vbo.release()
+                self.resources.release(vbo)
         for nbo in getattr(self, 'segment_nbos', []):
             if nbo:
-                nbo.release()
+                self.resources.release(nbo)
         # Release beam VAOs
         for vao in getattr(self, 'segment_beam_vaos', []):
             if vao:
-                vao.release()
+                self.resources.release(vao)
         for vbo in getattr(self, 'segment_beam_vbos', []):
             if vbo:
-                vbo.release()
+                self.resources.release(vbo)
         for abo in getattr(self, 'segment_beam_abos', []):
             if abo:
-                abo.release()
+                self.resources.release(abo)
         # Coordinate axes resources
         for attr in ['x_axis_vao', 'x_axis_vbo', 'x_axis_nbo',
                      'y_axis_vao', 'y_axis_vbo', 'y_axis_nbo',
                      'z_axis_vao', 'z_axis_vbo', 'z_axis_nbo']:
             obj = getattr(self, attr, None)
             if obj:
-                obj.release()
+                self.resources.release(obj)
 
 
 class SunstripRenderer(FixtureRenderer):
@@ -1512,10 +1526,7 @@ class SunstripRenderer(FixtureRenderer):
 
     def _create_geometry(self):
         """Create sunstrip body and lamp geometry."""
-        self.program = self.ctx.program(
-            vertex_shader=FIXTURE_VERTEX_SHADER,
-            fragment_shader=FIXTURE_FRAGMENT_SHADER
-        )
+        self.program = self.resources.program(FIXTURE_VERTEX_SHADER, FIXTURE_FRAGMENT_SHADER)
 
         # Create bar body
         body_verts, body_norms = GeometryBuilder.create_box(
@@ -1694,10 +1705,7 @@ class SunstripRenderer(FixtureRenderer):
 
     def _create_segment_beams(self):
         """Create per-segment cylindrical beams for each lamp."""
-        self.beam_program = self.ctx.program(
-            vertex_shader=BEAM_VERTEX_SHADER,
-            fragment_shader=BEAM_FRAGMENT_SHADER
-        )
+        self.beam_program = self.resources.program(BEAM_VERTEX_SHADER, BEAM_FRAGMENT_SHADER)
 
         beam_length = 0.3  # Short glow near fixture face
         beam_radius = self.lamp_radius * 0.8  # Slightly smaller than lamp
@@ -1844,25 +1852,25 @@ class SunstripRenderer(FixtureRenderer):
         """Release GPU resources."""
         super().release()
         if hasattr(self, 'lamp_vao') and self.lamp_vao:
-            self.lamp_vao.release()
+            self.resources.release(self.lamp_vao)
         if hasattr(self, 'lamp_vbo') and self.lamp_vbo:
-            self.lamp_vbo.release()
+            self.resources.release(self.lamp_vbo)
         if hasattr(self, 'lamp_nbo') and self.lamp_nbo:
-            self.lamp_nbo.release()
+            self.resources.release(self.lamp_nbo)
         # Segment beam resources
         if hasattr(self, 'segment_beam_vao') and self.segment_beam_vao:
-            self.segment_beam_vao.release()
+            self.resources.release(self.segment_beam_vao)
         if hasattr(self, 'segment_beam_vbo') and self.segment_beam_vbo:
-            self.segment_beam_vbo.release()
+            self.resources.release(self.segment_beam_vbo)
         if hasattr(self, 'segment_beam_abo') and self.segment_beam_abo:
-            self.segment_beam_abo.release()
+            self.resources.release(self.segment_beam_abo)
         # Coordinate axes resources
         for attr in ['x_axis_vao', 'x_axis_vbo', 'x_axis_nbo',
                      'y_axis_vao', 'y_axis_vbo', 'y_axis_nbo',
                      'z_axis_vao', 'z_axis_vbo', 'z_axis_nbo']:
             obj = getattr(self, attr, None)
             if obj:
-                obj.release()
+                self.resources.release(obj)
 
 
 class MovingHeadRenderer(FixtureRenderer):
@@ -1965,6 +1973,11 @@ class MovingHeadRenderer(FixtureRenderer):
 
         return 0  # Default to open
 
+    @property
+    def is_animating(self) -> bool:
+        """A spinning gobo keeps the beam changing between DMX frames."""
+        return self.dmx_values.get('gobo_rotation', 0) != 0
+
     def update_gobo_rotation(self, delta_time: float):
         """
         Update gobo rotation based on DMX rotation speed.
@@ -2078,10 +2091,7 @@ class MovingHeadRenderer(FixtureRenderer):
 
         See reference.md for full coordinate system documentation.
         """
-        self.program = self.ctx.program(
-            vertex_shader=FIXTURE_VERTEX_SHADER,
-            fragment_shader=FIXTURE_FRAGMENT_SHADER
-        )
+        self.program = self.resources.program(FIXTURE_VERTEX_SHADER, FIXTURE_FRAGMENT_SHADER)
 
         # Proportions based on physical dimensions
         base_size = min(self.width, self.depth)
@@ -2316,10 +2326,7 @@ class MovingHeadRenderer(FixtureRenderer):
     def _create_beam_geometry(self):
         """Create beam cone geometry for light visualization with gobo support."""
         # Beam program with gobo pattern support
-        self.beam_program = self.ctx.program(
-            vertex_shader=GOBO_BEAM_VERTEX_SHADER,
-            fragment_shader=GOBO_BEAM_FRAGMENT_SHADER
-        )
+        self.beam_program = self.resources.program(GOBO_BEAM_VERTEX_SHADER, GOBO_BEAM_FRAGMENT_SHADER)
 
         # Calculate beam radius at 5m distance based on beam angle
         beam_length = 5.0  # 5 meters
@@ -2347,10 +2354,7 @@ class MovingHeadRenderer(FixtureRenderer):
     def _create_floor_projection_geometry(self):
         """Create floor projection disk geometry with gobo support."""
         # Use gobo-enabled floor projection shader
-        self.floor_proj_program = self.ctx.program(
-            vertex_shader=FLOOR_PROJECTION_VERTEX_SHADER,
-            fragment_shader=GOBO_FLOOR_PROJECTION_FRAGMENT_SHADER
-        )
+        self.floor_proj_program = self.resources.program(FLOOR_PROJECTION_VERTEX_SHADER, GOBO_FLOOR_PROJECTION_FRAGMENT_SHADER)
 
         # Create unit disk (will be scaled/positioned via model matrix)
         proj_verts, proj_uvs = GeometryBuilder.create_floor_projection_disk(segments=32)
@@ -2447,9 +2451,9 @@ class MovingHeadRenderer(FixtureRenderer):
 
         return (hit_pos, major_radius, minor_radius, rotation_angle)
 
-    def update_dmx(self, dmx_data: bytes):
+    def apply_gathered(self, values: List[int]):
         """Update DMX values and calculate pan/tilt angles."""
-        super().update_dmx(dmx_data)
+        super().apply_gathered(values)
 
         # Calculate pan angle from DMX
         pan_coarse = self.dmx_values.get('pan', 127)
@@ -2924,7 +2928,7 @@ class MovingHeadRenderer(FixtureRenderer):
                      'floor_proj_vao', 'floor_proj_vbo', 'floor_proj_ubo', 'floor_proj_program']:
             obj = getattr(self, attr, None)
             if obj:
-                obj.release()
+                self.resources.release(obj)
 
 
 class WashRenderer(FixtureRenderer):
@@ -2939,10 +2943,7 @@ class WashRenderer(FixtureRenderer):
 
     def _create_geometry(self):
         """Create wash fixture body and lens."""
-        self.program = self.ctx.program(
-            vertex_shader=FIXTURE_VERTEX_SHADER,
-            fragment_shader=FIXTURE_FRAGMENT_SHADER
-        )
+        self.program = self.resources.program(FIXTURE_VERTEX_SHADER, FIXTURE_FRAGMENT_SHADER)
 
         # Create main body
         body_verts, body_norms = GeometryBuilder.create_box(
@@ -3089,10 +3090,7 @@ class WashRenderer(FixtureRenderer):
 
     def _create_rectangular_beam(self):
         """Create rectangular beam for wash fixture."""
-        self.beam_program = self.ctx.program(
-            vertex_shader=BEAM_VERTEX_SHADER,
-            fragment_shader=BEAM_FRAGMENT_SHADER
-        )
+        self.beam_program = self.resources.program(BEAM_VERTEX_SHADER, BEAM_FRAGMENT_SHADER)
 
         beam_length = 0.3  # Short glow near fixture face
         beam_width = self.lens_width * 0.8
@@ -3204,25 +3202,25 @@ class WashRenderer(FixtureRenderer):
         """Release GPU resources."""
         super().release()
         if hasattr(self, 'lens_vao') and self.lens_vao:
-            self.lens_vao.release()
+            self.resources.release(self.lens_vao)
         if hasattr(self, 'lens_vbo') and self.lens_vbo:
-            self.lens_vbo.release()
+            self.resources.release(self.lens_vbo)
         if hasattr(self, 'lens_nbo') and self.lens_nbo:
-            self.lens_nbo.release()
+            self.resources.release(self.lens_nbo)
         # Beam resources
         if hasattr(self, 'wash_beam_vao') and self.wash_beam_vao:
-            self.wash_beam_vao.release()
+            self.resources.release(self.wash_beam_vao)
         if hasattr(self, 'wash_beam_vbo') and self.wash_beam_vbo:
-            self.wash_beam_vbo.release()
+            self.resources.release(self.wash_beam_vbo)
         if hasattr(self, 'wash_beam_abo') and self.wash_beam_abo:
-            self.wash_beam_abo.release()
+            self.resources.release(self.wash_beam_abo)
         # Coordinate axes resources
         for attr in ['x_axis_vao', 'x_axis_vbo', 'x_axis_nbo',
                      'y_axis_vao', 'y_axis_vbo', 'y_axis_nbo',
                      'z_axis_vao', 'z_axis_vbo', 'z_axis_nbo']:
             obj = getattr(self, attr, None)
             if obj:
-                obj.release()
+                self.resources.release(obj)
 
 
 class PARRenderer(FixtureRenderer):
@@ -3242,10 +3240,7 @@ class PARRenderer(FixtureRenderer):
         - Cylindrical body extends along Z axis
         - Lens/beam faces +Z direction
         """
-        self.program = self.ctx.program(
-            vertex_shader=FIXTURE_VERTEX_SHADER,
-            fragment_shader=FIXTURE_FRAGMENT_SHADER
-        )
+        self.program = self.resources.program(FIXTURE_VERTEX_SHADER, FIXTURE_FRAGMENT_SHADER)
 
         # PAR can is a cylinder extending along Z axis (per reference.md)
         radius = min(self.width, self.height) / 2
@@ -3425,10 +3420,7 @@ class PARRenderer(FixtureRenderer):
 
         Beam extends along +Z (up) per reference.md.
         """
-        self.beam_program = self.ctx.program(
-            vertex_shader=BEAM_VERTEX_SHADER,
-            fragment_shader=BEAM_FRAGMENT_SHADER
-        )
+        self.beam_program = self.resources.program(BEAM_VERTEX_SHADER, BEAM_FRAGMENT_SHADER)
 
         beam_length = 0.3  # Short glow near fixture face
         beam_radius = self.lens_radius * 0.8
@@ -3543,25 +3535,25 @@ class PARRenderer(FixtureRenderer):
         """Release GPU resources."""
         super().release()
         if hasattr(self, 'lens_vao') and self.lens_vao:
-            self.lens_vao.release()
+            self.resources.release(self.lens_vao)
         if hasattr(self, 'lens_vbo') and self.lens_vbo:
-            self.lens_vbo.release()
+            self.resources.release(self.lens_vbo)
         if hasattr(self, 'lens_nbo') and self.lens_nbo:
-            self.lens_nbo.release()
+            self.resources.release(self.lens_nbo)
         # Beam resources
         if hasattr(self, 'par_beam_vao') and self.par_beam_vao:
-            self.par_beam_vao.release()
+            self.resources.release(self.par_beam_vao)
         if hasattr(self, 'par_beam_vbo') and self.par_beam_vbo:
-            self.par_beam_vbo.release()
+            self.resources.release(self.par_beam_vbo)
         if hasattr(self, 'par_beam_abo') and self.par_beam_abo:
-            self.par_beam_abo.release()
+            self.resources.release(self.par_beam_abo)
         # Coordinate axes resources
         for attr in ['x_axis_vao', 'x_axis_vbo', 'x_axis_nbo',
                      'y_axis_vao', 'y_axis_vbo', 'y_axis_nbo',
                      'z_axis_vao', 'z_axis_vbo', 'z_axis_nbo']:
             obj = getattr(self, attr, None)
             if obj:
-                obj.release()
+                self.resources.release(obj)
 
 
 def _detect_capabilities_from_payload(fixture_data: Dict[str, Any]):
@@ -3602,6 +3594,52 @@ def _detect_capabilities_from_payload(fixture_data: Dict[str, Any]):
         return None
 
 
+class UniverseGatherTable:
+    """
+    Precompiled DMX gather indices for the fixtures of one universe.
+
+    Compiled from each fixture's dmx_gather_indices()
+    when the fixture set changes. gather() then reads every fixture's
+    channels from a universe buffer with one fancy-index operation per
+    table instead of per-fixture, per-channel lookups.
+    """
+
+    def __init__(self, fixtures: List[Any]):
+        """
+        Args:
+            fixtures: Fixtures on the universe exposing dmx_gather_indices()
+                and apply_gathered()
+        """
+        self.fixtures = list(fixtures)
+        # fixture -> (start, end) of its values in the gather() result
+        self.slices: Dict[int, Tuple[int, int]] = {}
+        index_parts = []
+        offset = 0
+        for fixture in self.fixtures:
+            indices = fixture.dmx_gather_indices()
+            self.slices[id(fixture)] = (offset, offset + len(indices))
+            offset += len(indices)
+            index_parts.append(indices)
+
+        self.index = np.fromiter(
+            (i for part in index_parts for i in part), dtype=np.intp, count=offset,
+        )
+        self._buffer = np.zeros(GATHER_SENTINEL + 1, dtype=np.uint8)
+
+    def gather(self, dmx_data) -> List[int]:
+        """
+        Gather all fixtures' channel values from a universe buffer.
+
+        Returns:
+            Concatenated per-fixture values; slice with slices[id(fixture)]
+        """
+        buffer = self._buffer
+        length = min(len(dmx_data), GATHER_SENTINEL)
+        buffer[:length] = np.frombuffer(dmx_data, dtype=np.uint8, count=length)
+        buffer[length:] = 0
+        return buffer[self.index].tolist()
+
+
 class FixtureManager:
     """Manages all fixture renderers and coordinates updates."""
 
@@ -3614,6 +3652,12 @@ class FixtureManager:
         """
         self.ctx = ctx
         self.fixtures: Dict[str, FixtureRenderer] = {}
+        # universe -> [(first buffer index, end index, fixture)], rebuilt in update_fixtures
+        self._universe_index: Dict[int, List[Tuple[int, int, Any]]] = {}
+        # universe -> gather table of the fixtures supporting apply_gathered()
+        self._gather_tables: Dict[int, UniverseGatherTable] = {}
+        # Shared instanced beam renderer, created on the first composable render
+        self._beam_batch: Optional[BeamInstanceBatch] = None
 
     def update_fixtures(self, fixtures_data: List[Dict[str, Any]]):
         """
@@ -3644,9 +3688,10 @@ class FixtureManager:
                     existing.roll != new_orientation.get('roll', 0.0)
                 )
                 if existing.position != fixture_data.get('position') or orientation_changed:
-                    # Recreate fixture
-                    existing.release()
+                    # Recreate fixture; build first so shared GL resources
+                    # aren't freed and rebuilt in between
                     self.fixtures[name] = self._create_fixture(fixture_data)
+                    existing.release()
             else:
                 # Create new fixture
                 self.fixtures[name] = self._create_fixture(fixture_data)
@@ -3673,6 +3718,8 @@ class FixtureManager:
                     self.fixtures[name].brightness_scale = math.sqrt(lumens / max_lumens)
                     print(f"  Brightness: {name} = {lumens:.0f} lm -> scale {self.fixtures[name].brightness_scale:.2f}")
 
+        self._rebuild_universe_index()
+
         print(f"FixtureManager: {len(self.fixtures)} fixtures loaded")
         for name, fix in self.fixtures.items():
             extra_info = ""
@@ -3733,6 +3780,34 @@ class FixtureManager:
         else:  # PAR or unknown
             return PARRenderer(self.ctx, fixture_data)
 
+    def _rebuild_universe_index(self):
+        """Group fixtures by universe with the buffer span each one reads, and
+        compile the per-universe gather tables."""
+        index: Dict[int, List[Tuple[int, int, Any]]] = {}
+        gathered: Dict[int, List[Any]] = {}
+        for fixture in self.fixtures.values():
+            footprint = fixture.dmx_footprint() if hasattr(fixture, 'dmx_footprint') else 0
+            if footprint > 0:
+                start = fixture.address - 1
+                span = (start, start + footprint)
+            else:
+                span = (0, 512)  # Unknown: any change in the universe may matter
+            index.setdefault(fixture.universe, []).append((span[0], span[1], fixture))
+            if hasattr(fixture, 'apply_gathered') and fixture.dmx_gather_indices() is not None:
+                gathered.setdefault(fixture.universe, []).append(fixture)
+        self._universe_index = index
+        self._gather_tables = {
+            universe: UniverseGatherTable(fixtures) for universe, fixtures in gathered.items()
+        }
+
+    def _apply_dmx(self, fixture, dmx_data, table: Optional[UniverseGatherTable], values):
+        """Update one fixture from its gathered values, or the raw buffer if it has none."""
+        span = table.slices.get(id(fixture)) if table is not None else None
+        if span is None:
+            fixture.update_dmx(dmx_data)
+        else:
+            fixture.apply_gathered(values[span[0]:span[1]])
+
     def update_dmx(self, universe: int, dmx_data: bytes):
         """
         Update fixtures with new DMX data.
@@ -3741,11 +3816,12 @@ class FixtureManager:
             universe: Universe number
             dmx_data: 512 bytes of DMX data
         """
+        table = self._gather_tables.get(universe)
+        values = table.gather(dmx_data) if table is not None else None
         updated_count = 0
-        for fixture in self.fixtures.values():
-            if fixture.universe == universe:
-                fixture.update_dmx(dmx_data)
-                updated_count += 1
+        for _, _, fixture in self._universe_index.get(universe, ()):
+            self._apply_dmx(fixture, dmx_data, table, values)
+            updated_count += 1
 
         # Debug: log first few DMX updates
         if not hasattr(self, '_dmx_log_count'):
@@ -3756,6 +3832,25 @@ class FixtureManager:
             ch_preview = [dmx_data[i] for i in range(min(20, len(dmx_data)))]
             print(f"DMX U{universe}: {updated_count} fixtures, ch1-20: {ch_preview}")
 
+    def update_dmx_ranges(self, universe: int, dmx_data, ranges: List[Tuple[int, int]]):
+        """
+        Update only the fixtures whose channels overlap the changed ranges.
+
+        Args:
+            universe: Universe number
+            dmx_data: Full 512-byte universe buffer (already holding the changes)
+            ranges: Changed [start, end) buffer index ranges
+        """
+        if not ranges:
+            return
+        table = self._gather_tables.get(universe)
+        values = table.gather(dmx_data) if table is not None else None
+        for start, end, fixture in self._universe_index.get(universe, ()):
+            for range_start, range_end in ranges:
+                if range_start < end and start < range_end:
+                    self._apply_dmx(fixture, dmx_data, table, values)
+                    break
+
     def render(self, mvp: glm.mat4):
         """
         Render all fixtures in two passes (composable only).
@@ -3781,8 +3876,12 @@ class FixtureManager:
         ]
 
         # Pass 1: additive light volumes for all composable fixtures.
+        # Beams are queued on the shared batch and drawn instanced.
+        beam_batch = self._get_beam_batch() if two_pass else None
         for fixture in two_pass:
-            fixture.render_lighting(mvp)
+            fixture.render_lighting(mvp, beam_batch)
+        if beam_batch is not None:
+            beam_batch.flush(mvp)
 
         # Pass 2: opaque chassis on top.
         for fixture in two_pass:
@@ -3792,12 +3891,34 @@ class FixtureManager:
         for fixture in single_pass:
             fixture.render(mvp)
 
+    def is_animating(self) -> bool:
+        """Whether any fixture changes between frames without new DMX
+        (e.g. gobo rotation), so a render-on-demand view must keep drawing."""
+        return any(fixture.is_animating for fixture in self.fixtures.values())
+
+    def _get_beam_batch(self) -> Optional[BeamInstanceBatch]:
+        """The shared BeamInstanceBatch, or ``None`` when instancing is disabled."""
+        if not USE_BEAM_INSTANCING:
+            return None
+        if self._beam_batch is None:
+            self._beam_batch = BeamInstanceBatch(self.ctx)
+        return self._beam_batch
+
     def get_fixture(self, name: str) -> Optional[FixtureRenderer]:
         """Get fixture by name."""
         return self.fixtures.get(name)
 
     def release(self):
-        """Release all GPU resources."""
+        """Release all GPU resources.
+
+        Fixtures drop their references to the context's shared programs
+        and meshes; each is freed with its last reference.
+        """
         for fixture in self.fixtures.values():
             fixture.release()
         self.fixtures.clear()
+        self._universe_index.clear()
+        self._gather_tables.clear()
+        if self._beam_batch is not None:
+            self._beam_batch.release()
+            self._beam_batch = None
@@ -21,6 +21,7 @@ import moderngl
 import numpy as np
 
 from utils.geometry import GeometryBuilder
+from visualizer.renderer.gl_cache import resource_cache
 from visualizer.renderer.gl_state import set_depth_mask
 from visualizer.renderer.shaders import (
     FLOOR_PROJECTION_VERTEX_SHADER,
@@ -117,20 +118,22 @@ def _mat4_bytes(m: glm.mat4) -> bytes:
 class FloorProjectionComponent:
     """Renders a gobo+focus-modulated ellipse on the floor under a moving head.
 
-    Owns one program (gobo floor projection fragment shader) + one floor
-    disk VAO. Caller invokes :meth:`render` once per facet (so prism
+    Shares the program (gobo floor projection fragment shader) and floor
+    disk mesh through the context's resource cache; owns one VAO. Caller invokes :meth:`render` once per facet (so prism
     fixtures call it N times with different ``beam_dir_world`` per facet).
     """
 
     def __init__(self, ctx: moderngl.Context):
         self.ctx = ctx
-        self.program: moderngl.Program = ctx.program(
-            vertex_shader=FLOOR_PROJECTION_VERTEX_SHADER,
-            fragment_shader=GOBO_FLOOR_PROJECTION_FRAGMENT_SHADER,
+        self.resources = resource_cache(ctx)
+        self.program: moderngl.Program = self.resources.program(
+            FLOOR_PROJECTION_VERTEX_SHADER,
+            GOBO_FLOOR_PROJECTION_FRAGMENT_SHADER,
+        )
+        self.vbo, self.ubo = self.resources.mesh(
+            ('floor_disk', 32),
+            lambda: GeometryBuilder.create_floor_projection_disk(segments=32),
         )
-        verts, uvs = GeometryBuilder.create_floor_projection_disk(segments=32)
-        self.vbo = ctx.buffer(verts.tobytes())
-        self.ubo = ctx.buffer(uvs.tobytes())
         self.vao = ctx.vertex_array(
             self.program,
             [
@@ -221,11 +224,5 @@ class FloorProjectionComponent:
             self.ctx.disable(moderngl.BLEND)
 
     def release(self) -> None:
-        if self.vao:
-            self.vao.release()
-        if self.vbo:
-            self.vbo.release()
-        if self.ubo:
-            self.ubo.release()
-        if self.program:
-            self.program.release()
+        for resource in (self.vao, self.vbo, self.ubo, self.program):
+            self.resources.release(resource)
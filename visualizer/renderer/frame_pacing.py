@@ -0,0 +1,129 @@
+"""Render-on-demand scheduling and adaptive frame pacing for RenderEngine.
+
+The engine's render timer used to call ``update()`` every 16 ms, so the
+embedded preview re-rendered the full HDR scene pass and tonemap while
+nothing on stage moved — e.g. while editing with playback stopped — and
+competed with the Shows tab timeline for the UI thread.
+
+:class:`FramePacer` decides on each timer tick whether a repaint is due:
+
+- **On demand** (default): only when the scene was invalidated (DMX
+  change, camera interaction, resize, fixture edits) or a fixture is
+  animating on its own (gobo rotation).
+- **Continuous**: every tick, the old behaviour.
+
+It also paces the timer itself. ``max_fps`` is a user cap; the effective
+``target_fps`` backs off when the UI thread is busy and recovers when it
+is idle again. Busyness is read from two signals that cost nothing to
+collect: how late the timer fires (other work on the event loop) and how
+long ``paintGL`` takes (our own share of the thread).
+"""
+
+from __future__ import annotations
+
+from typing import Optional
+
+
+class FramePacer:
+    """Repaint decisions and timer interval for one render surface.
+
+    Usage (times in seconds from one monotonic clock)::
+
+        pacer = FramePacer(max_fps=60)
+        # on scene changes:
+        pacer.invalidate()
+        # each timer tick:
+        if pacer.tick(now, animating):
+            widget.update()
+        timer.setInterval(pacer.interval_ms)
+        # at the end of paintGL:
+        pacer.frame_rendered(paint_seconds)
+    """
+
+    DEFAULT_MAX_FPS = 60.0
+    MIN_FPS = 10.0
+
+    # Load = (timer lateness + paint cost) / frame interval. Above BUSY_LOAD
+    # the preview backs off; below IDLE_LOAD it speeds back up to the cap.
+    BUSY_LOAD = 0.5
+    IDLE_LOAD = 0.25
+    BACKOFF = 0.75
+    RECOVERY = 1.25
+    ADAPT_PERIOD_S = 0.5
+
+    # Exponential moving average weight for the load signals
+    SMOOTHING = 0.2
+
+    def __init__(self, max_fps: float = DEFAULT_MAX_FPS, on_demand: bool = True):
+        self.on_demand = on_demand
+        self.max_fps = self.DEFAULT_MAX_FPS
+        self.target_fps = self.DEFAULT_MAX_FPS
+        self.set_max_fps(max_fps)
+
+        self._dirty = True
+        self._last_tick: Optional[float] = None
+        self._last_adapt: Optional[float] = None
+        self._lateness = 0.0
+        self._frame_cost = 0.0
+
+    # --- configuration ---
+
+    def set_max_fps(self, fps: float) -> None:
+        """Set the frame-rate cap. The effective rate restarts at the cap."""
+        self.max_fps = max(1.0, float(fps))
+        self.target_fps = self.max_fps
+
+    @property
+    def min_fps(self) -> float:
+        return min(self.MIN_FPS, self.max_fps)
+
+    @property
+    def interval_ms(self) -> int:
+        """Timer interval for the current effective frame rate."""
+        return max(1, int(round(1000.0 / self.target_fps)))
+
+    # --- scene state ---
+
+    def invalidate(self) -> None:
+        """Mark the scene as changed; the next tick repaints."""
+        self._dirty = True
+
+    @property
+    def dirty(self) -> bool:
+        return self._dirty
+
+    @property
+    def load(self) -> float:
+        """Smoothed share of a frame interval spent late or painting."""
+        return (self._lateness + self._frame_cost) * self.target_fps
+
+    # --- per tick / per frame ---
+
+    def tick(self, now: float, animating: bool = False) -> bool:
+        """Record a timer tick at ``now``; return whether to repaint."""
+        if self._last_tick is not None:
+            late = max(0.0, now - self._last_tick - 1.0 / self.target_fps)
+            self._lateness += self.SMOOTHING * (late - self._lateness)
+        self._last_tick = now
+        self._adapt(now)
+
+        repaint = not self.on_demand or self._dirty or animating
+        if not repaint:
+            # Skipped ticks cost nothing; let the paint share decay
+            self._frame_cost *= 1.0 - self.SMOOTHING
+        return repaint
+
+    def frame_rendered(self, cost: float) -> None:
+        """Record a finished frame that took ``cost`` seconds to paint."""
+        self._dirty = False
+        self._frame_cost += self.SMOOTHING * (cost - self._frame_cost)
+
+    def _adapt(self, now: float) -> None:
+        if self._last_adapt is not None and now - self._last_adapt < self.ADAPT_PERIOD_S:
+            return
+        self._last_adapt = now
+        load = self.load
+        if load > self.BUSY_LOAD:
+            self.target_fps = max(self.min_fps, self.target_fps * self.BACKOFF)
+        elif load < self.IDLE_LOAD:
+            self.target_fps = min(self.max_fps, self.target_fps * self.RECOVERY)
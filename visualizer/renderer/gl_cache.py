@@ -0,0 +1,138 @@
+"""Context-scoped, reference-counted cache of shader programs and mesh buffers.
+
+Every fixture renderer used to compile its own copy of the same GLSL and
+upload its own VBOs for identical cylinders, boxes and cones, so a
+300-fixture rig compiled the fixture/beam shaders hundreds of times. The
+renderers now acquire those resources from the :class:`GLResourceCache`
+of their context:
+
+- :meth:`GLResourceCache.program` — keyed by the shader sources.
+- :meth:`GLResourceCache.mesh` — keyed by a caller-chosen tuple of mesh
+  parameters; one buffer per array the builder returns.
+
+Each acquisition takes a reference; :meth:`GLResourceCache.release` drops
+one and frees the GL object with the last reference. ``release`` also
+accepts resources the cache doesn't know (VAOs, per-fixture buffers) and
+simply frees those, so ``release()`` methods route everything through it.
+VAOs stay per fixture — they are cheap and bind per-fixture buffers.
+
+One cache exists per moderngl context (the embedded visualizer's widget
+context, an :class:`OfflineRenderer` standalone context, ...). It drops
+out of the registry once its last resource is released, so a destroyed
+context isn't kept alive.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable, Dict, Hashable, List, Sequence, Tuple
+
+import moderngl
+import numpy as np
+
+
+class GLResourceCache:
+    """Shared programs and mesh buffers for one moderngl context."""
+
+    def __init__(self, ctx: moderngl.Context):
+        self.ctx = ctx
+        # key -> [resource, reference count]
+        self._entries: Dict[Hashable, List[Any]] = {}
+        # id(resource) -> key, for release()
+        self._keys: Dict[int, Hashable] = {}
+        # mesh key -> number of arrays (buffers) in the mesh
+        self._mesh_arrays: Dict[Hashable, int] = {}
+        self.programs_compiled = 0
+        self.buffers_uploaded = 0
+
+    def __len__(self) -> int:
+        """Number of live shared resources."""
+        return len(self._entries)
+
+    def program(self, vertex_shader: str, fragment_shader: str) -> moderngl.Program:
+        """Acquire the program built from these shader sources."""
+        def build() -> moderngl.Program:
+            self.programs_compiled += 1
+            return self.ctx.program(
+                vertex_shader=vertex_shader,
+                fragment_shader=fragment_shader,
+            )
+        return self._acquire(('program', vertex_shader, fragment_shader), build)
+
+    def mesh(
+        self,
+        key: Hashable,
+        build: Callable[[], Sequence[np.ndarray]],
+    ) -> Tuple[moderngl.Buffer, ...]:
+        """Acquire one float32 buffer per array of the mesh identified by ``key``.
+
+        ``build`` (e.g. ``lambda: GeometryBuilder.create_box(w, h, d)``) only
+        runs when the mesh isn't resident yet. ``key`` must capture every
+        parameter the builder uses.
+        """
+        arrays = None
+        count = self._mesh_arrays.get(key)
+        if count is None or any(('mesh', key, i) not in self._entries for i in range(count)):
+            arrays = build()
+            count = self._mesh_arrays[key] = len(arrays)
+
+        def upload(i: int) -> moderngl.Buffer:
+            self.buffers_uploaded += 1
+            return self.ctx.buffer(np.asarray(arrays[i], dtype='f4').tobytes())
+
+        return tuple(
+            self._acquire(('mesh', key, i), lambda i=i: upload(i))
+            for i in range(count)
+        )
+
+    def refcount(self, resource: Any) -> int:
+        """References held on a shared resource (0 if it isn't cached)."""
+        key = self._keys.get(id(resource))
+        return self._entries[key][1] if key is not None else 0
+
+    def release(self, resource: Any) -> None:
+        """Drop one reference to ``resource``; free it with the last one.
+
+        Resources the cache doesn't own are released immediately.
+        ``None`` is ignored.
+        """
+        if resource is None:
+            return
+        key = self._keys.get(id(resource))
+        if key is None:
+            resource.release()
+            return
+        entry = self._entries[key]
+        entry[1] -= 1
+        if entry[1] > 0:
+            return
+        del self._entries[key]
+        del self._keys[id(resource)]
+        if key[0] == 'mesh' and not any(
+            ('mesh', key[1], i) in self._entries for i in range(self._mesh_arrays[key[1]])
+        ):
+            del self._mesh_arrays[key[1]]
+        resource.release()
+        if not self._entries and _CACHES.get(id(self.ctx)) is self:
+            del _CACHES[id(self.ctx)]
+
+    def _acquire(self, key: Hashable, build: Callable[[], Any]) -> Any:
+        entry = self._entries.get(key)
+        if entry is None:
+            resource = build()
+            entry = self._entries[key] = [resource, 0]
+            self._keys[id(resource)] = key
+        entry[1] += 1
+        return entry[0]
+
+
+# id(ctx) -> cache; the cache holds the context, so the id can't be reused
+# while the entry exists.
+_CACHES: Dict[int, GLResourceCache] = {}
+
+
+def resource_cache(ctx: moderngl.Context) -> GLResourceCache:
+    """The :class:`GLResourceCache` of ``ctx`` (created on first use)."""
+    cache = _CACHES.get(id(ctx))
+    if cache is None:
+        cache = _CACHES[id(ctx)] = GLResourceCache(ctx)
+    return cache
@@ -206,6 +206,102 @@ void main() {
 """
 
 
+# ---------------------------------------------------------------------------
+# Instanced beam shaders — one draw per beam mesh for every fixture
+# ---------------------------------------------------------------------------
+#
+# Per-instance attributes (one 96-byte row in the frame's instance buffer):
+# the beam's world matrix as four vec4 columns, rgb + intensity, and
+# gobo pattern / rotation / focus sharpness. The uniforms of the
+# per-fixture shaders become flat varyings with the same names, so the
+# fragment stages below share the single-draw GLSL verbatim.
+
+INSTANCED_BEAM_VERTEX_SHADER = """
+#version 330
+
+in vec3 in_position;
+in float in_alpha;
+in vec4 in_model_0;
+in vec4 in_model_1;
+in vec4 in_model_2;
+in vec4 in_model_3;
+in vec4 in_color;
+
+out float v_alpha;
+flat out vec3 beam_color;
+flat out float beam_intensity;
+
+uniform mat4 view_proj;
+
+void main() {
+    mat4 model = mat4(in_model_0, in_model_1, in_model_2, in_model_3);
+    gl_Position = view_proj * model * vec4(in_position, 1.0);
+    v_alpha = in_alpha;
+    beam_color = in_color.rgb;
+    beam_intensity = in_color.a;
+}
+"""
+
+INSTANCED_GOBO_BEAM_VERTEX_SHADER = """
+#version 330
+
+in vec3 in_position;
+in float in_alpha;
+in vec4 in_model_0;
+in vec4 in_model_1;
+in vec4 in_model_2;
+in vec4 in_model_3;
+in vec4 in_color;
+in vec4 in_gobo;
+
+out float v_alpha;
+out vec3 v_position;
+flat out vec3 beam_color;
+flat out float beam_intensity;
+flat out int gobo_pattern;
+flat out float gobo_rotation;
+flat out float focus_sharpness;
+
+uniform mat4 view_proj;
+
+void main() {
+    mat4 model = mat4(in_model_0, in_model_1, in_model_2, in_model_3);
+    gl_Position = view_proj * model * vec4(in_position, 1.0);
+    v_alpha = in_alpha;
+    v_position = in_position;
+    beam_color = in_color.rgb;
+    beam_intensity = in_color.a;
+    gobo_pattern = int(in_gobo.x + 0.5);
+    gobo_rotation = in_gobo.y;
+    focus_sharpness = in_gobo.z;
+}
+"""
+
+INSTANCED_BEAM_FRAGMENT_SHADER = BEAM_FRAGMENT_SHADER.replace(
+    """uniform vec3 beam_color;
+uniform float beam_intensity;
+""",
+    """flat in vec3 beam_color;
+flat in float beam_intensity;
+""",
+)
+
+INSTANCED_GOBO_BEAM_FRAGMENT_SHADER = GOBO_BEAM_FRAGMENT_SHADER.replace(
+    """uniform vec3 beam_color;
+uniform float beam_intensity;
+uniform int gobo_pattern;
+uniform float gobo_rotation;
+uniform float focus_sharpness;
+""",
+    """flat in vec3 beam_color;
+flat in float beam_intensity;
+flat in int gobo_pattern;
+flat in float gobo_rotation;
+flat in float focus_sharpness;
+""",
+)
+
+
 # ---------------------------------------------------------------------------
 # Floor projection shaders — soft spotlight footprint on the floor plane
 # ---------------------------------------------------------------------------
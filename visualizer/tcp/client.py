@@ -1,6 +1,8 @@
 # visualizer/tcp/client.py
 # TCP client for receiving configuration from Show Creator
 
+import base64
+import binascii
 import socket
 import threading
 import json
@@ -18,6 +20,7 @@ class VisualizerTCPClient(QObject):
     - Fixture list with positions and DMX addresses
     - Fixture groups
     - Configuration updates
+    - Delta-compressed DMX frames (utils.dmx_stream)
 
     Runs in a background thread to avoid blocking the UI.
     """
@@ -33,6 +36,9 @@ class VisualizerTCPClient(QObject):
     groups_received = pyqtSignal(list)  # list of group dicts
     update_received = pyqtSignal(str, dict)  # update_type, data
 
+    # DMX signal
+    dmx_stream_received = pyqtSignal(bytes)  # utils.dmx_stream frame
+
     # Default connection settings
     DEFAULT_HOST = "localhost"
     DEFAULT_PORT = 9000
@@ -205,6 +211,9 @@ class VisualizerTCPClient(QObject):
         elif msg_type == 'update':
             self._handle_update(message)
 
+        elif msg_type == 'dmx':
+            self._handle_dmx(message)
+
         elif msg_type == 'heartbeat':
             # Heartbeat - just acknowledge silently
             pass
@@ -258,6 +267,15 @@ class VisualizerTCPClient(QObject):
         print(f"Update: {update_type}")
         self.update_received.emit(update_type, data)
 
+    def _handle_dmx(self, message: Dict[str, Any]):
+        """Handle DMX stream frame message."""
+        try:
+            frame = base64.b64decode(message.get('frame', ''), validate=True)
+        except (binascii.Error, ValueError) as e:
+            print(f"Invalid DMX frame: {e}")
+            return
+        self.dmx_stream_received.emit(frame)
+
     def set_host(self, host: str):
         """Set server hostname."""
         self.host = host